@@ -0,0 +1,222 @@
+"""
+asyncio API for the AWS Bedrock Access Checker
+
+check_access() runs the same checks as the CLI from inside an event loop and
+returns the results instead of printing them, so the checker can be embedded
+in async services and many accounts can be checked from one process:
+
+    result = await check_access('dev', ['us-east-1', 'us-west-2'], CheckOptions(test_invoke=True))
+    if result.has_access:
+        ...
+
+The AWS calls themselves are blocking boto3 calls, so they run in an
+executor (the loop's default one unless another is passed in) and the event
+loop is never blocked. The per-region checks are the CLI's own check graph
+(see pipeline.py), run with CheckGraph.run_async(), and cancelling
+check_access() cancels the checks that have not started yet.
+
+As with the CLI, results are only ever written by one check at a time:
+worker threads make the AWS calls and return what they found, and the
+graph's apply steps record it one after the other. The credentials and
+regions checks own a whole component and fill a private results structure
+that is copied in when they finish. The caller gets a read-only snapshot of
+the results, so a check that is still running when the timeout passes or
+the call is cancelled can never change a result that was already returned.
+
+Model catalogs, quota listings, sessions, clients and caller identities are
+shared by every check_access() call in the process and, as in a CLI run,
+kept until cleared. Long-lived services should call set_cache_ttl() once so
+later calls see changes on the AWS side, or clear_caches() when they know
+something changed.
+"""
+
+import asyncio
+import functools
+import time
+
+from bedrock_access_checker.checker import (
+    console,
+    new_check_results,
+    check_aws_credentials,
+    check_bedrock_regions,
+    record_timed_out,
+    STATUS_SUCCESS,
+    DEFAULT_MAX_WORKERS
+)
+from bedrock_access_checker.catalog import model_catalog
+from bedrock_access_checker.clients import client_pool
+from bedrock_access_checker.pipeline import add_region_checks, isolated
+from bedrock_access_checker.quotas import quota_indexes
+from bedrock_access_checker.scheduler import CheckGraph
+
+
+class CheckOptions:
+    """
+    Which checks check_access() runs
+
+    The attribute names match the CLI's options of the same name.
+    """
+
+    def __init__(self, test_invoke=False, advanced=False, sagemaker_alternatives=False, estimate_costs=False,
+                 max_workers=DEFAULT_MAX_WORKERS, timeout=None):
+        """
+        Args:
+            test_invoke (bool, optional): Test model invocation with a simple prompt
+            advanced (bool, optional): Collect model details and quotas
+            sagemaker_alternatives (bool, optional): Look for SageMaker JumpStart alternatives to missing models
+            estimate_costs (bool, optional): Estimate costs for the available models
+            max_workers (int, optional): Maximum number of regions to probe concurrently
+            timeout (float, optional): Seconds the whole check may take (None for no limit)
+        """
+        self.test_invoke = test_invoke
+        self.advanced = advanced
+        self.sagemaker_alternatives = sagemaker_alternatives
+        self.estimate_costs = estimate_costs
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+
+class AccessCheckResult:
+    """Outcome of check_access() for one profile"""
+
+    def __init__(self, profile_name, results):
+        """
+        Args:
+            profile_name (str): AWS profile that was checked (None for default credentials)
+            results (CheckResults): The profile's results (a read-only snapshot is kept)
+        """
+        self.profile_name = profile_name
+        self.results = results.snapshot()
+
+    @property
+    def available_regions(self):
+        """list: Regions where Bedrock is available"""
+        return list(self.results.bedrock_regions.available)
+
+    @property
+    def available_models(self):
+        """list: Key models available in at least one region"""
+        return list(self.results.key_models.available)
+
+    @property
+    def missing_models(self):
+        """list: Key models that are not available in any checked region"""
+        return list(self.results.key_models.missing)
+
+    @property
+    def timed_out(self):
+        """list: Checks that did not finish before the timeout"""
+        return list(self.results.timed_out)
+
+    @property
+    def has_access(self):
+        """bool: True if the credentials work and Bedrock is available in at least one region"""
+        return self.results.aws_credentials.status == STATUS_SUCCESS and bool(self.available_regions)
+
+    def to_dict(self):
+        """
+        Get the results in the same shape as the CLI's JSON output
+
+        Returns:
+            dict: The results as plain dicts and lists
+        """
+        return self.results.to_dict()
+
+
+def set_cache_ttl(ttl):
+    """
+    Limit how long check_access() calls reuse what earlier calls fetched
+
+    Applies to the model catalogs, quota indexes, sessions, clients and
+    caller identities shared by all calls in the process.
+
+    Args:
+        ttl (float): Seconds an entry is reused (None to reuse it until clear_caches())
+    """
+    model_catalog.set_ttl(ttl)
+    quota_indexes.set_ttl(ttl)
+    client_pool.set_ttl(ttl)
+
+
+def clear_caches():
+    """
+    Forget everything earlier check_access() calls fetched
+
+    Call it between checks, not while check_access() calls are running.
+    """
+    model_catalog.clear()
+    quota_indexes.clear()
+    client_pool.clear()
+
+
+def _quietly(func, *args, **kwargs):
+    """Call a check function with its console output switched off"""
+    # Muting is per thread and skips rendering, so concurrent checks cost no Rich work
+    with console.mute():
+        return func(*args, **kwargs)
+
+
+def _add_quiet_check(graph, profile_name, name, func=None, deps=(), apply=None, component=None, region=None,
+                     resume=None):
+    """Add a check whose func and apply step run with console output switched off (see pipeline.add_check)"""
+    return graph.add(name, func and functools.partial(_quietly, func), deps,
+                     apply and functools.partial(_quietly, apply), component, region)
+
+
+async def check_access(profile_name=None, regions=None, options=None, executor=None):
+    """
+    Check a profile's Bedrock access without blocking the event loop
+
+    Nothing is printed; everything the checks find is in the returned result.
+
+    Args:
+        profile_name (str, optional): AWS profile name to check (None for default credentials)
+        regions (list, optional): Regions to check (None for the checker's defaults)
+        options (CheckOptions, optional): Which checks to run (defaults to the CLI's defaults)
+        executor (concurrent.futures.Executor, optional): Executor for the blocking AWS calls
+            (defaults to the event loop's default executor)
+
+    Returns:
+        AccessCheckResult: The profile's results
+
+    Raises:
+        asyncio.CancelledError: If the call is cancelled; its checks that have not started yet are cancelled with it
+    """
+    if options is None:
+        options = CheckOptions()
+
+    loop = asyncio.get_running_loop()
+    deadline = time.monotonic() + options.timeout if options.timeout else None
+    results = new_check_results()
+
+    async def isolated_check(component, func, *args, **kwargs):
+        """Run a whole-component check in a thread and copy its results in when it finishes"""
+        remaining = None if deadline is None else max(0, deadline - time.monotonic())
+        call = functools.partial(_quietly, isolated, component, func, *args, **kwargs)
+        try:
+            value, entry = await asyncio.wait_for(loop.run_in_executor(executor, call), remaining)
+        except asyncio.TimeoutError:
+            record_timed_out(component, results=results)
+            return None
+        if entry is not None:
+            setattr(results, component, entry)
+        return value
+
+    if not await isolated_check("aws_credentials", check_aws_credentials, profile_name):
+        return AccessCheckResult(profile_name, results)
+
+    available_regions = await isolated_check("bedrock_regions", check_bedrock_regions, profile_name, regions,
+                                             max_workers=options.max_workers, deadline=deadline)
+    if not available_regions:
+        return AccessCheckResult(profile_name, results)
+
+    # The region checks wait for the regions check by name; it has already finished here
+    graph = CheckGraph()
+    graph.add("regions", component="bedrock_regions")
+    add_region_checks(graph, profile_name, options, available_regions, results, deadline, add=_add_quiet_check)
+    await graph.run_async(deadline, executor)
+
+    for node in graph.timed_out():
+        record_timed_out(node.component, node.region, results=results)
+
+    return AccessCheckResult(profile_name, results)
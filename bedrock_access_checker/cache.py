@@ -0,0 +1,260 @@
+"""
+Persistent on-disk cache for the AWS Bedrock Access Checker
+
+Model catalogs, foundation model details and quota listings change rarely,
+so they can be reused across runs. Entries are keyed by the calling
+principal (IAM user or role), region and API call, expire after a TTL, and the cache directory is kept under a
+size limit by evicting the least recently used entries.
+
+Caching is opt-in: nothing is read or written until enable_disk_cache() is
+called (the CLI does this for --cache or BEDROCK_ACCESS_CHECKER_CACHE=1).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from bedrock_access_checker.clients import client_pool
+
+# Default cache location (follows XDG_CACHE_HOME when set)
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "bedrock-access-checker"
+)
+
+# Default time-to-live for cached entries (12 hours)
+DEFAULT_CACHE_TTL = 12 * 60 * 60
+
+# Default size limits for the cache directory
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+DEFAULT_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Environment variable that opts in to caching without --cache
+CACHE_ENV_VAR = "BEDROCK_ACCESS_CHECKER_CACHE"
+
+# Suffix of cache entry files
+_ENTRY_SUFFIX = ".json"
+
+
+class DiskCache:
+    """
+    Size-bounded, TTL-based JSON cache stored as one file per entry
+
+    Writes go to a temporary file that is atomically renamed into place, so
+    concurrent runs never read a partially written entry. Reading an entry
+    refreshes its modification time, which is what LRU eviction sorts by.
+    """
+
+    def __init__(self, directory=None, ttl=DEFAULT_CACHE_TTL, max_entries=DEFAULT_CACHE_MAX_ENTRIES,
+                 max_bytes=DEFAULT_CACHE_MAX_BYTES, refresh=False):
+        """
+        Create a cache (the directory is created with owner-only permissions)
+
+        Args:
+            directory (str, optional): Cache directory (defaults to DEFAULT_CACHE_DIR)
+            ttl (int, optional): Seconds an entry stays valid
+            max_entries (int, optional): Maximum number of entries kept
+            max_bytes (int, optional): Maximum total size of the entries in bytes
+            refresh (bool, optional): Ignore existing entries but still write new ones
+        """
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key):
+        """Get the file path for a key (a tuple of JSON-serializable parts)"""
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + _ENTRY_SUFFIX)
+
+    def get(self, *key):
+        """
+        Read an entry
+
+        Args:
+            *key: Parts of the cache key (e.g. principal, region, API name)
+
+        Returns:
+            The cached value, or None if missing, expired or unreadable
+        """
+        if self.refresh:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.ttl:
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("value")
+
+    def set(self, value, *key):
+        """
+        Write an entry atomically and evict old entries if over the limits
+
+        Args:
+            value: JSON-serializable value to store
+            *key: Parts of the cache key (e.g. principal, region, API name)
+        """
+        entry = {"stored_at": time.time(), "key": list(key), "value": value}
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entry, f)
+                os.replace(temp_path, self._path(key))
+            except Exception:
+                os.unlink(temp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            # Caching is best effort; a failed write only costs a later API call
+            return
+
+        self._evict()
+
+    def _evict(self):
+        """Remove expired entries, then least recently used ones over the limits"""
+        with self._lock:
+            entries = []
+            now = time.time()
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                return
+
+            for name in names:
+                if not name.endswith(_ENTRY_SUFFIX):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.ttl:
+                    self._remove(path)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+            # Oldest access first
+            entries.sort()
+            total_bytes = sum(size for _, size, _ in entries)
+            while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+                _, size, path = entries.pop(0)
+                self._remove(path)
+                total_bytes -= size
+
+    @staticmethod
+    def _remove(path):
+        """Delete an entry file, ignoring races with other runs"""
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+# Disk cache used by this run (None when caching is disabled)
+_disk_cache = None
+
+
+def enable_disk_cache(directory=None, ttl=DEFAULT_CACHE_TTL, refresh=False, max_entries=DEFAULT_CACHE_MAX_ENTRIES,
+                      max_bytes=DEFAULT_CACHE_MAX_BYTES):
+    """
+    Turn on the disk cache for this run
+
+    Args:
+        directory (str, optional): Cache directory (defaults to DEFAULT_CACHE_DIR)
+        ttl (int, optional): Seconds an entry stays valid
+        refresh (bool, optional): Ignore existing entries but still write new ones
+        max_entries (int, optional): Maximum number of entries kept
+        max_bytes (int, optional): Maximum total size of the entries in bytes
+
+    Returns:
+        DiskCache: The active cache
+    """
+    global _disk_cache
+    _disk_cache = DiskCache(directory, ttl=ttl, max_entries=max_entries, max_bytes=max_bytes, refresh=refresh)
+    return _disk_cache
+
+
+def disable_disk_cache():
+    """Turn off the disk cache for this run"""
+    global _disk_cache
+    _disk_cache = None
+
+
+def cache_enabled_by_env():
+    """Check whether the environment opts in to caching"""
+    return os.environ.get(CACHE_ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+
+
+def cache_principal(identity):
+    """
+    Get the principal whose cache entries a caller identity reads and writes
+
+    Assumed-role ARNs lose their session name, so every session of a role
+    (SSO, --org-sweep, ...) shares the role's entries.
+
+    Args:
+        identity (dict): get_caller_identity response (Account, Arn, UserId)
+
+    Returns:
+        str: The principal's ARN, or the account ID when there is no ARN
+    """
+    arn = identity.get("Arn")
+    if not arn:
+        return identity["Account"]
+    if ":assumed-role/" in arn:
+        arn = arn.rsplit("/", 1)[0]
+    return arn
+
+
+def cached_call(api, region, profile_name, fetch, *params):
+    """
+    Read an API result through the disk cache
+
+    Entries are keyed by the profile's principal (see cache_principal()), so
+    profiles using the same user or role share entries, while principals with
+    different permissions, even in the same account, never see each other's
+    results. When caching is off or the caller identity cannot be determined,
+    fetch() is simply called. Exceptions from fetch() propagate and are never
+    cached.
+
+    Args:
+        api (str): API name used in the cache key (e.g. 'list_foundation_models')
+        region (str): AWS region of the call
+        profile_name (str): AWS profile name used for the call
+        fetch (callable): Function making the API call and returning a JSON-serializable value
+        *params: Extra key parts identifying the request (e.g. a model ID)
+
+    Returns:
+        The cached or freshly fetched value
+    """
+    cache = _disk_cache
+    if cache is None:
+        return fetch()
+
+    try:
+        principal = cache_principal(client_pool.caller_identity(profile_name))
+    except Exception:
+        return fetch()
+
+    value = cache.get(principal, region, api, *params)
+    if value is None:
+        value = fetch()
+        cache.set(value, principal, region, api, *params)
+    return value
@@ -0,0 +1,149 @@
+"""
+Model catalog for the AWS Bedrock Access Checker
+
+Downloads each foundation model catalog and model detail record once per run
+and shares the parsed results between the region probe, the model table, the
+key model checks and advanced mode. When the disk cache is enabled, results
+are also reused across runs.
+"""
+
+import threading
+import time
+
+from bedrock_access_checker.cache import cached_call
+from bedrock_access_checker.clients import client_pool
+
+
+class ModelCatalog:
+    """
+    Thread-safe cache of list_foundation_models and get_foundation_model results
+
+    Catalogs are keyed by (profile, region) and model details by
+    (profile, region, model). Concurrent requests for the same key wait for a
+    single download instead of each making their own call. Failed downloads
+    are not cached, so a later check can retry them.
+
+    Entries are kept for the whole run unless a TTL is set, which long-lived
+    processes (see aio.py) use so that catalogs change when AWS's answer does.
+    """
+
+    def __init__(self, ttl=None):
+        """
+        Args:
+            ttl (float, optional): Seconds an entry is kept (None to keep it for the whole run)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # (value, time.monotonic() when stored) by key
+        self._entries = {}
+        self._key_locks = {}
+
+    def set_ttl(self, ttl):
+        """
+        Change how long entries are kept
+
+        Args:
+            ttl (float): Seconds an entry is kept (None to keep it for the whole run)
+        """
+        with self._lock:
+            self.ttl = ttl
+
+    def _lookup(self, key):
+        """Return (True, value) for a live entry, (False, None) otherwise; call with the lock held"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, stored = entry
+        if self.ttl is not None and time.monotonic() - stored >= self.ttl:
+            return False, None
+        return True, value
+
+    def _purge_expired(self):
+        """Drop expired entries so a long-lived process does not keep them forever; call with the lock held"""
+        if self.ttl is None:
+            return
+        cutoff = time.monotonic() - self.ttl
+        for key in [key for key, (_, stored) in self._entries.items() if stored <= cutoff]:
+            del self._entries[key]
+            self._key_locks.pop(key, None)
+
+    def _get_once(self, key, fetch):
+        """Return the cached value for key, calling fetch() at most once at a time"""
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Only one thread downloads a given entry; the others wait for it
+        with key_lock:
+            with self._lock:
+                found, value = self._lookup(key)
+                if found:
+                    return value
+
+            value = fetch()
+
+            with self._lock:
+                self._purge_expired()
+                self._entries[key] = (value, time.monotonic())
+            return value
+
+    def get_models(self, region, profile_name=None):
+        """
+        Get the foundation model summaries for a region
+
+        Args:
+            region (str): AWS region to list models in
+            profile_name (str, optional): AWS profile name to use
+
+        Returns:
+            list: The modelSummaries entries (shared, do not modify)
+        """
+        return self._get_once(
+            ("models", profile_name, region),
+            lambda: cached_call("list_foundation_models", region, profile_name,
+                                lambda: self._fetch_models(region, profile_name))
+        )
+
+    def get_model_details(self, model_id, region, profile_name=None):
+        """
+        Get the details of a foundation model
+
+        Args:
+            model_id (str): The model ID to describe
+            region (str): AWS region of the model
+            profile_name (str, optional): AWS profile name to use
+
+        Returns:
+            dict: The modelDetails record, or None if the response had none (shared, do not modify)
+        """
+        return self._get_once(
+            ("details", profile_name, region, model_id),
+            lambda: cached_call("get_foundation_model", region, profile_name,
+                                lambda: self._fetch_model_details(model_id, region, profile_name), model_id)
+        )
+
+    def _fetch_models(self, region, profile_name=None):
+        """Download a region's model catalog from the Bedrock API"""
+        client = client_pool.client('bedrock', region, profile_name)
+
+        # List foundation models - without parameters
+        response = client.list_foundation_models()
+        return response.get('modelSummaries', [])
+
+    def _fetch_model_details(self, model_id, region, profile_name=None):
+        """Download a model's details from the Bedrock API"""
+        client = client_pool.client('bedrock', region, profile_name)
+        response = client.get_foundation_model(modelIdentifier=model_id)
+        return response.get('modelDetails')
+
+    def clear(self):
+        """Forget all cached catalogs and model details"""
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+
+# Catalog shared by all checks in this run
+model_catalog = ModelCatalog()
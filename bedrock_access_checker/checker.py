@@ -9,6 +9,10 @@ import json
 import sys
 import os
 import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -20,6 +24,25 @@ from rich.align import Align
 from rich.layout import Layout
 from rich import print as rprint
 
+from bedrock_access_checker.catalog import model_catalog
+from bedrock_access_checker.clients import client_pool
+from bedrock_access_checker.invocation import (
+    invocation_prober,
+    invoke_test_prompt,
+    describe_invocation_error,
+    INVOKE_SUCCESS,
+    INVOKE_THROTTLED
+)
+from bedrock_access_checker.quotas import quota_indexes
+from bedrock_access_checker.results import (
+    CheckResults,
+    ComponentResult,
+    AvailabilityResult,
+    InvocationResults,
+    ModelDetails
+)
+from bedrock_access_checker.trace import traced
+
 # Modern imports to replace pkg_resources
 try:
     # Python 3.8+
@@ -28,24 +51,82 @@ except ImportError:
     # Python < 3.8
     from importlib_metadata import version, PackageNotFoundError
 
+class CheckerConsole(Console):
+    """
+    Rich console that can be switched off without rendering anything
+    
+    Rich's own quiet mode still renders everything it is asked to print and
+    only throws the result away. While this console is muted (for the whole
+    process with console.quiet, or for the current thread inside mute()),
+    print() returns at once, and new_table() hands out tables that keep
+    nothing, so checks skip the Rich work entirely (--quiet, the asyncio API).
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._muted = threading.local()
+    
+    @property
+    def muted(self):
+        """bool: True if output is switched off for the current thread"""
+        return self.quiet or getattr(self._muted, "value", False)
+    
+    @contextmanager
+    def mute(self):
+        """Switch output off for the current thread while the block runs"""
+        previous = getattr(self._muted, "value", False)
+        self._muted.value = True
+        try:
+            yield
+        finally:
+            self._muted.value = previous
+    
+    def print(self, *objects, **kwargs):
+        if self.muted:
+            return
+        super().print(*objects, **kwargs)
+
+class _NullTable:
+    """Table stand-in used while the console is muted"""
+    
+    def add_column(self, *args, **kwargs):
+        pass
+    
+    def add_row(self, *args, **kwargs):
+        pass
+
+def new_table(title=None, **kwargs):
+    """
+    Create a Rich table for the console (a stand-in that keeps nothing while it is muted)
+    
+    Args:
+        title (str, optional): Table title
+        **kwargs: Other Table arguments (box defaults to ROUNDED)
+        
+    Returns:
+        rich.table.Table: The table
+    """
+    if console.muted:
+        return _NullTable()
+    kwargs.setdefault("box", ROUNDED)
+    return Table(title=title, **kwargs)
+
 # Initialize Rich console
-console = Console()
+console = CheckerConsole()
 
 # Define status constants
 STATUS_SUCCESS = "✅ SUCCESS"
 STATUS_WARNING = "⚠️ WARNING"
 STATUS_ERROR = "❌ ERROR"
 STATUS_INFO = "ℹ️ INFO"
+STATUS_TIMEOUT = "⏱️ TIMED OUT"
 
-# Data structure to store check results
-check_results = {
-    "aws_credentials": {"status": None, "details": [], "errors": []},
-    "bedrock_regions": {"status": None, "available": [], "details": [], "errors": []},
-    "bedrock_runtime": {"status": None, "available": [], "details": [], "errors": []},
-    "bedrock_models": {"status": None, "available": [], "details": [], "errors": []},
-    "key_models": {"status": None, "available": [], "missing": [], "details": [], "errors": []},
-    "cost_estimates": {"models": {}, "details": []},
-}
+def new_check_results():
+    """Create an empty results structure for one profile's checks"""
+    return CheckResults()
+
+# Results used by checks called without per-profile results (kept for library callers)
+check_results = new_check_results()
 
 # Version comparison utility
 def is_version_less_than(v1, v2):
@@ -85,34 +166,38 @@ def list_available_profiles():
         console.print(f"[bold red]Error listing profiles: {e}[/bold red]")
         return []
 
-def check_aws_credentials(profile_name=None):
+@traced
+def check_aws_credentials(profile_name=None, results=None):
     """
     Check if AWS credentials are configured
     
     Args:
         profile_name (str, optional): AWS profile name to use
-    
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
+
     Returns:
         bool: True if valid credentials found, False otherwise
     """
-    if profile_name:
-        console.print(f"[bold]Checking AWS credentials for profile: [cyan]{profile_name}[/cyan]...[/bold]")
-    else:
-        console.print("[bold]Checking AWS credentials (default profile)...[/bold]")
-    
+    if results is None:
+        results = check_results
+
     # Reset results for this check
-    check_results["aws_credentials"] = {"status": None, "details": [], "errors": []}
+    results.aws_credentials = ComponentResult()
+    
+    # Sessions registered with the client pool (e.g. assumed roles in an org
+    # sweep) bring their own credentials and are not in the local configuration
+    registered = client_pool.is_registered(profile_name)
     
     # If profile specified, check if it exists
-    if profile_name:
+    if profile_name and not registered:
         available_profiles = list_available_profiles()
         if profile_name not in available_profiles:
             error_msg = f"Profile '{profile_name}' not found in AWS configuration!"
-            console.print(f"[bold red]{error_msg}[/bold red]")
-            console.print(f"[yellow]Available profiles: {', '.join(available_profiles) if available_profiles else 'None'}[/yellow]")
             
-            check_results["aws_credentials"]["status"] = STATUS_ERROR
-            check_results["aws_credentials"]["errors"].append(error_msg)
+            results.aws_credentials.status = STATUS_ERROR
+            results.aws_credentials.errors.append(error_msg)
+            results.aws_credentials.details.append(
+                f"Available profiles: {', '.join(available_profiles) if available_profiles else 'None'}")
             return False
     
     # Check environment variables (only relevant for default profile)
@@ -125,28 +210,23 @@ def check_aws_credentials(profile_name=None):
     config_file = os.path.expanduser("~/.aws/config")
     has_file_credentials = os.path.exists(credentials_file) or os.path.exists(config_file)
     
-    if not (has_env_credentials or has_file_credentials):
+    if not (registered or has_env_credentials or has_file_credentials):
         error_msg = "No AWS credentials found!"
-        console.print(f"[bold red]{error_msg}[/bold red]")
-        console.print("Please set up your AWS credentials using one of these methods:")
-        console.print("1. Run 'aws configure' to create credentials file")
-        console.print("2. Set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables (default profile only)")
         
-        check_results["aws_credentials"]["status"] = STATUS_ERROR
-        check_results["aws_credentials"]["errors"].append(error_msg)
+        results.aws_credentials.status = STATUS_ERROR
+        results.aws_credentials.errors.append(error_msg)
         return False
     
     # Try creating a session
     try:
-        session = boto3.Session(profile_name=profile_name)
+        session = client_pool.session(profile_name)
         credentials = session.get_credentials()
         
         if credentials is None:
             error_msg = "AWS credentials found but not valid!"
-            console.print(f"[bold red]{error_msg}[/bold red]")
             
-            check_results["aws_credentials"]["status"] = STATUS_ERROR
-            check_results["aws_credentials"]["errors"].append(error_msg)
+            results.aws_credentials.status = STATUS_ERROR
+            results.aws_credentials.errors.append(error_msg)
             return False
             
         # Show credential source (not the actual credentials)
@@ -158,35 +238,29 @@ def check_aws_credentials(profile_name=None):
                          "Unknown source"
         
         success_msg = f"Valid AWS credentials found from: {cred_source}"
-        console.print(f"[green]✓ {success_msg}[/green]")
-        check_results["aws_credentials"]["details"].append(success_msg)
+        results.aws_credentials.details.append(success_msg)
         
-        # Print boto3 version for debugging
+        # Record the boto3 version for debugging
         import botocore
         boto3_version = "unknown"
         try:
             boto3_version = version('boto3')
             botocore_version = version('botocore')
-            console.print(f"[dim]boto3 version: {boto3_version}[/dim]")
-            console.print(f"[dim]botocore version: {botocore_version}[/dim]")
-            check_results["aws_credentials"]["details"].append(f"boto3 version: {boto3_version}")
-            check_results["aws_credentials"]["details"].append(f"botocore version: {botocore_version}")
+            results.aws_credentials.details.append(f"boto3 version: {boto3_version}")
+            results.aws_credentials.details.append(f"botocore version: {botocore_version}")
             
             # Check if boto3 version might be too old
             MIN_BOTO3_VERSION = "1.28.0"
             if is_version_less_than(boto3_version, MIN_BOTO3_VERSION):
                 warning_msg = f"Your boto3 version ({boto3_version}) might be too old for Bedrock! Recommended version is {MIN_BOTO3_VERSION} or newer."
-                console.print(f"[yellow]Warning: {warning_msg}[/yellow]")
-                check_results["aws_credentials"]["status"] = STATUS_WARNING
-                check_results["aws_credentials"]["details"].append(f"WARNING: {warning_msg}")
+                results.aws_credentials.status = STATUS_WARNING
+                results.aws_credentials.details.append(f"WARNING: {warning_msg}")
         except PackageNotFoundError:
-            console.print("[dim]Could not determine boto3 version[/dim]")
-            check_results["aws_credentials"]["details"].append("Could not determine boto3 version")
+            results.aws_credentials.details.append("Could not determine boto3 version")
         
-        # Print account information if possible (without exposing sensitive data)
+        # Record account information if possible (without exposing sensitive data)
         try:
-            sts_client = session.client('sts')
-            identity = sts_client.get_caller_identity()
+            identity = client_pool.caller_identity(profile_name)
             account_id = identity['Account']
             user_id = identity['UserId']
             # Mask most of the account ID for security
@@ -198,45 +272,26 @@ def check_aws_credentials(profile_name=None):
             else:
                 masked_user = "****"
             
-            console.print(f"[dim]AWS Account: {masked_account}[/dim]")
-            console.print(f"[dim]Identity Type: {masked_user}[/dim]")
-            check_results["aws_credentials"]["details"].append(f"AWS Account: {masked_account}")
-            check_results["aws_credentials"]["details"].append(f"Identity Type: {masked_user}")
+            results.aws_credentials.details.append(f"AWS Account: {masked_account}")
+            results.aws_credentials.details.append(f"Identity Type: {masked_user}")
         except Exception:
             # Don't show error if this fails
             pass
         
         # If we got here and status is still None, set it to SUCCESS
-        if check_results["aws_credentials"]["status"] is None:
-            check_results["aws_credentials"]["status"] = STATUS_SUCCESS
+        if results.aws_credentials.status is None:
+            results.aws_credentials.status = STATUS_SUCCESS
             
         return True
         
     except Exception as e:
         error_msg = f"Error checking AWS credentials: {e}"
-        console.print(f"[bold red]{error_msg}[/bold red]")
         
-        check_results["aws_credentials"]["status"] = STATUS_ERROR
-        check_results["aws_credentials"]["errors"].append(error_msg)
+        results.aws_credentials.status = STATUS_ERROR
+        results.aws_credentials.errors.append(error_msg)
         return False
 
-def check_bedrock_regions(profile_name=None, regions_to_check=None):
-    """
-    Check which regions have Bedrock available
-    
-    Args:
-        profile_name (str, optional): AWS profile name to use
-        regions_to_check (list, optional): Specific regions to check
-    
-    Returns:
-        list: List of available regions
-    """
-    console.print("\n[bold]Checking Bedrock availability in regions...[/bold]")
-    
-    # Reset results for this check
-    check_results["bedrock_regions"] = {"status": None, "available": [], "details": [], "errors": []}
-    
-    # All regions where Bedrock is available (define at module level for import in CLI)
+# All regions where Bedrock is available (define at module level for import in CLI)
 all_bedrock_regions = [
     'us-east-1',    # N. Virginia
     'us-west-2',    # Oregon
@@ -250,222 +305,230 @@ all_bedrock_regions = [
     'ca-central-1',   # Canada
 ]
 
-def check_bedrock_regions(profile_name=None, regions_to_check=None):
+# Regions checked when none are selected
+DEFAULT_REGIONS = ['us-east-1', 'us-west-2']
+
+# Default number of regions probed concurrently
+DEFAULT_MAX_WORKERS = 10
+
+@traced
+def _probe_bedrock_region(region, profile_name=None):
+    """
+    Probe a single region for Bedrock availability
+
+    This runs in a worker thread, so it only talks to AWS and returns its
+    findings; all check_results updates happen in the caller.
+
+    Args:
+        region (str): AWS region to probe
+        profile_name (str, optional): AWS profile name to use
+
+    Returns:
+        dict: Probe outcome with status, message and a detail or error line
+    """
+    try:
+        # Listing the models proves access and fills the shared catalog
+        model_catalog.get_models(region, profile_name)
+        return {
+            "status": "available",
+            "message": "Successfully connected",
+            "detail": f"Region {region}: Available - Successfully connected",
+        }
+    except Exception as e:
+        error_msg = str(e)
+        if "AccessDeniedException" in error_msg:
+            return {"status": "denied", "message": "Permission denied",
+                    "error": f"Region {region}: Permission denied"}
+        elif "not authorized" in error_msg.lower():
+            return {"status": "denied", "message": "Not authorized",
+                    "error": f"Region {region}: Not authorized"}
+        elif "Could not connect to the endpoint URL" in error_msg:
+            return {"status": "not_available", "message": "Bedrock not available in this region",
+                    "detail": f"Region {region}: Not available"}
+        elif "ResourceNotFoundException" in error_msg:
+            return {"status": "not_available", "message": "Bedrock not found in this region",
+                    "detail": f"Region {region}: Not available - Service not found"}
+        else:
+            return {"status": "error", "message": error_msg[:50],
+                    "error": f"Region {region}: Error - {error_msg}"}
+
+@traced
+def check_bedrock_regions(profile_name=None, regions_to_check=None, max_workers=None, results=None, deadline=None):
     """
     Check which regions have Bedrock available
-    
+
+    Regions are probed concurrently, but the recorded details and the list
+    of available regions always follow the order of regions_to_check.
+    Regions still being probed at the deadline are reported as timed out.
+
     Args:
         profile_name (str, optional): AWS profile name to use
         regions_to_check (list, optional): Specific regions to check
-    
+        max_workers (int, optional): Maximum number of regions to probe at once
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
+        deadline (float, optional): time.monotonic() value to stop waiting for probes at
+
     Returns:
         list: List of available regions
     """
-    console.print("\n[bold]Checking Bedrock availability in regions...[/bold]")
-    
+    if results is None:
+        results = check_results
+
     # Reset results for this check
-    check_results["bedrock_regions"] = {"status": None, "available": [], "details": [], "errors": []}
-    
+    results.bedrock_regions = AvailabilityResult()
+
     # Use provided regions or default to common ones
-    regions_to_check = regions_to_check if regions_to_check else ['us-east-1', 'us-west-2']
-    
-    # Create a table for results
-    table = Table(title="Bedrock Region Availability", box=ROUNDED)
-    table.add_column("Region", style="cyan")
-    table.add_column("Status", style="green")
-    table.add_column("Message", style="yellow")
-    
+    regions_to_check = regions_to_check if regions_to_check else DEFAULT_REGIONS
+
     available_regions = []
     region_statuses = {}
-    
-    # Create session with profile if specified
-    session = boto3.Session(profile_name=profile_name)
-    
-    for region in regions_to_check:
-        try:
-            # Try to create a Bedrock client
-            client = session.client('bedrock', region_name=region)
-            
-            # Try a simple operation - without parameters
-            try:
-                client.list_foundation_models()
-                table.add_row(region, "✓ Available", "Successfully connected")
-                available_regions.append(region)
-                region_statuses[region] = {"status": "available", "message": "Successfully connected"}
-                check_results["bedrock_regions"]["details"].append(f"Region {region}: Available - Successfully connected")
-            except Exception as op_error:
-                error_msg = str(op_error)
-                if "AccessDeniedException" in error_msg:
-                    table.add_row(region, "✗ No access", "Permission denied")
-                    region_statuses[region] = {"status": "denied", "message": "Permission denied"}
-                    check_results["bedrock_regions"]["errors"].append(f"Region {region}: Permission denied")
-                elif "not authorized" in error_msg.lower():
-                    table.add_row(region, "✗ No access", "Not authorized")
-                    region_statuses[region] = {"status": "denied", "message": "Not authorized"}
-                    check_results["bedrock_regions"]["errors"].append(f"Region {region}: Not authorized")
-                else:
-                    table.add_row(region, "✗ Error", error_msg[:50])
-                    region_statuses[region] = {"status": "error", "message": error_msg[:50]}
-                    check_results["bedrock_regions"]["errors"].append(f"Region {region}: Error - {error_msg}")
-                
-        except Exception as e:
-            error_msg = str(e)
-            if "Could not connect to the endpoint URL" in error_msg:
-                table.add_row(region, "✗ Not available", "Bedrock not available in this region")
-                region_statuses[region] = {"status": "not_available", "message": "Bedrock not available in this region"}
-                check_results["bedrock_regions"]["details"].append(f"Region {region}: Not available")
-            elif "ResourceNotFoundException" in error_msg:
-                table.add_row(region, "✗ Not available", "Bedrock not found in this region")
-                region_statuses[region] = {"status": "not_available", "message": "Bedrock not found in this region"}
-                check_results["bedrock_regions"]["details"].append(f"Region {region}: Not available - Service not found")
-            else:
-                table.add_row(region, "✗ Error", error_msg[:50])
-                region_statuses[region] = {"status": "error", "message": error_msg[:50]}
-                check_results["bedrock_regions"]["errors"].append(f"Region {region}: Error - {error_msg}")
-    
-    console.print(table)
-    
+
+    # Fan out one probe per region
+    workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(regions_to_check)))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = [
+        executor.submit(_probe_bedrock_region, region, profile_name)
+        for region in regions_to_check
+    ]
+    timeout = None if deadline is None else max(0, deadline - time.monotonic())
+    wait(futures, timeout=timeout)
+
+    # Collect in submission order so the results are deterministic
+    for region, future in zip(regions_to_check, futures):
+        if not future.done():
+            future.cancel()
+            outcome = {
+                "status": "timed_out",
+                "message": "No response before the deadline",
+                "error": f"Region {region}: Timed out",
+            }
+        else:
+            outcome = future.result()
+
+        region_statuses[region] = {"status": outcome["status"], "message": outcome["message"]}
+
+        if outcome["status"] == "available":
+            available_regions.append(region)
+        if "detail" in outcome:
+            results.bedrock_regions.details.append(outcome["detail"])
+        else:
+            results.bedrock_regions.errors.append(outcome["error"])
+
+    # Do not wait for probes that timed out; they end within the client timeouts
+    executor.shutdown(wait=False)
+
     # Store available regions in results
-    check_results["bedrock_regions"]["available"] = available_regions
-    
+    results.bedrock_regions.available = available_regions
+
     # Set overall status based on results
     if available_regions:
-        check_results["bedrock_regions"]["status"] = STATUS_SUCCESS
+        results.bedrock_regions.status = STATUS_SUCCESS
     elif any(status["status"] == "denied" for status in region_statuses.values()):
-        check_results["bedrock_regions"]["status"] = STATUS_ERROR
+        results.bedrock_regions.status = STATUS_ERROR
+    elif any(status["status"] == "timed_out" for status in region_statuses.values()):
+        results.bedrock_regions.status = STATUS_TIMEOUT
     elif all(status["status"] == "not_available" for status in region_statuses.values()):
-        check_results["bedrock_regions"]["status"] = STATUS_WARNING
+        results.bedrock_regions.status = STATUS_WARNING
     else:
-        check_results["bedrock_regions"]["status"] = STATUS_ERROR
-    
+        results.bedrock_regions.status = STATUS_ERROR
+
     return available_regions
 
-def check_bedrock_runtime_access(region, profile_name=None):
+@traced
+def check_bedrock_runtime_access(region, profile_name=None, results=None):
     """
     Check if bedrock-runtime service is accessible
     
     Args:
         region (str): AWS region to check
         profile_name (str, optional): AWS profile name to use
-    
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
+
     Returns:
         bool: True if accessible, False otherwise
     """
-    console.print(f"\n[bold]Checking bedrock-runtime service in {region}...[/bold]")
-    
-    # Initialize result for this region if not present
-    if "bedrock_runtime" not in check_results:
-        check_results["bedrock_runtime"] = {"status": None, "available": [], "details": [], "errors": []}
-    
+    if results is None:
+        results = check_results
+
     try:
-        # Create session with profile if specified
-        session = boto3.Session(profile_name=profile_name)
-        
-        # Create bedrock-runtime client
-        client = session.client('bedrock-runtime', region_name=region)
+        # Get the pooled bedrock-runtime client
+        client = client_pool.client('bedrock-runtime', region, profile_name)
         
         # We can't make a simple call without invoking a model, so we'll just check if the client initializes
         success_msg = f"bedrock-runtime client created successfully in {region}"
-        console.print(f"[green]✓ {success_msg}[/green]")
         
         # Update results
-        check_results["bedrock_runtime"]["available"].append(region)
-        check_results["bedrock_runtime"]["details"].append(success_msg)
+        results.bedrock_runtime.available.append(region)
+        results.bedrock_runtime.details.append(success_msg)
         
         # Set status to success if not already set to an error
-        if check_results["bedrock_runtime"]["status"] != STATUS_ERROR:
-            check_results["bedrock_runtime"]["status"] = STATUS_SUCCESS
+        if results.bedrock_runtime.status != STATUS_ERROR:
+            results.bedrock_runtime.status = STATUS_SUCCESS
             
         return True
     except Exception as e:
         error_msg = f"Error creating bedrock-runtime client in {region}: {e}"
-        console.print(f"[bold red]{error_msg}[/bold red]")
         
         # Update results
-        check_results["bedrock_runtime"]["errors"].append(error_msg)
+        results.bedrock_runtime.errors.append(error_msg)
         
         # Set status to error if there are no available regions
-        if not check_results["bedrock_runtime"]["available"]:
-            check_results["bedrock_runtime"]["status"] = STATUS_ERROR
+        if not results.bedrock_runtime.available:
+            results.bedrock_runtime.status = STATUS_ERROR
             
         return False
 
-def check_bedrock_models(region, profile_name=None):
+@traced
+def check_bedrock_models(region, profile_name=None, results=None):
     """
     Check which Bedrock models are available in the specified region
     
     Args:
         region (str): AWS region to check
         profile_name (str, optional): AWS profile name to use
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
     """
-    console.print(f"\n[bold]Checking available Bedrock models in {region}...[/bold]")
-    
-    # Initialize result for this region if not present
-    if "bedrock_models" not in check_results:
-        check_results["bedrock_models"] = {"status": None, "available": [], "details": [], "errors": []}
-    
+    if results is None:
+        results = check_results
+
     try:
-        # Create session with profile if specified
-        session = boto3.Session(profile_name=profile_name)
-        
-        # Create Bedrock client
-        client = session.client('bedrock', region_name=region)
-        
-        # List foundation models - without parameters
-        response = client.list_foundation_models()
-        
-        # Create a table for results
-        table = Table(title=f"Bedrock Models in {region}", box=ROUNDED)
-        table.add_column("Model ID", style="cyan")
-        table.add_column("Provider", style="blue")
-        table.add_column("Status", style="green")
+        # Get the region's model catalog (usually already fetched by the region check)
+        model_summaries = model_catalog.get_models(region, profile_name)
         
         # Check if any models are returned
-        if 'modelSummaries' not in response or not response['modelSummaries']:
+        if not model_summaries:
             warning_msg = f"No models found in {region}. Your account may not have Bedrock enabled."
-            console.print(f"[yellow]{warning_msg}[/yellow]")
-            check_results["bedrock_models"]["details"].append(warning_msg)
+            results.bedrock_models.details.append(warning_msg)
             
             # Set warning status if no models found but no error occurred
-            if check_results["bedrock_models"]["status"] is None:
-                check_results["bedrock_models"]["status"] = STATUS_WARNING
+            if results.bedrock_models.status is None:
+                results.bedrock_models.status = STATUS_WARNING
                 
             return
         
-        # Process models
-        available_models = []
-        for model in response.get('modelSummaries', []):
-            model_id = model.get('modelId')
-            provider = model.get('providerName', 'Unknown')
-            
-            # Instead of checking for access, we'll just show if the model is listed
-            table.add_row(model_id, provider, "Listed")
-            
-            # Add to available models
-            available_models.append(model_id)
-            check_results["bedrock_models"]["available"].append(model_id)
-        
-        console.print(table)
+        # Record the region's models (each model ID is kept once across regions)
+        available_models = [model.get('modelId') for model in model_summaries]
+        results.bedrock_models.available.add(region, available_models)
         
         # Add success message to details
         count_msg = f"Found {len(available_models)} models in {region}"
-        check_results["bedrock_models"]["details"].append(count_msg)
+        results.bedrock_models.details.append(count_msg)
         
         # Set success status if models are found and no errors
-        if available_models and check_results["bedrock_models"]["status"] is None:
-            check_results["bedrock_models"]["status"] = STATUS_SUCCESS
+        if available_models and results.bedrock_models.status is None:
+            results.bedrock_models.status = STATUS_SUCCESS
         
     except Exception as e:
         error_msg = f"Error checking Bedrock models in {region}: {e}"
-        console.print(f"[bold red]{error_msg}[/bold red]")
         
         # Update results
-        check_results["bedrock_models"]["errors"].append(error_msg)
+        results.bedrock_models.errors.append(error_msg)
         
         # Set error status if there are errors and no models found
-        if not check_results["bedrock_models"]["available"]:
-            check_results["bedrock_models"]["status"] = STATUS_ERROR
+        if not results.bedrock_models.available:
+            results.bedrock_models.status = STATUS_ERROR
 
+@traced
 def test_model_invocation(model_id, region, profile_name=None):
     """
     Test a simple model invocation to verify full access
@@ -479,87 +542,13 @@ def test_model_invocation(model_id, region, profile_name=None):
         bool: True if invocation successful, False otherwise
         str: Response or error message
     """
-    console.print(f"[dim]Testing model invocation for {model_id}...[/dim]")
-    
     try:
-        # Create session with profile if specified
-        session = boto3.Session(profile_name=profile_name)
-        
-        # Create bedrock-runtime client
-        client = session.client('bedrock-runtime', region_name=region)
-        
-        # Prepare a minimal test prompt based on model type
-        if "embed" in model_id.lower():
-            # Embedding model
-            request_body = {
-                "inputText": "Hello, world!"
-            }
-        elif "anthropic.claude" in model_id.lower():
-            # Claude model
-            request_body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 10,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [{"type": "text", "text": "Say hello in 5 words or less."}]
-                    }
-                ]
-            }
-        elif "cohere" in model_id.lower():
-            # Cohere model
-            request_body = {
-                "prompt": "Say hello in 5 words or less.",
-                "max_tokens": 10
-            }
-        elif "meta.llama" in model_id.lower():
-            # Llama model
-            request_body = {
-                "prompt": "Human: Say hello in 5 words or less.\nAssistant:",
-                "max_gen_len": 10
-            }
-        elif "titan" in model_id.lower():
-            # Titan model
-            request_body = {
-                "inputText": "Say hello in 5 words or less.",
-                "textGenerationConfig": {
-                    "maxTokenCount": 10
-                }
-            }
-        else:
-            # Generic format - may not work with all models
-            request_body = {
-                "prompt": "Say hello in 5 words or less.",
-                "max_tokens": 10
-            }
-        
-        # Invoke the model
-        response = client.invoke_model(
-            modelId=model_id,
-            body=json.dumps(request_body)
-        )
-        
-        # Parse the response
-        response_body = json.loads(response['body'].read().decode('utf-8'))
-        
-        # Return success with shortened response
-        response_str = str(response_body)[:50] + "..." if len(str(response_body)) > 50 else str(response_body)
-        return True, f"Success: {response_str}"
-    
+        return True, invoke_test_prompt(model_id, region, profile_name)
     except Exception as e:
-        error_msg = str(e)
-        if "AccessDeniedException" in error_msg:
-            return False, "Access denied"
-        elif "ResourceNotFoundException" in error_msg:
-            return False, "Model not found"
-        elif "ValidationException" in error_msg:
-            return False, f"Validation error: {error_msg[:50]}..."
-        elif "ThrottlingException" in error_msg:
-            return False, "Rate limited"
-        else:
-            return False, f"Error: {error_msg[:50]}..."
+        return False, describe_invocation_error(e)
 
-def check_sagemaker_jumpstart_alternatives(missing_model_ids, region, profile_name=None):
+@traced
+def check_sagemaker_jumpstart_alternatives(missing_model_ids, region, profile_name=None, results=None):
     """
     Check for SageMaker JumpStart alternatives for missing Bedrock models
     
@@ -567,15 +556,17 @@ def check_sagemaker_jumpstart_alternatives(missing_model_ids, region, profile_na
         missing_model_ids (list): List of missing Bedrock model IDs
         region (str): AWS region to check in
         profile_name (str, optional): AWS profile name to use
-        
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
+
     Returns:
         dict: Dictionary mapping missing models to alternatives
     """
-    console.print(f"\n[bold]Checking SageMaker JumpStart alternatives in {region}...[/bold]")
-    
-    # Initialize SageMaker JumpStart alternatives in check_results if not present
-    if "sagemaker_alternatives" not in check_results:
-        check_results["sagemaker_alternatives"] = {}
+    if results is None:
+        results = check_results
+
+    # Initialize SageMaker JumpStart alternatives if not present
+    if results.sagemaker_alternatives is None:
+        results.sagemaker_alternatives = {}
     
     # Create a mapping of Bedrock models to similar JumpStart models
     # This is a manually curated list based on model capabilities
@@ -621,18 +612,12 @@ def check_sagemaker_jumpstart_alternatives(missing_model_ids, region, profile_na
     alternatives_found = {}
     
     try:
-        # Create session with profile if specified
-        session = boto3.Session(profile_name=profile_name)
+        # Get the shared session for the profile
+        client_pool.session(profile_name)
         
-        # Create SageMaker client
+        # Get the pooled SageMaker client
         try:
-            sm_client = session.client('sagemaker', region_name=region)
-            
-            # Create a table for alternatives
-            table = Table(title=f"SageMaker JumpStart Alternatives", box=ROUNDED)
-            table.add_column("Missing Bedrock Model", style="red")
-            table.add_column("JumpStart Alternative", style="green")
-            table.add_column("Notes", style="cyan")
+            sm_client = client_pool.client('sagemaker', region, profile_name)
             
             # Check availability of alternatives for each missing model
             for full_model_id in missing_model_ids:
@@ -660,37 +645,21 @@ def check_sagemaker_jumpstart_alternatives(missing_model_ids, region, profile_na
                     if matched_alternatives:
                         # Store the alternatives
                         alternatives_found[full_model_id] = matched_alternatives
-                        check_results["sagemaker_alternatives"][full_model_id] = matched_alternatives
-                        
-                        # Add to the table
-                        for alt in matched_alternatives:
-                            table.add_row(
-                                full_model_id if matched_alternatives.index(alt) == 0 else "", 
-                                f"{alt['name']} ({alt['model_id']})",
-                                alt['notes']
-                            )
-            
-            # Display the alternatives table if any found
-            if alternatives_found:
-                console.print(table)
-                console.print(f"[green]✓ Found SageMaker JumpStart alternatives for {len(alternatives_found)} missing Bedrock models[/green]")
-            else:
-                console.print("[yellow]No SageMaker JumpStart alternatives found for your missing models[/yellow]")
+                        results.sagemaker_alternatives[full_model_id] = matched_alternatives
             
             return alternatives_found
             
         except Exception as e:
             error_msg = f"Error checking SageMaker JumpStart alternatives: {e}"
-            console.print(f"[yellow]{error_msg}[/yellow]")
-            check_results["sagemaker_alternatives"]["error"] = error_msg
+            results.sagemaker_alternatives["error"] = error_msg
             return {}
             
     except Exception as e:
         error_msg = f"Error initializing SageMaker client: {e}"
-        console.print(f"[yellow]{error_msg}[/yellow]")
-        check_results["sagemaker_alternatives"]["error"] = error_msg
+        results.sagemaker_alternatives["error"] = error_msg
         return {}
 
+@traced
 def get_model_quotas_and_details(model_id, region, profile_name=None):
     """
     Get detailed information about a model's quotas and inference capabilities
@@ -711,59 +680,23 @@ def get_model_quotas_and_details(model_id, region, profile_name=None):
     }
     
     try:
-        # Create session with profile if specified
-        session = boto3.Session(profile_name=profile_name)
+        # Get the shared session for the profile
+        client_pool.session(profile_name)
         
-        # Get account quotas for the model using service quotas API
+        # Look up the model's quotas in the region's quota index (listed once per region)
         try:
-            quotas_client = session.client('service-quotas', region_name=region)
-            
-            # Get service code for Bedrock
-            service_code = "bedrock"
-            
-            # Try to get quotas for the model
-            response = quotas_client.list_service_quotas(
-                ServiceCode=service_code
-            )
-            
-            # Filter quotas related to the model (this is approximate as model IDs may not match quota names exactly)
-            model_name_parts = model_id.split('.')[-1].split('-')
-            for quota in response.get('Quotas', []):
-                quota_name = quota.get('QuotaName', '').lower()
-                
-                # Check if quota is related to this model by looking for substrings
-                relevant = False
-                for part in model_name_parts:
-                    if len(part) > 3 and part.lower() in quota_name:  # Only consider meaningful parts
-                        relevant = True
-                        break
-                
-                # Also include general throughput/rate quotas
-                if "throughput" in quota_name or "rate" in quota_name:
-                    relevant = True
-                    
-                if relevant:
-                    details["quotas"][quota.get('QuotaName')] = {
-                        "value": quota.get('Value'),
-                        "unit": quota.get('Unit'),
-                        "adjustable": quota.get('Adjustable', False)
-                    }
+            quota_index = quota_indexes.get_index(region, profile_name)
+            details["quotas"].update(quota_index.quotas_for_model(model_id))
         except Exception as e:
             details["quotas"]["error"] = f"Could not fetch quotas: {str(e)}"
         
         # Get model details from Bedrock API
         try:
-            bedrock_client = session.client('bedrock', region_name=region)
-            
-            # Get model details
-            response = bedrock_client.get_foundation_model(
-                modelIdentifier=model_id
-            )
+            # Get model details (shared with other checks and the disk cache)
+            model_details = model_catalog.get_model_details(model_id, region, profile_name)
             
             # Extract useful information
-            if 'modelDetails' in response:
-                model_details = response.get('modelDetails', {})
-                
+            if model_details is not None:
                 # Get inference parameters
                 if 'inferenceParameters' in model_details:
                     details["inference_params"] = model_details['inferenceParameters']
@@ -789,200 +722,286 @@ def get_model_quotas_and_details(model_id, region, profile_name=None):
     except Exception as e:
         return {"error": str(e)}
 
-def check_specific_models_simple(region, profile_name=None, test_invocation=False, advanced_mode=False):
+# Models checked for common Bedrock use cases, with their purpose
+needed_models = [
+    # Embedding models
+    {"id": "amazon.titan-embed-text-v1", "purpose": "Text embeddings (V1)"},
+    {"id": "amazon.titan-embed-text-v2:0", "purpose": "Text embeddings (V2)"},
+    
+    # Claude 3 models - latest and most advanced
+    {"id": "anthropic.claude-3-opus-20240229-v1:0", "purpose": "Text generation (Flagship)"},
+    {"id": "anthropic.claude-3-sonnet-20240229-v1:0", "purpose": "Text generation (Mid-tier)"},
+    {"id": "anthropic.claude-3-haiku-20240307-v1:0", "purpose": "Text generation (Fastest)"},
+    
+    # Claude 2 models - previous generation
+    {"id": "anthropic.claude-v2:1", "purpose": "Text generation (Previous gen)"},
+    {"id": "anthropic.claude-v2", "purpose": "Text generation (Previous gen)"},
+    {"id": "anthropic.claude-instant-v1", "purpose": "Text generation (Previous gen, fast)"},
+    
+    # Other useful models
+    {"id": "amazon.titan-text-express-v1", "purpose": "Amazon's text model"},
+    {"id": "cohere.command-text-v14", "purpose": "Cohere's text model"},
+    {"id": "meta.llama2-13b-chat-v1", "purpose": "Meta's open model"}
+]
+
+@traced
+def check_key_models(region, profile_name=None, results=None):
     """
-    Check specific models needed for common Bedrock use cases
+    Check which of the key models are listed in a region
     
     Args:
         region (str): AWS region to check
         profile_name (str, optional): AWS profile name to use
-        test_invocation (bool, optional): Whether to test model invocation
-        advanced_mode (bool, optional): Whether to show detailed model information
-    """
-    console.print(f"\n[bold]Checking key Bedrock model access in {region}...[/bold]")
-    
-    # Initialize result for key models if not present
-    if "key_models" not in check_results:
-        check_results["key_models"] = {"status": None, "available": [], "missing": [], "details": [], "errors": []}
-    
-    # Create a table for key models
-    table = Table(title=f"Key Models in {region}", box=ROUNDED)
-    table.add_column("Model", style="cyan")
-    table.add_column("Listed", style="green")
-    if test_invocation:
-        table.add_column("Invocation", style="magenta")
-    table.add_column("Purpose", style="blue")
-    
-    # Define models to check with their purpose
-    needed_models = [
-        # Embedding models
-        {"id": "amazon.titan-embed-text-v1", "purpose": "Text embeddings (V1)"},
-        {"id": "amazon.titan-embed-text-v2:0", "purpose": "Text embeddings (V2)"},
-        
-        # Claude 3 models - latest and most advanced
-        {"id": "anthropic.claude-3-opus-20240229-v1:0", "purpose": "Text generation (Flagship)"},
-        {"id": "anthropic.claude-3-sonnet-20240229-v1:0", "purpose": "Text generation (Mid-tier)"},
-        {"id": "anthropic.claude-3-haiku-20240307-v1:0", "purpose": "Text generation (Fastest)"},
-        
-        # Claude 2 models - previous generation
-        {"id": "anthropic.claude-v2:1", "purpose": "Text generation (Previous gen)"},
-        {"id": "anthropic.claude-v2", "purpose": "Text generation (Previous gen)"},
-        {"id": "anthropic.claude-instant-v1", "purpose": "Text generation (Previous gen, fast)"},
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
         
-        # Other useful models
-        {"id": "amazon.titan-text-express-v1", "purpose": "Amazon's text model"},
-        {"id": "cohere.command-text-v14", "purpose": "Cohere's text model"},
-        {"id": "meta.llama2-13b-chat-v1", "purpose": "Meta's open model"}
-    ]
-    
+    Returns:
+        list: IDs of the key models available in the region
+    """
+    if results is None:
+        results = check_results
+
     try:
-        # Create session with profile if specified
-        session = boto3.Session(profile_name=profile_name)
-        
-        # Create bedrock client
-        client = session.client('bedrock', region_name=region)
+        # Get all available models from the shared catalog
+        model_summaries = model_catalog.get_models(region, profile_name)
         
-        # Get all available models
-        response = client.list_foundation_models()
-        
-        # Extract model IDs
-        available_models = [model.get('modelId') for model in response.get('modelSummaries', [])]
+        # Extract model IDs (as a set, so each key model is a hash lookup)
+        available_models = {model.get('modelId') for model in model_summaries}
         
         # Check which needed models are available
         found_models = []
-        missing_models = []
-        
-        # Initialize invocation results in check_results if testing invocation
-        if test_invocation and "model_invocations" not in check_results:
-            check_results["model_invocations"] = {"successful": [], "failed": [], "details": []}
-            
-        # Initialize advanced details if in advanced mode
-        if advanced_mode and "model_details" not in check_results:
-            check_results["model_details"] = {}
         
         for model_info in needed_models:
             model_id = model_info["id"]
-            purpose = model_info["purpose"]
             
             if model_id in available_models:
-                status_msg = f"Model {model_id} is available"
-                console.print(f"[green]✓ {status_msg}[/green]")
-                
-                # Add to available models in results if not already there
-                if model_id not in check_results["key_models"]["available"]:
-                    check_results["key_models"]["available"].append(model_id)
-                
-                check_results["key_models"]["details"].append(f"{model_id}: Available")
-                
-                # Advanced mode processing
-                model_details_table = None
-                if advanced_mode:
-                    # Get detailed model information
-                    console.print(f"[dim]  Getting detailed information for {model_id}...[/dim]")
-                    model_details = get_model_quotas_and_details(model_id, region, profile_name)
-                    
-                    # Store in results
-                    check_results["model_details"][model_id] = model_details
-                    
-                    # Create a detailed table for this model
-                    model_details_table = Table(title=f"Details for {model_id}", box=ROUNDED)
-                    model_details_table.add_column("Parameter", style="cyan")
-                    model_details_table.add_column("Value", style="yellow")
-                    
-                    # Add basic specs
-                    if "specs" in model_details and model_details["specs"]:
-                        for key, value in model_details["specs"].items():
-                            if key != "error":
-                                model_details_table.add_row(f"Spec: {key}", str(value))
-                    
-                    # Add inference parameters
-                    if "inference_params" in model_details and model_details["inference_params"]:
-                        for key, value in model_details["inference_params"].items():
-                            model_details_table.add_row(f"Param: {key}", str(value))
-                    
-                    # Add quota information
-                    if "quotas" in model_details and model_details["quotas"]:
-                        for key, value in model_details["quotas"].items():
-                            if key != "error":
-                                if isinstance(value, dict):
-                                    quota_str = f"{value.get('value')} {value.get('unit', '')}"
-                                    if value.get('adjustable'):
-                                        quota_str += " (adjustable)"
-                                    model_details_table.add_row(f"Quota: {key}", quota_str)
-                                else:
-                                    model_details_table.add_row(f"Quota: {key}", str(value))
-                
-                # Test invocation if requested
-                if test_invocation:
-                    invoke_success, invoke_msg = test_model_invocation(model_id, region, profile_name)
-                    
-                    if invoke_success:
-                        table.add_row(model_id, "✅ Available", "✅ Success", purpose)
-                        console.print(f"[green]  ✓ Invocation successful: {invoke_msg}[/green]")
-                        
-                        # Add to successful invocations
-                        if model_id not in check_results["model_invocations"]["successful"]:
-                            check_results["model_invocations"]["successful"].append(model_id)
-                        
-                        check_results["model_invocations"]["details"].append(f"{model_id}: {invoke_msg}")
-                    else:
-                        table.add_row(model_id, "✅ Available", f"❌ Failed: {invoke_msg}", purpose)
-                        console.print(f"[yellow]  ✗ Invocation failed: {invoke_msg}[/yellow]")
-                        
-                        # Add to failed invocations
-                        if model_id not in check_results["model_invocations"]["failed"]:
-                            check_results["model_invocations"]["failed"].append(model_id)
-                        
-                        check_results["model_invocations"]["details"].append(f"{model_id}: Failed - {invoke_msg}")
-                else:
-                    table.add_row(model_id, "✅ Available", purpose)
-                
-                # Display detailed model information if in advanced mode
-                if advanced_mode and model_details_table:
-                    console.print(model_details_table)
+                # Add to available models in results if not already there; a model
+                # listed in any checked region is no longer missing
+                if model_id not in results.key_models.available:
+                    results.key_models.available.append(model_id)
+                if model_id in results.key_models.missing:
+                    results.key_models.missing.remove(model_id)
                 
+                results.key_models.details.append(f"{model_id}: Available")
                 found_models.append(model_id)
             else:
-                status_msg = f"Model {model_id} is not available"
-                console.print(f"[yellow]✗ {status_msg}[/yellow]")
-                
-                if test_invocation:
-                    table.add_row(model_id, "❌ Not Available", "❌ Not Tested", purpose)
-                else:
-                    table.add_row(model_id, "❌ Not Available", purpose)
+                # Add to missing models in results unless another region lists it
+                if model_id not in results.key_models.missing and model_id not in results.key_models.available:
+                    results.key_models.missing.append(model_id)
                 
-                missing_models.append(model_id)
-                
-                # Add to missing models in results if not already there
-                if model_id not in check_results["key_models"]["missing"]:
-                    check_results["key_models"]["missing"].append(model_id)
-                
-                check_results["key_models"]["details"].append(f"{model_id}: Not Available")
-        
-        console.print(table)
+                results.key_models.details.append(f"{model_id}: Not Available")
         
-        # Set status based on results
-        if found_models:
-            if missing_models:
-                check_results["key_models"]["status"] = STATUS_WARNING
+        # Set status based on the key models found in any region checked so far
+        if results.key_models.available:
+            if results.key_models.missing:
+                results.key_models.status = STATUS_WARNING
             else:
-                check_results["key_models"]["status"] = STATUS_SUCCESS
+                results.key_models.status = STATUS_SUCCESS
         else:
-            check_results["key_models"]["status"] = STATUS_ERROR
+            results.key_models.status = STATUS_ERROR
+        
+        return found_models
         
     except Exception as e:
         error_msg = f"Error checking key models in {region}: {e}"
-        console.print(f"[bold red]{error_msg}[/bold red]")
         
         # Update results
-        check_results["key_models"]["errors"].append(error_msg)
+        results.key_models.errors.append(error_msg)
         
         # Set error status if there are errors and no available models
-        if not check_results["key_models"]["available"]:
-            check_results["key_models"]["status"] = STATUS_ERROR
+        if not results.key_models.available:
+            results.key_models.status = STATUS_ERROR
+        
+        return []
+
+@traced
+def fetch_model_details(model_ids, region, profile_name=None):
+    """
+    Get quota and inference details for several models (no output, safe to run in a worker thread)
+    
+    Args:
+        model_ids (list): Model IDs to describe
+        region (str): AWS region of the models
+        profile_name (str, optional): AWS profile name to use
+        
+    Returns:
+        list: (model_id, details) pairs in the order of model_ids
+    """
+    return [(model_id, get_model_quotas_and_details(model_id, region, profile_name)) for model_id in model_ids]
+
+def record_model_details(region, model_details, results=None):
+    """
+    Store detailed model information (advanced mode)
+    
+    Args:
+        region (str): AWS region the details were fetched in
+        model_details (list): (model_id, details) pairs from fetch_model_details
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
+    """
+    if results is None:
+        results = check_results
+
+    # Initialize advanced details if not present
+    if results.model_details is None:
+        results.model_details = {}
+    
+    for model_id, details in model_details:
+        # Store in results
+        results.model_details[model_id] = ModelDetails(model_id=model_id, region=region, **details)
+
+@traced
+def run_model_invocations(model_ids, region, profile_name=None, deadline=None):
+    """
+    Test invocation of several models concurrently (no output, safe to run in a worker thread)
+    
+    Throttled calls are retried within the prober's deadline; see
+    bedrock_access_checker.invocation for the concurrency and rate limits.
+    
+    Args:
+        model_ids (list): Model IDs to invoke
+        region (str): AWS region to invoke in
+        profile_name (str, optional): AWS profile name to use
+        deadline (float, optional): time.monotonic() value to stop retrying at (if before the prober's own deadline)
+        
+    Returns:
+        list: (model_id, outcome, message) tuples in the order of model_ids
+    """
+    return invocation_prober.probe(model_ids, region, profile_name, deadline=deadline)
+
+def record_model_invocations(region, outcomes, results=None):
+    """
+    Store model invocation test results
+    
+    Args:
+        region (str): AWS region the models were invoked in
+        outcomes (list): (model_id, outcome, message) tuples from run_model_invocations
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
+    """
+    if results is None:
+        results = check_results
+
+    # Initialize invocation results if not present
+    if results.model_invocations is None:
+        results.model_invocations = InvocationResults()
+    
+    for model_id, outcome, invoke_msg in outcomes:
+        if outcome == INVOKE_SUCCESS:
+            # Add to successful invocations
+            if model_id not in results.model_invocations.successful:
+                results.model_invocations.successful.append(model_id)
+            
+            results.model_invocations.details.append(f"{model_id}: {invoke_msg}")
+        elif outcome == INVOKE_THROTTLED:
+            # Throttling means the model is accessible but busy, so it is not a failure
+            # Add to throttled invocations
+            if model_id not in results.model_invocations.throttled:
+                results.model_invocations.throttled.append(model_id)
+            
+            results.model_invocations.details.append(f"{model_id}: Throttled - {invoke_msg}")
+        else:
+            # Add to failed invocations
+            if model_id not in results.model_invocations.failed:
+                results.model_invocations.failed.append(model_id)
+            
+            results.model_invocations.details.append(f"{model_id}: Failed - {invoke_msg}")
+
+@traced
+def check_specific_models_simple(region, profile_name=None, test_invocation=False, advanced_mode=False, results=None):
+    """
+    Check specific models needed for common Bedrock use cases
+    
+    Runs the key model listing, then (optionally) the detail lookups and the
+    invocation tests for the models found, one after another. The CLI runs
+    the same steps as separate, overlapping nodes of a CheckGraph instead.
+    
+    Args:
+        region (str): AWS region to check
+        profile_name (str, optional): AWS profile name to use
+        test_invocation (bool, optional): Whether to test model invocation
+        advanced_mode (bool, optional): Whether to show detailed model information
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
+    """
+    if results is None:
+        results = check_results
+
+    found_models = check_key_models(region, profile_name, results=results)
+    
+    if advanced_mode:
+        record_model_details(region, fetch_model_details(found_models, region, profile_name), results=results)
+    
+    if test_invocation:
+        record_model_invocations(region, run_model_invocations(found_models, region, profile_name), results=results)
+
+def record_timed_out(component, region=None, results=None):
+    """
+    Record a check that did not finish before the run's deadline
+    
+    Args:
+        component (str): Results component of the check (e.g. 'bedrock_models')
+        region (str, optional): Region the check was for
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
+    """
+    if results is None:
+        results = check_results
+    
+    label = f"{component} ({region})" if region else component
+    results.timed_out.append(label)
+    
+    # Components with a status must not look successful if part of them never finished
+    entry = getattr(results, component, None)
+    if isinstance(entry, ComponentResult):
+        if entry.status in (None, STATUS_SUCCESS):
+            entry.status = STATUS_TIMEOUT
+        entry.errors.append(f"Timed out{' in ' + region if region else ''} before the deadline")
+
+# Console style of each overall status
+OVERALL_STYLES = {
+    STATUS_SUCCESS: "green",
+    STATUS_WARNING: "yellow",
+    STATUS_ERROR: "red",
+    STATUS_TIMEOUT: "red",
+}
+
+def overall_status(results):
+    """
+    Get the overall status of a set of results
+    
+    Args:
+        results (CheckResults): Results to summarize
+        
+    Returns:
+        tuple: (status, message)
+    """
+    all_statuses = [
+        results.aws_credentials.status,
+        results.bedrock_regions.status,
+        results.bedrock_runtime.status,
+        results.bedrock_models.status,
+        results.key_models.status
+    ]
+    
+    if STATUS_ERROR in all_statuses:
+        return STATUS_ERROR, "There are critical issues with your Bedrock setup"
+    if results.timed_out:
+        return STATUS_TIMEOUT, "Some checks did not finish before the deadline"
+    if STATUS_WARNING in all_statuses:
+        return STATUS_WARNING, "Your Bedrock setup has some issues but may work for some use cases"
+    if all(status == STATUS_SUCCESS for status in all_statuses if status is not None):
+        return STATUS_SUCCESS, "Your Bedrock setup looks good!"
+    return STATUS_INFO, "Some checks were inconclusive"
+
+def display_summary_dashboard(results=None):
+    """Display a summary dashboard with status of all checks
+
+    Args:
+        results (CheckResults, optional): Results structure to display (defaults to the module-level check_results)
+    """
+    if results is None:
+        results = check_results
+
+    # Nothing to show in quiet mode
+    if console.muted:
+        return
 
-def display_summary_dashboard():
-    """Display a summary dashboard with status of all checks"""
     console.print("\n")
     
     # Create the overall panel
@@ -996,55 +1015,57 @@ def display_summary_dashboard():
     console.print(panel)
     
     # Create the summary table
-    table = Table(box=ROUNDED, expand=True, padding=(0, 1))
+    table = new_table(expand=True, padding=(0, 1))
     table.add_column("Component", style="cyan", no_wrap=True)
     table.add_column("Status", style="bold", justify="center")
     table.add_column("Details", style="green")
     
     # Add rows for each component
     # AWS Credentials
-    cred_status = check_results["aws_credentials"]["status"] or STATUS_INFO
+    cred_status = results.aws_credentials.status or STATUS_INFO
     cred_style = "green" if cred_status == STATUS_SUCCESS else "yellow" if cred_status == STATUS_WARNING else "red"
     cred_details = ""
-    if check_results["aws_credentials"]["details"]:
-        cred_details = check_results["aws_credentials"]["details"][0]
-    elif check_results["aws_credentials"]["errors"]:
-        cred_details = check_results["aws_credentials"]["errors"][0]
+    if results.aws_credentials.details:
+        cred_details = results.aws_credentials.details[0]
+    elif results.aws_credentials.errors:
+        cred_details = results.aws_credentials.errors[0]
     table.add_row("AWS Credentials", f"[{cred_style}]{cred_status}[/{cred_style}]", cred_details)
     
     # Bedrock Regions
-    region_status = check_results["bedrock_regions"]["status"] or STATUS_INFO
+    region_status = results.bedrock_regions.status or STATUS_INFO
     region_style = "green" if region_status == STATUS_SUCCESS else "yellow" if region_status == STATUS_WARNING else "red"
-    region_count = len(check_results["bedrock_regions"]["available"])
+    region_count = len(results.bedrock_regions.available)
     region_details = f"{region_count} available regions"
     if region_count > 0:
-        region_details += f": {', '.join(check_results['bedrock_regions']['available'])}"
-    elif check_results["bedrock_regions"]["errors"]:
-        region_details = check_results["bedrock_regions"]["errors"][0]
+        region_details += f": {', '.join(results.bedrock_regions.available)}"
+    elif results.bedrock_regions.errors:
+        region_details = results.bedrock_regions.errors[0]
     table.add_row("Bedrock Regions", f"[{region_style}]{region_status}[/{region_style}]", region_details)
     
     # Bedrock Runtime
-    runtime_status = check_results["bedrock_runtime"]["status"] or STATUS_INFO
+    runtime_status = results.bedrock_runtime.status or STATUS_INFO
     runtime_style = "green" if runtime_status == STATUS_SUCCESS else "yellow" if runtime_status == STATUS_WARNING else "red"
     runtime_details = "Runtime service accessible"
-    if check_results["bedrock_runtime"]["errors"]:
-        runtime_details = check_results["bedrock_runtime"]["errors"][0]
+    if results.bedrock_runtime.errors:
+        runtime_details = results.bedrock_runtime.errors[0]
     table.add_row("Bedrock Runtime", f"[{runtime_style}]{runtime_status}[/{runtime_style}]", runtime_details)
     
     # Bedrock Models
-    models_status = check_results["bedrock_models"]["status"] or STATUS_INFO
+    models_status = results.bedrock_models.status or STATUS_INFO
     models_style = "green" if models_status == STATUS_SUCCESS else "yellow" if models_status == STATUS_WARNING else "red"
-    models_count = len(set(check_results["bedrock_models"]["available"]))  # Use set to avoid duplicates
+    models_count = len(results.bedrock_models.available)
     models_details = f"{models_count} models available"
-    if models_count == 0 and check_results["bedrock_models"]["errors"]:
-        models_details = check_results["bedrock_models"]["errors"][0]
+    if len(results.bedrock_models.available.regions) > 1:
+        models_details += f" ({len(results.bedrock_models.available.models_in_all_regions())} in every region)"
+    if models_count == 0 and results.bedrock_models.errors:
+        models_details = results.bedrock_models.errors[0]
     table.add_row("Bedrock Models", f"[{models_style}]{models_status}[/{models_style}]", models_details)
     
     # Key Models
-    key_status = check_results["key_models"]["status"] or STATUS_INFO
+    key_status = results.key_models.status or STATUS_INFO
     key_style = "green" if key_status == STATUS_SUCCESS else "yellow" if key_status == STATUS_WARNING else "red"
-    available_count = len(check_results["key_models"]["available"])
-    missing_count = len(check_results["key_models"]["missing"])
+    available_count = len(results.key_models.available)
+    missing_count = len(results.key_models.missing)
     total_count = available_count + missing_count
     key_details = f"{available_count}/{total_count} key models available"
     if missing_count > 0 and available_count > 0:
@@ -1054,21 +1075,29 @@ def display_summary_dashboard():
     table.add_row("Key Models", f"[{key_style}]{key_status}[/{key_style}]", key_details)
     
     # Add model invocation results if available
-    if "model_invocations" in check_results:
-        invoke_success_count = len(check_results["model_invocations"]["successful"])
-        invoke_failed_count = len(check_results["model_invocations"]["failed"])
-        invoke_total = invoke_success_count + invoke_failed_count
+    if results.model_invocations is not None:
+        invoke_success_count = len(results.model_invocations.successful)
+        invoke_failed_count = len(results.model_invocations.failed)
+        invoke_throttled_count = len(results.model_invocations.throttled)
+        invoke_total = invoke_success_count + invoke_failed_count + invoke_throttled_count
         
         if invoke_total > 0:
-            invoke_status = STATUS_SUCCESS if invoke_failed_count == 0 else STATUS_WARNING if invoke_success_count > 0 else STATUS_ERROR
+            if invoke_success_count == invoke_total:
+                invoke_status = STATUS_SUCCESS
+            elif invoke_failed_count == invoke_total:
+                invoke_status = STATUS_ERROR
+            else:
+                invoke_status = STATUS_WARNING
             invoke_style = "green" if invoke_status == STATUS_SUCCESS else "yellow" if invoke_status == STATUS_WARNING else "red"
             invoke_details = f"{invoke_success_count}/{invoke_total} models invoked successfully"
+            if invoke_throttled_count:
+                invoke_details += f" ({invoke_throttled_count} throttled)"
             table.add_row("Model Invocation", f"[{invoke_style}]{invoke_status}[/{invoke_style}]", invoke_details)
     
     # Add SageMaker JumpStart alternatives if available
-    if "sagemaker_alternatives" in check_results and check_results["sagemaker_alternatives"]:
+    if results.sagemaker_alternatives:
         # Exclude error entry when counting alternatives
-        alternatives_count = sum(1 for k in check_results["sagemaker_alternatives"] if k != "error")
+        alternatives_count = sum(1 for k in results.sagemaker_alternatives if k != "error")
         
         if alternatives_count > 0:
             sm_status = STATUS_INFO
@@ -1076,68 +1105,76 @@ def display_summary_dashboard():
             sm_details = f"Found alternatives for {alternatives_count} missing Bedrock models"
             table.add_row("SageMaker Alternatives", f"[{sm_style}]{sm_status}[/{sm_style}]", sm_details)
     
-    console.print(table)
+    # Checks cut off by the run's deadline
+    if results.timed_out:
+        table.add_row("Timed Out", f"[red]{STATUS_TIMEOUT}[/red]", ", ".join(results.timed_out))
     
-    # Overall status
-    all_statuses = [
-        check_results["aws_credentials"]["status"],
-        check_results["bedrock_regions"]["status"],
-        check_results["bedrock_runtime"]["status"],
-        check_results["bedrock_models"]["status"],
-        check_results["key_models"]["status"]
-    ]
+    console.print(table)
     
-    if STATUS_ERROR in all_statuses:
-        overall_status = STATUS_ERROR
-        overall_style = "red"
-        overall_message = "There are critical issues with your Bedrock setup"
-    elif STATUS_WARNING in all_statuses:
-        overall_status = STATUS_WARNING
-        overall_style = "yellow"
-        overall_message = "Your Bedrock setup has some issues but may work for some use cases"
-    elif all(status == STATUS_SUCCESS for status in all_statuses if status is not None):
-        overall_status = STATUS_SUCCESS
-        overall_style = "green"
-        overall_message = "Your Bedrock setup looks good!"
-    else:
-        overall_status = STATUS_INFO
-        overall_style = "blue"
-        overall_message = "Some checks were inconclusive"
+    # API call timing breakdown (--timings)
+    timings = results.timings
+    if timings and timings["total_calls"]:
+        timing_table = new_table(f"AWS API Call Timings ({timings['total_calls']} calls, {timings['total_ms'] / 1000:.2f}s total)")
+        timing_table.add_column("Operation", style="cyan", no_wrap=True)
+        timing_table.add_column("Calls", justify="right")
+        timing_table.add_column("Total (ms)", justify="right", style="yellow")
+        timing_table.add_column("Avg (ms)", justify="right")
+        timing_table.add_column("Max (ms)", justify="right")
+        timing_table.add_column("Retries", justify="right")
+        timing_table.add_column("Errors", justify="right", style="red")
+        
+        # Slowest operations first
+        for entry in timings["by_operation"][:10]:
+            timing_table.add_row(
+                f"{entry['service']}.{entry['operation']}",
+                str(entry["calls"]),
+                f"{entry['total_ms']:.0f}",
+                f"{entry['avg_ms']:.0f}",
+                f"{entry['max_ms']:.0f}",
+                str(entry["retries"]),
+                str(entry["errors"])
+            )
+        console.print(timing_table)
+        
+        region_times = ", ".join(f"{region}: {entry['total_ms'] / 1000:.2f}s" for region, entry in timings["by_region"].items())
+        console.print(f"[dim]Time spent in API calls by region: {region_times}[/dim]")
     
     # Print overall status
-    console.print(f"\n[bold {overall_style}]Overall Status: {overall_status}[/bold {overall_style}]")
-    console.print(f"[{overall_style}]{overall_message}[/{overall_style}]")
+    status, message = overall_status(results)
+    style = OVERALL_STYLES.get(status, "blue")
+    console.print(f"\n[bold {style}]Overall Status: {status}[/bold {style}]")
+    console.print(f"[{style}]{message}[/{style}]")
     
     # Print timestamp
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     console.print(f"\n[dim]Check completed at: {timestamp}[/dim]")
     
     # Print troubleshooting tips based on status
-    if overall_status != STATUS_SUCCESS:
+    if status != STATUS_SUCCESS:
         console.print("\n[bold yellow]Troubleshooting Tips:[/bold yellow]")
         
         # AWS Credentials issues
-        if check_results["aws_credentials"]["status"] in [STATUS_ERROR, STATUS_WARNING]:
+        if results.aws_credentials.status in [STATUS_ERROR, STATUS_WARNING]:
             console.print("[yellow]• AWS Credentials:[/yellow]")
             console.print("  - Run 'aws configure' to set up credentials")
             console.print("  - Verify your credentials have Bedrock permissions")
             console.print("  - Check if boto3 version is at least 1.28.0")
         
         # Bedrock Regions issues
-        if check_results["bedrock_regions"]["status"] in [STATUS_ERROR, STATUS_WARNING]:
+        if results.bedrock_regions.status in [STATUS_ERROR, STATUS_WARNING]:
             console.print("[yellow]• Bedrock Regions:[/yellow]")
             console.print("  - Make sure Bedrock is enabled in your AWS account")
             console.print("  - Check if your IAM permissions include bedrock:ListFoundationModels")
             console.print("  - Verify you're checking regions where Bedrock is available")
         
         # Bedrock Runtime issues
-        if check_results["bedrock_runtime"]["status"] in [STATUS_ERROR, STATUS_WARNING]:
+        if results.bedrock_runtime.status in [STATUS_ERROR, STATUS_WARNING]:
             console.print("[yellow]• Bedrock Runtime:[/yellow]")
             console.print("  - Verify your IAM permissions include bedrock-runtime:* actions")
             console.print("  - Check if the Bedrock service endpoint is accessible from your network")
         
         # Model access issues
-        if check_results["key_models"]["status"] in [STATUS_ERROR, STATUS_WARNING]:
+        if results.key_models.status in [STATUS_ERROR, STATUS_WARNING]:
             console.print("[yellow]• Model Access:[/yellow]")
             console.print("  - Visit AWS console to request access to needed models:")
             console.print("    https://console.aws.amazon.com/bedrock/home#/modelaccess")
@@ -1146,7 +1183,7 @@ def display_summary_dashboard():
     
     # Print next steps
     console.print("\n[bold green]Next Steps:[/bold green]")
-    if overall_status == STATUS_SUCCESS:
+    if status == STATUS_SUCCESS:
         console.print("✓ Your setup looks good! You can start using Bedrock services")
         console.print("✓ For usage examples, visit: https://docs.aws.amazon.com/bedrock/latest/userguide/")
     else:
@@ -1164,7 +1201,8 @@ def display_summary_dashboard():
     except PackageNotFoundError:
         pass
 
-def estimate_model_costs(available_models=None, region=None, profile_name=None):
+@traced
+def estimate_model_costs(available_models=None, region=None, profile_name=None, results=None):
     """
     Estimate costs for model usage based on token pricing
     
@@ -1173,18 +1211,19 @@ def estimate_model_costs(available_models=None, region=None, profile_name=None):
                                           If None, uses models from check_results.
         region (str, optional): AWS region to use for pricing (prices may vary by region)
         profile_name (str, optional): AWS profile name to use
-        
+        results (CheckResults, optional): Results structure to update (defaults to the module-level check_results)
+
     Returns:
         dict: Dictionary of cost estimates by model
     """
-    console.print("\n[bold]Estimating Model Usage Costs...[/bold]")
-    
+    if results is None:
+        results = check_results
+
     # Use available models from check_results if none provided
     if available_models is None:
-        available_models = check_results["key_models"]["available"]
+        available_models = results.key_models.available
     
     if not available_models:
-        console.print("[yellow]No models available for cost estimation.[/yellow]")
         return {}
     
     # Define model pricing (per million tokens, US regions) - May 2025 pricing
@@ -1212,14 +1251,6 @@ def estimate_model_costs(available_models=None, region=None, profile_name=None):
         "meta.llama2-13b-chat-v1": {"input": 0.75, "output": 1.00, "context_window": 4000},
     }
     
-    # Create a table for cost estimates
-    table = Table(title="Bedrock Cost Estimates (per 1M tokens)", box=ROUNDED)
-    table.add_column("Model", style="cyan")
-    table.add_column("Input Cost", style="green")
-    table.add_column("Output Cost", style="magenta")
-    table.add_column("Context Window", style="yellow")
-    table.add_column("Common Usage Est.", style="blue")
-    
     cost_estimates = {}
     
     for model_id in available_models:
@@ -1269,32 +1300,14 @@ def estimate_model_costs(available_models=None, region=None, profile_name=None):
                     "pricing_note": f"Pricing based on {pricing_key} rates" if pricing_key != base_model_id else "Direct pricing match",
                 }
                 
-                # Add to table
-                table.add_row(
-                    model_id,
-                    f"${pricing['input']:.2f}",
-                    f"${pricing['output']:.2f}",
-                    f"{pricing['context_window']:,} tokens",
-                    f"${total_cost:.2f}"
-                )
-                
                 # Add to check results
-                check_results["cost_estimates"]["models"][model_id] = cost_estimates[model_id]
+                results.cost_estimates.models[model_id] = cost_estimates[model_id]
                 
                 # Add details
-                check_results["cost_estimates"]["details"].append(
+                results.cost_estimates.details.append(
                     f"{model_id}: Input ${pricing['input']:.2f}, Output ${pricing['output']:.2f}, 1K requests est: ${total_cost:.2f}"
                 )
             else:
-                # Add to table with unknown pricing
-                table.add_row(
-                    model_id,
-                    "Unknown",
-                    "Unknown",
-                    "Unknown",
-                    "Unknown"
-                )
-                
                 # Still store the model but with placeholder data
                 cost_estimates[model_id] = {
                     "input_price": None,
@@ -1305,34 +1318,70 @@ def estimate_model_costs(available_models=None, region=None, profile_name=None):
                 }
                 
                 # Add to check results
-                check_results["cost_estimates"]["models"][model_id] = cost_estimates[model_id]
+                results.cost_estimates.models[model_id] = cost_estimates[model_id]
     
-    # Display the table
-    console.print(table)
+    return cost_estimates
+
+def csv_rows(results):
+    """
+    Get the rows of the CSV output
     
-    # Display usage explanation
-    console.print("\n[bold]Cost Estimate Details:[/bold]")
-    console.print("[dim]• Common Usage Estimate: Cost for 1,000 requests with 1,500 input tokens and 500 output tokens each[/dim]")
-    console.print("[dim]• Pricing may vary by region and is subject to change[/dim]")
-    console.print("[dim]• Context window shows maximum tokens allowed per request[/dim]")
-    console.print("[dim]• For most accurate pricing, visit AWS Pricing Calculator or Bedrock console[/dim]")
+    Args:
+        results (CheckResults): Results to write
+        
+    Returns:
+        list: (component, status, details) rows, with commas in the details replaced by semicolons
+    """
+    # AWS Credentials
+    cred_details = ""
+    if results.aws_credentials.details:
+        cred_details = results.aws_credentials.details[0].replace(',', ';')
+    rows = [("AWS Credentials", results.aws_credentials.status, cred_details)]
     
-    return cost_estimates
+    # Bedrock Regions
+    regions = ';'.join(results.bedrock_regions.available)
+    rows.append(("Bedrock Regions", results.bedrock_regions.status, regions))
+    
+    # Bedrock Runtime
+    runtime_details = "Runtime service accessible"
+    if results.bedrock_runtime.errors:
+        runtime_details = results.bedrock_runtime.errors[0].replace(',', ';')
+    rows.append(("Bedrock Runtime", results.bedrock_runtime.status, runtime_details))
+    
+    # Bedrock Models
+    models_count = len(results.bedrock_models.available)
+    rows.append(("Bedrock Models", results.bedrock_models.status, f"{models_count} models available"))
+    
+    # Key Models
+    available_count = len(results.key_models.available)
+    missing_count = len(results.key_models.missing)
+    total_count = available_count + missing_count
+    rows.append(("Key Models", results.key_models.status, f"{available_count}/{total_count} key models available"))
+    
+    # Checks cut off by the run's deadline
+    if results.timed_out:
+        rows.append(("Timed Out", STATUS_TIMEOUT, ';'.join(results.timed_out)))
+    return rows
 
-def output_results(format_type, prefix=""):
+@traced
+def output_results(format_type, prefix="", results=None):
     """
     Output results in the specified format
     
     Args:
         format_type (str): 'json', 'csv', or 'html'
         prefix (str, optional): Prefix to add to the output filename
+        results (CheckResults, optional): Results structure to write (defaults to the module-level check_results)
     """
+    if results is None:
+        results = check_results
+
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     
     if format_type == 'json':
         filename = f"bedrock_check_{prefix}{timestamp}.json"
         with open(filename, 'w') as f:
-            json.dump(check_results, f, indent=2)
+            json.dump(results.to_dict(), f, indent=2)
         console.print(f"\n[green]Results saved to {filename}[/green]")
     
     elif format_type == 'csv':
@@ -1340,384 +1389,16 @@ def output_results(format_type, prefix=""):
         with open(filename, 'w') as f:
             f.write("Component,Status,Details\n")
             
-            # AWS Credentials
-            cred_details = ""
-            if check_results["aws_credentials"]["details"]:
-                cred_details = check_results["aws_credentials"]["details"][0].replace(',', ';')
-            f.write(f"AWS Credentials,{check_results['aws_credentials']['status']},{cred_details}\n")
-            
-            # Bedrock Regions
-            regions = ';'.join(check_results["bedrock_regions"]["available"])
-            f.write(f"Bedrock Regions,{check_results['bedrock_regions']['status']},{regions}\n")
-            
-            # Bedrock Runtime
-            runtime_details = "Runtime service accessible"
-            if check_results["bedrock_runtime"]["errors"]:
-                runtime_details = check_results["bedrock_runtime"]["errors"][0].replace(',', ';')
-            f.write(f"Bedrock Runtime,{check_results['bedrock_runtime']['status']},{runtime_details}\n")
-            
-            # Bedrock Models
-            models_count = len(set(check_results["bedrock_models"]["available"]))
-            f.write(f"Bedrock Models,{check_results['bedrock_models']['status']},{models_count} models available\n")
-            
-            # Key Models
-            available_count = len(check_results["key_models"]["available"])
-            missing_count = len(check_results["key_models"]["missing"])
-            total_count = available_count + missing_count
-            key_details = f"{available_count}/{total_count} key models available"
-            f.write(f"Key Models,{check_results['key_models']['status']},{key_details}\n")
+            for component, status, details in csv_rows(results):
+                f.write(f"{component},{status},{details}\n")
             
         console.print(f"\n[green]Results saved to {filename}[/green]")
         
     elif format_type == 'html':
-        filename = f"bedrock_check_{prefix}{timestamp}.html"
-        
-        # Create an HTML report with improved visualization
-        html = []
-        html.append("<!DOCTYPE html>")
-        html.append("<html lang='en'>")
-        html.append("<head>")
-        html.append("  <meta charset='UTF-8'>")
-        html.append("  <meta name='viewport' content='width=device-width, initial-scale=1.0'>")
-        html.append("  <title>AWS Bedrock Access Check Report</title>")
-        html.append("  <style>")
-        html.append("    body { font-family: Arial, sans-serif; margin: 0; padding: 20px; line-height: 1.6; }")
-        html.append("    .container { max-width: 1200px; margin: 0 auto; }")
-        html.append("    .header { text-align: center; margin-bottom: 30px; }")
-        html.append("    .dashboard { background: #f5f5f5; padding: 20px; border-radius: 8px; margin-bottom: 30px; }")
-        html.append("    .summary-table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }")
-        html.append("    .summary-table th, .summary-table td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }")
-        html.append("    .summary-table th { background-color: #f0f0f0; }")
-        html.append("    .success { color: #2e7d32; font-weight: bold; }")
-        html.append("    .warning { color: #f57c00; font-weight: bold; }")
-        html.append("    .error { color: #d32f2f; font-weight: bold; }")
-        html.append("    .info { color: #1976d2; font-weight: bold; }")
-        html.append("    .details-section { margin-bottom: 30px; }")
-        html.append("    .details-section h2 { border-bottom: 1px solid #eee; padding-bottom: 8px; }")
-        html.append("    .model-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(300px, 1fr)); gap: 15px; }")
-        html.append("    .model-card { background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }")
-        html.append("    .model-card h3 { margin-top: 0; }")
-        html.append("    .region-list { display: flex; flex-wrap: wrap; gap: 10px; }")
-        html.append("    .region-badge { background: #e3f2fd; padding: 5px 10px; border-radius: 16px; font-size: 14px; }")
-        html.append("    .footer { margin-top: 30px; text-align: center; color: #666; font-size: 14px; }")
-        html.append("  </style>")
-        html.append("</head>")
-        html.append("<body>")
-        html.append("  <div class='container'>")
-        
-        # Header
-        html.append("    <div class='header'>")
-        html.append("      <h1>AWS Bedrock Access Verification Report</h1>")
-        html.append(f"      <p>Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>")
-        html.append("    </div>")
-        
-        # Dashboard
-        html.append("    <div class='dashboard'>")
-        html.append("      <h2>Status Dashboard</h2>")
-        html.append("      <table class='summary-table'>")
-        html.append("        <tr><th>Component</th><th>Status</th><th>Details</th></tr>")
-        
-        # AWS Credentials
-        cred_status = check_results["aws_credentials"]["status"] or "ℹ️ INFO"
-        cred_class = "success" if "SUCCESS" in cred_status else "warning" if "WARNING" in cred_status else "error" if "ERROR" in cred_status else "info"
-        cred_details = check_results["aws_credentials"]["details"][0] if check_results["aws_credentials"]["details"] else "N/A"
-        html.append(f"        <tr><td>AWS Credentials</td><td class='{cred_class}'>{cred_status}</td><td>{cred_details}</td></tr>")
+        # Imported here because the report module builds on this one
+        from bedrock_access_checker.html_report import write_html_report
         
-        # Bedrock Regions
-        region_status = check_results["bedrock_regions"]["status"] or "ℹ️ INFO"
-        region_class = "success" if "SUCCESS" in region_status else "warning" if "WARNING" in region_status else "error" if "ERROR" in region_status else "info"
-        region_count = len(check_results["bedrock_regions"]["available"])
-        region_details = f"{region_count} available regions"
-        html.append(f"        <tr><td>Bedrock Regions</td><td class='{region_class}'>{region_status}</td><td>{region_details}</td></tr>")
-        
-        # Bedrock Runtime
-        runtime_status = check_results["bedrock_runtime"]["status"] or "ℹ️ INFO"
-        runtime_class = "success" if "SUCCESS" in runtime_status else "warning" if "WARNING" in runtime_status else "error" if "ERROR" in runtime_status else "info"
-        runtime_details = "Runtime service accessible" if not check_results["bedrock_runtime"]["errors"] else check_results["bedrock_runtime"]["errors"][0]
-        html.append(f"        <tr><td>Bedrock Runtime</td><td class='{runtime_class}'>{runtime_status}</td><td>{runtime_details}</td></tr>")
-        
-        # Bedrock Models
-        models_status = check_results["bedrock_models"]["status"] or "ℹ️ INFO"
-        models_class = "success" if "SUCCESS" in models_status else "warning" if "WARNING" in models_status else "error" if "ERROR" in models_status else "info"
-        models_count = len(set(check_results["bedrock_models"]["available"]))
-        models_details = f"{models_count} models available"
-        html.append(f"        <tr><td>Bedrock Models</td><td class='{models_class}'>{models_status}</td><td>{models_details}</td></tr>")
-        
-        # Key Models
-        key_status = check_results["key_models"]["status"] or "ℹ️ INFO"
-        key_class = "success" if "SUCCESS" in key_status else "warning" if "WARNING" in key_status else "error" if "ERROR" in key_status else "info"
-        available_count = len(check_results["key_models"]["available"])
-        missing_count = len(check_results["key_models"]["missing"])
-        total_count = available_count + missing_count
-        key_details = f"{available_count}/{total_count} key models available"
-        html.append(f"        <tr><td>Key Models</td><td class='{key_class}'>{key_status}</td><td>{key_details}</td></tr>")
-        
-        # Model Invocation if available
-        if "model_invocations" in check_results:
-            invoke_success_count = len(check_results["model_invocations"]["successful"])
-            invoke_failed_count = len(check_results["model_invocations"]["failed"])
-            invoke_total = invoke_success_count + invoke_failed_count
-            
-            if invoke_total > 0:
-                if invoke_failed_count == 0:
-                    invoke_status = "✅ SUCCESS"
-                    invoke_class = "success"
-                elif invoke_success_count > 0:
-                    invoke_status = "⚠️ WARNING"
-                    invoke_class = "warning"
-                else:
-                    invoke_status = "❌ ERROR"
-                    invoke_class = "error"
-                    
-                invoke_details = f"{invoke_success_count}/{invoke_total} models invoked successfully"
-                html.append(f"        <tr><td>Model Invocation</td><td class='{invoke_class}'>{invoke_status}</td><td>{invoke_details}</td></tr>")
-        
-        html.append("      </table>")
-        
-        # Overall status
-        all_statuses = [
-            check_results["aws_credentials"]["status"],
-            check_results["bedrock_regions"]["status"],
-            check_results["bedrock_runtime"]["status"],
-            check_results["bedrock_models"]["status"],
-            check_results["key_models"]["status"]
-        ]
-        
-        if "❌ ERROR" in all_statuses:
-            overall_status = "❌ ERROR"
-            overall_class = "error"
-            overall_message = "There are critical issues with your Bedrock setup"
-        elif "⚠️ WARNING" in all_statuses:
-            overall_status = "⚠️ WARNING"
-            overall_class = "warning"
-            overall_message = "Your Bedrock setup has some issues but may work for some use cases"
-        elif all(status == "✅ SUCCESS" for status in all_statuses if status is not None):
-            overall_status = "✅ SUCCESS"
-            overall_class = "success"
-            overall_message = "Your Bedrock setup looks good!"
-        else:
-            overall_status = "ℹ️ INFO"
-            overall_class = "info"
-            overall_message = "Some checks were inconclusive"
-        
-        html.append(f"      <h3>Overall Status: <span class='{overall_class}'>{overall_status}</span></h3>")
-        html.append(f"      <p>{overall_message}</p>")
-        html.append("    </div>")
-        
-        # Regions Section
-        html.append("    <div class='details-section'>")
-        html.append("      <h2>Available Regions</h2>")
-        html.append("      <div class='region-list'>")
-        for region in check_results["bedrock_regions"]["available"]:
-            html.append(f"        <div class='region-badge'>{region}</div>")
-        html.append("      </div>")
-        html.append("    </div>")
-        
-        # Cost Estimation Section
-        if "cost_estimates" in check_results and check_results["cost_estimates"]["models"]:
-            html.append("    <div class='details-section'>")
-            html.append("      <h2>Cost Estimates</h2>")
-            html.append("      <p>Estimated costs for model usage based on current AWS Bedrock pricing (as of May 2025):</p>")
-            html.append("      <table class='summary-table'>")
-            html.append("        <tr><th>Model</th><th>Input Cost (per 1M tokens)</th><th>Output Cost (per 1M tokens)</th><th>Context Window</th><th>Est. Cost for 1K Requests</th></tr>")
-            
-            # Sort models by estimated cost (descending)
-            sorted_models = sorted(
-                check_results["cost_estimates"]["models"].items(), 
-                key=lambda x: x[1]["common_usage_estimate"] if x[1]["common_usage_estimate"] is not None else 0,
-                reverse=True
-            )
-            
-            for model_id, cost_data in sorted_models:
-                if cost_data["input_price"] is not None:
-                    html.append(f"        <tr>")
-                    html.append(f"          <td>{model_id}</td>")
-                    html.append(f"          <td>${cost_data['input_price']:.2f}</td>")
-                    html.append(f"          <td>${cost_data['output_price']:.2f}</td>")
-                    html.append(f"          <td>{cost_data['context_window']:,} tokens</td>")
-                    html.append(f"          <td>${cost_data['common_usage_estimate']:.2f}</td>")
-                    html.append(f"        </tr>")
-            
-            html.append("      </table>")
-            html.append("      <p><small>Cost estimates are based on 1,000 requests with 1,500 input tokens and 500 output tokens each.</small></p>")
-            html.append("      <p><small>Actual costs may vary based on usage patterns, AWS promotions, and pricing changes.</small></p>")
-            html.append("    </div>")
-            
-        # SageMaker Alternatives Section
-        if "sagemaker_alternatives" in check_results and check_results["sagemaker_alternatives"]:
-            # Exclude error entry when counting alternatives
-            alternatives_count = sum(1 for k in check_results["sagemaker_alternatives"] if k != "error")
-            
-            if alternatives_count > 0:
-                html.append("    <div class='details-section'>")
-                html.append("      <h2>SageMaker JumpStart Alternatives</h2>")
-                html.append("      <p>The following alternatives are available in SageMaker JumpStart for missing Bedrock models:</p>")
-                html.append("      <table class='summary-table'>")
-                html.append("        <tr><th>Missing Bedrock Model</th><th>SageMaker Alternative</th><th>Notes</th></tr>")
-                
-                for model_id, alternatives in check_results["sagemaker_alternatives"].items():
-                    if model_id != "error" and alternatives:
-                        for i, alt in enumerate(alternatives):
-                            if i == 0:  # First alternative for this model
-                                html.append(f"        <tr><td>{model_id}</td><td>{alt['name']} ({alt['model_id']})</td><td>{alt['notes']}</td></tr>")
-                            else:  # Additional alternatives
-                                html.append(f"        <tr><td></td><td>{alt['name']} ({alt['model_id']})</td><td>{alt['notes']}</td></tr>")
-                
-                html.append("      </table>")
-                html.append("    </div>")
-        
-        # Models Section
-        html.append("    <div class='details-section'>")
-        html.append("      <h2>Model Availability</h2>")
-        html.append("      <div class='model-grid'>")
-        
-        # Key models with their status
-        all_key_models = check_results["key_models"]["available"] + check_results["key_models"]["missing"]
-        
-        # Get invocation results if available
-        invoke_success = []
-        invoke_fail = []
-        if "model_invocations" in check_results:
-            invoke_success = check_results["model_invocations"]["successful"]
-            invoke_fail = check_results["model_invocations"]["failed"]
-            
-        # Get cost estimates if available
-        model_costs = {}
-        if "cost_estimates" in check_results and "models" in check_results["cost_estimates"]:
-            model_costs = check_results["cost_estimates"]["models"]
-        
-        for model in sorted(all_key_models):
-            is_available = model in check_results["key_models"]["available"]
-            status_class = "success" if is_available else "error"
-            status_text = "Available" if is_available else "Not Available"
-            
-            html.append(f"        <div class='model-card'>")
-            html.append(f"          <h3>{model}</h3>")
-            html.append(f"          <p>Listing: <span class='{status_class}'>{status_text}</span></p>")
-            
-            # Add invocation status if available
-            if is_available and (model in invoke_success or model in invoke_fail):
-                invoke_status = "Invocation Successful" if model in invoke_success else "Invocation Failed"
-                invoke_class = "success" if model in invoke_success else "error"
-                html.append(f"          <p>Test: <span class='{invoke_class}'>{invoke_status}</span></p>")
-            elif is_available and "model_invocations" in check_results:
-                html.append(f"          <p>Test: <span class='info'>Not Tested</span></p>")
-                
-            # Get the purpose for this model
-            model_purpose = "Unknown"
-            for model_info in needed_models:
-                if model_info["id"] == model:
-                    model_purpose = model_info["purpose"]
-                    break
-                    
-            html.append(f"          <p><small>{model_purpose}</small></p>")
-            
-            # Add detailed model information if available
-            if "model_details" in check_results and model in check_results["model_details"]:
-                model_details = check_results["model_details"][model]
-                
-                # Add collapsible section for details
-                html.append("          <details>")
-                html.append("            <summary>Advanced Details</summary>")
-                html.append("            <div style='margin-top: 10px;'>")
-                
-                # Cost information if available
-                if model in model_costs and model_costs[model]["input_price"] is not None:
-                    cost_data = model_costs[model]
-                    html.append("              <h4>Cost Information</h4>")
-                    html.append("              <ul>")
-                    html.append(f"                <li><strong>Input Cost:</strong> ${cost_data['input_price']:.2f} per 1M tokens</li>")
-                    html.append(f"                <li><strong>Output Cost:</strong> ${cost_data['output_price']:.2f} per 1M tokens</li>")
-                    html.append(f"                <li><strong>Context Window:</strong> {cost_data['context_window']:,} tokens</li>")
-                    if cost_data['common_usage_estimate']:
-                        html.append(f"                <li><strong>Usage Estimate:</strong> ${cost_data['common_usage_estimate']:.2f} for 1K standard requests</li>")
-                    html.append(f"                <li><strong>Note:</strong> {cost_data['pricing_note']}</li>")
-                    html.append("              </ul>")
-                
-                # Specs section
-                if "specs" in model_details and model_details["specs"]:
-                    html.append("              <h4>Specifications</h4>")
-                    html.append("              <ul>")
-                    for key, value in model_details["specs"].items():
-                        if key != "error":
-                            html.append(f"                <li><strong>{key}:</strong> {value}</li>")
-                    html.append("              </ul>")
-                
-                # Inference parameters
-                if "inference_params" in model_details and model_details["inference_params"]:
-                    html.append("              <h4>Inference Parameters</h4>")
-                    html.append("              <ul>")
-                    for key, value in model_details["inference_params"].items():
-                        html.append(f"                <li><strong>{key}:</strong> {value}</li>")
-                    html.append("              </ul>")
-                
-                # Quotas
-                if "quotas" in model_details and model_details["quotas"]:
-                    html.append("              <h4>Quotas</h4>")
-                    html.append("              <ul>")
-                    for key, value in model_details["quotas"].items():
-                        if key != "error":
-                            if isinstance(value, dict):
-                                quota_str = f"{value.get('value')} {value.get('unit', '')}"
-                                if value.get('adjustable'):
-                                    quota_str += " (adjustable)"
-                                html.append(f"                <li><strong>{key}:</strong> {quota_str}</li>")
-                            else:
-                                html.append(f"                <li><strong>{key}:</strong> {value}</li>")
-                    html.append("              </ul>")
-                
-                # Close the collapsible section
-                html.append("            </div>")
-                html.append("          </details>")
-            
-            html.append("        </div>")
-        
-        html.append("      </div>")
-        html.append("    </div>")
-        
-        # Troubleshooting Section
-        if overall_status != "✅ SUCCESS":
-            html.append("    <div class='details-section'>")
-            html.append("      <h2>Troubleshooting Tips</h2>")
-            
-            if check_results["aws_credentials"]["status"] in ["❌ ERROR", "⚠️ WARNING"]:
-                html.append("      <h3>AWS Credentials</h3>")
-                html.append("      <ul>")
-                html.append("        <li>Run 'aws configure' to set up credentials</li>")
-                html.append("        <li>Verify your credentials have Bedrock permissions</li>")
-                html.append("        <li>Check if boto3 version is at least 1.28.0</li>")
-                html.append("      </ul>")
-            
-            if check_results["bedrock_regions"]["status"] in ["❌ ERROR", "⚠️ WARNING"]:
-                html.append("      <h3>Bedrock Regions</h3>")
-                html.append("      <ul>")
-                html.append("        <li>Make sure Bedrock is enabled in your AWS account</li>")
-                html.append("        <li>Check if your IAM permissions include bedrock:ListFoundationModels</li>")
-                html.append("        <li>Verify you're checking regions where Bedrock is available</li>")
-                html.append("      </ul>")
-            
-            if check_results["key_models"]["status"] in ["❌ ERROR", "⚠️ WARNING"]:
-                html.append("      <h3>Model Access</h3>")
-                html.append("      <ul>")
-                html.append("        <li>Visit AWS console to request access to needed models: ")
-                html.append("          <a href='https://console.aws.amazon.com/bedrock/home#/modelaccess' target='_blank'>AWS Bedrock Model Access</a></li>")
-                html.append("        <li>For Claude models, make sure you've accepted Anthropic's terms of service</li>")
-                html.append("        <li>Some models require explicit subscription - check your model access</li>")
-                html.append("      </ul>")
-            html.append("    </div>")
-        
-        # Footer
-        html.append("    <div class='footer'>")
-        html.append("      <p>Generated by AWS Bedrock Access Verification Tool</p>")
-        html.append(f"      <p>Report ID: {timestamp}</p>")
-        html.append("    </div>")
-        
-        html.append("  </div>")
-        html.append("</body>")
-        html.append("</html>")
-        
-        # Write the HTML file
-        with open(filename, 'w') as f:
-            f.write('\n'.join(html))
+        filename = f"bedrock_check_{prefix}{timestamp}.html"
+        write_html_report(filename, results, timestamp)
         
         console.print(f"\n[green]HTML report saved to {filename}[/green]")
\ No newline at end of file
@@ -3,157 +3,689 @@ Command-line interface for the AWS Bedrock Access Checker.
 """
 
 import argparse
-from rich.console import Console
+import datetime
+import os
+import re
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from rich.markup import escape
 from rich.panel import Panel
 from rich.prompt import Prompt
-from rich.table import Table
-from rich.box import ROUNDED
 
 from bedrock_access_checker.checker import (
     list_available_profiles,
     check_aws_credentials,
     check_bedrock_regions,
-    check_bedrock_runtime_access,
-    check_bedrock_models,
-    check_specific_models_simple,
-    check_sagemaker_jumpstart_alternatives,
+    record_timed_out,
     display_summary_dashboard,
     output_results,
-    check_results
+    new_check_results,
+    all_bedrock_regions,
+    console,
+    new_table,
+    STATUS_SUCCESS,
+    STATUS_ERROR,
+    DEFAULT_REGIONS,
+    DEFAULT_MAX_WORKERS
+)
+from bedrock_access_checker.clients import (
+    client_pool,
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_MAX_ATTEMPTS
+)
+from bedrock_access_checker.credentials import credential_cache, CREDENTIAL_CACHE_SUBDIR
+from bedrock_access_checker.pipeline import add_region_checks
+from bedrock_access_checker.journal import open_journal, close_journal, active_journal
+from bedrock_access_checker.standin import standin_main
+from bedrock_access_checker.stream import open_stream, close_stream, active_stream, stream_filename, STDOUT
+from bedrock_access_checker.report import compare_profiles, write_consolidated_report, write_json
+from bedrock_access_checker.shard import (
+    parse_shard,
+    shard_plan,
+    partial_filename,
+    write_partial,
+    read_partials,
+    merge_partials
+)
+from bedrock_access_checker.invocation import (
+    invocation_prober,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_INVOKE_RATE,
+    DEFAULT_INVOKE_DEADLINE
+)
+from bedrock_access_checker.render import terminal_renderer, start_progress, stop_progress, active_progress
+from bedrock_access_checker.timings import enable_timings, timing_summary
+from bedrock_access_checker.trace import enable_tracing, write_trace
+from bedrock_access_checker.scheduler import CheckGraph, concurrency_budget, warm, DONE, DEFAULT_MAX_CONCURRENCY
+from bedrock_access_checker.cache import (
+    enable_disk_cache,
+    cache_enabled_by_env,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_TTL,
+    CACHE_ENV_VAR
+)
+from bedrock_access_checker.org import (
+    load_accounts,
+    account_label,
+    assume_account_role,
+    assumed_role_sessions,
+    DEFAULT_ROLE_NAME,
+    DEFAULT_SWEEP_WORKERS
 )
-
-console = Console()
 
 
-def compare_profile_results(profile_results):
+def compare_profile_results(profile_results, comparison=None):
     """
     Compare the results from multiple profiles and display a comparison table.
     
     Args:
-        profile_results (dict): Dictionary mapping profile names to their check_results
+        profile_results (dict): Dictionary mapping profile names to their CheckResults
+        comparison (dict, optional): Result of compare_profiles() (computed here if not given)
     """
-    console.print("\n[bold]Profile Comparison[/bold]")
+    # Nothing to show in quiet mode
+    if console.muted:
+        return
+    if comparison is None:
+        comparison = compare_profiles(profile_results)
+    rows = comparison["profiles"]
+    marks = {True: "✓", False: "✗", None: "-"}
     
-    # Create tables for different comparison aspects
+    console.print("\n[bold]Profile Comparison[/bold]")
     
     # 1. Overall status comparison
-    status_table = Table(title="Profile Status Comparison", box=ROUNDED)
+    status_table = new_table("Profile Status Comparison")
     status_table.add_column("Profile", style="cyan")
-    status_table.add_column("AWS Credentials", style="green")
-    status_table.add_column("Bedrock Regions", style="green")
-    status_table.add_column("Bedrock Models", style="green")
-    status_table.add_column("Key Models", style="green")
-    
-    for profile_name, results in profile_results.items():
-        # For each profile, add a row with their statuses
-        cred_status = results["aws_credentials"]["status"] or "N/A"
-        region_status = results["bedrock_regions"]["status"] or "N/A"
-        models_status = results["bedrock_models"]["status"] or "N/A"
-        key_models_status = results["key_models"]["status"] or "N/A"
-        
-        status_table.add_row(
-            profile_name,
-            cred_status,
-            region_status,
-            models_status,
-            key_models_status
-        )
-    
+    for title in comparison["components"].values():
+        status_table.add_column(title, style="green")
+    for row in rows:
+        status_table.add_row(row["profile"], *(row["statuses"][name] or "N/A" for name in comparison["components"]))
     console.print(status_table)
     
     # 2. Region availability comparison
-    region_table = Table(title="Region Availability Comparison", box=ROUNDED)
+    region_table = new_table("Region Availability Comparison")
     region_table.add_column("Profile", style="cyan")
-    
-    # Find all available regions across all profiles
-    all_regions = set()
-    for results in profile_results.values():
-        all_regions.update(results["bedrock_regions"]["available"])
-    
-    # Add columns for each region
-    for region in sorted(all_regions):
+    for region in comparison["regions"]:
         region_table.add_column(region, style="green")
-    
-    # Add rows for each profile
-    for profile_name, results in profile_results.items():
-        row_data = [profile_name]
-        
-        # Add availability for each region
-        for region in sorted(all_regions):
-            if region in results["bedrock_regions"]["available"]:
-                row_data.append("✓")
-            else:
-                row_data.append("✗")
-        
-        region_table.add_row(*row_data)
-    
+    for row in rows:
+        region_table.add_row(row["profile"], *(marks[available] for available in row["regions"]))
     console.print(region_table)
     
     # 3. Key model availability comparison
-    model_table = Table(title="Key Model Availability Comparison", box=ROUNDED)
+    model_table = new_table("Key Model Availability Comparison")
     model_table.add_column("Profile", style="cyan")
-    
-    # Find all available and missing models across all profiles
-    all_models = set()
-    for results in profile_results.values():
-        all_models.update(results["key_models"]["available"])
-        all_models.update(results["key_models"]["missing"])
-    
-    # Add columns for each model
-    for model in sorted(all_models):
-        # Shorten model name for display
-        short_model = model.split(':')[0] if ':' in model else model
-        short_model = short_model.split('.')[-1]  # Get just the model name part
+    for short_model in comparison["model_names"]:
         model_table.add_column(short_model, style="green")
-    
-    # Add rows for each profile
-    for profile_name, results in profile_results.items():
-        row_data = [profile_name]
-        
-        # Add availability for each model
-        for model in sorted(all_models):
-            if model in results["key_models"]["available"]:
-                row_data.append("✓")
-            elif model in results["key_models"]["missing"]:
-                row_data.append("✗")
-            else:
-                row_data.append("-")
-        
-        model_table.add_row(*row_data)
-    
+    for row in rows:
+        model_table.add_row(row["profile"], *(marks[available] for available in row["models"]))
     console.print(model_table)
     
     # 4. Summary statistics
-    summary_table = Table(title="Profile Summary Statistics", box=ROUNDED)
+    summary_table = new_table("Profile Summary Statistics")
     summary_table.add_column("Profile", style="cyan")
     summary_table.add_column("Available Regions", style="green")
     summary_table.add_column("Available Models", style="green")
     summary_table.add_column("Key Models", style="green")
-    
-    for profile_name, results in profile_results.items():
-        region_count = len(results["bedrock_regions"]["available"])
-        model_count = len(set(results["bedrock_models"]["available"])) if "available" in results["bedrock_models"] else 0
-        key_model_count = len(results["key_models"]["available"])
-        key_model_total = len(results["key_models"]["available"]) + len(results["key_models"]["missing"])
-        
+    for row in rows:
+        counts = row["counts"]
         summary_table.add_row(
-            profile_name,
-            str(region_count),
-            str(model_count),
-            f"{key_model_count}/{key_model_total}"
+            row["profile"],
+            str(counts["regions"]),
+            str(counts["models"]),
+            f"{counts['key_models']}/{counts['key_models_total']}"
         )
-    
     console.print(summary_table)
 
 
+def select_regions(args):
+    """
+    Determine which regions to check from the command line arguments
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+
+    Returns:
+        list: Regions to check, or None to use the checker's default regions
+    """
+    regions_to_check = None
+
+    if args.all_regions:
+        # Use all available Bedrock regions
+        regions_to_check = all_bedrock_regions.copy()
+        console.print(f"[bold]Checking all {len(regions_to_check)} Bedrock-supported regions...[/bold]")
+    elif args.region:
+        # Use regions specified on the command line
+        regions_to_check = args.region
+        # Validate regions
+        for region in regions_to_check[:]:
+            if region not in all_bedrock_regions:
+                console.print(f"[yellow]Warning: {region} may not support Bedrock[/yellow]")
+    elif args.interactive:
+        # Interactive region selection
+        console.print("\n[bold]Select regions to check:[/bold]")
+        
+        # Group regions by geography for easier selection
+        region_groups = {
+            "US Regions": [r for r in all_bedrock_regions if r.startswith("us-")],
+            "Europe Regions": [r for r in all_bedrock_regions if r.startswith("eu-")],
+            "Asia Pacific Regions": [r for r in all_bedrock_regions if r.startswith("ap-")],
+            "Other Regions": [r for r in all_bedrock_regions if not (r.startswith("us-") or r.startswith("eu-") or r.startswith("ap-"))]
+        }
+        
+        # Create region choices with human-readable names
+        region_display = {
+            'us-east-1': 'US East (N. Virginia)',
+            'us-east-2': 'US East (Ohio)',
+            'us-west-1': 'US West (N. California)',
+            'us-west-2': 'US West (Oregon)',
+            'ap-northeast-1': 'Asia Pacific (Tokyo)',
+            'ap-northeast-2': 'Asia Pacific (Seoul)',
+            'ap-south-1': 'Asia Pacific (Mumbai)',
+            'ap-southeast-1': 'Asia Pacific (Singapore)',
+            'ap-southeast-2': 'Asia Pacific (Sydney)',
+            'eu-central-1': 'Europe (Frankfurt)',
+            'eu-north-1': 'Europe (Stockholm)',
+            'eu-west-1': 'Europe (Ireland)',
+            'eu-west-2': 'Europe (London)',
+            'eu-west-3': 'Europe (Paris)',
+            'ca-central-1': 'Canada (Central)'
+        }
+        
+        # Display choices by group
+        selected_regions = []
+        
+        console.print("\nSelect regions to check (space to select, enter to confirm):")
+        
+        for group_name, group_regions in region_groups.items():
+            if not group_regions:
+                continue
+                
+            console.print(f"\n[bold]{group_name}:[/bold]")
+            choices = [f"{r} - {region_display.get(r, r)}" for r in group_regions]
+            
+            # Use Prompt.ask for each region rather than Checkbox which is harder to use in CLI
+            for i, choice in enumerate(choices):
+                include = Prompt.ask(f"  Include {choice}", choices=["y", "n"], default="n")
+                if include.lower() == "y":
+                    selected_regions.append(group_regions[i])
+        
+        # Make sure at least one region is selected
+        if not selected_regions:
+            console.print("[yellow]No regions selected. Using default regions (us-east-1, us-west-2).[/yellow]")
+            selected_regions = ['us-east-1', 'us-west-2']
+        else:
+            console.print(f"[green]Selected {len(selected_regions)} regions for checking.[/green]")
+            
+        regions_to_check = selected_regions
+
+    return regions_to_check
+
+
+def _add_check(graph, profile_name, name, func=None, deps=(), apply=None, component=None, region=None, resume=None):
+    """
+    Add a check to a CheckGraph, or a stand-in for it if the checkpoint journal lists it as done
+    
+    The stand-in makes no AWS calls; the check's results were already
+    restored from the journal.
+    
+    Args:
+        graph (CheckGraph): Graph to add the check to
+        profile_name (str): AWS profile name the check is for
+        name, func, deps, apply, component, region: As for CheckGraph.add()
+        resume (callable, optional): Called with the journaled result instead of apply, to redo
+            what apply does besides recording results (e.g. adding follow-up checks)
+    
+    Returns:
+        CheckNode: The new node
+    """
+    journal = active_journal()
+    if journal is not None and journal.is_completed(profile_name, name):
+        value = journal.completed_value(profile_name, name)
+        func = None
+        apply = (lambda _: resume(value)) if resume is not None else (lambda _: value)
+    return graph.add(name, func, deps, apply, component, region)
+
+
+def _on_done(profile_name, results, graph=None):
+    """
+    Get the CheckGraph on_done callback for a profile's checks
+    
+    It journals completed checks (--checkpoint), streams every finished
+    check unit (--stream) and moves the live progress bar along.
+    
+    Args:
+        profile_name (str): AWS profile name or account label (None for default credentials)
+        results (CheckResults): The profile's results
+        graph (CheckGraph, optional): The profile's graph, whose progress the bar shows
+    
+    Returns:
+        callable: The callback (None if none of them is on)
+    """
+    journal = active_journal()
+    stream = active_stream()
+    recorder = stream.recorder(profile_name, results) if stream is not None else None
+    progress = active_progress() if graph is not None else None
+    if journal is None and recorder is None and progress is None:
+        return None
+    
+    def on_done(node):
+        # Failed checks run again on resume; checks skipped on resume are already in the journal
+        if journal is not None and node.state == DONE and not journal.is_completed(profile_name, node.name):
+            journal.record(profile_name, node, results)
+        if recorder is not None:
+            recorder(node)
+        if progress is not None:
+            progress.update(profile_name, *graph.progress())
+    
+    return on_done
+
+
+def add_profile_checks(graph, profile_name, args, regions_to_check, results, deadline=None):
+    """
+    Add a profile's checks to a CheckGraph
+    
+    Credentials are checked first and then the regions; once the available
+    regions are known, each region's runtime, model, key model, quota and
+    invocation checks are added as separate nodes so they all overlap, with
+    the SageMaker and cost checks waiting only for the key model listings.
+    
+    Args:
+        graph (CheckGraph): Graph to add the checks to
+        profile_name (str): AWS profile name to check (None for default credentials)
+        args (argparse.Namespace): Parsed command line arguments
+        regions_to_check (list): Regions to check (None for the checker's defaults)
+        results (dict): This profile's results structure
+        deadline (float, optional): time.monotonic() value the run must finish by
+    """
+    def apply_credentials(_):
+        # A profile without valid credentials is skipped
+        return bool(check_aws_credentials(profile_name, results=results))
+    
+    def apply_regions(_):
+        available_regions = check_bedrock_regions(profile_name, regions_to_check, max_workers=args.max_workers,
+                                                  results=results, deadline=deadline)
+        if not available_regions:
+            return False
+        add_region_checks(graph, profile_name, args, available_regions, results, deadline, add=_add_check)
+        return True
+    
+    def resume_regions(_):
+        # The available regions were restored from the checkpoint journal
+        add_region_checks(graph, profile_name, args, list(results.bedrock_regions.available), results, deadline,
+                          add=_add_check)
+    
+    _add_check(graph, profile_name, "credentials", lambda: warm(client_pool.caller_identity, profile_name),
+               apply=apply_credentials, component="aws_credentials")
+    _add_check(graph, profile_name, "regions", deps=["credentials"], apply=apply_regions,
+               component="bedrock_regions", resume=resume_regions)
+
+
+def run_profile_checks(profile_name, args, regions_to_check, deadline=None):
+    """
+    Run the full check pipeline for a single profile
+    
+    Nothing is printed; the results are rendered once the run's checks
+    have finished (see render_profile), so this is safe to call from
+    several threads at once.
+    
+    Args:
+        profile_name (str): AWS profile name to check (None for default credentials)
+        args (argparse.Namespace): Parsed command line arguments
+        regions_to_check (list): Regions to check (None for the checker's defaults)
+        deadline (float, optional): time.monotonic() value the run must finish by
+    
+    Returns:
+        dict: This profile's check results
+    """
+    results = new_check_results()
+    
+    # Continue from the checkpoint journal (--resume)
+    journal = active_journal()
+    if journal is not None:
+        journal.restore(profile_name, results)
+    
+    graph = CheckGraph()
+    graph.on_done = _on_done(profile_name, results, graph)
+    add_profile_checks(graph, profile_name, args, regions_to_check, results, deadline)
+    graph.run(deadline)
+    
+    # Record the checks cut off by the deadline
+    for node in graph.timed_out():
+        record_timed_out(node.component, node.region, results=results)
+        if graph.on_done is not None:
+            graph.on_done(node)
+    
+    # Attach this profile's API call timings (--timings)
+    if args.timings:
+        results.timings = timing_summary(profile_name)
+    
+    return results
+
+
+def render_profile(profile_name, results, profile_index=0, profile_count=1):
+    """
+    Print a profile's check results and summary dashboard
+    
+    Args:
+        profile_name (str): AWS profile name or account label (None for default credentials)
+        results (CheckResults): The profile's results
+        profile_index (int, optional): Position of this profile in the run
+        profile_count (int, optional): Total number of profiles in the run
+    """
+    checked = terminal_renderer.render(results, profile_name, profile_index, profile_count)
+    
+    # Checks stopped early (no credentials or no regions) only get the summary
+    if checked and profile_count > 1:
+        console.print(f"\n[bold]Summary for profile: {escape(profile_name or 'default')}[/bold]")
+    
+    display_summary_dashboard(results)
+
+
+# Role session names botocore makes up for profiles without role_session_name
+_DEFAULT_ROLE_SESSION = re.compile(r"^(arn:[^:]+:sts::\d+:assumed-role/[^/]+)/botocore-session-\d+$")
+
+# Number of profiles whose identities are looked up at the same time
+IDENTITY_LOOKUP_WORKERS = 8
+
+
+def _principal(identity):
+    """
+    Get the (account, ARN) pair identifying the principal behind a caller identity
+    
+    Roles assumed with botocore's generated session names differ only in the
+    timestamp of the session name, so that part is left out.
+    """
+    arn = identity['Arn']
+    match = _DEFAULT_ROLE_SESSION.match(arn)
+    return identity['Account'], match.group(1) if match else arn
+
+
+def group_profiles_by_identity(profiles, max_workers=IDENTITY_LOOKUP_WORKERS):
+    """
+    Group profiles that resolve to the same AWS principal
+    
+    Each profile's caller identity is looked up (concurrently, through the
+    client pool, so the credential check reuses it). Profiles whose identity
+    cannot be determined each stay in a group of their own, so their
+    credential check reports the problem as usual.
+    
+    Args:
+        profiles (list): AWS profile names (None for default credentials)
+        max_workers (int, optional): Number of identities looked up at the same time
+    
+    Returns:
+        list: Groups of profile names in the order the profiles were given; the
+            first profile of each group is the one to check
+    """
+    def lookup(profile_name):
+        try:
+            return _principal(client_pool.caller_identity(profile_name))
+        except Exception:
+            return None
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(profiles)))) as executor:
+        principals = list(executor.map(lookup, profiles))
+    
+    groups = {}
+    for profile_name, principal in zip(profiles, principals):
+        key = principal if principal is not None else ("profile", profile_name)
+        groups.setdefault(key, []).append(profile_name)
+    return list(groups.values())
+
+
+def plan_sweep(labels, regions_to_check, shard=None):
+    """
+    Get the regions this run checks for each profile or account
+    
+    Args:
+        labels (list): Profile names or account labels, in run order
+        regions_to_check (list): Regions to check (None for the checker's defaults)
+        shard (tuple, optional): (i, N) to check only shard i of N (--shard)
+    
+    Returns:
+        OrderedDict: Regions to check by label, for every label (an empty list
+            for profiles that belong entirely to other shards)
+    """
+    if shard is None:
+        return OrderedDict((label, regions_to_check) for label in labels)
+    in_shard = shard_plan(labels, regions_to_check or DEFAULT_REGIONS, *shard)
+    return OrderedDict((label, in_shard.get(label, [])) for label in labels)
+
+
+def _sweep_account(account_id, args, regions_to_check, deadline=None):
+    """
+    Assume the sweep role in one account and run its checks (in a worker thread)
+    
+    The account's results are not rendered; a summary line is printed
+    when it finishes and the full results go into the report.
+    
+    Returns:
+        tuple: (account label, results)
+    """
+    label = account_label(account_id, args.role_name)
+    try:
+        assume_account_role(account_id, args.role_name)
+    except Exception as e:
+        results = new_check_results()
+        results.aws_credentials.status = STATUS_ERROR
+        results.aws_credentials.errors.append(f"Could not assume role {args.role_name} in account {account_id}: {e}")
+        return label, results
+    
+    return label, run_profile_checks(label, args, regions_to_check, deadline)
+
+
+def _sweep_summary_line(account_id, account_name, results):
+    """Build the line printed when an account of a sweep finishes"""
+    account = f"{account_id} ({escape(account_name)})" if account_name else account_id
+    
+    if results.aws_credentials.status != STATUS_SUCCESS:
+        reason = results.aws_credentials.errors[0] if results.aws_credentials.errors else "credential check failed"
+        return f"[red]✗ {account}: {escape(reason)}[/red]"
+    if not results.bedrock_regions.available:
+        return f"[red]✗ {account}: no available Bedrock regions[/red]"
+    
+    available = len(results.key_models.available)
+    total = available + len(results.key_models.missing)
+    style = "green" if available == total else "yellow"
+    timed_out = f", {len(results.timed_out)} checks timed out" if results.timed_out else ""
+    return (f"[{style}]✓ {account}: {len(results.bedrock_regions.available)} regions, "
+            f"{available}/{total} key models{timed_out}[/{style}]")
+
+
+def run_org_sweep(args, regions_to_check, deadline=None):
+    """
+    Check every account of an organization sweep (--org-sweep)
+    
+    Roles are assumed and accounts checked --sweep-workers at a time. A
+    summary line is printed as soon as each account finishes, in completion
+    order. With --shard, only the accounts and regions of that shard are
+    checked.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        regions_to_check (list): Regions to check (None for the checker's defaults)
+        deadline (float, optional): time.monotonic() value the run must finish by
+    
+    Returns:
+        tuple: (results by account label in account order, sweep plan from plan_sweep())
+    """
+    base_profile = args.profile[0] if args.profile else None
+    assumed_role_sessions.configure(base_profile=base_profile)
+    
+    try:
+        accounts = load_accounts(args.accounts_file, base_profile)
+    except Exception as e:
+        console.print(f"[bold red]Could not get the accounts to sweep: {escape(str(e))}[/bold red]")
+        return {}, OrderedDict()
+    if not accounts:
+        console.print("[bold red]No accounts to sweep.[/bold red]")
+        return {}, OrderedDict()
+    
+    plan = plan_sweep([account_label(account_id, args.role_name) for account_id, _ in accounts],
+                      regions_to_check, args.shard)
+    accounts = [(account_id, account_name) for account_id, account_name in accounts
+                if plan[account_label(account_id, args.role_name)] != []]
+    
+    console.print(f"[bold]Sweeping {len(accounts)} accounts with role {args.role_name} "
+                  f"({args.sweep_workers} at a time)...[/bold]")
+    
+    sweep_results = {}
+    with ThreadPoolExecutor(max_workers=args.sweep_workers) as executor:
+        futures = {
+            executor.submit(_sweep_account, account_id, args, plan[account_label(account_id, args.role_name)],
+                            deadline): (account_id, account_name)
+            for account_id, account_name in accounts
+        }
+        for finished, future in enumerate(as_completed(futures), 1):
+            account_id, account_name = futures[future]
+            label, results = future.result()
+            sweep_results[label] = results
+            console.print(f"\\[{finished}/{len(accounts)}] {_sweep_summary_line(account_id, account_name, results)}")
+    
+    results = {account_label(account_id, args.role_name): sweep_results[account_label(account_id, args.role_name)]
+               for account_id, _ in accounts}
+    return results, plan
+
+
+def write_reports(profile_results, output_format=None, compare=False):
+    """
+    Show the profile comparison and write the output files of a run
+    
+    A run over several profiles gets one consolidated report; the profile
+    comparison is computed once for both the console and the report.
+    
+    Args:
+        profile_results (dict): CheckResults by profile name or account label
+        output_format (str, optional): 'json', 'csv' or 'html' (None for no output files)
+        compare (bool, optional): Show the profile comparison if more than one profile was checked
+    
+    Returns:
+        dict: The profile comparison (None if only one profile was checked)
+    """
+    comparison = compare_profiles(profile_results) if len(profile_results) > 1 else None
+    
+    # If multiple profiles were checked and --compare was specified, display a comparison
+    if comparison is not None and compare:
+        compare_profile_results(profile_results, comparison)
+    
+    # Handle output formats if specified
+    if output_format and profile_results:
+        if comparison is not None:
+            filename = write_consolidated_report(output_format, profile_results, comparison)
+            console.print(f"\n[green]Results for {len(profile_results)} profiles saved to {filename}[/green]")
+        else:
+            output_results(output_format, results=next(iter(profile_results.values())))
+    return comparison
+
+
+def _shard_argument(text):
+    """argparse type for --shard"""
+    try:
+        return parse_shard(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _positive_int(text):
+    """argparse type for counts that must be at least 1"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {text!r}")
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return value
+
+
+def _positive_float(text):
+    """argparse type for rates that must be greater than 0"""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number, got {text!r}")
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return value
+
+
+def _endpoint_argument(text):
+    """argparse type for --endpoint-url: URL for all services, or SERVICE=URL"""
+    service, sep, url = text.partition('=')
+    if not sep:
+        service, url = '*', text
+    if not re.match(r'^https?://', url):
+        raise argparse.ArgumentTypeError(f"expected URL or SERVICE=URL with an http(s) URL, got {text!r}")
+    return service, url
+
+
+def _timestamp():
+    """Timestamp of a run, as used in output file names"""
+    return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def merge_main(argv):
+    """
+    Combine the partial result files of a sharded sweep into one report (the merge subcommand)
+    
+    Args:
+        argv (list): Command line arguments after 'merge'
+    """
+    parser = argparse.ArgumentParser(prog='check-bedrock-access.py merge',
+                                     description='Combine the partial result files written by --shard runs')
+    parser.add_argument('files', nargs='+', metavar='PARTIAL', help='Partial result files, one per shard')
+    parser.add_argument('--output', '-o', choices=['json', 'csv', 'html'], help='Output format for the combined results')
+    parser.add_argument('--compare', '-c', action='store_true', help='Compare results when the sweep covered multiple profiles')
+    parser.add_argument('--format', '-f', choices=['rich', 'machine'], default='rich', help='Console output: rich (default), or machine for only the combined results as JSON on standard output')
+    parser.add_argument('--quiet', '-q', action='store_true', help='Same as --format machine')
+    args = parser.parse_args(argv)
+    machine = args.quiet or args.format == 'machine'
+    if machine:
+        console.quiet = True
+    
+    try:
+        partials, count, missing = read_partials(args.files)
+    except (OSError, ValueError) as e:
+        console.print(f"[bold red]Could not read the partial results: {escape(str(e))}[/bold red]")
+        sys.exit(1)
+    if missing:
+        shards = ", ".join(f"{index}/{count}" for index in missing)
+        console.print(f"[yellow]Warning: no results for shard {shards}; the report only covers the other shards.[/yellow]")
+    
+    profile_results = merge_partials(partials)
+    console.print(f"[bold]Merged {len(partials)} of {count} shards covering {len(profile_results)} profiles.[/bold]")
+    
+    for profile_index, (profile_name, results) in enumerate(profile_results.items()):
+        render_profile(profile_name, results, profile_index, len(profile_results))
+    
+    comparison = write_reports(profile_results, args.output, args.compare)
+    if machine:
+        write_json(sys.stdout, profile_results, comparison or compare_profiles(profile_results), _timestamp())
+        sys.stdout.flush()
+        console.quiet = False
+
+
 def main():
     """Main entry point for the AWS Bedrock Access Checker"""
+    # Subcommands come first on the command line; everything else is a check run
+    if sys.argv[1:2] == ['merge']:
+        return merge_main(sys.argv[2:])
+    if sys.argv[1:2] == ['standin']:
+        return standin_main(sys.argv[2:])
+    
     # Parse command line arguments
-    parser = argparse.ArgumentParser(description='Check AWS Bedrock access with profile support')
+    parser = argparse.ArgumentParser(description='Check AWS Bedrock access with profile support',
+                                     epilog='Use "%(prog)s merge PARTIAL..." to combine the results of --shard runs, '
+                                            'and "%(prog)s standin" to serve a local stand-in for the AWS APIs.')
     parser.add_argument('--profile', '-p', action='append', help='AWS profile name(s) to use (can be specified multiple times)')
     parser.add_argument('--all-profiles', '-P', action='store_true', help='Check all available AWS profiles')
     parser.add_argument('--interactive', '-i', action='store_true', help='Interactive mode to select profile and/or regions')
-    parser.add_argument('--output', '-o', choices=['json', 'csv', 'html'], help='Output format for saving results')
+    parser.add_argument('--output', '-o', choices=['json', 'csv', 'html', 'ndjson'], help='Output format for saving results (ndjson streams a record per check as it finishes)')
+    parser.add_argument('--format', '-f', choices=['rich', 'machine'], default='rich', help='Console output: rich tables and panels (default), or machine, which prints nothing but the final results as JSON on standard output')
+    parser.add_argument('--quiet', '-q', action='store_true', help='Same as --format machine')
+    parser.add_argument('--stream', nargs='?', const=STDOUT, metavar='FILE', help='Stream a JSON record per finished check to FILE as the run goes (default: standard output, with the console output moved to standard error)')
     parser.add_argument('--region', '-r', action='append', help='Specific AWS region(s) to check (can be used multiple times)')
     parser.add_argument('--all-regions', '-a', action='store_true', help='Check all Bedrock-supported regions')
     parser.add_argument('--test-invoke', '-t', action='store_true', help='Test model invocation to verify full access (may incur costs)')
@@ -161,8 +693,107 @@ def main():
     parser.add_argument('--sagemaker-alternatives', '-s', action='store_true', help='Check SageMaker JumpStart for alternatives to missing Bedrock models')
     parser.add_argument('--estimate-costs', '-e', action='store_true', help='Show cost estimates for using available Bedrock models')
     parser.add_argument('--compare', '-c', action='store_true', help='Compare results when checking multiple profiles')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS, help=f'Maximum number of regions to probe concurrently (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--max-in-flight', type=_positive_int, default=DEFAULT_MAX_IN_FLIGHT, help=f'Maximum number of test invocations in flight per region (default: {DEFAULT_MAX_IN_FLIGHT})')
+    parser.add_argument('--invoke-rate', type=_positive_float, default=DEFAULT_INVOKE_RATE, help=f'Test invocations per second for each model family in a region (default: {DEFAULT_INVOKE_RATE})')
+    parser.add_argument('--invoke-deadline', type=float, default=DEFAULT_INVOKE_DEADLINE, metavar='SECONDS', help=f'Time allowed for retrying throttled test invocations in a region (default: {DEFAULT_INVOKE_DEADLINE})')
+    parser.add_argument('--deadline', type=float, metavar='SECONDS', help='Stop the whole run after this many seconds, reporting unfinished checks as timed out')
+    parser.add_argument('--connect-timeout', type=float, default=DEFAULT_CONNECT_TIMEOUT, metavar='SECONDS', help=f'Connection timeout for each AWS API call (default: {DEFAULT_CONNECT_TIMEOUT})')
+    parser.add_argument('--read-timeout', type=float, default=DEFAULT_READ_TIMEOUT, metavar='SECONDS', help=f'Read timeout for each AWS API call (default: {DEFAULT_READ_TIMEOUT}; model invocations allow 60)')
+    parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS, help=f'Attempts per AWS API call, retries included (default: {DEFAULT_MAX_ATTEMPTS})')
+    parser.add_argument('--timings', action='store_true', help='Time every AWS API call and show a breakdown (also saved under "timings" in JSON output)')
+    parser.add_argument('--trace-file', metavar='FILE', help='Write a Chrome trace (chrome://tracing, Perfetto) of every check and AWS API call to FILE')
+    parser.add_argument('--max-concurrency', type=_positive_int, default=DEFAULT_MAX_CONCURRENCY, help=f'Maximum number of checks running at once across all profiles (default: {DEFAULT_MAX_CONCURRENCY})')
+    parser.add_argument('--parallel-profiles', type=int, default=1, metavar='N', help='Check up to N profiles concurrently (default: 1, one at a time)')
+    parser.add_argument('--no-dedupe-profiles', action='store_true', help='Check every profile in full, even profiles that resolve to the same account and role or user')
+    parser.add_argument('--org-sweep', action='store_true', help='Check the accounts of an AWS Organization (or --accounts-file) by assuming --role-name in each, using --profile as the base credentials')
+    parser.add_argument('--accounts-file', metavar='FILE', help='Accounts for --org-sweep, one 12-digit account ID (optionally followed by a name) per line (default: organizations:ListAccounts)')
+    parser.add_argument('--role-name', default=DEFAULT_ROLE_NAME, help=f'Role to assume in each account for --org-sweep (default: {DEFAULT_ROLE_NAME})')
+    parser.add_argument('--sweep-workers', type=int, default=DEFAULT_SWEEP_WORKERS, metavar='N', help=f'Accounts checked concurrently during --org-sweep (default: {DEFAULT_SWEEP_WORKERS})')
+    parser.add_argument('--shard', type=_shard_argument, metavar='I/N', help='Only check shard I of N of the profile/region units, writing partial results for the merge subcommand')
+    parser.add_argument('--shard-file', metavar='FILE', help='Partial result file of a --shard run (default: bedrock_check_shard_I_of_N.json)')
+    parser.add_argument('--checkpoint', metavar='JOURNAL', help='Record every completed check in JOURNAL (replacing its contents) so an interrupted run can be continued with --resume')
+    parser.add_argument('--resume', metavar='JOURNAL', help='Continue an interrupted run: skip the checks JOURNAL lists as done, restore their results, and keep appending to JOURNAL')
+    parser.add_argument('--endpoint-url', type=_endpoint_argument, action='append', metavar='[SERVICE=]URL', help='Send AWS API calls to URL instead of AWS, e.g. a local stand-in server (can be used multiple times; SERVICE=URL overrides a single service such as bedrock-runtime)')
+    parser.add_argument('--max-pool-connections', type=int, default=DEFAULT_MAX_POOL_CONNECTIONS, help=f'HTTP connections kept open per AWS client (default: {DEFAULT_MAX_POOL_CONNECTIONS})')
+    parser.add_argument('--cache', action='store_true', help=f'Cache model catalogs, model details, quotas and assumed-role/SSO credentials on disk between runs (also enabled by {CACHE_ENV_VAR}=1)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the disk cache even if it is enabled by the environment')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached entries and refresh the disk cache from AWS')
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_CACHE_TTL, metavar='SECONDS', help=f'How long cached entries stay valid (default: {DEFAULT_CACHE_TTL})')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help=f'Disk cache directory (default: {DEFAULT_CACHE_DIR})')
     args = parser.parse_args()
     
+    # Machine mode skips all console rendering; the results are printed as JSON at the end
+    machine = args.quiet or args.format == 'machine'
+    if machine:
+        if args.interactive:
+            parser.error("--interactive cannot be combined with --quiet or --format machine")
+        console.quiet = True
+    
+    # Stream a record per finished check unit (--stream, --output ndjson)
+    stream_path = args.stream or (stream_filename() if args.output == 'ndjson' else None)
+    try:
+        _run_main(args, machine, stream_path)
+    finally:
+        # Early returns and errors too: flush the journal and stream, and give the console back
+        close_stream()
+        if stream_path == STDOUT:
+            # Back to standard output
+            console.file = None
+        if machine:
+            console.quiet = False
+        close_journal()
+
+
+def _run_main(args, machine, stream_path):
+    """
+    Run the checks and write the output of a check run (main() after parsing the arguments)
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        machine (bool): Machine mode (--quiet, --format machine)
+        stream_path (str): Where check records are streamed (None for nowhere)
+    """
+    # The deadline covers everything from here on, across all profiles
+    deadline = time.monotonic() + args.deadline if args.deadline else None
+    
+    # Limit how many checks run at once
+    concurrency_budget.resize(args.max_concurrency)
+    
+    # Bound and rate limit the test invocations
+    invocation_prober.configure(max_in_flight=args.max_in_flight, rate=args.invoke_rate, deadline=args.invoke_deadline)
+    
+    # Instrument AWS clients before any are created
+    if args.timings:
+        enable_timings()
+    if args.trace_file:
+        enable_tracing()
+    
+    # Size the connection pools of the shared AWS clients
+    client_pool.configure(max_pool_connections=args.max_pool_connections, connect_timeout=args.connect_timeout,
+                          read_timeout=args.read_timeout, max_attempts=args.max_attempts,
+                          endpoint_urls=dict(args.endpoint_url or ()))
+    
+    # Turn on the disk cache if requested (--no-cache always wins); assumed-role
+    # and SSO credentials are then kept between runs too, until they expire
+    if (args.cache or args.refresh or cache_enabled_by_env()) and not args.no_cache:
+        enable_disk_cache(args.cache_dir, ttl=args.cache_ttl, refresh=args.refresh)
+        credential_cache.configure(os.path.join(args.cache_dir, CREDENTIAL_CACHE_SUBDIR))
+    
+    # Journal completed checks, or pick up where an interrupted run stopped
+    if args.resume:
+        journal = open_journal(args.resume, resume=True)
+        console.print(f"[bold]Resuming from {escape(args.resume)}: {journal.resumed_checks} completed checks will be skipped.[/bold]")
+    elif args.checkpoint:
+        open_journal(args.checkpoint)
+    
+    # Stream a record per finished check unit
+    if stream_path == STDOUT:
+        # Standard output is kept for the records
+        console.file = sys.stderr
+    if stream_path:
+        open_stream(stream_path)
+    
     # Initialize results storage for multiple profiles
     all_profile_results = {}
     
@@ -242,200 +873,118 @@ def main():
         border_style="blue"
     ))
     
-    # Initialize a dictionary to store results for each profile
-    from copy import deepcopy
-    
-    # Loop through each profile and run the checks
-    for profile_index, profile_name in enumerate(profiles_to_check):
-        # Reset check_results for each profile 
-        global check_results
-        check_results = {
-            "aws_credentials": {"status": None, "details": [], "errors": []},
-            "bedrock_regions": {"status": None, "available": [], "details": [], "errors": []},
-            "bedrock_runtime": {"status": None, "available": [], "details": [], "errors": []},
-            "bedrock_models": {"status": None, "available": [], "details": [], "errors": []},
-            "key_models": {"status": None, "available": [], "missing": [], "details": [], "errors": []},
-            "cost_estimates": {"models": {}, "details": []},
-        }
-        
-        # Print header for current profile
-        if len(profiles_to_check) > 1:
-            console.print(f"\n[bold]=== Checking profile {profile_index + 1}/{len(profiles_to_check)}: {profile_name or 'default'} ===[/bold]")
-        elif profile_name:
-            console.print(f"[bold]Using AWS profile: [cyan]{profile_name}[/cyan][/bold]")
-        
-        # Check AWS credentials
-        if not check_aws_credentials(profile_name):
-            console.print(f"\n[bold red]AWS credential check failed for profile '{profile_name or 'default'}'. Skipping this profile.[/bold red]")
-            # Store the results for this profile anyway
-            all_profile_results[profile_name or "default"] = deepcopy(check_results)
-            continue
-    
-        # Determine which regions to check
-        regions_to_check = None
-        
-        # Get list of all Bedrock regions from checker module
-        from bedrock_access_checker.checker import all_bedrock_regions
-        
-        if args.all_regions:
-            # Use all available Bedrock regions
-            regions_to_check = all_bedrock_regions.copy()
-            console.print(f"[bold]Checking all {len(regions_to_check)} Bedrock-supported regions...[/bold]")
-        elif args.region:
-            # Use regions specified on the command line
-            regions_to_check = args.region
-            # Validate regions
-            for region in regions_to_check[:]:
-                if region not in all_bedrock_regions:
-                    console.print(f"[yellow]Warning: {region} may not support Bedrock[/yellow]")
-        elif args.interactive:
-            # Interactive region selection
-            from rich.checkbox import Checkbox
-            
-            console.print("\n[bold]Select regions to check:[/bold]")
-            
-            # Group regions by geography for easier selection
-            region_groups = {
-                "US Regions": [r for r in all_bedrock_regions if r.startswith("us-")],
-                "Europe Regions": [r for r in all_bedrock_regions if r.startswith("eu-")],
-                "Asia Pacific Regions": [r for r in all_bedrock_regions if r.startswith("ap-")],
-                "Other Regions": [r for r in all_bedrock_regions if not (r.startswith("us-") or r.startswith("eu-") or r.startswith("ap-"))]
-            }
-            
-            # Create region choices with human-readable names
-            region_display = {
-                'us-east-1': 'US East (N. Virginia)',
-                'us-east-2': 'US East (Ohio)',
-                'us-west-1': 'US West (N. California)',
-                'us-west-2': 'US West (Oregon)',
-                'ap-northeast-1': 'Asia Pacific (Tokyo)',
-                'ap-northeast-2': 'Asia Pacific (Seoul)',
-                'ap-south-1': 'Asia Pacific (Mumbai)',
-                'ap-southeast-1': 'Asia Pacific (Singapore)',
-                'ap-southeast-2': 'Asia Pacific (Sydney)',
-                'eu-central-1': 'Europe (Frankfurt)',
-                'eu-north-1': 'Europe (Stockholm)',
-                'eu-west-1': 'Europe (Ireland)',
-                'eu-west-2': 'Europe (London)',
-                'eu-west-3': 'Europe (Paris)',
-                'ca-central-1': 'Canada (Central)'
-            }
-            
-            # Display choices by group
-            selected_regions = []
-            
-            console.print("\nSelect regions to check (space to select, enter to confirm):")
-            
-            for group_name, group_regions in region_groups.items():
-                if not group_regions:
-                    continue
-                    
-                console.print(f"\n[bold]{group_name}:[/bold]")
-                choices = [f"{r} - {region_display.get(r, r)}" for r in group_regions]
-                
-                # Use Prompt.ask for each region rather than Checkbox which is harder to use in CLI
-                for i, choice in enumerate(choices):
-                    include = Prompt.ask(f"  Include {choice}", choices=["y", "n"], default="n")
-                    if include.lower() == "y":
-                        selected_regions.append(group_regions[i])
-            
-            # Make sure at least one region is selected
-            if not selected_regions:
-                console.print("[yellow]No regions selected. Using default regions (us-east-1, us-west-2).[/yellow]")
-                selected_regions = ['us-east-1', 'us-west-2']
-            else:
-                console.print(f"[green]Selected {len(selected_regions)} regions for checking.[/green]")
-                
-            regions_to_check = selected_regions
-        
-        # Check Bedrock regions
-        available_regions = check_bedrock_regions(profile_name, regions_to_check)
-        
-        if not available_regions:
-            console.print("\n[bold red]No available Bedrock regions found![/bold red]")
-            console.print("[yellow]Possible reasons:[/yellow]")
-            console.print("1. Your AWS account doesn't have Bedrock enabled")
-            console.print("2. Your AWS credentials don't have Bedrock permissions")
-            console.print("3. Bedrock isn't available in your account's regions")
-            
-            # Store the results for this profile
-            all_profile_results[profile_name or "default"] = deepcopy(check_results)
-            
-            # Skip to the next profile
-            continue
-        
-        # For each available region, check runtime access and models
-        for region in available_regions:
-            check_bedrock_runtime_access(region, profile_name)
-            check_bedrock_models(region, profile_name)
-            check_specific_models_simple(region, profile_name, args.test_invoke, args.advanced)
-            
-        # Check SageMaker JumpStart alternatives if requested
-        if args.sagemaker_alternatives and check_results["key_models"]["missing"]:
-            # Use the first valid region for checking SageMaker alternatives
-            sagemaker_region = available_regions[0] if available_regions else "us-east-1"
-            check_sagemaker_jumpstart_alternatives(check_results["key_models"]["missing"], sagemaker_region, profile_name)
-            
-        # Estimate costs if requested
-        if args.estimate_costs and check_results["key_models"]["available"]:
-            # Import the function
-            from bedrock_access_checker.checker import estimate_model_costs
-            # Use the first valid region for cost estimation (pricing may vary by region)
-            cost_region = available_regions[0] if available_regions else "us-east-1"
-            estimate_model_costs(check_results["key_models"]["available"], cost_region, profile_name)
-        
-        # Store the results for this profile
-        all_profile_results[profile_name or "default"] = deepcopy(check_results)
-        
-        # Add notices based on mode
-        if args.test_invoke:
-            console.print("\n[yellow]Notice: Model invocation tests may have incurred small AWS charges.[/yellow]")
-        
-        if args.advanced:
-            console.print("\n[blue]Advanced mode: Detailed model information and quotas have been included in the results.[/blue]")
-            
-        if args.sagemaker_alternatives:
-            console.print("\n[blue]SageMaker JumpStart alternatives have been suggested for missing Bedrock models.[/blue]")
-        
-        if args.estimate_costs:
-            console.print("\n[blue]Cost estimates have been provided for available Bedrock models.[/blue]")
-        
-        # Display the summary dashboard for each profile
-        if len(profiles_to_check) > 1:
-            console.print(f"\n[bold]Summary for profile: {profile_name or 'default'}[/bold]")
-        
-        display_summary_dashboard()
+    # Determine which regions to check (shared by all profiles)
+    regions_to_check = select_regions(args)
     
-    # If multiple profiles were checked and --compare was specified, display a comparison
-    if len(profiles_to_check) > 1 and args.compare:
-        compare_profile_results(all_profile_results)
+    # With --shard, only this shard's profiles and regions are checked. The plan is made from the
+    # configured profiles, so every shard agrees on it whatever their identity lookups return
+    profile_regions = plan_sweep(profiles_to_check, regions_to_check, args.shard)
+    planned_profiles = profiles_to_check
+    if args.shard and not args.org_sweep:
+        planned_profiles = [profile_name for profile_name in profiles_to_check if profile_regions[profile_name] != []]
+        unit_count = sum(len(regions) for regions in profile_regions.values())
+        console.print(f"[bold]Shard {args.shard[0]}/{args.shard[1]}: checking {unit_count} profile/region "
+                      f"units of {len(planned_profiles)} profiles.[/bold]")
     
-    # Handle output formats if specified
-    if args.output:
-        # For multiple profiles, create separate output files for each profile
-        if len(profiles_to_check) > 1:
-            for profile_name, results in all_profile_results.items():
-                # Temporarily replace check_results with this profile's results
-                temp_results = check_results
-                check_results = results
-                
-                # Create a filename that includes the profile name
-                output_results(args.output, f"{profile_name}_")
-                
-                # Restore the original check_results
-                check_results = temp_results
+    # Profiles that are aliases for the same principal are only checked once
+    if len(planned_profiles) > 1 and not args.org_sweep and not args.no_dedupe_profiles:
+        profile_groups = []
+        for group in group_profiles_by_identity(planned_profiles):
+            # A shard can only check aliases once if it has the same regions for each of them
+            by_regions = OrderedDict()
+            for profile_name in group:
+                by_regions.setdefault(tuple(profile_regions[profile_name] or ()), []).append(profile_name)
+            profile_groups.extend(by_regions.values())
+    else:
+        profile_groups = [[profile_name] for profile_name in planned_profiles]
+    for group in profile_groups:
+        if len(group) > 1:
+            aliases = ", ".join(profile_name or "default" for profile_name in group[1:])
+            console.print(f"[dim]{aliases}: same identity as {group[0] or 'default'}, checked once.[/dim]")
+    unique_profiles = [group[0] for group in profile_groups]
+    
+    if len(unique_profiles) == 1 and unique_profiles[0] and not args.org_sweep:
+        console.print(f"[bold]Using AWS profile: [cyan]{escape(unique_profiles[0])}[/cyan][/bold]")
+    
+    # The checks print nothing while they run; a progress bar counts the finished checks instead
+    start_progress()
+    unique_results = {}
+    try:
+        if args.org_sweep:
+            # Assume a role in each account and check the accounts concurrently
+            all_profile_results, sweep_plan = run_org_sweep(args, regions_to_check, deadline)
+        elif args.parallel_profiles > 1 and len(unique_profiles) > 1:
+            # Run every profile's pipeline concurrently, each with its own results
+            with ThreadPoolExecutor(max_workers=args.parallel_profiles) as executor:
+                futures = [
+                    executor.submit(run_profile_checks, profile_name, args, profile_regions[profile_name], deadline)
+                    for profile_name in unique_profiles
+                ]
+                for profile_name, future in zip(unique_profiles, futures):
+                    unique_results[profile_name] = future.result()
         else:
-            output_results(args.output)
-            
-    # If multiple profiles were checked, display a summary
-    if len(profiles_to_check) > 1:
-        console.print(f"\n[bold green]Completed checking {len(profiles_to_check)} AWS profiles.[/bold green]")
+            # Loop through each profile and run the checks
+            for profile_name in unique_profiles:
+                unique_results[profile_name] = run_profile_checks(profile_name, args, profile_regions[profile_name],
+                                                                  deadline)
+    finally:
+        stop_progress()
+    
+    if args.org_sweep:
+        if not sweep_plan:
+            return
+        profiles_to_check = list(all_profile_results)
+    else:
+        # Render every profile's results once all of them are in, in profile order
+        for profile_index, profile_name in enumerate(unique_profiles):
+            render_profile(profile_name, unique_results[profile_name], profile_index, len(unique_profiles))
+    
+    # Every alias gets the results of the profile checked for its principal
+    if not args.org_sweep:
+        checked_as = {profile_name: group[0] for group in profile_groups for profile_name in group}
+        all_profile_results = {profile_name or "default": unique_results[checked_as[profile_name]]
+                               for profile_name in profiles_to_check if profile_name in checked_as}
+        sweep_plan = OrderedDict((profile_name or "default", profile_regions[profile_name])
+                                 for profile_name in profiles_to_check)
+    
+    if args.shard:
+        # Reports are made by the merge subcommand once every shard has finished
+        shard_file = args.shard_file or partial_filename(*args.shard)
+        write_partial(shard_file, args.shard[0], args.shard[1], list(sweep_plan), regions_to_check or DEFAULT_REGIONS,
+                      all_profile_results,
+                      OrderedDict((label, regions) for label, regions in sweep_plan.items() if regions))
+        console.print(f"\n[green]Partial results of shard {args.shard[0]}/{args.shard[1]} saved to {shard_file}[/green]")
+    else:
+        comparison = write_reports(all_profile_results, None if args.output == 'ndjson' else args.output, args.compare)
+        
+        # The final results are the only output in machine mode (unless records are streamed there)
+        if machine and stream_path != STDOUT:
+            if comparison is None:
+                comparison = compare_profiles(all_profile_results)
+            write_json(sys.stdout, all_profile_results, comparison, _timestamp())
+            sys.stdout.flush()
+    
+    # If multiple profiles were checked, display a summary (shards are summarized by merge)
+    if len(profiles_to_check) > 1 and not args.shard:
+        checked = "accounts" if args.org_sweep else "AWS profiles"
+        console.print(f"\n[bold green]Completed checking {len(profiles_to_check)} {checked}.[/bold green]")
+        if len(unique_profiles) < len(profiles_to_check) and not args.org_sweep:
+            console.print(f"[dim]They resolve to {len(unique_profiles)} distinct identities, each checked once.[/dim]")
         
         # Count profiles with access
         profiles_with_access = sum(1 for results in all_profile_results.values() 
-                                  if results["key_models"]["available"])
+                                  if results.key_models.available)
         
-        console.print(f"[green]{profiles_with_access}/{len(profiles_to_check)} profiles have Bedrock access.[/green]")
+        console.print(f"[green]{profiles_with_access}/{len(profiles_to_check)} {checked} have Bedrock access.[/green]")
+    
+    # Write the trace last so it covers the output step too
+    if args.trace_file:
+        span_count = write_trace(args.trace_file)
+        console.print(f"\n[green]Trace with {span_count} spans saved to {args.trace_file}[/green]")
+    
+    stream = active_stream()
+    if stream is not None and stream_path != STDOUT:
+        console.print(f"\n[green]{stream.count} check records streamed to {stream_path}[/green]")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,302 @@
+"""
+Shared AWS sessions and clients for the AWS Bedrock Access Checker
+
+Creating a boto3 session re-resolves credentials and reloads the botocore
+service models, and every new client opens its own TLS connections. The pool
+in this module creates each session and client once and shares them between
+all checks (and threads) for the whole run.
+
+Every client gets explicit connect/read timeouts and a bounded retry
+budget, so an unreachable regional endpoint fails within seconds instead of
+stalling a check for botocore's defaults (60 second timeouts, retried).
+
+Sessions share one credential cache and have their temporary credentials
+refreshed ahead of expiry in the background (see credentials.py).
+
+Endpoint overrides send a service's calls (or all calls) to another URL,
+such as the local stand-in server in standin.py.
+
+Everything is kept for the whole run unless a TTL is set; long-lived
+processes (see aio.py) set one so sessions, clients and caller identities
+are rebuilt from time to time instead of piling up.
+"""
+
+import threading
+import time
+
+import boto3
+from botocore.config import Config
+
+from bedrock_access_checker.credentials import credential_refresher, prepare_session
+from bedrock_access_checker.timings import active_recorder
+
+# Default size of each client's HTTP connection pool
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+# Default timeouts (seconds) and total attempts per API call
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 20
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Per-service overrides of the defaults above
+SERVICE_CALL_OVERRIDES = {
+    # Model invocations can take a while to respond, and throttled
+    # invocations are retried by the invocation prober itself
+    'bedrock-runtime': {"read_timeout": 60, "max_attempts": 1},
+}
+
+
+class ClientPool:
+    """
+    Thread-safe pool of boto3 sessions and clients
+
+    Sessions are keyed by profile and clients by (profile, service, region).
+    boto3 sessions are not safe to use from several threads at once, so a
+    profile's session and clients are built under that profile's own lock.
+    The pool-wide lock only guards the dictionaries, so resolving one
+    profile's credentials (which may mean an STS or SSO call) never holds up
+    lookups for the others. The clients themselves are thread-safe once
+    created.
+
+    With a TTL, a profile's session is dropped that many seconds after it was
+    created, together with its clients and caller identity. Sessions added
+    with register_session() are kept until they are replaced or cleared.
+    """
+
+    def __init__(self, max_pool_connections=DEFAULT_MAX_POOL_CONNECTIONS, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=DEFAULT_READ_TIMEOUT, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.max_pool_connections = max_pool_connections
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_attempts = max_attempts
+        self.endpoint_urls = {}
+        self.ttl = None
+        self._lock = threading.RLock()
+        self._sessions = {}
+        self._registered = set()
+        self._clients = {}
+        self._identities = {}
+        self._profile_locks = {}
+        # time.monotonic() when each profile's session was created (registered sessions are not listed)
+        self._created = {}
+
+    def _profile_lock(self, profile_name):
+        """Get the lock that serializes building a profile's session and clients"""
+        with self._lock:
+            return self._profile_locks.setdefault(profile_name, threading.RLock())
+
+    def configure(self, max_pool_connections=None, connect_timeout=None, read_timeout=None, max_attempts=None,
+                  endpoint_urls=None):
+        """
+        Change the settings used for clients created from now on
+
+        Args:
+            max_pool_connections (int, optional): HTTP connections kept per client
+            connect_timeout (float, optional): Seconds to wait for a connection
+            read_timeout (float, optional): Seconds to wait for a response
+            max_attempts (int, optional): Total attempts per API call, retries included
+            endpoint_urls (dict, optional): Endpoint URL by service name, with '*' for all
+                services ({} removes the overrides)
+        """
+        with self._lock:
+            if max_pool_connections is not None:
+                self.max_pool_connections = max_pool_connections
+            if connect_timeout is not None:
+                self.connect_timeout = connect_timeout
+            if read_timeout is not None:
+                self.read_timeout = read_timeout
+            if max_attempts is not None:
+                self.max_attempts = max_attempts
+            if endpoint_urls is not None:
+                self.endpoint_urls = dict(endpoint_urls)
+
+    def set_ttl(self, ttl):
+        """
+        Change how long sessions, clients and caller identities are kept
+
+        Args:
+            ttl (float): Seconds a profile's session and everything built from it are kept
+                (None to keep them for the whole run)
+        """
+        with self._lock:
+            self.ttl = ttl
+
+    def _expire(self):
+        """Drop the sessions older than the TTL, with their clients and caller identities"""
+        with self._lock:
+            if self.ttl is None:
+                return
+            cutoff = time.monotonic() - self.ttl
+            expired = [profile_name for profile_name, created in self._created.items() if created <= cutoff]
+            sessions = []
+            for profile_name in expired:
+                del self._created[profile_name]
+                sessions.append(self._sessions.pop(profile_name, None))
+                self._identities.pop(profile_name, None)
+                self._profile_locks.pop(profile_name, None)
+            for key in [key for key in self._clients if key[0] in expired]:
+                del self._clients[key]
+
+        # The dropped sessions' credentials no longer need refreshing
+        for session in sessions:
+            if session is None:
+                continue
+            try:
+                credential_refresher.unwatch(session.get_credentials())
+            except Exception:
+                # A profile whose credentials never resolved has nothing watched
+                pass
+
+    def client_config(self, service):
+        """
+        Build the botocore config for a service's clients
+
+        Args:
+            service (str): AWS service name
+
+        Returns:
+            botocore.config.Config: Connection pool, timeout and retry settings
+        """
+        settings = {
+            "connect_timeout": self.connect_timeout,
+            "read_timeout": self.read_timeout,
+            "max_attempts": self.max_attempts,
+        }
+        settings.update(SERVICE_CALL_OVERRIDES.get(service, {}))
+
+        return Config(
+            max_pool_connections=self.max_pool_connections,
+            connect_timeout=settings["connect_timeout"],
+            read_timeout=settings["read_timeout"],
+            retries={"max_attempts": settings["max_attempts"], "mode": "standard"}
+        )
+
+    def session(self, profile_name=None):
+        """
+        Get the shared session for a profile
+
+        Args:
+            profile_name (str, optional): AWS profile name to use
+
+        Returns:
+            boto3.Session: The profile's session
+        """
+        self._expire()
+        with self._lock:
+            session = self._sessions.get(profile_name)
+        if session is not None:
+            return session
+
+        # Only one thread builds a profile's session; the others wait for it
+        with self._profile_lock(profile_name):
+            with self._lock:
+                session = self._sessions.get(profile_name)
+            if session is None:
+                # Resolves the credentials, outside the pool-wide lock
+                session = prepare_session(boto3.Session(profile_name=profile_name))
+                with self._lock:
+                    self._sessions[profile_name] = session
+                    self._created[profile_name] = time.monotonic()
+            return session
+
+    def register_session(self, profile_name, session):
+        """
+        Use a ready-made session (e.g. assumed-role credentials) under a profile name
+        
+        Checks given this name use the session instead of looking the name up
+        in the local AWS configuration.
+        
+        Args:
+            profile_name (str): Name the checks will use for the session
+            session (boto3.Session): The session to use
+        """
+        with self._profile_lock(profile_name):
+            with self._lock:
+                self._sessions[profile_name] = session
+                self._registered.add(profile_name)
+                self._created.pop(profile_name, None)
+        credential_refresher.watch(session.get_credentials())
+
+    def is_registered(self, profile_name):
+        """
+        Check whether a profile name refers to a registered session rather than the local AWS configuration
+        
+        Args:
+            profile_name (str): Profile name
+        
+        Returns:
+            bool: True if the name was registered with register_session()
+        """
+        with self._lock:
+            return profile_name in self._registered
+
+    def client(self, service, region_name=None, profile_name=None):
+        """
+        Get the shared client for a service in a region
+
+        Args:
+            service (str): AWS service name (e.g. 'bedrock')
+            region_name (str, optional): AWS region (None for the session default)
+            profile_name (str, optional): AWS profile name to use
+
+        Returns:
+            botocore.client.BaseClient: The pooled client
+        """
+        key = (profile_name, service, region_name)
+        self._expire()
+        with self._lock:
+            client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        # Clients are built from the profile's session, so one at a time per profile
+        with self._profile_lock(profile_name):
+            with self._lock:
+                client = self._clients.get(key)
+                config = self.client_config(service)
+                endpoint_url = self.endpoint_urls.get(service, self.endpoint_urls.get('*'))
+            if client is None:
+                kwargs = {}
+                if endpoint_url:
+                    kwargs["endpoint_url"] = endpoint_url
+                client = self.session(profile_name).client(service, region_name=region_name, config=config, **kwargs)
+                recorder = active_recorder()
+                if recorder is not None:
+                    recorder.instrument(client, profile_name)
+                with self._lock:
+                    self._clients[key] = client
+            return client
+
+    def caller_identity(self, profile_name=None):
+        """
+        Get the STS caller identity of a profile, calling STS once per run
+
+        Args:
+            profile_name (str, optional): AWS profile name to use
+
+        Returns:
+            dict: The get_caller_identity response (Account, Arn, UserId)
+        """
+        self._expire()
+        with self._lock:
+            identity = self._identities.get(profile_name)
+        if identity is None:
+            identity = self.client('sts', profile_name=profile_name).get_caller_identity()
+            with self._lock:
+                self._identities[profile_name] = identity
+        return identity
+
+    def clear(self):
+        """Drop all pooled sessions, clients and identities"""
+        credential_refresher.stop()
+        with self._lock:
+            self._sessions.clear()
+            self._registered.clear()
+            self._clients.clear()
+            self._identities.clear()
+            self._profile_locks.clear()
+            self._created.clear()
+
+
+# Pool shared by all checks in this run
+client_pool = ClientPool()
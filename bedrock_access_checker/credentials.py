@@ -0,0 +1,316 @@
+"""
+Credential caching and refresh-ahead for the AWS Bedrock Access Checker
+
+Profiles that assume a role (role_arn) or sign in with IAM Identity Center
+(SSO) resolve their credentials with extra STS/SSO calls, and by default
+botocore keeps the result only inside the session that asked for it. This
+module gives every pooled session one shared credential cache, so profiles
+that chain to the same role share one AssumeRole call, and with a cache
+directory configured (the CLI uses a subdirectory of the disk cache) the
+credentials are reused by later runs until they expire. The directory is
+owner-only and every entry file is written with 0600 permissions.
+
+Temporary credentials refresh themselves when they are about to expire, but
+botocore does so on whichever thread next signs a request, and close to
+expiry every thread blocks until the refresh finishes. The refresher in this
+module watches the pooled sessions' credentials from a background thread
+and refreshes them well before that point, so long sweeps never stall on a
+synchronous refresh.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Credential providers that accept a cache for the credentials they fetch
+CACHED_PROVIDERS = ("assume-role", "assume-role-with-web-identity", "sso")
+
+# Refresh credentials this many seconds before they expire (botocore's own
+# advisory refresh starts 15 minutes before expiry)
+DEFAULT_REFRESH_AHEAD = 20 * 60
+
+# How often the refresher looks at the watched credentials (seconds)
+DEFAULT_CHECK_INTERVAL = 30
+
+# Subdirectory of the disk cache directory that the CLI persists credentials in
+CREDENTIAL_CACHE_SUBDIR = "credentials"
+
+# Suffix of credential cache files
+_ENTRY_SUFFIX = ".json"
+
+
+def _serialize(value):
+    """JSON fallback for the datetimes in STS responses"""
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class CredentialCache:
+    """
+    Dict-like credential cache shared by the credential providers of all sessions
+
+    Entries are always kept in memory. When a directory is configured they
+    are also written there (one JSON file per entry, owner-only permissions)
+    and read back by later runs. botocore's providers check the expiry of
+    what they read, so expired entries are simply replaced.
+    """
+
+    def __init__(self, directory=None):
+        """
+        Args:
+            directory (str, optional): Directory to persist credentials in (None to keep them in memory only)
+        """
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.directory = None
+        self.configure(directory)
+
+    def configure(self, directory=None):
+        """
+        Change where credentials are persisted
+
+        Args:
+            directory (str, optional): Directory to persist credentials in (None to keep them in memory only)
+        """
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            # makedirs() leaves the permissions of an existing directory alone
+            os.chmod(directory, 0o700)
+        with self._lock:
+            self.directory = directory
+
+    def _path(self, key):
+        """Get the file path for a cache key"""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + _ENTRY_SUFFIX)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, key):
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            directory = self.directory
+        if directory is None:
+            raise KeyError(key)
+
+        try:
+            with open(self._path(key), 'r') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            raise KeyError(key)
+        with self._lock:
+            return self._entries.setdefault(key, value)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            directory = self.directory
+        if directory is None:
+            return
+
+        try:
+            # mkstemp() creates the file readable and writable by the owner only
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(value, f, default=_serialize)
+                os.replace(temp_path, self._path(key))
+            except Exception:
+                os.unlink(temp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            # Persisting is best effort; the credentials are still cached in memory
+            logger.debug("Could not persist cached credentials", exc_info=True)
+
+    def __delitem__(self, key):
+        with self._lock:
+            found = self._entries.pop(key, None) is not None
+            directory = self.directory
+        if directory is not None:
+            try:
+                os.unlink(self._path(key))
+                found = True
+            except OSError:
+                pass
+        if not found:
+            raise KeyError(key)
+
+    def clear(self):
+        """Forget the credentials cached in memory (persisted entries are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+
+# botocore internals used for non-blocking advisory refreshes (see _refresh_in_background)
+_REFRESH_INTERNALS = ("_expiry_time", "_refresh_lock", "_protected_refresh")
+
+
+def _has_refresh_internals(credentials):
+    """Check whether credentials still have the botocore internals _refresh_in_background() relies on"""
+    missing = [name for name in _REFRESH_INTERNALS if not hasattr(credentials, name)]
+    if missing:
+        logger.debug("botocore credentials lack %s; refreshing through the public API", ", ".join(missing))
+    return not missing
+
+
+def _refresh_in_background(credentials, refresh_ahead):
+    """
+    Refresh credentials ahead of expiry without making the checks wait
+
+    Uses botocore's advisory refresh, which keeps the current credentials if
+    it fails, and skips credentials another thread is already refreshing.
+
+    Returns:
+        int: 1 if the credentials were refreshed, 0 otherwise
+    """
+    # Credentials that were never used have nothing to refresh yet
+    if credentials._expiry_time is None or not credentials.refresh_needed(refresh_ahead):
+        return 0
+    # Whoever holds the lock is already refreshing them
+    if not credentials._refresh_lock.acquire(False):
+        return 0
+    try:
+        if not credentials.refresh_needed(refresh_ahead):
+            return 0
+        credentials._protected_refresh(is_mandatory=False)
+        return 1
+    finally:
+        credentials._refresh_lock.release()
+
+
+class CredentialRefresher:
+    """
+    Background refresh of temporary credentials before they expire
+
+    Watched credentials are checked every interval seconds by a daemon
+    thread, which is started on the first watch(). Credentials that expire
+    within refresh_ahead seconds are refreshed on that thread while the
+    checks keep using the current ones. A failed refresh is logged and
+    retried on the next check; botocore's own refresh remains the fallback.
+    """
+
+    def __init__(self, refresh_ahead=DEFAULT_REFRESH_AHEAD, interval=DEFAULT_CHECK_INTERVAL):
+        """
+        Args:
+            refresh_ahead (int, optional): Seconds before expiry at which credentials are refreshed
+            interval (float, optional): Seconds between checks of the watched credentials
+        """
+        self.refresh_ahead = refresh_ahead
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._watched = []
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def watch(self, credentials):
+        """
+        Keep a session's credentials fresh
+
+        Args:
+            credentials (botocore.credentials.Credentials): Credentials to watch; credentials
+                without an expiry (static keys) are ignored
+        """
+        if credentials is None or not hasattr(credentials, "refresh_needed"):
+            return
+        with self._lock:
+            if any(watched is credentials for watched in self._watched):
+                return
+            self._watched.append(credentials)
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._run, name="credential-refresher", daemon=True)
+                self._thread.start()
+
+    def unwatch(self, credentials):
+        """
+        Stop refreshing credentials that are no longer used
+
+        Args:
+            credentials (botocore.credentials.Credentials): Credentials passed to watch() earlier
+        """
+        with self._lock:
+            self._watched = [watched for watched in self._watched if watched is not credentials]
+
+    def refresh_due(self):
+        """
+        Refresh every watched credential that expires within refresh_ahead seconds
+
+        Returns:
+            int: Number of credentials refreshed
+        """
+        with self._lock:
+            watched = list(self._watched)
+
+        refreshed = 0
+        for credentials in watched:
+            try:
+                if _has_refresh_internals(credentials):
+                    refreshed += _refresh_in_background(credentials, self.refresh_ahead)
+                elif credentials.refresh_needed(self.refresh_ahead):
+                    # Public path: reading the credentials refreshes them within botocore's own refresh window
+                    credentials.get_frozen_credentials()
+                    refreshed += 1
+            except Exception:
+                logger.debug("Refreshing credentials ahead of expiry failed", exc_info=True)
+        return refreshed
+
+    def _run(self):
+        """Refresher thread: check the watched credentials until stopped"""
+        while not self._stopped.wait(self.interval):
+            self.refresh_due()
+
+    def stop(self):
+        """Stop the refresher thread and forget the watched credentials"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._watched = []
+            self._stopped.set()
+        if thread is not None:
+            thread.join(timeout=self.interval)
+
+
+def prepare_session(session):
+    """
+    Give a session the shared credential cache and keep its credentials fresh
+
+    Must be called before the session resolves its credentials, i.e. before
+    any client is created from it.
+
+    Args:
+        session (boto3.Session): Session to prepare
+
+    Returns:
+        boto3.Session: The same session
+    """
+    resolver = session._session.get_component('credential_provider')
+    for provider in resolver.providers:
+        if provider.METHOD in CACHED_PROVIDERS:
+            provider.cache = credential_cache
+
+    try:
+        credentials = session.get_credentials()
+    except Exception:
+        # Broken profiles are reported by the checks that use them
+        return session
+    credential_refresher.watch(credentials)
+    return session
+
+
+# Credential cache shared by all sessions in this run
+credential_cache = CredentialCache()
+
+# Refresher for the credentials of all pooled sessions
+credential_refresher = CredentialRefresher()
@@ -0,0 +1,527 @@
+"""
+Streaming HTML report writer for the AWS Bedrock Access Checker
+
+The report is written to its file section by section while it is built,
+so the page is never held in memory as a whole. Sections with one entry
+per model (the model cards and the cost table) are not written out as
+markup: each model's data (listing, test invocation, purpose, cost and
+advanced details) is embedded once as compact JSON, and a small inline
+script renders those sections in the browser a page at a time. Reports of
+large sweeps stay small and open quickly.
+
+Without JavaScript the dashboard, regions, SageMaker alternatives and
+troubleshooting sections are still readable.
+"""
+
+import datetime
+import json
+from html import escape
+
+from bedrock_access_checker.checker import (
+    needed_models,
+    overall_status,
+    STATUS_SUCCESS,
+    STATUS_WARNING,
+    STATUS_ERROR,
+    STATUS_INFO,
+    STATUS_TIMEOUT
+)
+
+# Model cards and cost table rows shown per page
+PAGE_SIZE = 24
+
+_STYLE = """\
+    body { font-family: Arial, sans-serif; margin: 0; padding: 20px; line-height: 1.6; }
+    .container { max-width: 1200px; margin: 0 auto; }
+    .header { text-align: center; margin-bottom: 30px; }
+    .dashboard { background: #f5f5f5; padding: 20px; border-radius: 8px; margin-bottom: 30px; }
+    .summary-table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
+    .summary-table th, .summary-table td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+    .summary-table th { background-color: #f0f0f0; }
+    .success { color: #2e7d32; font-weight: bold; }
+    .warning { color: #f57c00; font-weight: bold; }
+    .error { color: #d32f2f; font-weight: bold; }
+    .info { color: #1976d2; font-weight: bold; }
+    .details-section { margin-bottom: 30px; }
+    .details-section h2 { border-bottom: 1px solid #eee; padding-bottom: 8px; }
+    .model-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(300px, 1fr)); gap: 15px; }
+    .model-card { background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+    .model-card h3 { margin-top: 0; }
+    .region-list { display: flex; flex-wrap: wrap; gap: 10px; }
+    .region-badge { background: #e3f2fd; padding: 5px 10px; border-radius: 16px; font-size: 14px; }
+    .pager { margin: 10px 0; }
+    .pager button { margin: 0 8px; }
+    .comparison { overflow-x: auto; }
+    details.profile { margin-bottom: 20px; }
+    details.profile > summary { font-size: 1.3em; font-weight: bold; cursor: pointer; }
+    .footer { margin-top: 30px; text-align: center; color: #666; font-size: 14px; }"""
+
+# Renders the model cards and cost tables from the embedded data, a page at a time
+_SCRIPT = """\
+(function () {
+  var PAGE = %d;
+  var TESTS = {ok: ['success', 'Invocation Successful'], failed: ['error', 'Invocation Failed'],
+               throttled: ['warning', 'Throttled'], untested: ['info', 'Not Tested']};
+  function esc(value) {
+    return String(value).replace(/[&<>"']/g, function (c) { return '&#' + c.charCodeAt(0) + ';'; });
+  }
+  function money(value) { return '$' + value.toFixed(2); }
+  function items(title, values) {
+    var keys = Object.keys(values || {});
+    if (!keys.length) return '';
+    return '<h4>' + title + '</h4><ul>' + keys.map(function (key) {
+      return '<li><strong>' + esc(key) + ':</strong> ' + esc(values[key]) + '</li>';
+    }).join('') + '</ul>';
+  }
+  function card(m) {
+    var html = '<div class="model-card"><h3>' + esc(m.id) + '</h3><p>Listing: ' +
+      (m.listed ? '<span class="success">Available</span>' : '<span class="error">Not Available</span>') + '</p>';
+    if (m.test) html += '<p>Test: <span class="' + TESTS[m.test][0] + '">' + TESTS[m.test][1] + '</span></p>';
+    html += '<p><small>' + esc(m.purpose) + '</small></p>';
+    if (m.details) {
+      html += '<details><summary>Advanced Details</summary><div style="margin-top: 10px;">';
+      if (m.cost) {
+        html += '<h4>Cost Information</h4><ul><li><strong>Input Cost:</strong> ' + money(m.cost.input) +
+          ' per 1M tokens</li><li><strong>Output Cost:</strong> ' + money(m.cost.output) +
+          ' per 1M tokens</li><li><strong>Context Window:</strong> ' + m.cost.context.toLocaleString('en-US') + ' tokens</li>';
+        if (m.cost.estimate) html += '<li><strong>Usage Estimate:</strong> ' + money(m.cost.estimate) + ' for 1K standard requests</li>';
+        html += '<li><strong>Note:</strong> ' + esc(m.cost.note) + '</li></ul>';
+      }
+      html += items('Specifications', m.details.specs) + items('Inference Parameters', m.details.params) +
+        items('Quotas', m.details.quotas) + '</div></details>';
+    }
+    return html + '</div>';
+  }
+  function costRow(m) {
+    return '<tr><td>' + esc(m.id) + '</td><td>' + money(m.cost.input) + '</td><td>' + money(m.cost.output) +
+      '</td><td>' + m.cost.context.toLocaleString('en-US') + ' tokens</td><td>' + money(m.cost.estimate || 0) + '</td></tr>';
+  }
+  function paginate(target, pager, entries, render, join) {
+    var page = 0, pages = Math.max(1, Math.ceil(entries.length / PAGE));
+    function show() {
+      target.innerHTML = join(entries.slice(page * PAGE, (page + 1) * PAGE).map(render).join(''));
+      pager.innerHTML = pages < 2 ? '' : '<button data-step="-1"' + (page ? '' : ' disabled') + '>&lt; Previous</button>' +
+        'Page ' + (page + 1) + ' of ' + pages + ' (' + entries.length + ')' +
+        '<button data-step="1"' + (page < pages - 1 ? '' : ' disabled') + '>Next &gt;</button>';
+    }
+    pager.onclick = function (event) {
+      var step = event.target.getAttribute('data-step');
+      if (step) { page = Math.min(pages - 1, Math.max(0, page + Number(step))); show(); }
+    };
+    show();
+  }
+  Array.prototype.forEach.call(document.querySelectorAll('script.report-data'), function (node) {
+    var data = JSON.parse(node.textContent), id = node.getAttribute('data-section');
+    paginate(document.getElementById(id + '-models'), document.getElementById(id + '-models-pager'),
+             data.models, card, function (cards) { return cards; });
+    var costs = data.models.filter(function (m) { return m.cost; });
+    costs.sort(function (a, b) { return (b.cost.estimate || 0) - (a.cost.estimate || 0); });
+    var table = document.getElementById(id + '-costs');
+    if (table && costs.length) {
+      table.parentNode.style.display = '';
+      paginate(table, document.getElementById(id + '-costs-pager'), costs, costRow, function (rows) {
+        return '<tr><th>Model</th><th>Input Cost (per 1M tokens)</th><th>Output Cost (per 1M tokens)</th>' +
+          '<th>Context Window</th><th>Est. Cost for 1K Requests</th></tr>' + rows;
+      });
+    }
+  });
+})();"""
+
+# Dashboard class of each status
+_STATUS_CLASSES = {
+    STATUS_SUCCESS: "success",
+    STATUS_WARNING: "warning",
+    STATUS_ERROR: "error",
+    STATUS_TIMEOUT: "error",
+}
+
+
+def _status_class(status):
+    """CSS class for a status"""
+    return _STATUS_CLASSES.get(status, "info")
+
+
+def _compact_json(value):
+    """JSON that is safe to embed in a <script> element"""
+    text = json.dumps(value, separators=(',', ':'), default=str)
+    # A "</" inside a string would end the script element early
+    return text.replace("</", "<\\/")
+
+
+def _quota_text(value):
+    """Quota as shown in the report"""
+    if not isinstance(value, dict):
+        return value
+    text = f"{value.get('value')} {value.get('unit', '')}"
+    if value.get('adjustable'):
+        text += " (adjustable)"
+    return text
+
+
+def model_entries(results, purposes=None):
+    """
+    Get the per-model data embedded in the report
+
+    Every lookup goes through a set or dict built once per report, so the
+    cost is linear in the number of models.
+
+    Args:
+        results (CheckResults): Results to report
+        purposes (dict, optional): Purpose by model ID (defaults to the key model list)
+
+    Returns:
+        list: One compact dict per key model, sorted by model ID
+    """
+    if purposes is None:
+        purposes = {model_info["id"]: model_info["purpose"] for model_info in needed_models}
+
+    available = set(results.key_models.available)
+    invocations = results.model_invocations
+    tests = {}
+    if invocations is not None:
+        # Later outcomes win, like the order of the checks in the old report
+        for outcome, model_ids in (("throttled", invocations.throttled), ("failed", invocations.failed),
+                                   ("ok", invocations.successful)):
+            for model_id in model_ids:
+                tests[model_id] = outcome
+    costs = results.cost_estimates.models
+    model_details = results.model_details or {}
+
+    entries = []
+    for model_id in sorted(available.union(results.key_models.missing)):
+        listed = model_id in available
+        entry = {"id": model_id, "listed": 1 if listed else 0, "purpose": purposes.get(model_id, "Unknown")}
+        if listed and invocations is not None:
+            entry["test"] = tests.get(model_id, "untested")
+
+        cost = costs.get(model_id)
+        if cost and cost.get("input_price") is not None:
+            entry["cost"] = {
+                "input": cost["input_price"],
+                "output": cost["output_price"],
+                "context": cost["context_window"],
+                "estimate": cost["common_usage_estimate"],
+                "note": cost.get("pricing_note"),
+            }
+
+        details = model_details.get(model_id)
+        if details is not None:
+            entry["details"] = {
+                "specs": {key: value for key, value in (details.get("specs") or {}).items() if key != "error"},
+                "params": dict(details.get("inference_params") or {}),
+                "quotas": {key: _quota_text(value) for key, value in (details.get("quotas") or {}).items()
+                           if key != "error"},
+            }
+        entries.append(entry)
+    return entries
+
+
+class HtmlReportWriter:
+    """
+    Writes an HTML report to an open file, one section at a time
+
+    Call begin(), optionally comparison() when several profiles are
+    reported, then profile() for each set of results, then end().
+    """
+
+    def __init__(self, f):
+        """
+        Args:
+            f (file): Text file to write the report to
+        """
+        self._f = f
+        self._sections = 0
+
+    def _write(self, *lines):
+        self._f.write("\n".join(lines) + "\n")
+
+    def begin(self, title="AWS Bedrock Access Verification Report"):
+        """
+        Write the page head and the report header
+
+        Args:
+            title (str, optional): Report title
+        """
+        self._write(
+            "<!DOCTYPE html>",
+            "<html lang='en'>",
+            "<head>",
+            "  <meta charset='UTF-8'>",
+            "  <meta name='viewport' content='width=device-width, initial-scale=1.0'>",
+            "  <title>AWS Bedrock Access Check Report</title>",
+            "  <style>",
+            _STYLE,
+            "  </style>",
+            "</head>",
+            "<body>",
+            "  <div class='container'>",
+            "    <div class='header'>",
+            f"      <h1>{escape(title)}</h1>",
+            f"      <p>Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>",
+            "    </div>",
+        )
+
+    def profile(self, results, label=None):
+        """
+        Write the sections of one set of results
+
+        Args:
+            results (CheckResults): Results to report
+            label (str, optional): Heading for the results (e.g. the profile name)
+
+        Returns:
+            str: ID of the written section
+        """
+        section = f"r{self._sections}"
+        self._sections += 1
+
+        if label is not None:
+            # Profiles of a multi-profile report start collapsed
+            status = overall_status(results)[0]
+            self._write(f"    <details class='profile' id='{section}'>",
+                        f"    <summary>Profile: {escape(label)} <span class='{_status_class(status)}'>{escape(status)}</span></summary>")
+        else:
+            self._write(f"    <div id='{section}'>")
+        status = self._dashboard(results)
+        self._regions(results)
+        self._write(
+            "    <div class='details-section' style='display: none'>",
+            "      <h2>Cost Estimates</h2>",
+            "      <p>Estimated costs for model usage based on current AWS Bedrock pricing (as of May 2025):</p>",
+            f"      <table class='summary-table' id='{section}-costs'></table>",
+            f"      <div class='pager' id='{section}-costs-pager'></div>",
+            "      <p><small>Cost estimates are based on 1,000 requests with 1,500 input tokens and 500 output tokens each.</small></p>",
+            "      <p><small>Actual costs may vary based on usage patterns, AWS promotions, and pricing changes.</small></p>",
+            "    </div>",
+        )
+        self._sagemaker(results)
+        self._write(
+            "    <div class='details-section'>",
+            "      <h2>Model Availability</h2>",
+            "      <noscript><p>Enable JavaScript to see the model cards.</p></noscript>",
+            f"      <div class='model-grid' id='{section}-models'></div>",
+            f"      <div class='pager' id='{section}-models-pager'></div>",
+            f"      <script type='application/json' class='report-data' data-section='{section}'>"
+            f"{_compact_json({'models': model_entries(results)})}</script>",
+            "    </div>",
+        )
+        if status != STATUS_SUCCESS:
+            self._troubleshooting(results)
+        self._write("    </details>" if label is not None else "    </div>")
+        return section
+
+    def comparison(self, comparison):
+        """
+        Write the profile comparison
+
+        Args:
+            comparison (dict): Result of report.compare_profiles()
+        """
+        components = comparison["components"]
+        marks = {True: "<td class='success'>✓</td>", False: "<td class='error'>✗</td>", None: "<td>-</td>"}
+        rows = comparison["profiles"]
+        # The profile sections written next get the following section IDs
+        first_section = self._sections
+
+        self._write(
+            "    <div class='details-section comparison'>",
+            "      <h2>Profile Comparison</h2>",
+            "      <h3>Status</h3>",
+            "      <table class='summary-table'>",
+            "        <tr><th>Profile</th>" + "".join(f"<th>{escape(title)}</th>" for title in components.values()) +
+            "<th>Overall</th></tr>",
+        )
+        for index, row in enumerate(rows):
+            cells = "".join(f"<td class='{_status_class(row['statuses'][name])}'>{escape(row['statuses'][name] or 'N/A')}</td>"
+                            for name in components)
+            self._write(f"        <tr><td><a href='#r{first_section + index}'>{escape(row['profile'])}</a></td>{cells}"
+                        f"<td class='{_status_class(row['overall'])}'>{escape(row['overall'])}</td></tr>")
+
+        self._write(
+            "      </table>",
+            "      <h3>Region Availability</h3>",
+            "      <table class='summary-table'>",
+            "        <tr><th>Profile</th>" + "".join(f"<th>{escape(region)}</th>" for region in comparison["regions"]) + "</tr>",
+        )
+        for row in rows:
+            self._write(f"        <tr><td>{escape(row['profile'])}</td>{''.join(marks[value] for value in row['regions'])}</tr>")
+
+        self._write(
+            "      </table>",
+            "      <h3>Key Model Availability</h3>",
+            "      <table class='summary-table'>",
+            "        <tr><th>Profile</th>" + "".join(
+                f"<th title='{escape(model_id)}'>{escape(name)}</th>"
+                for model_id, name in zip(comparison["models"], comparison["model_names"])) + "</tr>",
+        )
+        for row in rows:
+            self._write(f"        <tr><td>{escape(row['profile'])}</td>{''.join(marks[value] for value in row['models'])}</tr>")
+
+        self._write(
+            "      </table>",
+            "      <h3>Summary Statistics</h3>",
+            "      <table class='summary-table'>",
+            "        <tr><th>Profile</th><th>Available Regions</th><th>Available Models</th><th>Key Models</th></tr>",
+        )
+        for row in rows:
+            counts = row["counts"]
+            self._write(f"        <tr><td>{escape(row['profile'])}</td><td>{counts['regions']}</td><td>{counts['models']}</td>"
+                        f"<td>{counts['key_models']}/{counts['key_models_total']}</td></tr>")
+        self._write("      </table>", "    </div>")
+
+    def _dashboard(self, results):
+        """Write the status dashboard, returning the overall status"""
+        rows = []
+
+        def row(component, status, details):
+            status = status or STATUS_INFO
+            rows.append(f"        <tr><td>{component}</td><td class='{_status_class(status)}'>{escape(status)}</td>"
+                        f"<td>{escape(str(details))}</td></tr>")
+
+        row("AWS Credentials", results.aws_credentials.status,
+            results.aws_credentials.details[0] if results.aws_credentials.details else "N/A")
+        row("Bedrock Regions", results.bedrock_regions.status, f"{len(results.bedrock_regions.available)} available regions")
+        row("Bedrock Runtime", results.bedrock_runtime.status,
+            results.bedrock_runtime.errors[0] if results.bedrock_runtime.errors else "Runtime service accessible")
+        row("Bedrock Models", results.bedrock_models.status, f"{len(results.bedrock_models.available)} models available")
+        available_count = len(results.key_models.available)
+        total_count = available_count + len(results.key_models.missing)
+        row("Key Models", results.key_models.status, f"{available_count}/{total_count} key models available")
+
+        invocations = results.model_invocations
+        if invocations is not None:
+            success_count = len(invocations.successful)
+            failed_count = len(invocations.failed)
+            throttled_count = len(invocations.throttled)
+            invoke_total = success_count + failed_count + throttled_count
+            if invoke_total > 0:
+                if success_count == invoke_total:
+                    invoke_status = STATUS_SUCCESS
+                elif failed_count < invoke_total:
+                    invoke_status = STATUS_WARNING
+                else:
+                    invoke_status = STATUS_ERROR
+                invoke_details = f"{success_count}/{invoke_total} models invoked successfully"
+                if throttled_count:
+                    invoke_details += f" ({throttled_count} throttled)"
+                row("Model Invocation", invoke_status, invoke_details)
+
+        # Checks cut off by the run's deadline
+        if results.timed_out:
+            row("Timed Out", STATUS_TIMEOUT, ", ".join(results.timed_out))
+
+        status, message = overall_status(results)
+        self._write(
+            "    <div class='dashboard'>",
+            "      <h2>Status Dashboard</h2>",
+            "      <table class='summary-table'>",
+            "        <tr><th>Component</th><th>Status</th><th>Details</th></tr>",
+            *rows,
+            "      </table>",
+            f"      <h3>Overall Status: <span class='{_status_class(status)}'>{escape(status)}</span></h3>",
+            f"      <p>{escape(message)}</p>",
+            "    </div>",
+        )
+        return status
+
+    def _regions(self, results):
+        """Write the available regions"""
+        self._write(
+            "    <div class='details-section'>",
+            "      <h2>Available Regions</h2>",
+            "      <div class='region-list'>",
+            *(f"        <div class='region-badge'>{escape(region)}</div>" for region in results.bedrock_regions.available),
+            "      </div>",
+            "    </div>",
+        )
+
+    def _sagemaker(self, results):
+        """Write the SageMaker JumpStart alternatives, if any were found"""
+        alternatives = {model_id: matches for model_id, matches in (results.sagemaker_alternatives or {}).items()
+                        if model_id != "error" and matches}
+        if not alternatives:
+            return
+        self._write(
+            "    <div class='details-section'>",
+            "      <h2>SageMaker JumpStart Alternatives</h2>",
+            "      <p>The following alternatives are available in SageMaker JumpStart for missing Bedrock models:</p>",
+            "      <table class='summary-table'>",
+            "        <tr><th>Missing Bedrock Model</th><th>SageMaker Alternative</th><th>Notes</th></tr>",
+        )
+        for model_id, matches in alternatives.items():
+            for index, alt in enumerate(matches):
+                # The model is only named on its first alternative
+                name = escape(model_id) if index == 0 else ""
+                self._write(f"        <tr><td>{name}</td><td>{escape(alt['name'])} ({escape(alt['model_id'])})</td>"
+                            f"<td>{escape(alt['notes'])}</td></tr>")
+        self._write("      </table>", "    </div>")
+
+    def _troubleshooting(self, results):
+        """Write troubleshooting tips for the components with problems"""
+        problems = (STATUS_ERROR, STATUS_WARNING)
+        self._write("    <div class='details-section'>", "      <h2>Troubleshooting Tips</h2>")
+        if results.aws_credentials.status in problems:
+            self._write(
+                "      <h3>AWS Credentials</h3>",
+                "      <ul>",
+                "        <li>Run 'aws configure' to set up credentials</li>",
+                "        <li>Verify your credentials have Bedrock permissions</li>",
+                "        <li>Check if boto3 version is at least 1.28.0</li>",
+                "      </ul>",
+            )
+        if results.bedrock_regions.status in problems:
+            self._write(
+                "      <h3>Bedrock Regions</h3>",
+                "      <ul>",
+                "        <li>Make sure Bedrock is enabled in your AWS account</li>",
+                "        <li>Check if your IAM permissions include bedrock:ListFoundationModels</li>",
+                "        <li>Verify you're checking regions where Bedrock is available</li>",
+                "      </ul>",
+            )
+        if results.key_models.status in problems:
+            self._write(
+                "      <h3>Model Access</h3>",
+                "      <ul>",
+                "        <li>Visit AWS console to request access to needed models: ",
+                "          <a href='https://console.aws.amazon.com/bedrock/home#/modelaccess' target='_blank'>AWS Bedrock Model Access</a></li>",
+                "        <li>For Claude models, make sure you've accepted Anthropic's terms of service</li>",
+                "        <li>Some models require explicit subscription - check your model access</li>",
+                "      </ul>",
+            )
+        self._write("    </div>")
+
+    def end(self, report_id):
+        """
+        Write the footer and the rendering script
+
+        Args:
+            report_id (str): ID shown in the footer
+        """
+        self._write(
+            "    <div class='footer'>",
+            "      <p>Generated by AWS Bedrock Access Verification Tool</p>",
+            f"      <p>Report ID: {escape(report_id)}</p>",
+            "    </div>",
+            "  </div>",
+            "  <script>",
+            _SCRIPT % PAGE_SIZE,
+            "  </script>",
+            "</body>",
+            "</html>",
+        )
+
+
+def write_html_report(filename, results, report_id):
+    """
+    Write the HTML report of one set of results
+
+    Args:
+        filename (str): File to write
+        results (CheckResults): Results to report
+        report_id (str): ID shown in the footer
+    """
+    with open(filename, 'w') as f:
+        writer = HtmlReportWriter(f)
+        writer.begin()
+        writer.profile(results)
+        writer.end(report_id)
@@ -0,0 +1,353 @@
+"""
+Model invocation probes for the AWS Bedrock Access Checker
+
+Invokes a region's models concurrently with a small test prompt, keeping
+the number of requests in flight bounded. Each model family gets its own
+token bucket (Bedrock's rate limits are per account, region and model), and
+throttled calls are retried with jittered exponential backoff until the
+probe's deadline. A model that is still throttled at the deadline is
+reported as throttled rather than as failed, since it is accessible.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bedrock_access_checker.clients import client_pool
+from bedrock_access_checker.trace import traced
+
+# Invocation probe outcomes
+INVOKE_SUCCESS = "success"
+INVOKE_FAILED = "failed"
+INVOKE_THROTTLED = "throttled"
+
+# Default number of invocations in flight per region
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# Default request rate (per second) and burst size for each model family in a region
+DEFAULT_INVOKE_RATE = 2.0
+DEFAULT_INVOKE_BURST = 2
+
+# Default time (seconds) a region's invocation probe may take, retries included
+DEFAULT_INVOKE_DEADLINE = 60
+
+# Backoff between retries of a throttled call: random delay up to base * 2^attempt, capped
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_CAP = 8.0
+
+# Error codes that mean "slow down" rather than "no access"
+THROTTLING_ERROR_CODES = ("ThrottlingException", "TooManyRequestsException")
+
+
+def model_family(model_id):
+    """
+    Get the family of a model, used to group models that share rate limits
+
+    Args:
+        model_id (str): Bedrock model ID (e.g. anthropic.claude-3-haiku-20240307-v1:0)
+
+    Returns:
+        str: Provider and model name prefix (e.g. 'anthropic.claude')
+    """
+    match = re.match(r"([a-z0-9-]+)\.([a-z]+)", model_id.lower())
+    return f"{match.group(1)}.{match.group(2)}" if match else model_id.lower()
+
+
+def build_test_request(model_id):
+    """
+    Build a minimal test prompt in the request format of a model's provider
+
+    Args:
+        model_id (str): The model ID to invoke
+
+    Returns:
+        dict: The invoke_model request body
+    """
+    if "embed" in model_id.lower():
+        # Embedding model
+        return {
+            "inputText": "Hello, world!"
+        }
+    elif "anthropic.claude" in model_id.lower():
+        # Claude model
+        return {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 10,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [{"type": "text", "text": "Say hello in 5 words or less."}]
+                }
+            ]
+        }
+    elif "cohere" in model_id.lower():
+        # Cohere model
+        return {
+            "prompt": "Say hello in 5 words or less.",
+            "max_tokens": 10
+        }
+    elif "meta.llama" in model_id.lower():
+        # Llama model
+        return {
+            "prompt": "Human: Say hello in 5 words or less.\nAssistant:",
+            "max_gen_len": 10
+        }
+    elif "titan" in model_id.lower():
+        # Titan model
+        return {
+            "inputText": "Say hello in 5 words or less.",
+            "textGenerationConfig": {
+                "maxTokenCount": 10
+            }
+        }
+    else:
+        # Generic format - may not work with all models
+        return {
+            "prompt": "Say hello in 5 words or less.",
+            "max_tokens": 10
+        }
+
+
+def invoke_test_prompt(model_id, region, profile_name=None):
+    """
+    Invoke a model once with its test prompt
+
+    Args:
+        model_id (str): The model ID to invoke
+        region (str): AWS region to invoke in
+        profile_name (str, optional): AWS profile name to use
+
+    Returns:
+        str: Success message with the (shortened) response
+
+    Raises:
+        Exception: Any error from the invocation
+    """
+    # Get the pooled bedrock-runtime client
+    client = client_pool.client('bedrock-runtime', region, profile_name)
+
+    # Invoke the model
+    response = client.invoke_model(
+        modelId=model_id,
+        body=json.dumps(build_test_request(model_id))
+    )
+
+    # Parse the response
+    response_body = json.loads(response['body'].read().decode('utf-8'))
+
+    # Return success with shortened response
+    response_str = str(response_body)[:50] + "..." if len(str(response_body)) > 50 else str(response_body)
+    return f"Success: {response_str}"
+
+
+def is_throttling_error(error):
+    """
+    Check whether an invocation error is throttling
+
+    Args:
+        error (Exception): Error raised by invoke_model
+
+    Returns:
+        bool: True if the call was throttled
+    """
+    code = getattr(error, 'response', {}).get('Error', {}).get('Code')
+    return code in THROTTLING_ERROR_CODES or any(name in str(error) for name in THROTTLING_ERROR_CODES)
+
+
+def describe_invocation_error(error):
+    """
+    Turn an invocation error into a short message
+
+    Args:
+        error (Exception): Error raised by invoke_model
+
+    Returns:
+        str: Short description of the error
+    """
+    error_msg = str(error)
+    if "AccessDeniedException" in error_msg:
+        return "Access denied"
+    elif "ResourceNotFoundException" in error_msg:
+        return "Model not found"
+    elif "ValidationException" in error_msg:
+        return f"Validation error: {error_msg[:50]}..."
+    elif is_throttling_error(error):
+        return "Rate limited"
+    else:
+        return f"Error: {error_msg[:50]}..."
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter"""
+
+    def __init__(self, rate, capacity):
+        """
+        Create a full bucket
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (int): Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline=None):
+        """
+        Take a token, waiting for one if the bucket is empty
+
+        Args:
+            deadline (float, optional): time.monotonic() value after which to give up
+
+        Returns:
+            bool: True if a token was taken, False if none would be available before the deadline
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class InvocationProber:
+    """
+    Concurrent, rate-limited model invocation probe
+
+    Token buckets are kept per (profile, region, model family) for the whole
+    run, so probes of the same family never exceed the configured rate even
+    when several regions or profiles are probed at once.
+    """
+
+    def __init__(self, max_in_flight=DEFAULT_MAX_IN_FLIGHT, rate=DEFAULT_INVOKE_RATE, burst=DEFAULT_INVOKE_BURST,
+                 deadline=DEFAULT_INVOKE_DEADLINE, backoff_base=DEFAULT_BACKOFF_BASE, backoff_cap=DEFAULT_BACKOFF_CAP):
+        """
+        Create a prober
+
+        Args:
+            max_in_flight (int, optional): Invocations in flight per region
+            rate (float, optional): Requests per second for each model family in a region
+            burst (int, optional): Requests a model family may make at once before the rate applies
+            deadline (float, optional): Seconds a region's probe may take, retries included
+            backoff_base (float, optional): Base delay in seconds between throttled retries
+            backoff_cap (float, optional): Maximum delay in seconds between throttled retries
+        """
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        self.burst = burst
+        self.deadline = deadline
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def configure(self, max_in_flight=None, rate=None, deadline=None):
+        """
+        Change the settings used by probes started from now on
+
+        Args:
+            max_in_flight (int, optional): Invocations in flight per region
+            rate (float, optional): Requests per second for each model family in a region
+            deadline (float, optional): Seconds a region's probe may take, retries included
+        """
+        with self._lock:
+            if max_in_flight is not None:
+                self.max_in_flight = max_in_flight
+            if rate is not None:
+                self.rate = rate
+                self._buckets.clear()
+            if deadline is not None:
+                self.deadline = deadline
+
+    def _bucket(self, model_id, region, profile_name):
+        """Get the token bucket shared by a model's family in a region"""
+        key = (profile_name, region, model_family(model_id))
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[key] = bucket
+            return bucket
+
+    @traced
+    def probe_model(self, model_id, region, profile_name=None, deadline=None):
+        """
+        Invoke a model, retrying throttled calls until the deadline
+
+        Args:
+            model_id (str): The model ID to invoke
+            region (str): AWS region to invoke in
+            profile_name (str, optional): AWS profile name to use
+            deadline (float, optional): time.monotonic() value to give up at (defaults to now + the probe deadline)
+
+        Returns:
+            str: INVOKE_SUCCESS, INVOKE_FAILED or INVOKE_THROTTLED
+            str: Response or error message
+        """
+        if deadline is None:
+            deadline = time.monotonic() + self.deadline
+        bucket = self._bucket(model_id, region, profile_name)
+
+        attempts = 0
+        while True:
+            if not bucket.acquire(deadline):
+                return INVOKE_THROTTLED, f"Rate limited (no request slot before the deadline, {attempts} attempts)"
+
+            attempts += 1
+            try:
+                return INVOKE_SUCCESS, invoke_test_prompt(model_id, region, profile_name)
+            except Exception as e:
+                if not is_throttling_error(e):
+                    return INVOKE_FAILED, describe_invocation_error(e)
+
+            # Full jitter: spreads retries of concurrent probes apart
+            delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempts))
+            if time.monotonic() + delay > deadline:
+                return INVOKE_THROTTLED, f"Rate limited (still throttled after {attempts} attempts)"
+            time.sleep(delay)
+
+    def probe(self, model_ids, region, profile_name=None, deadline=None):
+        """
+        Invoke several models in a region concurrently
+
+        Args:
+            model_ids (list): Model IDs to invoke
+            region (str): AWS region to invoke in
+            profile_name (str, optional): AWS profile name to use
+            deadline (float, optional): time.monotonic() value to stop retrying at, if earlier than the probe deadline
+
+        Returns:
+            list: (model_id, outcome, message) tuples in the order of model_ids
+        """
+        if not model_ids:
+            return []
+
+        probe_deadline = time.monotonic() + self.deadline
+        deadline = probe_deadline if deadline is None else min(deadline, probe_deadline)
+        with ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(model_ids))) as executor:
+            futures = [
+                executor.submit(self.probe_model, model_id, region, profile_name, deadline)
+                for model_id in model_ids
+            ]
+            return [(model_id,) + future.result() for model_id, future in zip(model_ids, futures)]
+
+    def clear(self):
+        """Forget all token buckets"""
+        with self._lock:
+            self._buckets.clear()
+
+
+# Prober shared by all checks in this run
+invocation_prober = InvocationProber()
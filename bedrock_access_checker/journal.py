@@ -0,0 +1,186 @@
+"""
+Checkpoint journal for resumable runs of the AWS Bedrock Access Checker
+
+With --checkpoint FILE, FILE is started afresh and every check that finishes
+successfully for a (profile, region, check) unit is appended to it as one
+JSON line, together with the results component it updated. Results
+otherwise live only in memory until the report is written, so a large sweep
+interrupted by Ctrl-C, an expired SSO token or a CI timeout would lose
+everything.
+
+With --resume FILE, the journal is read back first: each profile's
+components are restored from their latest journal entries, the checks the
+journal lists as done are skipped, and only the remaining ones run (and are
+appended to the same file). The final report is then built as usual.
+
+Journal entries are written by the check graph's on_done callback, which
+runs on the graph's apply thread, so they always match the results at the
+time. A line cut short by a crash is ignored when the journal is read.
+"""
+
+import json
+import os
+import threading
+import time
+
+from bedrock_access_checker.results import to_plain
+
+# Format version written into every journal entry
+JOURNAL_VERSION = 1
+
+
+class CheckpointJournal:
+    """Append-only record of the checks completed for each profile"""
+
+    def __init__(self, path, resume=False):
+        """
+        Open a journal for writing
+
+        A new journal replaces whatever the file held, so entries of an
+        unrelated earlier run can never be resumed by mistake.
+
+        Args:
+            path (str): Journal file
+            resume (bool, optional): Read the entries already in the file so their checks can be skipped,
+                and append to it
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # Journal entry value by (profile, check)
+        self._completed = {}
+        # Latest plain data of each component, by profile
+        self._components = {}
+        if resume and os.path.exists(path):
+            self._load()
+        # Checks completed by earlier runs
+        self.resumed_checks = len(self._completed)
+        self._file = open(path, 'a' if resume else 'w')
+
+    def _load(self):
+        """Read the entries of an existing journal"""
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Partial last line of an interrupted run
+                    continue
+                if entry.get("version") != JOURNAL_VERSION:
+                    continue
+                profile_name = entry.get("profile")
+                self._completed[(profile_name, entry["check"])] = entry.get("value")
+                if entry.get("component"):
+                    self._components.setdefault(profile_name, {})[entry["component"]] = entry.get("data")
+
+    def is_completed(self, profile_name, check):
+        """
+        Check whether a check already finished for a profile
+
+        Args:
+            profile_name (str): AWS profile name (None for default credentials)
+            check (str): Check node name (e.g. 'models:us-east-1')
+
+        Returns:
+            bool: True if the journal lists the check as done
+        """
+        with self._lock:
+            return (profile_name, check) in self._completed
+
+    def completed_value(self, profile_name, check):
+        """
+        Get the value recorded with a completed check
+
+        Args:
+            profile_name (str): AWS profile name (None for default credentials)
+            check (str): Check node name
+
+        Returns:
+            The recorded value (None if there is none)
+        """
+        with self._lock:
+            return self._completed.get((profile_name, check))
+
+    def restore(self, profile_name, results):
+        """
+        Load a profile's components as the journal last recorded them
+
+        Args:
+            profile_name (str): AWS profile name (None for default credentials)
+            results (CheckResults): Results to restore into
+
+        Returns:
+            int: Number of components restored
+        """
+        with self._lock:
+            components = dict(self._components.get(profile_name, {}))
+        for name, data in components.items():
+            results.load_component(name, data)
+        return len(components)
+
+    def record(self, profile_name, node, results):
+        """
+        Append a completed check and the component it updated
+
+        Args:
+            profile_name (str): AWS profile name (None for default credentials)
+            node (CheckNode): The finished check; its result is recorded as the entry's value
+            results (CheckResults): The profile's results
+        """
+        data = to_plain(getattr(results, node.component)) if node.component else None
+        entry = {
+            "version": JOURNAL_VERSION,
+            "time": time.time(),
+            "profile": profile_name,
+            "check": node.name,
+            "region": node.region,
+            "component": node.component,
+            "value": to_plain(node.result),
+            "data": data,
+        }
+        line = json.dumps(entry, default=str) + "\n"
+        with self._lock:
+            self._completed[(profile_name, node.name)] = entry["value"]
+            if node.component:
+                self._components.setdefault(profile_name, {})[node.component] = data
+            self._file.write(line)
+            # Flushed per entry, so an interrupted run keeps everything it finished
+            self._file.flush()
+
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            self._file.close()
+
+
+# Journal of this run (None when checkpointing is off)
+_journal = None
+
+
+def open_journal(path, resume=False):
+    """
+    Turn on checkpointing for this run
+
+    Args:
+        path (str): Journal file
+        resume (bool, optional): Skip the checks the journal already lists as done
+
+    Returns:
+        CheckpointJournal: The active journal
+    """
+    global _journal
+    close_journal()
+    _journal = CheckpointJournal(path, resume=resume)
+    return _journal
+
+
+def close_journal():
+    """Turn off checkpointing, closing the journal file"""
+    global _journal
+    if _journal is not None:
+        _journal.close()
+    _journal = None
+
+
+def active_journal():
+    """Get the journal of this run (None when checkpointing is off)"""
+    return _journal
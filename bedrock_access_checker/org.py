@@ -0,0 +1,235 @@
+"""
+Organization-wide account sweeps for the AWS Bedrock Access Checker
+
+With --org-sweep, the checks run against member accounts of an AWS
+Organization instead of local profiles. The accounts come from a file or
+from organizations:ListAccounts, and a role with the same name is assumed in
+each of them using the base credentials (--profile, or the defaults).
+
+Each assumed role gets one boto3 session with refreshable credentials: the
+AssumeRole call is made once per account and repeated only when the
+credentials are about to expire, so long sweeps keep working. The
+credentials go through the shared credential cache, so a repeated sweep
+with a persistent cache reuses them. The session is registered with the
+client pool under the account's label, which the checks then use like any
+profile name.
+"""
+
+import datetime
+import re
+import threading
+
+import boto3
+from botocore.credentials import RefreshableCredentials
+from botocore.session import get_session
+from botocore.utils import parse_timestamp
+
+from bedrock_access_checker.clients import client_pool
+from bedrock_access_checker.credentials import credential_cache, DEFAULT_REFRESH_AHEAD
+
+# Role created in member accounts by AWS Organizations
+DEFAULT_ROLE_NAME = "OrganizationAccountAccessRole"
+
+# Default number of accounts checked at the same time
+DEFAULT_SWEEP_WORKERS = 8
+
+# Lifetime requested for assumed-role credentials (seconds)
+DEFAULT_SESSION_DURATION = 3600
+
+# Session name recorded in CloudTrail for the assumed roles
+ROLE_SESSION_NAME = "bedrock-access-checker"
+
+_ACCOUNT_ID = re.compile(r"^\d{12}$")
+
+
+def account_label(account_id, role_name):
+    """
+    Get the name an account's checks and results are filed under
+
+    Args:
+        account_id (str): AWS account ID
+        role_name (str): Role assumed in the account
+
+    Returns:
+        str: Label such as 'OrganizationAccountAccessRole@123456789012'
+    """
+    return f"{role_name}@{account_id}"
+
+
+def load_accounts(accounts_file=None, profile_name=None):
+    """
+    Get the accounts to sweep
+
+    The accounts file has one account per line: the 12-digit account ID,
+    optionally followed by a comma or whitespace and a name. Blank lines and
+    lines starting with '#' are ignored. Without a file, the active accounts
+    of the organization are listed with organizations:ListAccounts.
+
+    Args:
+        accounts_file (str, optional): Path of the accounts file
+        profile_name (str, optional): AWS profile to list the organization's accounts with
+
+    Returns:
+        list: (account_id, name) tuples in file or listing order, without duplicates
+
+    Raises:
+        ValueError: If a line of the accounts file has no valid account ID
+    """
+    accounts = []
+    if accounts_file:
+        with open(accounts_file) as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                parts = re.split(r"[,\s]+", line, maxsplit=1)
+                account_id = parts[0]
+                if not _ACCOUNT_ID.match(account_id):
+                    raise ValueError(f"{accounts_file}:{line_number}: '{account_id}' is not a 12-digit account ID")
+                accounts.append((account_id, parts[1].strip() if len(parts) > 1 else ""))
+    else:
+        client = client_pool.client('organizations', profile_name=profile_name)
+        for page in client.get_paginator('list_accounts').paginate():
+            for account in page.get('Accounts', []):
+                if account.get('Status', 'ACTIVE') == 'ACTIVE':
+                    accounts.append((account['Id'], account.get('Name', "")))
+
+    seen = set()
+    unique = []
+    for account_id, name in accounts:
+        if account_id not in seen:
+            seen.add(account_id)
+            unique.append((account_id, name))
+    return unique
+
+
+class AssumedRoleSessions:
+    """
+    Thread-safe cache of sessions for roles assumed in member accounts
+
+    Sessions are keyed by role ARN. Their credentials refresh themselves
+    (another AssumeRole call) shortly before they expire.
+    """
+
+    def __init__(self, base_profile=None, duration=DEFAULT_SESSION_DURATION):
+        self.base_profile = base_profile
+        self.duration = duration
+        self._lock = threading.Lock()
+        self._sessions = {}
+
+    def configure(self, base_profile=None, duration=None):
+        """
+        Change the settings used for roles assumed from now on
+
+        Args:
+            base_profile (str, optional): AWS profile whose credentials assume the roles
+            duration (int, optional): Requested credential lifetime in seconds
+        """
+        with self._lock:
+            self.base_profile = base_profile
+            if duration is not None:
+                self.duration = duration
+
+    def role_arn(self, account_id, role_name):
+        """
+        Build the ARN of a role in an account, in the base credentials' partition
+
+        Args:
+            account_id (str): AWS account ID
+            role_name (str): Role name
+
+        Returns:
+            str: The role ARN
+        """
+        partition = client_pool.caller_identity(self.base_profile)["Arn"].split(":")[1]
+        return f"arn:{partition}:iam::{account_id}:role/{role_name}"
+
+    def _assume(self, role_arn):
+        """Call AssumeRole and return the credentials in botocore's refresh format"""
+        response = client_pool.client('sts', profile_name=self.base_profile).assume_role(
+            RoleArn=role_arn,
+            RoleSessionName=ROLE_SESSION_NAME,
+            DurationSeconds=self.duration,
+        )
+        credentials = response['Credentials']
+        return {
+            "access_key": credentials['AccessKeyId'],
+            "secret_key": credentials['SecretAccessKey'],
+            "token": credentials['SessionToken'],
+            "expiry_time": credentials['Expiration'].isoformat(),
+        }
+
+    def _cached_assume(self, role_arn):
+        """Get the role's credentials from the credential cache, assuming the role if they expire soon"""
+        key = f"org-sweep:{client_pool.caller_identity(self.base_profile)['Arn']}:{role_arn}:{self.duration}"
+        try:
+            metadata = credential_cache[key]
+            remaining = parse_timestamp(metadata["expiry_time"]) - datetime.datetime.now(datetime.timezone.utc)
+            if remaining.total_seconds() > DEFAULT_REFRESH_AHEAD:
+                return metadata
+        except (KeyError, TypeError, ValueError):
+            pass
+        metadata = self._assume(role_arn)
+        credential_cache[key] = metadata
+        return metadata
+
+    def session(self, account_id, role_name):
+        """
+        Get the session for a role in an account, assuming the role the first time
+
+        Args:
+            account_id (str): AWS account ID
+            role_name (str): Role to assume
+
+        Returns:
+            boto3.Session: Session using the role's (self-refreshing) credentials
+
+        Raises:
+            botocore.exceptions.ClientError: If the role cannot be assumed
+        """
+        role_arn = self.role_arn(account_id, role_name)
+        with self._lock:
+            session = self._sessions.get(role_arn)
+        if session is not None:
+            return session
+
+        credentials = RefreshableCredentials.create_from_metadata(
+            metadata=self._cached_assume(role_arn),
+            refresh_using=lambda: self._cached_assume(role_arn),
+            method="assume-role",
+        )
+        botocore_session = get_session()
+        botocore_session._credentials = credentials
+        # Default to the base profile's region, like the profiles themselves
+        region = client_pool.session(self.base_profile).region_name
+        if region:
+            botocore_session.set_config_variable('region', region)
+        session = boto3.Session(botocore_session=botocore_session)
+
+        with self._lock:
+            return self._sessions.setdefault(role_arn, session)
+
+    def clear(self):
+        """Forget all assumed-role sessions"""
+        with self._lock:
+            self._sessions.clear()
+
+
+def assume_account_role(account_id, role_name):
+    """
+    Assume the sweep role in an account and make it available to the checks
+
+    Args:
+        account_id (str): AWS account ID
+        role_name (str): Role to assume
+
+    Returns:
+        str: The account's label (see account_label), usable as a profile name by all checks
+    """
+    label = account_label(account_id, role_name)
+    client_pool.register_session(label, assumed_role_sessions.session(account_id, role_name))
+    return label
+
+
+# Assumed-role sessions shared by all checks in this run
+assumed_role_sessions = AssumedRoleSessions()
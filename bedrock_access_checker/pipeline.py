@@ -0,0 +1,150 @@
+"""
+Per-region check pipeline for the AWS Bedrock Access Checker
+
+Once a profile's available regions are known, the same checks run for it
+whether they are driven by the CLI's thread-based CheckGraph.run() or by the
+asyncio API's CheckGraph.run_async(). add_region_checks() adds them to a
+graph for both, so the two entry points cannot drift apart.
+"""
+
+from bedrock_access_checker.checker import (
+    new_check_results,
+    check_bedrock_runtime_access,
+    check_bedrock_models,
+    check_key_models,
+    fetch_model_details,
+    record_model_details,
+    run_model_invocations,
+    record_model_invocations,
+    check_sagemaker_jumpstart_alternatives,
+    estimate_model_costs
+)
+from bedrock_access_checker.catalog import model_catalog
+from bedrock_access_checker.clients import client_pool
+from bedrock_access_checker.quotas import quota_indexes
+from bedrock_access_checker.scheduler import warm
+
+
+def add_check(graph, profile_name, name, func=None, deps=(), apply=None, component=None, region=None, resume=None):
+    """
+    Add a check to a CheckGraph
+
+    The CLI passes its own version instead, which takes the checkpoint
+    journal into account.
+
+    Args:
+        graph (CheckGraph): Graph to add the check to
+        profile_name (str): AWS profile name the check is for
+        name, func, deps, apply, component, region: As for CheckGraph.add()
+        resume (callable, optional): Only used when resuming from a journal; ignored here
+
+    Returns:
+        CheckNode: The new node
+    """
+    return graph.add(name, func, deps, apply, component, region)
+
+
+def isolated(component, func, *args, **kwargs):
+    """
+    Run a check that owns a whole results component against a private results structure
+
+    Such checks can then run in a worker thread; the caller copies the
+    component into the shared results afterwards.
+
+    Returns:
+        tuple: (func's return value, the component's results)
+    """
+    results = new_check_results()
+    value = func(*args, results=results, **kwargs)
+    return value, getattr(results, component)
+
+
+def add_region_checks(graph, profile_name, options, available_regions, results, deadline=None, add=add_check):
+    """
+    Add the per-region checks (and the checks that follow them) to a CheckGraph
+
+    The regions check has normally downloaded each available region's model
+    catalog already, so the model listings mostly just record their results.
+
+    Args:
+        graph (CheckGraph): Graph to add the checks to
+        profile_name (str): AWS profile name to check (None for default credentials)
+        options: Which checks to run (the CLI's parsed arguments or aio.CheckOptions; 'advanced',
+            'test_invoke', 'sagemaker_alternatives' and 'estimate_costs' are used)
+        available_regions (list): Regions where Bedrock is available
+        results (CheckResults): This profile's results structure
+        deadline (float, optional): time.monotonic() value the run must finish by
+        add (callable, optional): Adds a node, called like add_check()
+    """
+    # Key models found per region, filled in by the key model nodes
+    found_models = {}
+
+    def add_region(region):
+        def apply_key_models(_):
+            found_models[region] = check_key_models(region, profile_name, results=results)
+            return found_models[region]
+
+        def resume_key_models(found):
+            found_models[region] = found or []
+            return found_models[region]
+
+        # A resumed run may have skipped the regions check, so the catalog is warmed here too (a cache hit otherwise)
+        warm_catalog = lambda: warm(model_catalog.get_models, region, profile_name)
+
+        add(graph, profile_name, f"runtime:{region}",
+            lambda: warm(client_pool.client, 'bedrock-runtime', region, profile_name),
+            deps=["regions"],
+            apply=lambda _: check_bedrock_runtime_access(region, profile_name, results=results),
+            component="bedrock_runtime", region=region)
+        add(graph, profile_name, f"models:{region}", warm_catalog, deps=["regions"],
+            apply=lambda _: check_bedrock_models(region, profile_name, results=results),
+            component="bedrock_models", region=region)
+        add(graph, profile_name, f"key_models:{region}", warm_catalog, deps=["regions"],
+            apply=apply_key_models, component="key_models", region=region, resume=resume_key_models)
+
+        if options.advanced:
+            add(graph, profile_name, f"quotas:{region}", lambda: warm(quota_indexes.get_index, region, profile_name),
+                deps=["regions"], component="model_details", region=region)
+            add(graph, profile_name, f"details:{region}",
+                lambda: fetch_model_details(found_models[region], region, profile_name),
+                deps=[f"key_models:{region}", f"quotas:{region}"],
+                apply=lambda details: record_model_details(region, details, results=results),
+                component="model_details", region=region)
+
+        if options.test_invoke:
+            add(graph, profile_name, f"invoke:{region}",
+                lambda: run_model_invocations(found_models[region], region, profile_name, deadline=deadline),
+                deps=[f"key_models:{region}"],
+                apply=lambda outcomes: record_model_invocations(region, outcomes, results=results),
+                component="model_invocations", region=region)
+
+    for region in available_regions:
+        add_region(region)
+
+    # Checks that need the key model listings of every region
+    key_model_nodes = [f"key_models:{region}" for region in available_regions]
+
+    # Use the first valid region for SageMaker alternatives and cost estimation (pricing may vary by region)
+    first_region = available_regions[0]
+
+    def find_sagemaker_alternatives():
+        # The key model nodes are all done, so the missing models no longer change
+        if results.key_models.missing:
+            return isolated("sagemaker_alternatives", check_sagemaker_jumpstart_alternatives,
+                            list(results.key_models.missing), first_region, profile_name)[1]
+        return None
+
+    def apply_sagemaker(alternatives):
+        if alternatives is not None:
+            results.sagemaker_alternatives = alternatives
+
+    def apply_costs(_):
+        if results.key_models.available:
+            estimate_model_costs(results.key_models.available, first_region, profile_name, results=results)
+
+    if options.sagemaker_alternatives:
+        add(graph, profile_name, "sagemaker", find_sagemaker_alternatives, deps=key_model_nodes,
+            apply=apply_sagemaker, component="sagemaker_alternatives")
+
+    if options.estimate_costs:
+        add(graph, profile_name, "costs", deps=key_model_nodes, apply=apply_costs, component="cost_estimates")
@@ -0,0 +1,205 @@
+"""
+Service Quotas index for the AWS Bedrock Access Checker
+
+Lists a region's Bedrock quotas once (all pages) and indexes them by the
+tokens in their names, so each model's relevant quotas are found with a few
+dictionary lookups instead of a scan over every quota.
+"""
+
+import re
+import threading
+import time
+
+from bedrock_access_checker.cache import cached_call
+from bedrock_access_checker.clients import client_pool
+
+# Service code for Bedrock in the Service Quotas API
+BEDROCK_SERVICE_CODE = "bedrock"
+
+# Quotas whose names contain these tokens apply to every model
+GENERAL_QUOTA_TOKENS = ("throughput", "rate")
+
+# Model ID parts this short (versions, sizes) are too generic to match on
+MIN_MODEL_TOKEN_LENGTH = 4
+
+
+def tokenize(text):
+    """
+    Split text into normalized lowercase alphanumeric tokens
+
+    Args:
+        text (str): Quota name or model ID part
+
+    Returns:
+        list: Tokens in order of appearance
+    """
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def model_tokens(model_id):
+    """
+    Get the meaningful name tokens of a model ID
+
+    Args:
+        model_id (str): Bedrock model ID (e.g. anthropic.claude-3-sonnet-20240229-v1:0)
+
+    Returns:
+        set: Tokens to look up in the quota index (e.g. {'claude', 'sonnet', '20240229'})
+    """
+    name = model_id.split('.')[-1]
+    return {token for token in tokenize(name) if len(token) >= MIN_MODEL_TOKEN_LENGTH}
+
+
+class QuotaIndex:
+    """Bedrock quotas of one region, indexed by quota-name token"""
+
+    def __init__(self, quotas):
+        """
+        Build the index
+
+        Args:
+            quotas (list): Quota entries as returned by list_service_quotas
+        """
+        self.quotas = quotas
+        self._by_token = {}
+        self._general = []
+
+        for position, quota in enumerate(quotas):
+            tokens = set(tokenize(quota.get('QuotaName', '')))
+            for token in tokens:
+                self._by_token.setdefault(token, []).append(position)
+            if any(token in tokens for token in GENERAL_QUOTA_TOKENS):
+                self._general.append(position)
+
+    def quotas_for_model(self, model_id):
+        """
+        Get the quotas relevant to a model
+
+        Args:
+            model_id (str): Bedrock model ID
+
+        Returns:
+            dict: Quota name mapped to its value, unit and adjustability
+        """
+        positions = set(self._general)
+        for token in model_tokens(model_id):
+            positions.update(self._by_token.get(token, ()))
+
+        relevant = {}
+        for position in sorted(positions):
+            quota = self.quotas[position]
+            relevant[quota.get('QuotaName')] = {
+                "value": quota.get('Value'),
+                "unit": quota.get('Unit'),
+                "adjustable": quota.get('Adjustable', False)
+            }
+        return relevant
+
+
+def list_bedrock_quotas(region, profile_name=None):
+    """
+    List every Bedrock quota in a region, following all result pages
+
+    Args:
+        region (str): AWS region to list quotas in
+        profile_name (str, optional): AWS profile name to use
+
+    Returns:
+        list: All quota entries
+    """
+    client = client_pool.client('service-quotas', region, profile_name)
+
+    quotas = []
+    for page in client.get_paginator('list_service_quotas').paginate(ServiceCode=BEDROCK_SERVICE_CODE):
+        quotas.extend(page.get('Quotas', []))
+    return quotas
+
+
+class QuotaIndexCache:
+    """
+    Thread-safe cache of per-region quota indexes
+
+    Each (profile, region) index is built once per run. Failures are not
+    kept: a throttled or timed-out listing is tried again by the next lookup
+    rather than hiding the region's quotas for the rest of the run. As with
+    the model catalog, a TTL makes long-lived processes list them again.
+    """
+
+    def __init__(self, ttl=None):
+        """
+        Args:
+            ttl (float, optional): Seconds an index is kept (None to keep it for the whole run)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # (index, time.monotonic() when built) by (profile, region)
+        self._indexes = {}
+        self._key_locks = {}
+
+    def set_ttl(self, ttl):
+        """
+        Change how long indexes are kept
+
+        Args:
+            ttl (float): Seconds an index is kept (None to keep it for the whole run)
+        """
+        with self._lock:
+            self.ttl = ttl
+
+    def _live_index(self, key):
+        """Get the index for key if it has not expired; call with the lock held"""
+        entry = self._indexes.get(key)
+        if entry is None:
+            return None
+        index, built = entry
+        if self.ttl is not None and time.monotonic() - built >= self.ttl:
+            return None
+        return index
+
+    def get_index(self, region, profile_name=None):
+        """
+        Get the quota index for a region
+
+        Args:
+            region (str): AWS region
+            profile_name (str, optional): AWS profile name to use
+
+        Returns:
+            QuotaIndex: The region's quota index
+
+        Raises:
+            Exception: The error from listing the quotas, if it failed
+        """
+        key = (profile_name, region)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Only one thread lists a region's quotas; the others wait for it
+        with key_lock:
+            with self._lock:
+                index = self._live_index(key)
+
+            if index is None:
+                quotas = cached_call("list_service_quotas", region, profile_name,
+                                     lambda: list_bedrock_quotas(region, profile_name))
+                index = QuotaIndex(quotas)
+                with self._lock:
+                    if self.ttl is not None:
+                        # Drop the other expired indexes too, so a long-lived process does not keep them
+                        cutoff = time.monotonic() - self.ttl
+                        for expired in [other for other, (_, built) in self._indexes.items() if built <= cutoff]:
+                            del self._indexes[expired]
+                            self._key_locks.pop(expired, None)
+                    self._indexes[key] = (index, time.monotonic())
+
+        return index
+
+    def clear(self):
+        """Forget all cached indexes"""
+        with self._lock:
+            self._indexes.clear()
+            self._key_locks.clear()
+
+
+# Quota indexes shared by all checks in this run
+quota_indexes = QuotaIndexCache()
@@ -0,0 +1,414 @@
+"""
+Deferred rendering for the AWS Bedrock Access Checker
+
+The checks only record what they find in a profile's CheckResults; none of
+them print while AWS calls are in flight. Once a run's checks have finished,
+each profile's results are rendered in one pass: TerminalRenderer prints the
+check tables (regions, models, key models, advanced details, invocations,
+SageMaker alternatives, cost estimates), the CLI adds the summary dashboard,
+and the json, csv and html outputs are written from the same results.
+Profiles checked side by side therefore never interleave their output, and
+every table is built once, over all regions, instead of once per region.
+
+While the checks run, ProgressView shows a live progress bar counting the
+check units that have finished (on interactive terminals only).
+"""
+
+import threading
+
+from rich.markup import escape
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+
+from bedrock_access_checker.checker import (
+    console,
+    new_table,
+    needed_models,
+    STATUS_ERROR,
+    STATUS_TIMEOUT
+)
+
+# Width of the region table's message column, like the region probes used to print it
+REGION_MESSAGE_WIDTH = 50
+
+
+def _region_row(line, available):
+    """
+    Split a 'Region <region>: <outcome>' line of the region check into table cells
+
+    Returns:
+        tuple: (region, status, message, style), or None if the line is not about a region
+    """
+    if not line.startswith("Region ") or ": " not in line:
+        return None
+    region, outcome = line[len("Region "):].split(": ", 1)
+    outcome, _, message = outcome.partition(" - ")
+    if region in available:
+        return region, "✓ Available", message or "Successfully connected", "green"
+    if outcome == "Timed out":
+        return region, STATUS_TIMEOUT, "No response before the deadline", "red"
+    if outcome.startswith("Not available"):
+        return region, "✗ Not available", message or "Bedrock not available in this region", "yellow"
+    if outcome in ("Permission denied", "Not authorized"):
+        return region, "✗ No access", outcome, "red"
+    return region, "✗ Error", (message or outcome)[:REGION_MESSAGE_WIDTH], "red"
+
+
+def _quota_text(value):
+    """A quota value as shown in the model details table"""
+    if not isinstance(value, dict):
+        return str(value)
+    text = f"{value.get('value')} {value.get('unit', '')}"
+    if value.get('adjustable'):
+        text += " (adjustable)"
+    return text
+
+
+class TerminalRenderer:
+    """
+    Prints a profile's check results on the console
+
+    Sections without results (e.g. invocations without --test-invoke) are
+    left out. Rendering stops after the credentials or regions section when
+    the checks stopped there, like the checks themselves do.
+    """
+
+    def __init__(self, output=None):
+        """
+        Create a renderer
+
+        Args:
+            output (Console, optional): Console to print to (defaults to the checker's console)
+        """
+        self.console = output if output is not None else console
+
+    def render(self, results, profile_name=None, profile_index=0, profile_count=1):
+        """
+        Print a profile's check results (without the summary dashboard)
+
+        Args:
+            results (CheckResults): The profile's results
+            profile_name (str, optional): AWS profile name or account label (None for default credentials)
+            profile_index (int, optional): Position of this profile in the run
+            profile_count (int, optional): Total number of profiles in the run
+
+        Returns:
+            bool: True if the checks got past the credentials and regions (so there is more than the dashboard to show)
+        """
+        # Nothing is built in quiet mode
+        if self.console.muted:
+            return False
+
+        if profile_count > 1:
+            self.console.print(f"\n[bold]=== Profile {profile_index + 1}/{profile_count}: "
+                               f"{escape(profile_name or 'default')} ===[/bold]")
+
+        if not self._credentials(results, profile_name) or not self._regions(results):
+            self._timed_out(results)
+            return False
+
+        self._runtime(results)
+        self._models(results)
+        self._key_models(results)
+        self._model_details(results)
+        self._invocations(results)
+        self._sagemaker(results)
+        self._costs(results)
+        self._timed_out(results)
+        self._notices(results)
+        return True
+
+    def _lines(self, component, style="green", mark="✓ "):
+        """Print a component's detail lines, then its errors"""
+        for line in component.details:
+            self.console.print(f"[{style}]{mark}{escape(line)}[/{style}]")
+        for line in component.errors:
+            self.console.print(f"[bold red]{escape(line)}[/bold red]")
+
+    def _credentials(self, results, profile_name):
+        credentials = results.aws_credentials
+        if credentials.details or credentials.errors:
+            self.console.print(f"[bold]AWS credentials ({escape(profile_name or 'default profile')}):[/bold]")
+        for index, line in enumerate(credentials.details):
+            if line.startswith("WARNING: "):
+                self.console.print(f"[yellow]Warning: {escape(line[len('WARNING: '):])}[/yellow]")
+            elif index == 0 and credentials.status != STATUS_ERROR:
+                self.console.print(f"[green]✓ {escape(line)}[/green]")
+            else:
+                self.console.print(f"[dim]{escape(line)}[/dim]")
+        for line in credentials.errors:
+            self.console.print(f"[bold red]{escape(line)}[/bold red]")
+
+        if credentials.status == STATUS_ERROR:
+            self.console.print(f"\n[bold red]AWS credential check failed for profile "
+                               f"'{escape(profile_name or 'default')}'. Skipping this profile.[/bold red]")
+            return False
+        return True
+
+    def _regions(self, results):
+        regions = results.bedrock_regions
+        available = set(regions.available)
+        rows = [row for row in (_region_row(line, available) for line in regions.details + regions.errors) if row]
+        if rows:
+            table = new_table("Bedrock Region Availability")
+            table.add_column("Region", style="cyan")
+            table.add_column("Status")
+            table.add_column("Message", style="yellow")
+            for region, status, message, style in rows:
+                table.add_row(region, f"[{style}]{status}[/{style}]", escape(message))
+            self.console.print()
+            self.console.print(table)
+
+        if not regions.available:
+            self.console.print("\n[bold red]No available Bedrock regions found![/bold red]")
+            self.console.print("[yellow]Possible reasons:[/yellow]")
+            self.console.print("1. Your AWS account doesn't have Bedrock enabled")
+            self.console.print("2. Your AWS credentials don't have Bedrock permissions")
+            self.console.print("3. Bedrock isn't available in your account's regions")
+            return False
+        return True
+
+    def _runtime(self, results):
+        if results.bedrock_runtime.details or results.bedrock_runtime.errors:
+            self.console.print("\n[bold]bedrock-runtime service:[/bold]")
+            self._lines(results.bedrock_runtime)
+
+    def _models(self, results):
+        models = results.bedrock_models
+        listed = models.available
+        if len(listed):
+            every_region = set(listed.models_in_all_regions())
+            region_count = len(listed.regions)
+            table = new_table(f"Bedrock Models ({len(listed)} listed in {region_count} "
+                              f"region{'s' if region_count != 1 else ''})")
+            table.add_column("Model ID", style="cyan")
+            table.add_column("Provider", style="blue")
+            table.add_column("Listed In", style="green")
+            for model_id in listed:
+                regions = "All checked regions" if model_id in every_region else ", ".join(listed.regions_for(model_id))
+                table.add_row(model_id, model_id.split('.')[0], regions)
+            self.console.print()
+            self.console.print(table)
+
+        # Only the warnings (e.g. regions without models) and errors; the counts are in the table
+        for line in models.details:
+            if not line.startswith("Found "):
+                self.console.print(f"[yellow]{escape(line)}[/yellow]")
+        for line in models.errors:
+            self.console.print(f"[bold red]{escape(line)}[/bold red]")
+
+    def _key_models(self, results):
+        key_models = results.key_models
+        available, missing = set(key_models.available), set(key_models.missing)
+        if available or missing:
+            listed = results.bedrock_models.available
+            table = new_table("Key Models")
+            table.add_column("Model", style="cyan")
+            table.add_column("Listed", style="green")
+            table.add_column("Purpose", style="blue")
+            table.add_column("Regions", style="green")
+            for model_info in needed_models:
+                model_id = model_info["id"]
+                if model_id in available:
+                    table.add_row(model_id, "✅ Available", model_info["purpose"], ", ".join(listed.regions_for(model_id)))
+                elif model_id in missing:
+                    table.add_row(model_id, "❌ Not Available", model_info["purpose"], "")
+            self.console.print()
+            self.console.print(table)
+        for line in key_models.errors:
+            self.console.print(f"[bold red]{escape(line)}[/bold red]")
+
+    def _model_details(self, results):
+        for model_id, details in (results.model_details or {}).items():
+            region = details.get("region")
+            table = new_table(f"Details for {model_id}" + (f" in {region}" if region else ""))
+            table.add_column("Parameter", style="cyan")
+            table.add_column("Value", style="yellow")
+            for key, value in (details.get("specs") or {}).items():
+                if key != "error":
+                    table.add_row(f"Spec: {key}", escape(str(value)))
+            for key, value in (details.get("inference_params") or {}).items():
+                table.add_row(f"Param: {key}", escape(str(value)))
+            for key, value in (details.get("quotas") or {}).items():
+                if key != "error":
+                    table.add_row(f"Quota: {key}", escape(_quota_text(value)))
+            self.console.print()
+            self.console.print(table)
+
+    def _invocations(self, results):
+        invocations = results.model_invocations
+        if not invocations or not invocations.details:
+            return
+        table = new_table("Model Invocation")
+        table.add_column("Model", style="cyan")
+        table.add_column("Invocation", style="magenta")
+        for line in invocations.details:
+            model_id, _, message = line.partition(": ")
+            if message.startswith("Throttled - "):
+                outcome = f"⏳ Throttled: {message[len('Throttled - '):]}"
+            elif message.startswith("Failed - "):
+                outcome = f"❌ Failed: {message[len('Failed - '):]}"
+            else:
+                outcome = "✅ Success"
+            table.add_row(model_id, escape(outcome))
+        self.console.print()
+        self.console.print(table)
+
+    def _sagemaker(self, results):
+        alternatives = results.sagemaker_alternatives
+        if alternatives is None:
+            return
+        if "error" in alternatives:
+            self.console.print(f"\n[yellow]{escape(str(alternatives['error']))}[/yellow]")
+            return
+        if not alternatives:
+            self.console.print("\n[yellow]No SageMaker JumpStart alternatives found for your missing models[/yellow]")
+            return
+        table = new_table("SageMaker JumpStart Alternatives")
+        table.add_column("Missing Bedrock Model", style="red")
+        table.add_column("JumpStart Alternative", style="green")
+        table.add_column("Notes", style="cyan")
+        for model_id, matches in alternatives.items():
+            for index, alt in enumerate(matches):
+                table.add_row(model_id if index == 0 else "", f"{alt['name']} ({alt['model_id']})", alt['notes'])
+        self.console.print()
+        self.console.print(table)
+        self.console.print(f"[green]✓ Found SageMaker JumpStart alternatives for {len(alternatives)} missing Bedrock models[/green]")
+
+    def _costs(self, results):
+        estimates = results.cost_estimates.models
+        if not estimates:
+            return
+        table = new_table("Bedrock Cost Estimates (per 1M tokens)")
+        table.add_column("Model", style="cyan")
+        table.add_column("Input Cost", style="green")
+        table.add_column("Output Cost", style="magenta")
+        table.add_column("Context Window", style="yellow")
+        table.add_column("Common Usage Est.", style="blue")
+        for model_id, estimate in estimates.items():
+            if estimate.get("input_price") is None:
+                table.add_row(model_id, "Unknown", "Unknown", "Unknown", "Unknown")
+            else:
+                table.add_row(
+                    model_id,
+                    f"${estimate['input_price']:.2f}",
+                    f"${estimate['output_price']:.2f}",
+                    f"{estimate['context_window']:,} tokens",
+                    f"${estimate['common_usage_estimate']:.2f}"
+                )
+        self.console.print()
+        self.console.print(table)
+        self.console.print("\n[bold]Cost Estimate Details:[/bold]")
+        self.console.print("[dim]• Common Usage Estimate: Cost for 1,000 requests with 1,500 input tokens and 500 output tokens each[/dim]")
+        self.console.print("[dim]• Pricing may vary by region and is subject to change[/dim]")
+        self.console.print("[dim]• Context window shows maximum tokens allowed per request[/dim]")
+        self.console.print("[dim]• For most accurate pricing, visit AWS Pricing Calculator or Bedrock console[/dim]")
+
+    def _timed_out(self, results):
+        if results.timed_out:
+            self.console.print(f"\n[bold red]Deadline reached: {len(results.timed_out)} checks did not finish.[/bold red]")
+
+    def _notices(self, results):
+        if results.model_invocations is not None:
+            self.console.print("\n[yellow]Notice: Model invocation tests may have incurred small AWS charges.[/yellow]")
+        if results.model_details is not None:
+            self.console.print("\n[blue]Advanced mode: Detailed model information and quotas have been included in the results.[/blue]")
+        if results.sagemaker_alternatives is not None:
+            self.console.print("\n[blue]SageMaker JumpStart alternatives have been suggested for missing Bedrock models.[/blue]")
+        if results.cost_estimates.models:
+            self.console.print("\n[blue]Cost estimates have been provided for available Bedrock models.[/blue]")
+
+
+# Renderer used by the CLI
+terminal_renderer = TerminalRenderer()
+
+
+class ProgressView:
+    """
+    Live progress bar counting finished check units
+
+    Every profile's CheckGraph reports its progress through update() from
+    its on_done callback. Graphs add their per-region checks as they go, so
+    the bar's total grows until the region lists are known.
+    """
+
+    def __init__(self, output, description="Checking"):
+        """
+        Create a progress view (shown once started)
+
+        Args:
+            output (Console): Console to draw on
+            description (str, optional): Text in front of the bar
+        """
+        self._lock = threading.Lock()
+        # (settled, total) units by profile
+        self._counts = {}
+        self._progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[bold]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.completed:.0f}/{task.total:.0f} checks"),
+            TimeElapsedColumn(),
+            console=output,
+            transient=True,
+        )
+        self._task = self._progress.add_task(description, total=0)
+
+    def start(self):
+        """Start drawing the bar"""
+        self._progress.start()
+
+    def update(self, profile_name, settled, total):
+        """
+        Record a profile's progress
+
+        Args:
+            profile_name (str): AWS profile name or account label
+            settled (int): The profile's check units that have finished, failed or been skipped
+            total (int): All of the profile's check units known so far
+        """
+        with self._lock:
+            self._counts[profile_name] = (settled, total)
+            completed = sum(count[0] for count in self._counts.values())
+            total = sum(count[1] for count in self._counts.values())
+        self._progress.update(self._task, completed=completed, total=total)
+
+    def stop(self):
+        """Remove the bar"""
+        self._progress.stop()
+
+
+# Progress view of this run (None when not shown)
+_progress = None
+
+
+def start_progress(output=None, description="Checking"):
+    """
+    Show the live progress bar for this run, if the console is an interactive terminal
+
+    Args:
+        output (Console, optional): Console to draw on (defaults to the checker's console)
+        description (str, optional): Text in front of the bar
+
+    Returns:
+        ProgressView: The progress view (None if it is not shown)
+    """
+    global _progress
+    stop_progress()
+    output = output if output is not None else console
+    if output.is_terminal and not output.muted:
+        _progress = ProgressView(output, description)
+        _progress.start()
+    return _progress
+
+
+def stop_progress():
+    """Remove the live progress bar"""
+    global _progress
+    if _progress is not None:
+        _progress.stop()
+    _progress = None
+
+
+def active_progress():
+    """Get the progress view of this run (None when not shown)"""
+    return _progress
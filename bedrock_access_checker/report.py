@@ -0,0 +1,169 @@
+"""
+Consolidated multi-profile reports for the AWS Bedrock Access Checker
+
+When more than one profile (or account) is checked, the json, csv and html
+outputs are written as one document with a profile axis instead of one file
+per profile. The profile comparison (statuses, region and key model
+matrices, summary counts) is computed once by compare_profiles() and used by
+both the console comparison and the report.
+
+Profiles are written to the file one at a time, so a report over hundreds
+of profiles never builds the whole document in memory.
+"""
+
+import datetime
+import json
+
+from bedrock_access_checker.checker import csv_rows, overall_status
+from bedrock_access_checker.html_report import HtmlReportWriter
+
+# Components compared across profiles, with their column titles
+COMPARED_COMPONENTS = (
+    ("aws_credentials", "AWS Credentials"),
+    ("bedrock_regions", "Bedrock Regions"),
+    ("bedrock_models", "Bedrock Models"),
+    ("key_models", "Key Models"),
+)
+
+
+def short_model_name(model_id):
+    """
+    Shorten a model ID for a comparison column (e.g. 'anthropic.claude-v2:1' -> 'claude-v2')
+
+    Args:
+        model_id (str): Model ID
+
+    Returns:
+        str: Short name
+    """
+    return model_id.split(':')[0].split('.')[-1]
+
+
+def compare_profiles(profile_results):
+    """
+    Compare the results of several profiles
+
+    Args:
+        profile_results (dict): CheckResults by profile name or account label
+
+    Returns:
+        dict: 'components' (compared components and their titles), 'regions' and
+            'models' (sorted, over all profiles), 'model_names' (short model names)
+            and one row per profile in 'profiles' with its statuses, region access
+            (True/False per region), key model access (True, False or None when
+            not checked, per model) and counts
+    """
+    all_regions = set()
+    all_models = set()
+    for results in profile_results.values():
+        all_regions.update(results.bedrock_regions.available)
+        all_models.update(results.key_models.available)
+        all_models.update(results.key_models.missing)
+    regions = sorted(all_regions)
+    models = sorted(all_models)
+
+    rows = []
+    for label, results in profile_results.items():
+        available_regions = set(results.bedrock_regions.available)
+        available_models = set(results.key_models.available)
+        missing_models = set(results.key_models.missing)
+        rows.append({
+            "profile": label,
+            "statuses": {name: getattr(results, name).status for name, _ in COMPARED_COMPONENTS},
+            "overall": overall_status(results)[0],
+            "regions": [region in available_regions for region in regions],
+            "models": [True if model in available_models else False if model in missing_models else None
+                       for model in models],
+            "counts": {
+                "regions": len(available_regions),
+                "models": len(results.bedrock_models.available),
+                "key_models": len(available_models),
+                "key_models_total": len(available_models) + len(missing_models),
+            },
+        })
+    return {
+        "components": dict(COMPARED_COMPONENTS),
+        "regions": regions,
+        "models": models,
+        "model_names": [short_model_name(model_id) for model_id in models],
+        "profiles": rows,
+    }
+
+
+def report_filename(format_type, timestamp):
+    """
+    Get the file name of a consolidated report
+
+    Args:
+        format_type (str): 'json', 'csv' or 'html'
+        timestamp (str): Timestamp of the run
+
+    Returns:
+        str: File name
+    """
+    return f"bedrock_check_profiles_{timestamp}.{format_type}"
+
+
+def _csv_field(value):
+    """A value as a CSV field, like the single-profile output does it"""
+    return str(value if value is not None else "").replace(',', ';')
+
+
+def write_json(f, profile_results, comparison, timestamp):
+    """
+    Write the JSON document of a run, one profile at a time
+
+    Args:
+        f (file): Text file to write to
+        profile_results (dict): CheckResults by profile name or account label
+        comparison (dict): Result of compare_profiles()
+        timestamp (str): Timestamp of the run
+    """
+    f.write('{\n  "generated": %s,\n  "comparison": %s,\n  "profiles": {' % (
+        json.dumps(timestamp), json.dumps(comparison)))
+    for index, (label, results) in enumerate(profile_results.items()):
+        f.write("%s\n    %s: %s" % ("," if index else "", json.dumps(label), json.dumps(results.to_dict())))
+    f.write("\n  }\n}\n")
+
+
+def write_consolidated_report(format_type, profile_results, comparison=None, timestamp=None):
+    """
+    Write one report covering every profile
+
+    Args:
+        format_type (str): 'json', 'csv' or 'html'
+        profile_results (dict): CheckResults by profile name or account label
+        comparison (dict, optional): Result of compare_profiles() (computed here if not given)
+        timestamp (str, optional): Timestamp of the run (defaults to now)
+
+    Returns:
+        str: Name of the written file
+    """
+    if comparison is None:
+        comparison = compare_profiles(profile_results)
+    if timestamp is None:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = report_filename(format_type, timestamp)
+
+    with open(filename, 'w') as f:
+        if format_type == 'json':
+            write_json(f, profile_results, comparison, timestamp)
+
+        elif format_type == 'csv':
+            f.write("Profile,Component,Status,Details\n")
+            for label, results in profile_results.items():
+                profile = _csv_field(label)
+                for component, status, details in csv_rows(results):
+                    f.write(f"{profile},{component},{status},{details}\n")
+
+        elif format_type == 'html':
+            writer = HtmlReportWriter(f)
+            writer.begin(f"AWS Bedrock Access Verification Report ({len(profile_results)} profiles)")
+            writer.comparison(comparison)
+            for label, results in profile_results.items():
+                writer.profile(results, label)
+            writer.end(timestamp)
+
+        else:
+            raise ValueError(f"Unknown report format: {format_type}")
+    return filename
@@ -0,0 +1,492 @@
+"""
+Check result model for the AWS Bedrock Access Checker
+
+Every profile's results live in one CheckResults object that is passed
+explicitly to the checks. Its components are small __slots__ classes, so a
+sweep over hundreds of profiles keeps one compact object per component
+instead of a nest of dicts. The models listed in each region are kept in a
+ModelRegistry, which stores every model ID once with a bitset of its regions.
+
+Results have a single writer: the CLI's check graph and the asyncio API only
+update them from one thread at a time (see scheduler.py). Anything that
+reads results from another thread, or keeps them after the run moves on,
+takes a snapshot(): a read-only copy in which lists become tuples and dicts
+become read-only mappings. Strings and numbers are shared with the original,
+so a snapshot is much cheaper than copy.deepcopy().
+
+For compatibility with code written against the old dict structure, records
+also support item access (results["key_models"]["available"]), "in", get()
+and setdefault(), and to_dict() returns the plain structure used for JSON.
+from_dict() turns that structure back into records (e.g. from a checkpoint
+journal).
+"""
+
+from types import MappingProxyType
+
+# Field names per record class, filled in on first use
+_field_names = {}
+
+
+def _freeze(value):
+    """Read-only copy of a result value"""
+    if isinstance(value, (ResultRecord, ModelRegistry)):
+        return value.snapshot()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _plain(value):
+    """Plain dict/list copy of a result value (for JSON)"""
+    if isinstance(value, (ResultRecord, ModelRegistry)):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+def to_plain(value):
+    """
+    Get a result value (record, registry, or dicts and lists of them) as plain data
+
+    Args:
+        value: The value to convert
+
+    Returns:
+        The value as plain dicts and lists
+    """
+    return _plain(value)
+
+
+class ModelRegistry:
+    """
+    De-duplicated record of which models are listed in which regions
+
+    Each model ID is stored once, with the regions it is listed in kept as a
+    bitset (bit i set for the i-th region added), so membership tests are
+    hash lookups and "in every region" is a single integer comparison.
+
+    Iterating the registry, len() and "in" work on the unique model IDs, in
+    the order they were first listed.
+    """
+
+    __slots__ = ("_regions", "_region_bits", "_models", "_frozen")
+
+    def __init__(self):
+        self._regions = []
+        self._region_bits = {}
+        self._models = {}
+        self._frozen = False
+
+    def add(self, region, model_ids):
+        """
+        Record the models listed in a region
+
+        Args:
+            region (str): AWS region
+            model_ids (iterable): IDs of the models listed there
+        """
+        if self._frozen:
+            raise AttributeError("ModelRegistry snapshot is read-only")
+        bit = self._region_bits.get(region)
+        if bit is None:
+            bit = 1 << len(self._regions)
+            self._regions.append(region)
+            self._region_bits[region] = bit
+        models = self._models
+        for model_id in model_ids:
+            models[model_id] = models.get(model_id, 0) | bit
+
+    @property
+    def regions(self):
+        """list: Regions recorded so far, in the order they were added"""
+        return list(self._regions)
+
+    def _regions_in(self, bits):
+        return [region for index, region in enumerate(self._regions) if bits >> index & 1]
+
+    def regions_for(self, model_id):
+        """
+        Get the regions a model is listed in
+
+        Args:
+            model_id (str): Model ID
+
+        Returns:
+            list: Regions listing the model (empty if it is listed nowhere)
+        """
+        return self._regions_in(self._models.get(model_id, 0))
+
+    def models_in(self, region):
+        """
+        Get the models listed in a region
+
+        Args:
+            region (str): AWS region
+
+        Returns:
+            list: Model IDs listed in the region
+        """
+        bit = self._region_bits.get(region, 0)
+        return [model_id for model_id, bits in self._models.items() if bits & bit]
+
+    def models_in_all_regions(self):
+        """
+        Get the models listed in every recorded region
+
+        Returns:
+            list: Model IDs listed everywhere
+        """
+        if not self._regions:
+            return []
+        every_region = (1 << len(self._regions)) - 1
+        return [model_id for model_id, bits in self._models.items() if bits == every_region]
+
+    def __contains__(self, model_id):
+        return model_id in self._models
+
+    def __iter__(self):
+        return iter(self._models)
+
+    def __len__(self):
+        return len(self._models)
+
+    def __eq__(self, other):
+        if isinstance(other, ModelRegistry):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, (list, tuple)):
+            return list(self._models) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def snapshot(self):
+        """
+        Get a read-only copy of this registry
+
+        Returns:
+            ModelRegistry: Copy that cannot be added to
+        """
+        if self._frozen:
+            return self
+        copy = ModelRegistry()
+        copy._regions = list(self._regions)
+        copy._region_bits = dict(self._region_bits)
+        copy._models = dict(self._models)
+        copy._frozen = True
+        return copy
+
+    def to_dict(self):
+        """
+        Get the registry as plain data
+
+        Returns:
+            dict: Regions listing each model, by model ID
+        """
+        return {model_id: self._regions_in(bits) for model_id, bits in self._models.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a registry from to_dict() output
+
+        Args:
+            data (dict): Regions listing each model, by model ID
+
+        Returns:
+            ModelRegistry: The registry
+        """
+        registry = cls()
+        for model_id, regions in data.items():
+            for region in regions:
+                registry.add(region, [model_id])
+        return registry
+
+    def __repr__(self):
+        return f"ModelRegistry({len(self._models)} models in {len(self._regions)} regions)"
+
+
+class ResultRecord:
+    """
+    Base class of the result records
+
+    Subclasses list their fields in __slots__; fields named in _optional are
+    left out of to_dict() (and "in" checks) while they are None.
+    """
+
+    __slots__ = ("_frozen",)
+    _optional = ()
+
+    def __init__(self, **fields):
+        object.__setattr__(self, "_frozen", False)
+        for name in self.fields():
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {', '.join(sorted(fields))}")
+
+    @classmethod
+    def fields(cls):
+        """Field names of this record, base class fields first"""
+        names = _field_names.get(cls)
+        if names is None:
+            names = tuple(
+                name
+                for klass in reversed(cls.__mro__)
+                for name in klass.__dict__.get("__slots__", ())
+                if not name.startswith("_")
+            )
+            _field_names[cls] = names
+        return names
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} snapshot is read-only")
+        object.__setattr__(self, name, value)
+
+    def snapshot(self):
+        """
+        Get a read-only copy of this record
+
+        Returns:
+            ResultRecord: Copy whose lists are tuples and dicts read-only mappings
+        """
+        if self._frozen:
+            return self
+        copy = object.__new__(type(self))
+        for name in self.fields():
+            object.__setattr__(copy, name, _freeze(getattr(self, name)))
+        object.__setattr__(copy, "_frozen", True)
+        return copy
+
+    @property
+    def frozen(self):
+        """bool: True if this record is a read-only snapshot"""
+        return self._frozen
+
+    def to_dict(self):
+        """
+        Get the record as plain dicts and lists
+
+        Returns:
+            dict: The record's fields (unset optional fields left out)
+        """
+        return {name: _plain(getattr(self, name)) for name in self.keys()}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a record from to_dict() output
+
+        Args:
+            data (dict): The record's fields (unknown fields are ignored)
+
+        Returns:
+            ResultRecord: The record
+        """
+        fields = cls.fields()
+        return cls(**{name: value for name, value in data.items() if name in fields})
+
+    # Dict-style access
+
+    def keys(self):
+        """Names of the fields that are set"""
+        return [name for name in self.fields() if name not in self._optional or getattr(self, name) is not None]
+
+    def items(self):
+        """(name, value) pairs of the fields that are set"""
+        return [(name, getattr(self, name)) for name in self.keys()]
+
+    def __contains__(self, name):
+        return name in self.keys()
+
+    def __getitem__(self, name):
+        if name not in self.fields():
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __setitem__(self, name, value):
+        if name not in self.fields():
+            raise KeyError(name)
+        setattr(self, name, value)
+
+    def get(self, name, default=None):
+        """Value of a set field, or default"""
+        return getattr(self, name) if name in self else default
+
+    def setdefault(self, name, default=None):
+        """Value of a field, setting it to default first if it is unset"""
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def __eq__(self, other):
+        if isinstance(other, ResultRecord):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.keys())
+        return f"{type(self).__name__}({fields})"
+
+
+class ComponentResult(ResultRecord):
+    """Status, detail lines and errors of one check component"""
+
+    __slots__ = ("status", "details", "errors")
+
+    def __init__(self, status=None, details=None, errors=None, **fields):
+        super().__init__(status=status, details=details or [], errors=errors or [], **fields)
+
+
+class AvailabilityResult(ComponentResult):
+    """Component result that also lists what was found available (regions, models)"""
+
+    __slots__ = ("available",)
+
+    def __init__(self, available=None, **fields):
+        super().__init__(available=available or [], **fields)
+
+
+class ModelListingResult(ComponentResult):
+    """Models listed in the checked regions, as a ModelRegistry"""
+
+    __slots__ = ("available",)
+
+    def __init__(self, available=None, **fields):
+        super().__init__(available=available if available is not None else ModelRegistry(), **fields)
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data["available"] = ModelRegistry.from_dict(data.get("available", {}))
+        return super().from_dict(data)
+
+
+class KeyModelsResult(AvailabilityResult):
+    """Key model availability: available and missing model IDs"""
+
+    __slots__ = ("missing",)
+
+    def __init__(self, missing=None, **fields):
+        super().__init__(missing=missing or [], **fields)
+
+
+class InvocationResults(ResultRecord):
+    """Outcome of the test invocations, by model ID"""
+
+    __slots__ = ("successful", "failed", "throttled", "details")
+
+    def __init__(self, successful=None, failed=None, throttled=None, details=None):
+        super().__init__(successful=successful or [], failed=failed or [], throttled=throttled or [],
+                         details=details or [])
+
+
+class CostEstimates(ResultRecord):
+    """Estimated costs per model ID"""
+
+    __slots__ = ("models", "details")
+
+    def __init__(self, models=None, details=None):
+        super().__init__(models=models or {}, details=details or [])
+
+
+class ModelDetails(ResultRecord):
+    """Quota, inference parameter, pricing and spec details of one model in one region"""
+
+    __slots__ = ("model_id", "region", "quotas", "inference_params", "pricing", "specs", "error")
+    _optional = ("model_id", "region", "error")
+
+    def __init__(self, model_id=None, region=None, quotas=None, inference_params=None, pricing=None, specs=None,
+                 error=None):
+        super().__init__(model_id=model_id, region=region, quotas=quotas or {},
+                         inference_params=inference_params or {}, pricing=pricing or {}, specs=specs or {},
+                         error=error)
+
+
+class CheckResults(ResultRecord):
+    """All check results of one profile"""
+
+    __slots__ = (
+        "aws_credentials",
+        "bedrock_regions",
+        "bedrock_runtime",
+        "bedrock_models",
+        "key_models",
+        "model_details",
+        "model_invocations",
+        "sagemaker_alternatives",
+        "cost_estimates",
+        "timed_out",
+        "timings",
+    )
+    # Components that only exist once their check has run
+    _optional = ("model_details", "model_invocations", "sagemaker_alternatives", "timings")
+
+    def __init__(self):
+        super().__init__(
+            aws_credentials=ComponentResult(),
+            bedrock_regions=AvailabilityResult(),
+            bedrock_runtime=AvailabilityResult(),
+            bedrock_models=ModelListingResult(),
+            key_models=KeyModelsResult(),
+            cost_estimates=CostEstimates(),
+            timed_out=[],
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a profile's results from to_dict() output (e.g. the JSON report)
+
+        Args:
+            data (dict): The results as plain dicts and lists
+
+        Returns:
+            CheckResults: The results
+        """
+        results = cls()
+        for name, value in data.items():
+            if name in cls.fields():
+                results.load_component(name, value)
+        return results
+
+    def load_component(self, name, data):
+        """
+        Replace one component with plain data from to_dict()
+
+        Args:
+            name (str): Component name (e.g. 'bedrock_models')
+            data: The component as plain dicts and lists (None for an unset optional component)
+        """
+        if name not in self.fields():
+            raise KeyError(name)
+        record_type = _COMPONENT_TYPES.get(name)
+        if data is None:
+            value = None
+        elif record_type is not None:
+            value = record_type.from_dict(data)
+        elif name == "model_details":
+            value = {model_id: ModelDetails.from_dict(details) for model_id, details in data.items()}
+        else:
+            value = _plain(data)
+        setattr(self, name, value)
+
+
+# Record type of each CheckResults component that is a single record
+_COMPONENT_TYPES = {
+    "aws_credentials": ComponentResult,
+    "bedrock_regions": AvailabilityResult,
+    "bedrock_runtime": AvailabilityResult,
+    "bedrock_models": ModelListingResult,
+    "key_models": KeyModelsResult,
+    "model_invocations": InvocationResults,
+    "cost_estimates": CostEstimates,
+}
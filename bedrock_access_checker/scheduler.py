@@ -0,0 +1,312 @@
+"""
+Dependency-aware check scheduler for the AWS Bedrock Access Checker
+
+Checks are modelled as nodes in a graph with explicit dependencies. Every
+node whose dependencies have finished runs concurrently with the others,
+subject to a process-wide concurrency budget.
+
+Each node has two parts:
+
+- func: the slow part (AWS calls), run in a worker thread. It must not touch
+  shared results; it returns whatever the next step needs.
+- apply: the bookkeeping part, run on the thread that called run(), one node
+  at a time. It receives func's return value, may update results and add
+  more nodes to the graph (rendering waits until the run is over). Returning False marks the node as failed,
+  which skips everything that depends on it. Any other return value is
+  kept as the node's result (func's return value if there is no apply).
+
+A graph can be given an on_done callback, called on the run() thread with
+each node that finishes, successfully or not (e.g. to checkpoint or stream
+it); node.state tells which. Each node also records when its func started
+and finished, so node.latency is the time its AWS calls took.
+
+Because only apply steps write results and they never overlap, check
+results need no locking.
+
+A run can be given a deadline. Nodes that have not finished by then are
+marked as timed out and the run returns without waiting for them.
+
+run_async() runs a graph from an event loop instead: funcs run in an
+executor, and so do apply steps, still one at a time, so bookkeeping that
+falls back to an AWS call (e.g. listing a catalog whose warm-up failed)
+never blocks the loop.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# Default number of nodes allowed to run at once across the whole process
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Node states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+TIMED_OUT = "timed_out"
+
+
+def warm(func, *args):
+    """
+    Call func to fill a shared cache ahead of the check that needs it
+    
+    Errors are ignored here; the check itself repeats the call and reports them.
+    """
+    try:
+        func(*args)
+    except Exception:
+        pass
+
+
+class ConcurrencyBudget:
+    """Process-wide limit on how many node functions run at the same time"""
+
+    def __init__(self, limit=DEFAULT_MAX_CONCURRENCY):
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+
+    def resize(self, limit):
+        """
+        Change the limit (only affects nodes started afterwards)
+
+        Args:
+            limit (int): Maximum number of node functions running at once
+        """
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+
+    def acquire(self):
+        """
+        Wait for a free slot
+
+        Returns:
+            threading.BoundedSemaphore: The semaphore to release when done (kept across resizes)
+        """
+        semaphore = self._semaphore
+        semaphore.acquire()
+        return semaphore
+
+
+# Budget shared by every graph in this process (e.g. parallel profiles)
+concurrency_budget = ConcurrencyBudget()
+
+
+class CheckNode:
+    """A single check in a CheckGraph"""
+
+    def __init__(self, name, func=None, deps=(), apply=None, component=None, region=None):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.apply = apply
+        self.component = component
+        self.region = region
+        self.state = PENDING
+        self.output = None
+        self.result = None
+        # perf_counter() values around func, once it has run
+        self.started = None
+        self.finished = None
+
+    @property
+    def latency(self):
+        """float: Seconds func took (None until the node finishes)"""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+class CheckGraph:
+    """Graph of checks executed in dependency order with maximum overlap"""
+
+    def __init__(self, budget=None, on_done=None):
+        """
+        Create an empty graph
+
+        Args:
+            budget (ConcurrencyBudget, optional): Concurrency budget (defaults to the process-wide one)
+            on_done (callable, optional): Called with each node that finishes (done or failed)
+        """
+        self.budget = budget or concurrency_budget
+        self.on_done = on_done
+        self._nodes = OrderedDict()
+
+    def add(self, name, func=None, deps=(), apply=None, component=None, region=None):
+        """
+        Add a node (also allowed from an apply step while the graph runs)
+
+        Args:
+            name (str): Unique node name
+            func (callable, optional): Slow part, called with no arguments in a worker thread
+            deps (iterable, optional): Names of nodes that must finish first
+            apply (callable, optional): Bookkeeping part, called with func's return value
+            component (str, optional): Results component the node reports on (e.g. 'bedrock_models')
+            region (str, optional): Region the node checks
+
+        Returns:
+            CheckNode: The new node
+        """
+        if name in self._nodes:
+            raise ValueError(f"Duplicate check node: {name}")
+        node = CheckNode(name, func, deps, apply, component, region)
+        self._nodes[name] = node
+        return node
+
+    def node(self, name):
+        """Get a node by name"""
+        return self._nodes[name]
+
+    def succeeded(self, name):
+        """Check whether a node ran and did not fail"""
+        return name in self._nodes and self._nodes[name].state == DONE
+
+    def timed_out(self):
+        """Get the nodes that did not finish before the deadline, in the order they were added"""
+        return [node for node in self._nodes.values() if node.state == TIMED_OUT]
+
+    def progress(self):
+        """
+        Count the nodes that have settled (finished, failed, skipped or timed out)
+
+        Returns:
+            tuple: (settled nodes, all nodes added so far)
+        """
+        settled = sum(1 for node in self._nodes.values() if node.state not in (PENDING, RUNNING))
+        return settled, len(self._nodes)
+
+    def _run_func(self, node):
+        """Run a node's func in a worker thread within the concurrency budget"""
+        semaphore = self.budget.acquire()
+        node.started = time.perf_counter()
+        try:
+            return node.func()
+        finally:
+            node.finished = time.perf_counter()
+            semaphore.release()
+
+    def _finish(self, node, output):
+        """Apply a finished node's output and record its final state"""
+        if node.started is None:
+            # Nodes without a func take no time
+            node.started = node.finished = time.perf_counter()
+        node.output = output
+        result = node.apply(output) if node.apply is not None else output
+        if result is False:
+            node.state = FAILED
+        else:
+            node.result = result
+            node.state = DONE
+        if self.on_done is not None:
+            self.on_done(node)
+
+    def _next_ready(self):
+        """Get pending nodes whose dependencies are done, skipping ones that can never run"""
+        ready = []
+        for node in list(self._nodes.values()):
+            if node.state != PENDING:
+                continue
+            dep_states = [self._nodes[dep].state if dep in self._nodes else PENDING for dep in node.deps]
+            if any(state in (FAILED, SKIPPED) for state in dep_states):
+                node.state = SKIPPED
+            elif all(state == DONE for state in dep_states):
+                ready.append(node)
+        return ready
+
+    def run(self, deadline=None):
+        """
+        Run every node, overlapping independent nodes
+
+        Exceptions raised by a node's func or apply are not expected (checks
+        report AWS errors in their results) and are re-raised here.
+
+        Args:
+            deadline (float, optional): time.monotonic() value at which unfinished nodes time out
+        """
+        executor = ThreadPoolExecutor(max_workers=self.budget.limit)
+        running = {}
+        try:
+            while True:
+                # Start everything that is ready; nodes without a func finish immediately
+                progressed = deadline is None or time.monotonic() < deadline
+                while progressed:
+                    progressed = False
+                    for node in self._next_ready():
+                        node.state = RUNNING
+                        if node.func is None:
+                            self._finish(node, None)
+                            progressed = True
+                        else:
+                            running[executor.submit(self._run_func, node)] = node
+
+                if not running and not self._next_ready():
+                    break
+
+                timeout = None if deadline is None else max(0, deadline - time.monotonic())
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    self._time_out(running)
+                    break
+
+                for future in done:
+                    node = running.pop(future)
+                    self._finish(node, future.result())
+        finally:
+            # Do not wait for timed out calls; they end on their own within the client timeouts
+            executor.shutdown(wait=not running)
+
+    async def run_async(self, deadline=None, executor=None):
+        """
+        Run every node from an event loop, like run() but without blocking the loop
+
+        Args:
+            deadline (float, optional): time.monotonic() value at which unfinished nodes time out
+            executor (concurrent.futures.Executor, optional): Executor for funcs and apply steps
+                (defaults to the event loop's default executor)
+
+        Raises:
+            asyncio.CancelledError: If the run is cancelled; calls already in progress end on their own
+        """
+        loop = asyncio.get_running_loop()
+        running = {}
+        try:
+            while True:
+                # Start everything that is ready; nodes without a func finish immediately
+                progressed = deadline is None or time.monotonic() < deadline
+                while progressed:
+                    progressed = False
+                    for node in self._next_ready():
+                        node.state = RUNNING
+                        if node.func is None:
+                            await loop.run_in_executor(executor, self._finish, node, None)
+                            progressed = True
+                        else:
+                            running[loop.run_in_executor(executor, self._run_func, node)] = node
+
+                if not running and not self._next_ready():
+                    break
+
+                timeout = None if deadline is None else max(0, deadline - time.monotonic())
+                done, _ = await asyncio.wait(list(running), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    self._time_out(running)
+                    break
+
+                for future in done:
+                    node = running.pop(future)
+                    await loop.run_in_executor(executor, self._finish, node, future.result())
+        finally:
+            # Calls that have not started yet are dropped (e.g. when the run is cancelled)
+            for future in running:
+                future.cancel()
+
+    def _time_out(self, running):
+        """Mark every unfinished node as timed out and cancel calls that have not started"""
+        for future in running:
+            future.cancel()
+        for node in self._nodes.values():
+            if node.state in (PENDING, RUNNING):
+                node.state = TIMED_OUT
@@ -0,0 +1,294 @@
+"""
+Sharded sweeps for the AWS Bedrock Access Checker
+
+A sweep plan is every (profile, region) unit of a run: the profiles (or
+accounts) in order, each with the regions to check. With --shard i/N, the
+plan is split round-robin into N shards and a run only checks the units of
+shard i, so N processes or CI runners can share one sweep without talking
+to each other. Every shard computes the same plan from the same arguments,
+so the split is deterministic.
+
+Each shard writes its results to a partial result file. The merge
+subcommand reads the partial files back and combines each profile's
+results from all shards into one, which is then reported as usual.
+
+Checks that cover a whole profile (credentials, SageMaker alternatives,
+cost estimates) run in every shard that has units of the profile; merging
+combines them, so for example a model missing in one shard's regions but
+available in another's ends up available.
+"""
+
+import json
+from collections import OrderedDict
+
+from bedrock_access_checker.checker import (
+    STATUS_SUCCESS,
+    STATUS_WARNING,
+    STATUS_ERROR,
+    STATUS_INFO,
+    STATUS_TIMEOUT
+)
+from bedrock_access_checker.results import (
+    AvailabilityResult,
+    CheckResults,
+    ComponentResult,
+    KeyModelsResult,
+    ModelListingResult
+)
+
+# Format version of partial result files
+PARTIAL_VERSION = 1
+
+# Statuses from most to least severe, for combining a component's statuses
+_SEVERITY = (STATUS_ERROR, STATUS_TIMEOUT, STATUS_WARNING, STATUS_INFO, STATUS_SUCCESS)
+
+
+def parse_shard(text):
+    """
+    Parse a shard specification
+
+    Args:
+        text (str): Shard as 'i/N', with i counted from 1
+
+    Returns:
+        tuple: (i, N)
+
+    Raises:
+        ValueError: If the specification is malformed or i is not between 1 and N
+    """
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"shard must look like i/N (e.g. 1/4), not '{text}'")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"shard {text}: i must be between 1 and N")
+    return index, count
+
+
+def shard_plan(profiles, regions, index, count):
+    """
+    Get one shard of a sweep plan
+
+    The plan's units are taken profile by profile, each with every region in
+    order, and dealt out round-robin, so shards get a near-equal number of
+    units and most profiles are spread over several shards.
+
+    Args:
+        profiles (list): Profile names or account labels, in run order
+        regions (list): Regions to check for every profile
+        index (int): Shard number, counted from 1
+        count (int): Number of shards
+
+    Returns:
+        OrderedDict: Regions to check for each profile that has units in the shard
+    """
+    plan = OrderedDict()
+    unit = 0
+    for profile_name in profiles:
+        for region in regions:
+            if unit % count == index - 1:
+                plan.setdefault(profile_name, []).append(region)
+            unit += 1
+    return plan
+
+
+def partial_filename(index, count):
+    """
+    Get the default partial result file name of a shard
+
+    Args:
+        index (int): Shard number, counted from 1
+        count (int): Number of shards
+
+    Returns:
+        str: File name
+    """
+    return f"bedrock_check_shard_{index}_of_{count}.json"
+
+
+def write_partial(filename, index, count, profile_order, regions, profile_results, plan):
+    """
+    Write a shard's results to a partial result file
+
+    Args:
+        filename (str): File to write
+        index (int): Shard number, counted from 1
+        count (int): Number of shards
+        profile_order (list): Every profile label of the whole sweep, in run order
+        regions (list): Every region of the whole sweep, in run order
+        profile_results (dict): This shard's CheckResults by profile label
+        plan (dict): Regions this shard checked, by profile label
+    """
+    partial = {
+        "version": PARTIAL_VERSION,
+        "shard": {"index": index, "count": count},
+        "profile_order": list(profile_order),
+        "regions": list(regions),
+        "plan": {label: list(regions) for label, regions in plan.items()},
+        "profiles": {label: results.to_dict() for label, results in profile_results.items()},
+    }
+    with open(filename, 'w') as f:
+        json.dump(partial, f, indent=2)
+
+
+def read_partials(filenames):
+    """
+    Read the partial result files of a sharded sweep
+
+    Args:
+        filenames (list): Partial result files
+
+    Returns:
+        tuple: (partials sorted by shard number, shard count, shard numbers missing from the files)
+
+    Raises:
+        ValueError: If a file is not a partial result file, the files disagree on the number
+            of shards, or a shard appears twice
+    """
+    partials = []
+    for filename in filenames:
+        with open(filename) as f:
+            partial = json.load(f)
+        if not isinstance(partial, dict) or partial.get("version") != PARTIAL_VERSION or "shard" not in partial:
+            raise ValueError(f"{filename} is not a partial result file of a sharded run")
+        partials.append(partial)
+
+    counts = {partial["shard"]["count"] for partial in partials}
+    if len(counts) != 1:
+        raise ValueError(f"The partial result files come from runs with different shard counts: {sorted(counts)}")
+    count = counts.pop()
+
+    partials.sort(key=lambda partial: partial["shard"]["index"])
+    indexes = [partial["shard"]["index"] for partial in partials]
+    duplicates = sorted({index for index in indexes if indexes.count(index) > 1})
+    if duplicates:
+        raise ValueError(f"Shard {duplicates[0]}/{count} appears in more than one partial result file")
+
+    missing = [index for index in range(1, count + 1) if index not in indexes]
+    return partials, count, missing
+
+
+def _union(lists):
+    """Items of several lists without duplicates, in first-seen order"""
+    seen = []
+    for items in lists:
+        for item in items:
+            if item not in seen:
+                seen.append(item)
+    return seen
+
+
+def _combined_status(statuses, available):
+    """Status of a component combined from several shards"""
+    statuses = [status for status in statuses if status]
+    if available and STATUS_SUCCESS in statuses:
+        return STATUS_SUCCESS
+    for status in _SEVERITY:
+        if status in statuses:
+            return status
+    return statuses[0] if statuses else None
+
+
+def _merge_component(entries):
+    """Combine the same component of several shards' results"""
+    merged = type(entries[0])()
+    merged.details = _union(entry.details for entry in entries)
+    merged.errors = _union(entry.errors for entry in entries)
+
+    if isinstance(merged, ModelListingResult):
+        for entry in entries:
+            for model_id, regions in entry.available.to_dict().items():
+                for region in regions:
+                    merged.available.add(region, [model_id])
+    elif isinstance(merged, AvailabilityResult):
+        merged.available = _union(entry.available for entry in entries)
+
+    if isinstance(merged, KeyModelsResult):
+        # A key model listed in any shard's regions is available
+        merged.missing = [model_id for model_id in _union(entry.missing for entry in entries)
+                          if model_id not in merged.available]
+        if merged.available:
+            merged.status = STATUS_WARNING if merged.missing else STATUS_SUCCESS
+        else:
+            merged.status = _combined_status([entry.status for entry in entries], False)
+    else:
+        available = getattr(merged, "available", None)
+        merged.status = _combined_status([entry.status for entry in entries], bool(available))
+    return merged
+
+
+def merge_results(parts, regions=None):
+    """
+    Combine one profile's results from several shards
+
+    Args:
+        parts (list): The profile's CheckResults from each shard, in shard order
+        regions (list, optional): The sweep's regions in run order, used to order
+            the combined region lists like an unsharded run would
+
+    Returns:
+        CheckResults: The combined results
+    """
+    if len(parts) == 1:
+        return parts[0]
+
+    merged = CheckResults()
+    for name in CheckResults.fields():
+        values = [getattr(part, name) for part in parts if getattr(part, name) is not None]
+        if not values:
+            continue
+
+        if isinstance(values[0], ComponentResult):
+            setattr(merged, name, _merge_component(values))
+        elif name == "timed_out":
+            merged.timed_out = _union(values)
+        elif name == "model_details":
+            merged.model_details = {}
+            for details in values:
+                merged.model_details.update(details)
+        elif name == "model_invocations":
+            invocations = type(values[0])()
+            for field in invocations.fields():
+                setattr(invocations, field, _union(getattr(value, field) for value in values))
+            merged.model_invocations = invocations
+        elif name == "cost_estimates":
+            merged.cost_estimates.details = _union(value.details for value in values)
+            for value in values:
+                merged.cost_estimates.models.update(value.models)
+        elif name == "sagemaker_alternatives":
+            # Only keep alternatives for models that no shard found in Bedrock
+            alternatives = {}
+            for value in values:
+                alternatives.update(value)
+            merged.sagemaker_alternatives = {
+                model_id: matches for model_id, matches in alternatives.items()
+                if model_id not in merged.key_models.available
+            }
+        # API call timings belong to each shard's own run and are not combined
+
+    if regions:
+        rank = {region: position for position, region in enumerate(regions)}
+        for component in (merged.bedrock_regions, merged.bedrock_runtime):
+            component.available.sort(key=lambda region: rank.get(region, len(rank)))
+    return merged
+
+
+def merge_partials(partials):
+    """
+    Combine the results of every profile in a sharded sweep
+
+    Args:
+        partials (list): Partial result file contents (see read_partials)
+
+    Returns:
+        OrderedDict: Combined CheckResults by profile label, in the sweep's run order
+    """
+    parts = OrderedDict()
+    for label in partials[0].get("profile_order", []):
+        parts[label] = []
+    for partial in partials:
+        for label, data in partial["profiles"].items():
+            parts.setdefault(label, []).append(CheckResults.from_dict(data))
+
+    regions = partials[0].get("regions")
+    return OrderedDict((label, merge_results(results, regions)) for label, results in parts.items() if results)
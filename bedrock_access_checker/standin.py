@@ -0,0 +1,571 @@
+"""
+Local stand-in for the AWS APIs used by the AWS Bedrock Access Checker
+
+The stand-in is a small HTTP server that answers the calls the checker
+makes (list_foundation_models, get_foundation_model, invoke_model,
+list_service_quotas and get_caller_identity) in the wire formats botocore
+expects, so a run can be benchmarked on a machine without network access:
+
+    check-bedrock-access standin --config standin.json --port 8765
+    AWS_ACCESS_KEY_ID=standin AWS_SECRET_ACCESS_KEY=standin \\
+        check-bedrock-access --all-regions --test-invoke --endpoint-url http://127.0.0.1:8765
+
+Every service is served from the one port. Requests are told apart by
+their path, X-Amz-Target header or Action parameter, and the region is
+read from the request signature's credential scope; signatures are not
+checked.
+
+Each region can be given its own behaviour in the config file: a latency
+distribution, an error rate, throttling quotas (token buckets per
+operation), an outage, whether Bedrock is offered at all, and which models
+it lists. Settings under "*" apply to every region. Random choices come
+from one seeded generator, so a run with the same config and seed sees the
+same errors and, up to thread scheduling, the same latencies:
+
+    {
+      "seed": 7,
+      "regions": {
+        "*": {"latency_ms": {"distribution": "lognormal", "median": 80, "sigma": 0.5}},
+        "us-east-1": {"throttle": {"invoke_model": {"rate": 2, "burst": 4}}},
+        "eu-west-1": {"error_rate": 0.1},
+        "ap-south-1": {"available": false},
+        "ap-northeast-1": {"outage": true}
+      }
+    }
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote
+
+from bedrock_access_checker.checker import needed_models
+from bedrock_access_checker.invocation import TokenBucket
+
+# Default address of the stand-in
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Account the stand-in's caller identity belongs to
+DEFAULT_ACCOUNT = "123456789012"
+
+# Quotas returned per list_service_quotas page
+DEFAULT_QUOTA_PAGE_SIZE = 100
+
+# Region used when a request's signature has none
+DEFAULT_REGION = "us-east-1"
+
+# Operations the stand-in answers
+OPERATIONS = ("list_foundation_models", "get_foundation_model", "invoke_model", "list_service_quotas",
+              "get_caller_identity")
+
+# Wire protocol of each operation ('rest-json', 'json' or 'query')
+PROTOCOLS = {
+    "list_foundation_models": "rest-json",
+    "get_foundation_model": "rest-json",
+    "invoke_model": "rest-json",
+    "list_service_quotas": "json",
+    "get_caller_identity": "query",
+}
+
+# Error codes per protocol for throttled, failed and unavailable calls
+_ERROR_CODES = {
+    "rest-json": {"throttled": "ThrottlingException", "error": "InternalServerException",
+                  "outage": "ServiceUnavailableException"},
+    "json": {"throttled": "TooManyRequestsException", "error": "ServiceException", "outage": "ServiceException"},
+    "query": {"throttled": "Throttling", "error": "InternalFailure", "outage": "ServiceUnavailable"},
+}
+
+_CREDENTIAL_SCOPE = re.compile(r"Credential=[^/]+/\d{8}/([a-z0-9-]+)/")
+
+
+class StandInError(Exception):
+    """An AWS-style error answered by the stand-in"""
+
+    def __init__(self, status, code, message):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def sample_latency(spec, rng):
+    """
+    Draw one response delay from a latency distribution
+
+    Args:
+        spec: Milliseconds as a number (fixed), or a dict with 'distribution' set to
+            'fixed' (value), 'uniform' (low, high), 'normal' (mean, stddev) or
+            'lognormal' (median, sigma), plus an optional 'max' cap
+        rng (random.Random): Random number generator
+
+    Returns:
+        float: Delay in seconds
+
+    Raises:
+        ValueError: If the distribution is unknown
+    """
+    if not spec:
+        return 0.0
+    if isinstance(spec, (int, float)):
+        return max(0.0, spec / 1000)
+
+    distribution = spec.get("distribution", "fixed")
+    if distribution == "fixed":
+        value = spec.get("value", 0)
+    elif distribution == "uniform":
+        value = rng.uniform(spec.get("low", 0), spec.get("high", 0))
+    elif distribution == "normal":
+        value = rng.gauss(spec.get("mean", 0), spec.get("stddev", 0))
+    elif distribution == "lognormal":
+        value = rng.lognormvariate(math.log(max(spec.get("median", 1), 1e-6)), spec.get("sigma", 0))
+    else:
+        raise ValueError(f"Unknown latency distribution: {distribution}")
+    if "max" in spec:
+        value = min(value, spec["max"])
+    return max(0.0, value / 1000)
+
+
+def _per_operation(setting, operation, default=None):
+    """A setting given for all operations, or per operation (with '*' as the fallback)"""
+    if isinstance(setting, dict):
+        return setting.get(operation, setting.get("*", default))
+    return default if setting is None else setting
+
+
+class RegionProfile:
+    """Simulated behaviour of one region"""
+
+    def __init__(self, name, settings):
+        """
+        Build a region from its config settings
+
+        Args:
+            name (str): AWS region
+            settings (dict): 'latency_ms', 'error_rate', 'throttle', 'outage',
+                'available', 'models' and 'denied_models' (all optional)
+        """
+        self.name = name
+        self.latency = settings.get("latency_ms")
+        self.error_rate = settings.get("error_rate", 0.0)
+        self.outage = settings.get("outage", False)
+        self.available = settings.get("available", True)
+        self.models = settings.get("models")
+        self.denied_models = set(settings.get("denied_models", ()))
+        self._buckets = {}
+        for operation in OPERATIONS:
+            quota = _per_operation(settings.get("throttle"), operation)
+            if quota is None:
+                continue
+            if isinstance(quota, (int, float)):
+                quota = {"rate": quota}
+            self._buckets[operation] = TokenBucket(quota["rate"], quota.get("burst", max(1, int(quota["rate"]))))
+
+    def admit(self, operation):
+        """
+        Take a token from an operation's throttling quota without waiting
+
+        Returns:
+            bool: False if the call is over the quota
+        """
+        bucket = self._buckets.get(operation)
+        return bucket is None or bucket.acquire(deadline=time.monotonic())
+
+
+class StandInService:
+    """
+    The stand-in's simulated AWS state and per-region behaviour
+
+    handle() answers one parsed request; the HTTP layer only translates
+    between the wire and handle(), so the simulation can also be used
+    without a server.
+    """
+
+    def __init__(self, config=None):
+        """
+        Create the service
+
+        Args:
+            config (dict, optional): Stand-in configuration (see the module docstring); also
+                'account', 'models' (default catalog) and 'quota_page_size'
+        """
+        config = config or {}
+        self.account = str(config.get("account", DEFAULT_ACCOUNT))
+        self.models = list(config.get("models") or [model["id"] for model in needed_models])
+        self.quota_page_size = config.get("quota_page_size", DEFAULT_QUOTA_PAGE_SIZE)
+        self._rng = random.Random(config.get("seed"))
+        self._rng_lock = threading.Lock()
+        self._region_settings = config.get("regions", {})
+        self._regions = {}
+        self._lock = threading.Lock()
+        # (calls, throttled, errors) by operation
+        self._stats = {}
+
+    def region(self, name):
+        """
+        Get a region's profile, built on first use
+
+        Args:
+            name (str): AWS region
+
+        Returns:
+            RegionProfile: The region's simulated behaviour
+        """
+        with self._lock:
+            profile = self._regions.get(name)
+            if profile is None:
+                settings = dict(self._region_settings.get("*", {}))
+                settings.update(self._region_settings.get(name, {}))
+                profile = RegionProfile(name, settings)
+                self._regions[name] = profile
+            return profile
+
+    def _random(self, func, *args):
+        with self._rng_lock:
+            return func(*args)
+
+    def _count(self, operation, outcome=None):
+        with self._lock:
+            calls, throttled, errors = self._stats.get(operation, (0, 0, 0))
+            self._stats[operation] = (calls + 1, throttled + (outcome == "throttled"), errors + (outcome == "error"))
+
+    def stats(self):
+        """
+        Count the calls answered so far
+
+        Returns:
+            dict: {'calls', 'throttled', 'errors'} by operation
+        """
+        with self._lock:
+            return {operation: {"calls": calls, "throttled": throttled, "errors": errors}
+                    for operation, (calls, throttled, errors) in self._stats.items()}
+
+    def delay(self, region):
+        """
+        Draw the response delay of a call in a region
+
+        Returns:
+            float: Seconds to wait before answering
+        """
+        profile = self.region(region)
+        return self._random(sample_latency, profile.latency, self._rng)
+
+    def handle(self, operation, region, params):
+        """
+        Answer one call
+
+        Args:
+            operation (str): Operation name (e.g. 'invoke_model')
+            region (str): AWS region of the call
+            params (dict): The call's parameters ('modelId', 'body', 'NextToken', ...)
+
+        Returns:
+            The response data for the operation
+
+        Raises:
+            StandInError: For simulated outages, throttling, injected errors and bad requests
+        """
+        codes = _ERROR_CODES[PROTOCOLS[operation]]
+        profile = self.region(region)
+
+        if profile.outage:
+            self._count(operation, "error")
+            raise StandInError(503, codes["outage"], f"Service unavailable in {region}")
+        if not profile.admit(operation):
+            self._count(operation, "throttled")
+            raise StandInError(429 if PROTOCOLS[operation] != "query" else 400, codes["throttled"],
+                               "Rate exceeded")
+        error_rate = _per_operation(profile.error_rate, operation, 0.0)
+        if error_rate and self._random(self._rng.random) < error_rate:
+            self._count(operation, "error")
+            raise StandInError(500, codes["error"], "Simulated internal error")
+        self._count(operation)
+
+        if operation == "get_caller_identity":
+            return {"Account": self.account, "Arn": f"arn:aws:iam::{self.account}:user/standin",
+                    "UserId": "AIDASTANDINEXAMPLE"}
+        if operation == "list_service_quotas":
+            return self._quotas(region, params)
+
+        # Bedrock operations
+        if not profile.available:
+            raise StandInError(404, "ResourceNotFoundException", f"Bedrock is not offered in {region}")
+        models = profile.models if profile.models is not None else self.models
+        if operation == "list_foundation_models":
+            return {"modelSummaries": [model_summary(model_id, region) for model_id in models]}
+
+        model_id = params.get("modelId")
+        if model_id not in models:
+            raise StandInError(404, "ResourceNotFoundException", f"Model {model_id} not found")
+        if operation == "get_foundation_model":
+            return {"modelDetails": model_summary(model_id, region)}
+        if model_id in profile.denied_models:
+            raise StandInError(403, "AccessDeniedException", "You don't have access to the model with the specified model ID.")
+        return invoke_response(model_id, params.get("body"))
+
+    def _quotas(self, region, params):
+        """One page of the region's Bedrock quotas"""
+        quotas = []
+        for model_id in self.models:
+            name = model_id.split('.')[-1]
+            for metric, value in (("requests", 100.0), ("tokens", 200000.0)):
+                quotas.append({
+                    "ServiceCode": "bedrock",
+                    "ServiceName": "Amazon Bedrock",
+                    "QuotaCode": f"L-{len(quotas):08X}",
+                    "QuotaName": f"On-demand InvokeModel {metric} per minute for {name}",
+                    "QuotaArn": f"arn:aws:servicequotas:{region}:{self.account}:bedrock/L-{len(quotas):08X}",
+                    "Value": value,
+                    "Unit": "None",
+                    "Adjustable": metric == "tokens",
+                    "GlobalQuota": False,
+                })
+        start = int(params.get("NextToken") or 0)
+        page = {"Quotas": quotas[start:start + self.quota_page_size]}
+        if start + self.quota_page_size < len(quotas):
+            page["NextToken"] = str(start + self.quota_page_size)
+        return page
+
+
+def model_summary(model_id, region):
+    """
+    Build a model's list_foundation_models / get_foundation_model entry
+
+    Args:
+        model_id (str): Model ID
+        region (str): AWS region
+
+    Returns:
+        dict: The model summary
+    """
+    provider = model_id.split('.')[0]
+    embedding = "embed" in model_id
+    return {
+        "modelArn": f"arn:aws:bedrock:{region}::foundation-model/{model_id}",
+        "modelId": model_id,
+        "modelName": model_id.split('.')[-1],
+        "providerName": provider.capitalize(),
+        "inputModalities": ["TEXT"],
+        "outputModalities": ["EMBEDDING"] if embedding else ["TEXT"],
+        "responseStreamingSupported": not embedding,
+        "customizationsSupported": [],
+        "inferenceTypesSupported": ["ON_DEMAND"],
+        "modelLifecycle": {"status": "ACTIVE"},
+    }
+
+
+def invoke_response(model_id, body):
+    """
+    Build an invoke_model response body in the format of the model's provider
+
+    Args:
+        model_id (str): Model ID
+        body (bytes): The request body
+
+    Returns:
+        dict: The response body
+    """
+    try:
+        request = json.loads(body or b"{}")
+    except ValueError:
+        raise StandInError(400, "ValidationException", "Malformed input request, please reformat your input and try again.")
+    if "embed" in model_id:
+        return {"embedding": [0.0] * 8, "inputTextTokenCount": len(str(request.get("inputText", "")).split())}
+    if "messages" in request:
+        return {"id": f"msg_{uuid.uuid4().hex[:12]}", "type": "message", "role": "assistant",
+                "content": [{"type": "text", "text": "Hello from the stand-in!"}], "stop_reason": "end_turn",
+                "usage": {"input_tokens": 12, "output_tokens": 5}}
+    if "inputText" in request:
+        return {"inputTextTokenCount": 8, "results": [{"tokenCount": 5, "outputText": "Hello from the stand-in!",
+                                                       "completionReason": "FINISH"}]}
+    return {"generation": "Hello from the stand-in!", "stop_reason": "stop"}
+
+
+def _query_xml(operation, data):
+    """Query protocol (STS) response document"""
+    fields = "".join(f"<{key}>{value}</{key}>" for key, value in data.items())
+    name = "".join(part.capitalize() for part in operation.split("_"))
+    return (f'<{name}Response xmlns="https://sts.amazonaws.com/doc/2011-06-15/">'
+            f"<{name}Result>{fields}</{name}Result>"
+            f"<ResponseMetadata><RequestId>{uuid.uuid4()}</RequestId></ResponseMetadata></{name}Response>")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Translates HTTP requests to StandInService.handle() calls and back"""
+
+    protocol_version = "HTTP/1.1"
+    # Set on the server's handler subclass
+    service = None
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def log_message(self, format, *args):
+        # Benchmarks want quiet servers; use stats() for counts
+        pass
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        region = self._region()
+
+        try:
+            operation, params = self._operation(body)
+        except StandInError as e:
+            self._error("rest-json", e)
+            return
+
+        # Latency is added to every answer, errors included
+        time.sleep(self.service.delay(region))
+        try:
+            data = self.service.handle(operation, region, params)
+        except StandInError as e:
+            self._error(PROTOCOLS[operation], e)
+            return
+
+        protocol = PROTOCOLS[operation]
+        if protocol == "query":
+            self._send(200, "text/xml", _query_xml(operation, data).encode())
+        elif protocol == "json":
+            self._send(200, "application/x-amz-json-1.1", json.dumps(data).encode())
+        else:
+            self._send(200, "application/json", json.dumps(data).encode())
+
+    def _region(self):
+        """Region from the signature's credential scope"""
+        match = _CREDENTIAL_SCOPE.search(self.headers.get("Authorization", ""))
+        return match.group(1) if match else DEFAULT_REGION
+
+    def _operation(self, body):
+        """Work out the operation and its parameters"""
+        path = self.path.split("?", 1)[0]
+        target = self.headers.get("X-Amz-Target", "")
+        if self.command == "GET" and path == "/foundation-models":
+            return "list_foundation_models", {}
+        if self.command == "GET" and path.startswith("/foundation-models/"):
+            return "get_foundation_model", {"modelId": unquote(path[len("/foundation-models/"):])}
+        if self.command == "POST" and path.startswith("/model/") and path.endswith("/invoke"):
+            return "invoke_model", {"modelId": unquote(path[len("/model/"):-len("/invoke")]), "body": body}
+        if target.endswith(".ListServiceQuotas"):
+            return "list_service_quotas", json.loads(body or b"{}")
+        if parse_qs(body.decode("utf-8", "replace")).get("Action") == ["GetCallerIdentity"]:
+            return "get_caller_identity", {}
+        raise StandInError(400, "UnknownOperationException", f"The stand-in does not implement {self.command} {path}")
+
+    def _error(self, protocol, error):
+        if protocol == "query":
+            body = (f"<ErrorResponse><Error><Type>Sender</Type><Code>{error.code}</Code>"
+                    f"<Message>{error.message}</Message></Error><RequestId>{uuid.uuid4()}</RequestId></ErrorResponse>")
+            self._send(error.status, "text/xml", body.encode())
+        elif protocol == "json":
+            self._send(error.status, "application/x-amz-json-1.1",
+                       json.dumps({"__type": error.code, "message": error.message}).encode())
+        else:
+            self._send(error.status, "application/json", json.dumps({"message": error.message}).encode(),
+                       {"x-amzn-ErrorType": error.code})
+
+    def _send(self, status, content_type, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("x-amzn-RequestId", str(uuid.uuid4()))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_standin(config=None, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    Start the stand-in in a background thread
+
+    Args:
+        config (dict, optional): Stand-in configuration
+        host (str, optional): Address to listen on
+        port (int, optional): Port to listen on (0 for any free port)
+
+    Returns:
+        ThreadingHTTPServer: The running server; its 'service' attribute is the
+            StandInService, and shutdown() stops it
+    """
+    service = StandInService(config)
+    handler = type("StandInRequestHandler", (StandInHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.service = service
+    threading.Thread(target=server.serve_forever, name="standin", daemon=True).start()
+    return server
+
+
+def standin_url(server):
+    """
+    Get the endpoint URL of a running stand-in
+
+    Args:
+        server (ThreadingHTTPServer): Server from start_standin()
+
+    Returns:
+        str: URL to pass to --endpoint-url
+    """
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def load_config(filename):
+    """
+    Read a stand-in configuration file
+
+    Args:
+        filename (str): JSON file
+
+    Returns:
+        dict: The configuration
+    """
+    with open(filename) as f:
+        return json.load(f)
+
+
+def standin_main(argv):
+    """
+    Run the stand-in until interrupted (the standin subcommand)
+
+    Args:
+        argv (list): Command line arguments after 'standin'
+    """
+    parser = argparse.ArgumentParser(prog='check-bedrock-access.py standin',
+                                     description='Serve a local stand-in for the Bedrock, Service Quotas and STS APIs')
+    parser.add_argument('--config', metavar='FILE', help='JSON file with per-region latency, error, throttling and outage settings')
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Address to listen on (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('--seed', type=int, help='Seed for the simulated latencies and errors (overrides the config file)')
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config) if args.config else {}
+    if args.seed is not None:
+        config["seed"] = args.seed
+    server = start_standin(config, args.host, args.port)
+    url = standin_url(server)
+    print(f"Stand-in listening on {url}; run the checker with --endpoint-url {url} (any credentials will do)",
+          file=sys.stderr)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.service.stats(), indent=2, sort_keys=True), file=sys.stderr)
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    standin_main(sys.argv[1:])
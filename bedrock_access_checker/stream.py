@@ -0,0 +1,191 @@
+"""
+Streaming NDJSON output for the AWS Bedrock Access Checker
+
+The json, csv and html outputs are written once every check has finished.
+With --output ndjson (or --stream), one JSON record per check unit is
+written as soon as the unit finishes instead, one record per line, so log
+pipelines can start ingesting while a long sweep is still running.
+
+A unit is one node of a profile's check graph (e.g. 'models:us-east-1').
+Its record holds the profile, region, check, results component, the
+component's status, the details and errors the unit added, and how long
+the unit's AWS calls took. Records are written from the graph's on_done
+callback and flushed one by one; nothing is kept after a record is
+written.
+"""
+
+import datetime
+import json
+import sys
+import threading
+import time
+
+# Stream target that means standard output
+STDOUT = "-"
+
+
+def stream_filename():
+    """
+    Get the default file name for --output ndjson
+
+    Returns:
+        str: File name
+    """
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"bedrock_check_{timestamp}.ndjson"
+
+
+def _lines(component):
+    """Details and errors of a results component (empty lists if it has none)"""
+    return list(getattr(component, "details", None) or []), list(getattr(component, "errors", None) or [])
+
+
+class ResultStream:
+    """Thread-safe writer of NDJSON unit records"""
+
+    def __init__(self, path):
+        """
+        Open a stream
+
+        Args:
+            path (str): File to write the records to ('-' for standard output)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = sys.stdout if path == STDOUT else open(path, 'w')
+        # Number of records written so far
+        self.count = 0
+
+    def write(self, record):
+        """
+        Write one record
+
+        Args:
+            record (dict): JSON-serializable record
+        """
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            # Flushed per record, so readers see every unit as soon as it finishes
+            self._file.flush()
+            self.count += 1
+
+    def recorder(self, profile_name, results):
+        """
+        Get a callback that streams a profile's finished units
+
+        Must be called after anything restored into results (e.g. from a
+        checkpoint journal), so each record only holds what its unit added.
+
+        Args:
+            profile_name (str): AWS profile name or account label (None for default credentials)
+            results (CheckResults): The profile's results
+
+        Returns:
+            UnitRecorder: Callable taking a finished CheckNode
+        """
+        return UnitRecorder(self, profile_name, results)
+
+    def close(self):
+        """Close the stream (standard output is left open)"""
+        with self._lock:
+            if self._file is not sys.stdout:
+                self._file.close()
+
+
+class UnitRecorder:
+    """
+    Streams the finished units of one profile's check graph
+
+    Units of the same profile finish one at a time on the graph's apply
+    thread, so the details and errors a unit added are the ones its
+    component gained since the component's previous unit.
+    """
+
+    def __init__(self, stream, profile_name, results):
+        self.stream = stream
+        self.profile_name = profile_name
+        self.results = results
+        # (details, errors) already streamed, by component
+        self._streamed = {}
+        for name in results.fields():
+            details, errors = _lines(getattr(results, name))
+            self._streamed[name] = (len(details), len(errors))
+
+    def __call__(self, node):
+        """
+        Stream a unit that finished, failed or timed out
+
+        Args:
+            node (CheckNode): The unit's node
+        """
+        self.stream.write(self.record(node))
+
+    def record(self, node):
+        """
+        Build a unit's record
+
+        Args:
+            node (CheckNode): The unit's node
+
+        Returns:
+            dict: The record
+        """
+        status, details, errors = None, [], []
+        if node.component:
+            component = getattr(self.results, node.component)
+            status = getattr(component, "status", None)
+            details, errors = _lines(component)
+            seen_details, seen_errors = self._streamed.get(node.component, (0, 0))
+            self._streamed[node.component] = (len(details), len(errors))
+            details, errors = details[seen_details:], errors[seen_errors:]
+        if status is None:
+            # Components without a status of their own (e.g. model details) report the unit's outcome
+            status = node.state
+
+        latency = node.latency
+        return {
+            "time": time.time(),
+            "profile": self.profile_name or "default",
+            "region": node.region,
+            "check": node.name,
+            "component": node.component,
+            "state": node.state,
+            "status": status,
+            "details": details,
+            "errors": errors,
+            "latency_ms": round(latency * 1000, 1) if latency is not None else None,
+        }
+
+
+# Stream of this run (None when streaming is off)
+_stream = None
+
+
+def open_stream(path):
+    """
+    Turn on NDJSON streaming for this run
+
+    Args:
+        path (str): File to write the records to ('-' for standard output)
+
+    Returns:
+        ResultStream: The active stream
+    """
+    global _stream
+    close_stream()
+    _stream = ResultStream(path)
+    return _stream
+
+
+def close_stream():
+    """Turn off streaming, closing the stream's file"""
+    global _stream
+    if _stream is not None:
+        _stream.close()
+    _stream = None
+
+
+def active_stream():
+    """Get the stream of this run (None when streaming is off)"""
+    return _stream
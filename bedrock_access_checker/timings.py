@@ -0,0 +1,198 @@
+"""
+AWS API call timings for the AWS Bedrock Access Checker
+
+When enabled, every client created by the client pool is instrumented with
+botocore's before-call/after-call events, and each API call is recorded with
+its service, operation, region, profile, latency, retry count and HTTP
+status. Summaries per profile feed the dashboard's timing breakdown and the
+"timings" key of the JSON output.
+
+Instrumentation is opt-in: nothing is recorded until enable_timings() is
+called (the CLI does this for --timings).
+"""
+
+import threading
+import time
+
+# Key under which the call's start time and operation are kept in botocore's request context
+_CONTEXT_START = "bedrock_access_checker_start"
+
+
+class CallRecorder:
+    """Thread-safe log of AWS API calls"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = []
+        # perf_counter() value that call start times are relative to
+        self.origin = time.perf_counter()
+
+    def instrument(self, client, profile_name=None):
+        """
+        Record every API call made through a client
+
+        Args:
+            client (botocore.client.BaseClient): Client to instrument
+            profile_name (str, optional): AWS profile the client belongs to
+        """
+        service = client.meta.service_model.service_name
+        region = client.meta.region_name
+
+        def before_call(model=None, context=None, **kwargs):
+            if context is not None:
+                context[_CONTEXT_START] = (time.perf_counter(), model.name if model is not None else None)
+
+        def after_call(context=None, parsed=None, http_response=None, exception=None, **kwargs):
+            if context is None or _CONTEXT_START not in context:
+                return
+            end = time.perf_counter()
+            start, operation = context.pop(_CONTEXT_START)
+
+            metadata = (parsed or {}).get('ResponseMetadata', {})
+            http_status = metadata.get('HTTPStatusCode')
+            if http_status is None and http_response is not None:
+                http_status = getattr(http_response, 'status_code', None)
+
+            error = None
+            if exception is not None:
+                error = type(exception).__name__
+            elif parsed and 'Error' in parsed:
+                error = parsed['Error'].get('Code')
+
+            self.record({
+                "service": service,
+                "operation": operation,
+                "region": region,
+                "profile": profile_name,
+                "start_ms": round((start - self.origin) * 1000, 3),
+                "latency_ms": round((end - start) * 1000, 3),
+                "retries": metadata.get('RetryAttempts', 0),
+                "http_status": http_status,
+                "error": error,
+                "thread": threading.get_ident(),
+            })
+
+        client.meta.events.register('before-call', before_call)
+        client.meta.events.register('after-call', after_call)
+        # Calls that fail without a response (timeouts, connection errors)
+        client.meta.events.register('after-call-error', after_call)
+
+    def record(self, call):
+        """Add a call record"""
+        with self._lock:
+            self._calls.append(call)
+
+    def calls(self, profile_name=None, all_profiles=False):
+        """
+        Get the recorded calls
+
+        Args:
+            profile_name (str, optional): Only calls made with this profile
+            all_profiles (bool, optional): Ignore profile_name and return every call
+
+        Returns:
+            list: Call records in the order they finished
+        """
+        with self._lock:
+            calls = list(self._calls)
+        if all_profiles:
+            return calls
+        return [call for call in calls if call["profile"] == profile_name]
+
+    def clear(self):
+        """Forget all recorded calls"""
+        with self._lock:
+            self._calls = []
+            self.origin = time.perf_counter()
+
+
+def summarize_calls(calls):
+    """
+    Aggregate call records into a timing breakdown
+
+    Args:
+        calls (list): Call records from CallRecorder.calls()
+
+    Returns:
+        dict: Totals, per-operation and per-region breakdowns (slowest first), and the raw calls
+    """
+    by_operation = {}
+    by_region = {}
+    for call in calls:
+        key = (call["service"], call["operation"])
+        entry = by_operation.setdefault(key, {
+            "service": call["service"], "operation": call["operation"],
+            "calls": 0, "total_ms": 0.0, "max_ms": 0.0, "retries": 0, "errors": 0,
+        })
+        entry["calls"] += 1
+        entry["total_ms"] += call["latency_ms"]
+        entry["max_ms"] = max(entry["max_ms"], call["latency_ms"])
+        entry["retries"] += call["retries"] or 0
+        entry["errors"] += 1 if call["error"] else 0
+
+        region = by_region.setdefault(call["region"] or "global", {"calls": 0, "total_ms": 0.0})
+        region["calls"] += 1
+        region["total_ms"] += call["latency_ms"]
+
+    operations = sorted(by_operation.values(), key=lambda entry: entry["total_ms"], reverse=True)
+    for entry in operations:
+        entry["avg_ms"] = round(entry["total_ms"] / entry["calls"], 3)
+        entry["total_ms"] = round(entry["total_ms"], 3)
+
+    regions = {
+        region: {"calls": entry["calls"], "total_ms": round(entry["total_ms"], 3)}
+        for region, entry in sorted(by_region.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+    }
+
+    return {
+        "total_calls": len(calls),
+        "total_ms": round(sum(call["latency_ms"] for call in calls), 3),
+        "total_retries": sum(call["retries"] or 0 for call in calls),
+        "by_operation": operations,
+        "by_region": regions,
+        "calls": calls,
+    }
+
+
+# Recorder used by this run (None when instrumentation is disabled)
+_recorder = None
+
+
+def enable_timings():
+    """
+    Turn on API call instrumentation for clients created from now on
+
+    Returns:
+        CallRecorder: The active recorder
+    """
+    global _recorder
+    if _recorder is None:
+        _recorder = CallRecorder()
+    return _recorder
+
+
+def disable_timings():
+    """Turn off API call instrumentation"""
+    global _recorder
+    _recorder = None
+
+
+def active_recorder():
+    """Get the active recorder, or None when instrumentation is disabled"""
+    return _recorder
+
+
+def timing_summary(profile_name=None):
+    """
+    Get the timing breakdown of one profile's API calls
+
+    Args:
+        profile_name (str, optional): AWS profile name
+
+    Returns:
+        dict: Summary from summarize_calls(), or None when instrumentation is disabled
+    """
+    recorder = _recorder
+    if recorder is None:
+        return None
+    return summarize_calls(recorder.calls(profile_name))
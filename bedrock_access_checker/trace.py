@@ -0,0 +1,178 @@
+"""
+Chrome trace export for the AWS Bedrock Access Checker
+
+With --trace-file, every traced check function and every AWS API call is
+written as a span in Chrome Trace Event Format, which chrome://tracing and
+Perfetto (ui.perfetto.dev) can open. Each profile is shown as its own
+process and each thread as a track, so API calls appear nested under the
+check that made them and missing concurrency shows up as gaps.
+
+API call spans come from the timings recorder (see timings.py), which is
+switched on together with tracing.
+"""
+
+import functools
+import inspect
+import json
+import threading
+import time
+
+from bedrock_access_checker.timings import enable_timings, active_recorder
+
+# Function arguments copied into span args
+SPAN_ARGUMENTS = ("profile_name", "region", "model_id")
+
+
+class Tracer:
+    """Thread-safe collector of completed spans"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans = []
+        self._thread_names = {}
+        # perf_counter() value that span timestamps are relative to
+        self.origin = time.perf_counter()
+
+    def add_span(self, name, category, start, end, args):
+        """
+        Add a completed span
+
+        Args:
+            name (str): Span name (e.g. the function name)
+            category (str): Span category ('check' or 'aws')
+            start (float): perf_counter() value at the start
+            end (float): perf_counter() value at the end
+            args (dict): Tags shown with the span (profile, region, ...)
+        """
+        thread = threading.current_thread()
+        with self._lock:
+            self._thread_names[thread.ident] = thread.name
+            self._spans.append((name, category, start, end, thread.ident, args))
+
+    def events(self, api_calls=()):
+        """
+        Build the trace events
+
+        Args:
+            api_calls (iterable, optional): Call records from the timings recorder
+
+        Returns:
+            list: Chrome trace events (complete "X" events plus process/thread name metadata)
+        """
+        with self._lock:
+            spans = list(self._spans)
+            thread_names = dict(self._thread_names)
+
+        # Turn API calls into spans on the same clock
+        recorder = active_recorder()
+        for call in api_calls:
+            start = recorder.origin + call["start_ms"] / 1000
+            end = start + call["latency_ms"] / 1000
+            args = {
+                "profile_name": call["profile"],
+                "region": call["region"],
+                "http_status": call["http_status"],
+                "retries": call["retries"],
+                "error": call["error"],
+            }
+            spans.append((f"{call['service']}.{call['operation']}", "aws", start, end, call["thread"], args))
+
+        # One trace process per profile
+        pids = {}
+        events = []
+        for name, category, start, end, thread, args in sorted(spans, key=lambda span: span[2]):
+            profile = args.get("profile_name") or "default"
+            pid = pids.setdefault(profile, len(pids) + 1)
+            events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((start - self.origin) * 1e6, 1),
+                "dur": round((end - start) * 1e6, 1),
+                "pid": pid,
+                "tid": thread,
+                "args": args,
+            })
+
+        for profile, pid in pids.items():
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": f"profile: {profile}"}})
+            for thread in {event["tid"] for event in events if event.get("pid") == pid and event["ph"] == "X"}:
+                events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread,
+                               "args": {"name": thread_names.get(thread, f"thread {thread}")}})
+        return events
+
+
+# Tracer used by this run (None when tracing is disabled)
+_tracer = None
+
+
+def enable_tracing():
+    """
+    Turn on tracing (and the API call recorder it takes AWS spans from)
+
+    Returns:
+        Tracer: The active tracer
+    """
+    global _tracer
+    enable_timings()
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def disable_tracing():
+    """Turn off tracing"""
+    global _tracer
+    _tracer = None
+
+
+def traced(func):
+    """
+    Record a span for every call of a function while tracing is enabled
+
+    The function's profile_name, region and model_id arguments (when it has
+    them) are attached to the span. When tracing is off the function is
+    called directly.
+    """
+    signature = inspect.signature(func)
+    tagged = [name for name in SPAN_ARGUMENTS if name in signature.parameters]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tracer = _tracer
+        if tracer is None:
+            return func(*args, **kwargs)
+
+        bound = signature.bind_partial(*args, **kwargs)
+        span_args = {name: bound.arguments.get(name) for name in tagged}
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            tracer.add_span(func.__name__, "check", start, time.perf_counter(), span_args)
+
+    return wrapper
+
+
+def write_trace(filename):
+    """
+    Write the trace collected so far
+
+    Args:
+        filename (str): Path of the JSON trace file
+
+    Returns:
+        int: Number of spans written (0 if tracing is disabled)
+    """
+    tracer = _tracer
+    if tracer is None:
+        return 0
+
+    recorder = active_recorder()
+    api_calls = recorder.calls(all_profiles=True) if recorder is not None else []
+    events = tracer.events(api_calls)
+
+    with open(filename, 'w') as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return sum(1 for event in events if event["ph"] == "X")
@@ -11,6 +11,57 @@ import boto3
 import pytest
 from moto import mock_sts, mock_bedrock, mock_sagemaker, mock_servicequotas
 
+from bedrock_access_checker.cache import disable_disk_cache
+from bedrock_access_checker.catalog import model_catalog
+from bedrock_access_checker.checker import console
+from bedrock_access_checker.clients import client_pool
+from bedrock_access_checker.credentials import credential_cache
+from bedrock_access_checker.quotas import quota_indexes
+from bedrock_access_checker.invocation import invocation_prober
+from bedrock_access_checker.journal import close_journal
+from bedrock_access_checker.org import assumed_role_sessions
+from bedrock_access_checker.stream import close_stream
+from bedrock_access_checker.timings import disable_timings
+from bedrock_access_checker.trace import disable_tracing
+
+
+@pytest.fixture(autouse=True)
+def reset_run_caches():
+    """Start every test with empty per-run caches and client pool."""
+    disable_disk_cache()
+    disable_timings()
+    disable_tracing()
+    close_journal()
+    close_stream()
+    console.quiet = False
+    model_catalog.set_ttl(None)
+    model_catalog.clear()
+    quota_indexes.set_ttl(None)
+    quota_indexes.clear()
+    invocation_prober.clear()
+    assumed_role_sessions.clear()
+    client_pool.set_ttl(None)
+    client_pool.clear()
+    credential_cache.configure(None)
+    credential_cache.clear()
+    yield
+    disable_disk_cache()
+    disable_timings()
+    disable_tracing()
+    close_journal()
+    close_stream()
+    console.quiet = False
+    model_catalog.set_ttl(None)
+    model_catalog.clear()
+    quota_indexes.set_ttl(None)
+    quota_indexes.clear()
+    invocation_prober.clear()
+    assumed_role_sessions.clear()
+    client_pool.set_ttl(None)
+    client_pool.clear()
+    credential_cache.configure(None)
+    credential_cache.clear()
+
 
 @pytest.fixture
 def aws_credentials():
@@ -0,0 +1,175 @@
+"""
+Unit tests for the bedrock_access_checker.aio module.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from bedrock_access_checker.aio import check_access, CheckOptions
+from bedrock_access_checker.catalog import model_catalog
+from bedrock_access_checker.checker import console, STATUS_SUCCESS
+
+
+def fake_credentials(profile_name, results):
+    console.print("Checking AWS credentials...")
+    results["aws_credentials"]["status"] = STATUS_SUCCESS
+    return True
+
+
+def fake_regions(profile_name, regions_to_check, max_workers=None, results=None, deadline=None):
+    console.print("Checking regions...")
+    results["bedrock_regions"]["available"] = list(regions_to_check)
+    results["bedrock_regions"]["status"] = STATUS_SUCCESS
+    return list(regions_to_check)
+
+
+def fake_key_models(region, profile_name=None, results=None):
+    console.print(f"Key models in {region}")
+    if 'anthropic.claude-v2' not in results["key_models"]["available"]:
+        results["key_models"]["available"].append('anthropic.claude-v2')
+    return ['anthropic.claude-v2']
+
+
+@contextmanager
+def fake_checks(**overrides):
+    """Patch the checks check_access() runs with fast fakes that print."""
+    checks = {
+        "check_aws_credentials": MagicMock(side_effect=fake_credentials),
+        "check_bedrock_regions": MagicMock(side_effect=fake_regions),
+        "check_bedrock_runtime_access": MagicMock(side_effect=lambda *args, **kwargs: console.print("runtime")),
+        "check_bedrock_models": MagicMock(side_effect=lambda *args, **kwargs: console.print("models")),
+        "check_key_models": MagicMock(side_effect=fake_key_models),
+    }
+    checks.update(overrides)
+    # Credentials and regions run in aio itself; the region checks come from the shared pipeline
+    own = {name: checks.pop(name) for name in ("check_aws_credentials", "check_bedrock_regions")}
+    with patch.multiple('bedrock_access_checker.aio', **own), patch.multiple('bedrock_access_checker.pipeline', **checks):
+        yield
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+def test_check_access_returns_results_without_printing(aws_credentials, capsys):
+    """Test that check_access runs every region's checks and returns the results silently."""
+    with fake_checks(), patch.object(model_catalog, 'get_models', return_value=[]):
+        result = asyncio.run(check_access('dev', ['us-east-1', 'us-west-2']))
+
+    assert capsys.readouterr().out == ""
+    assert result.profile_name == 'dev'
+    assert result.has_access
+    assert result.available_regions == ['us-east-1', 'us-west-2']
+    assert result.available_models == ['anthropic.claude-v2']
+    assert result.timed_out == []
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+def test_check_access_timeout_marks_unfinished_checks(aws_credentials):
+    """Test that checks still running at the timeout are recorded as timed out."""
+    def slow_invocations(model_ids, region, profile_name=None, deadline=None):
+        time.sleep(1)
+        return []
+
+    record_invocations = MagicMock()
+    with fake_checks(run_model_invocations=MagicMock(side_effect=slow_invocations),
+                     record_model_invocations=record_invocations), \
+            patch.object(model_catalog, 'get_models', return_value=[]):
+        async def run():
+            start = time.monotonic()
+            result = await check_access(None, ['us-east-1'], CheckOptions(test_invoke=True, timeout=0.2))
+            return result, time.monotonic() - start
+
+        result, elapsed = asyncio.run(run())
+
+    assert elapsed < 0.9
+    assert result.timed_out == ["model_invocations (us-east-1)"]
+    record_invocations.assert_not_called()
+    # Checks that finished in time are still reported
+    assert result.available_models == ['anthropic.claude-v2']
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+def test_check_access_can_be_cancelled(aws_credentials):
+    """Test that cancelling check_access stops it instead of waiting for its checks."""
+    def slow_regions(profile_name, regions_to_check, max_workers=None, results=None, deadline=None):
+        time.sleep(0.5)
+        return fake_regions(profile_name, regions_to_check, results=results)
+
+    runtime = MagicMock()
+    with fake_checks(check_bedrock_regions=MagicMock(side_effect=slow_regions), check_bedrock_runtime_access=runtime):
+        async def run():
+            task = asyncio.ensure_future(check_access(None, ['us-east-1']))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+    runtime.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+def test_check_access_keeps_catalog_retries_off_the_event_loop(aws_credentials):
+    """Test that a check repeating a failed catalog download never makes the call on the event loop thread."""
+    import threading
+    from bedrock_access_checker.checker import check_bedrock_models, check_key_models
+
+    callers = []
+
+    def failing_catalog(region, profile_name=None):
+        callers.append(threading.current_thread())
+        raise RuntimeError("Could not connect to the endpoint URL")
+
+    with fake_checks(check_bedrock_models=MagicMock(side_effect=check_bedrock_models),
+                     check_key_models=MagicMock(side_effect=check_key_models)), \
+            patch.object(model_catalog, 'get_models', side_effect=failing_catalog):
+        async def run():
+            return threading.current_thread(), await check_access(None, ['us-east-1'])
+
+        loop_thread, result = asyncio.run(run())
+
+    # Warm-ups plus the two checks' own attempts, none of them on the loop
+    assert len(callers) == 4
+    assert loop_thread not in callers
+    assert any("Could not connect" in error for error in result.results.bedrock_models.errors)
+
+
+@pytest.mark.unit
+def test_check_access_sees_backend_changes_after_the_cache_ttl(aws_credentials):
+    """Test that with a cache TTL, or after clear_caches(), a later call reports what the backend says now."""
+    from bedrock_access_checker.aio import clear_caches, set_cache_ttl
+    from bedrock_access_checker.clients import client_pool
+    from bedrock_access_checker.standin import start_standin, standin_url
+
+    claude, titan = 'anthropic.claude-3-sonnet-20240229-v1:0', 'amazon.titan-embed-text-v1'
+    server = start_standin({"models": [claude, titan]}, port=0)
+    client_pool.configure(endpoint_urls={'*': standin_url(server)}, max_attempts=1)
+    try:
+        set_cache_ttl(0.2)
+        first = asyncio.run(check_access(None, ['us-east-1']))
+        assert claude in first.available_models
+
+        # Access to the model is removed on the AWS side
+        server.service.models = [titan]
+        time.sleep(0.3)
+        second = asyncio.run(check_access(None, ['us-east-1']))
+        assert claude not in second.available_models
+        assert claude in second.missing_models
+
+        # ...and granted again; clearing the caches picks it up without waiting for the TTL
+        set_cache_ttl(None)
+        server.service.models = [claude, titan]
+        clear_caches()
+        third = asyncio.run(check_access(None, ['us-east-1']))
+        assert claude in third.available_models
+    finally:
+        client_pool.configure(endpoint_urls={}, max_attempts=3)
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the bedrock_access_checker.cache module.
+"""
+
+import os
+import stat
+import time
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from bedrock_access_checker.cache import DiskCache, enable_disk_cache
+from bedrock_access_checker.catalog import ModelCatalog
+
+
+@pytest.mark.unit
+def test_disk_cache_roundtrip_and_permissions(tmp_path):
+    """Test that entries round-trip and the directory is private."""
+    cache = DiskCache(str(tmp_path / "cache"))
+    cache.set({"models": ["a", "b"]}, "123456789012", "us-east-1", "list_foundation_models")
+
+    assert cache.get("123456789012", "us-east-1", "list_foundation_models") == {"models": ["a", "b"]}
+    assert cache.get("123456789012", "us-west-2", "list_foundation_models") is None
+    assert stat.S_IMODE(os.stat(cache.directory).st_mode) == 0o700
+
+    # Atomic writes leave no temporary files behind
+    assert all(name.endswith(".json") for name in os.listdir(cache.directory))
+
+
+@pytest.mark.unit
+def test_disk_cache_ttl_and_refresh(tmp_path):
+    """Test that expired entries are ignored and refresh skips reads."""
+    cache = DiskCache(str(tmp_path), ttl=60)
+    cache.set([1, 2, 3], "acct", "us-east-1", "api")
+
+    with patch('bedrock_access_checker.cache.time.time', return_value=time.time() + 61):
+        assert cache.get("acct", "us-east-1", "api") is None
+
+    refreshing = DiskCache(str(tmp_path), ttl=60, refresh=True)
+    assert refreshing.get("acct", "us-east-1", "api") is None
+
+
+@pytest.mark.unit
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    """Test that the oldest unused entries are evicted over the entry limit."""
+    cache = DiskCache(str(tmp_path), max_entries=2)
+    cache.set("a", "key-a")
+    cache.set("b", "key-b")
+
+    # Make key-a the most recently used entry
+    past = time.time() - 10
+    os.utime(cache._path(("key-a",)), (past, past))
+    os.utime(cache._path(("key-b",)), (past - 5, past - 5))
+    assert cache.get("key-a") == "a"
+
+    cache.set("c", "key-c")
+    assert cache.get("key-b") is None
+    assert cache.get("key-a") == "a"
+    assert cache.get("key-c") == "c"
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.cache.client_pool')
+@patch('bedrock_access_checker.catalog.client_pool')
+def test_catalog_reads_through_disk_cache(mock_catalog_pool, mock_cache_pool, tmp_path,
+                                          mock_foundation_models_response):
+    """Test that a later run within the TTL reuses the cached catalog."""
+    mock_cache_pool.caller_identity.return_value = {"Account": "123456789012"}
+    mock_client = MagicMock()
+    mock_client.list_foundation_models.return_value = mock_foundation_models_response
+    mock_catalog_pool.client.return_value = mock_client
+
+    enable_disk_cache(str(tmp_path))
+    first_run = ModelCatalog().get_models('us-east-1')
+    second_run = ModelCatalog().get_models('us-east-1')
+
+    mock_client.list_foundation_models.assert_called_once()
+    assert second_run == first_run
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.cache.client_pool')
+@patch('bedrock_access_checker.catalog.client_pool')
+def test_disk_cache_is_per_principal(mock_catalog_pool, mock_cache_pool, tmp_path, mock_foundation_models_response):
+    """Test that principals in one account keep separate entries, while sessions of one role share them."""
+    mock_client = MagicMock()
+    mock_client.list_foundation_models.return_value = mock_foundation_models_response
+    mock_catalog_pool.client.return_value = mock_client
+    enable_disk_cache(str(tmp_path))
+
+    for arn in ("arn:aws:sts::123456789012:assumed-role/BedrockAdmin/alice",
+                "arn:aws:sts::123456789012:assumed-role/BedrockAdmin/bob",
+                "arn:aws:iam::123456789012:user/readonly"):
+        mock_cache_pool.caller_identity.return_value = {"Account": "123456789012", "Arn": arn}
+        ModelCatalog().get_models('us-east-1')
+
+    # One fetch for the role (both sessions) and one for the user
+    assert mock_client.list_foundation_models.call_count == 2
@@ -0,0 +1,72 @@
+"""
+Unit tests for the bedrock_access_checker.catalog module.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from bedrock_access_checker.catalog import ModelCatalog
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_catalog_fetches_once_per_region(mock_session, mock_foundation_models_response):
+    """Test that repeated lookups reuse the downloaded catalog."""
+    mock_client = MagicMock()
+    mock_client.list_foundation_models.return_value = mock_foundation_models_response
+    mock_session.return_value.client.return_value = mock_client
+
+    catalog = ModelCatalog()
+    first = catalog.get_models('us-east-1')
+    second = catalog.get_models('us-east-1')
+    catalog.get_models('us-west-2')
+
+    assert first is second
+    assert len(first) == 4
+    assert mock_client.list_foundation_models.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_catalog_concurrent_lookups_share_download(mock_session, mock_foundation_models_response):
+    """Test that concurrent lookups for the same region make a single call."""
+    def slow_list(**kwargs):
+        time.sleep(0.1)
+        return mock_foundation_models_response
+
+    mock_client = MagicMock()
+    mock_client.list_foundation_models.side_effect = slow_list
+    mock_session.return_value.client.return_value = mock_client
+
+    catalog = ModelCatalog()
+    threads = [threading.Thread(target=catalog.get_models, args=('us-east-1',)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    mock_client.list_foundation_models.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_catalog_does_not_cache_failures(mock_session, mock_foundation_models_response):
+    """Test that a failed download is retried on the next lookup."""
+    mock_client = MagicMock()
+    mock_client.list_foundation_models.side_effect = [
+        Exception("ThrottlingException"),
+        mock_foundation_models_response,
+    ]
+    mock_session.return_value.client.return_value = mock_client
+
+    catalog = ModelCatalog()
+    with pytest.raises(Exception):
+        catalog.get_models('us-east-1')
+
+    assert len(catalog.get_models('us-east-1')) == 4
@@ -131,18 +131,203 @@ def test_get_model_quotas_and_details(mock_session, mock_model_details_response,
     
     # Set up the mock clients to return the expected responses
     mock_bedrock_client.get_foundation_model.return_value = mock_model_details_response
-    mock_quotas_client.list_service_quotas.return_value = mock_servicequotas_response
+    mock_quotas_client.get_paginator.return_value.paginate.return_value = [mock_servicequotas_response]
     
     # Test the function
     details = get_model_quotas_and_details('anthropic.claude-3-sonnet-20240229-v1:0', 'us-east-1')
     
     # Verify the API calls
     mock_bedrock_client.get_foundation_model.assert_called_once()
-    mock_quotas_client.list_service_quotas.assert_called_once()
+    mock_quotas_client.get_paginator.return_value.paginate.assert_called_once_with(ServiceCode='bedrock')
     
     # Check the results
     assert "specs" in details
     assert "inference_params" in details
     assert "quotas" in details
     assert details["specs"]["model_name"] == "Claude 3 Sonnet"
-    assert details["inference_params"]["maxTokens"]["defaultValue"] == "4096"
\ No newline at end of file
+    assert details["inference_params"]["maxTokens"]["defaultValue"] == "4096"
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.checker.boto3.Session')
+def test_check_bedrock_regions_concurrent_order(mock_session, mock_foundation_models_response):
+    """Test that concurrent region probes are reported in the requested order."""
+    import time
+
+    # The first region answers slowest, so completion order is reversed
+    delays = {'us-east-1': 0.2, 'us-west-2': 0.1, 'eu-west-1': 0.0}
+    clients = {}
+    for region, delay in delays.items():
+        client = MagicMock()
+
+        def list_models(delay=delay, region=region):
+            time.sleep(delay)
+            if region == 'us-west-2':
+                raise Exception("AccessDeniedException: not allowed")
+            return mock_foundation_models_response
+
+        client.list_foundation_models.side_effect = list_models
+        clients[region] = client
+
+    mock_session_instance = MagicMock()
+    mock_session_instance.client.side_effect = lambda service, region_name=None, **kwargs: clients[region_name]
+    mock_session.return_value = mock_session_instance
+
+    regions = check_bedrock_regions(regions_to_check=list(delays), max_workers=3)
+
+    from bedrock_access_checker.checker import check_results
+    assert regions == ['us-east-1', 'eu-west-1']
+    assert check_results["bedrock_regions"]["errors"] == ["Region us-west-2: Permission denied"]
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.checker.boto3.Session')
+def test_region_and_model_checks_share_catalog(mock_session, mock_foundation_models_response):
+    """Test that the region, model and key model checks list the catalog only once."""
+    from bedrock_access_checker.checker import check_specific_models_simple, new_check_results
+
+    mock_client = MagicMock()
+    mock_client.list_foundation_models.return_value = mock_foundation_models_response
+    mock_session.return_value.client.return_value = mock_client
+
+    results = new_check_results()
+    regions = check_bedrock_regions(regions_to_check=['us-east-1'], results=results)
+    check_bedrock_models('us-east-1', results=results)
+    check_specific_models_simple('us-east-1', results=results)
+
+    assert regions == ['us-east-1']
+    mock_client.list_foundation_models.assert_called_once()
+    assert "anthropic.claude-3-haiku-20240307-v1:0" in results["key_models"]["available"]
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.invocation.invoke_test_prompt')
+@patch('bedrock_access_checker.checker.model_catalog')
+def test_check_specific_models_simple_records_invocations(mock_catalog, mock_invoke):
+    """Test that the key model listing and invocation steps fill the results."""
+    from bedrock_access_checker.checker import check_specific_models_simple, new_check_results
+
+    mock_catalog.get_models.return_value = [
+        {"modelId": "anthropic.claude-3-haiku-20240307-v1:0"},
+        {"modelId": "amazon.titan-embed-text-v1"},
+    ]
+
+    def invoke(model_id, region, profile_name=None):
+        if model_id.startswith("anthropic"):
+            return "Success: hello"
+        raise Exception("An error occurred (AccessDeniedException) when calling the InvokeModel operation")
+
+    mock_invoke.side_effect = invoke
+
+    results = new_check_results()
+    check_specific_models_simple('us-east-1', test_invocation=True, results=results)
+
+    assert results["key_models"]["available"] == [
+        "amazon.titan-embed-text-v1", "anthropic.claude-3-haiku-20240307-v1:0"
+    ]
+    assert results["model_invocations"]["successful"] == ["anthropic.claude-3-haiku-20240307-v1:0"]
+    assert results["model_invocations"]["failed"] == ["amazon.titan-embed-text-v1"]
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.checker._probe_bedrock_region')
+def test_check_bedrock_regions_deadline(mock_probe):
+    """Test that regions still being probed at the deadline are reported as timed out."""
+    import threading
+    import time
+    from bedrock_access_checker.checker import new_check_results, record_timed_out, STATUS_TIMEOUT, STATUS_SUCCESS
+
+    release = threading.Event()
+
+    def probe(region, profile_name=None):
+        if region == 'us-west-2':
+            release.wait(5)
+        return {"status": "available", "label": "✅ Available", "message": "1 model",
+                "detail": f"Region {region}: Available"}
+
+    mock_probe.side_effect = probe
+
+    results = new_check_results()
+    regions = check_bedrock_regions(regions_to_check=['us-east-1', 'us-west-2'], results=results,
+                                    deadline=time.monotonic() + 0.2)
+    release.set()
+
+    assert regions == ['us-east-1']
+    assert results["bedrock_regions"]["errors"] == ["Region us-west-2: Timed out"]
+
+    # Timed out nodes from the scheduler mark their component as timed out
+    results["bedrock_runtime"]["status"] = STATUS_SUCCESS
+    record_timed_out("bedrock_runtime", "us-west-2", results=results)
+    record_timed_out("model_invocations", "us-west-2", results=results)
+    assert results["bedrock_runtime"]["status"] == STATUS_TIMEOUT
+    assert results["timed_out"] == ["bedrock_runtime (us-west-2)", "model_invocations (us-west-2)"]
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.checker.model_catalog')
+def test_models_listed_in_some_regions(mock_catalog):
+    """Test that models are recorded once across regions and a key model found anywhere is not missing."""
+    from bedrock_access_checker.checker import check_key_models, new_check_results, STATUS_WARNING
+
+    catalogs = {
+        'us-east-1': [{"modelId": "amazon.titan-embed-text-v1"}, {"modelId": "anthropic.claude-v2"}],
+        'us-west-2': [{"modelId": "anthropic.claude-v2"}, {"modelId": "anthropic.claude-3-haiku-20240307-v1:0"}],
+    }
+    mock_catalog.get_models.side_effect = lambda region, profile_name=None: catalogs[region]
+
+    results = new_check_results()
+    for region in catalogs:
+        check_bedrock_models(region, results=results)
+        check_key_models(region, results=results)
+
+    listed = results.bedrock_models.available
+    assert len(listed) == 3
+    assert listed.regions_for("anthropic.claude-v2") == ['us-east-1', 'us-west-2']
+    assert listed.models_in_all_regions() == ["anthropic.claude-v2"]
+
+    # Haiku is missing in us-east-1 but listed in us-west-2
+    assert "anthropic.claude-3-haiku-20240307-v1:0" in results.key_models.available
+    assert "anthropic.claude-3-haiku-20240307-v1:0" not in results.key_models.missing
+    assert not set(results.key_models.available) & set(results.key_models.missing)
+    assert results.key_models.status == STATUS_WARNING
+
+
+@pytest.mark.unit
+def test_muted_console_skips_rendering(capsys):
+    """Test that a muted console prints nothing and hands out tables that are never built."""
+    from rich.table import Table
+    from bedrock_access_checker.checker import console, new_table
+
+    assert isinstance(new_table("Regions"), Table)
+    with console.mute():
+        assert console.muted
+        console.print("[green]hidden[/green]")
+        table = new_table("Regions")
+        table.add_column("Region")
+        table.add_row("us-east-1")
+        assert not isinstance(table, Table)
+    assert not console.muted
+    assert "hidden" not in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_summary_dashboard_for_a_successful_run(capsys):
+    """Test that a fully successful run gets the success next steps and no troubleshooting tips."""
+    from bedrock_access_checker.checker import STATUS_SUCCESS, display_summary_dashboard
+    from bedrock_access_checker.results import CheckResults
+
+    results = CheckResults()
+    for component in (results.aws_credentials, results.bedrock_regions, results.bedrock_runtime,
+                      results.bedrock_models, results.key_models):
+        component.status = STATUS_SUCCESS
+
+    display_summary_dashboard(results)
+
+    out = capsys.readouterr().out
+    assert "Your setup looks good!" in out
+    assert "Troubleshooting Tips" not in out
+    assert "Address the issues" not in out
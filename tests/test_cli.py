@@ -4,7 +4,7 @@ Tests for the CLI interface of the bedrock_access_checker.
 
 import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 
 from bedrock_access_checker.cli import main
 
@@ -36,9 +36,9 @@ def test_cli_basic_flow(mock_display, mock_regions, mock_credentials):
 @pytest.mark.mock
 @patch('bedrock_access_checker.cli.check_aws_credentials')
 @patch('bedrock_access_checker.cli.check_bedrock_regions')
-@patch('bedrock_access_checker.cli.check_bedrock_runtime_access')
-@patch('bedrock_access_checker.cli.check_bedrock_models')
-@patch('bedrock_access_checker.cli.check_specific_models_simple')
+@patch('bedrock_access_checker.pipeline.check_bedrock_runtime_access')
+@patch('bedrock_access_checker.pipeline.check_bedrock_models')
+@patch('bedrock_access_checker.pipeline.check_key_models')
 @patch('bedrock_access_checker.cli.display_summary_dashboard')
 def test_cli_with_profile(mock_display, mock_models_simple, mock_models, 
                           mock_runtime, mock_regions, mock_credentials):
@@ -54,34 +54,43 @@ def test_cli_with_profile(mock_display, mock_models_simple, mock_models,
             main()
     
     # Verify correct function calls with profile
-    mock_credentials.assert_called_once_with('test-profile')
+    mock_credentials.assert_called_once_with('test-profile', results=ANY)
     mock_regions.assert_called_once()
-    mock_runtime.assert_called_once_with('us-east-1', 'test-profile')
-    mock_models.assert_called_once_with('us-east-1', 'test-profile')
+    mock_runtime.assert_called_once_with('us-east-1', 'test-profile', results=ANY)
+    mock_models.assert_called_once_with('us-east-1', 'test-profile', results=ANY)
 
 
 @pytest.mark.unit
 @pytest.mark.mock
 @patch('bedrock_access_checker.cli.check_aws_credentials')
 @patch('bedrock_access_checker.cli.check_bedrock_regions')
-@patch('bedrock_access_checker.cli.check_sagemaker_jumpstart_alternatives')
+@patch('bedrock_access_checker.pipeline.check_bedrock_runtime_access')
+@patch('bedrock_access_checker.pipeline.check_bedrock_models')
+@patch('bedrock_access_checker.pipeline.check_key_models')
+@patch('bedrock_access_checker.pipeline.check_sagemaker_jumpstart_alternatives')
 @patch('bedrock_access_checker.cli.display_summary_dashboard')
-def test_cli_with_sagemaker_alternatives(mock_display, mock_sagemaker, mock_regions, mock_credentials):
+def test_cli_with_sagemaker_alternatives(mock_display, mock_sagemaker, mock_models_simple, mock_models,
+                                         mock_runtime, mock_regions, mock_credentials):
     """Test CLI with SageMaker alternatives option."""
     # Configure mocks
     mock_credentials.return_value = True
     mock_regions.return_value = ['us-east-1']
     
-    # Set up check_results mock
-    with patch('bedrock_access_checker.cli.check_results', {'key_models': {'missing': ['model1', 'model2']}}):
-        # Mock argparse to simulate command line args
-        with patch('sys.argv', ['check-bedrock-access.py', '--sagemaker-alternatives']):
-            # Silence output for cleaner test results
-            with patch('bedrock_access_checker.cli.console.print'):
-                main()
+    # Report two missing key models in the profile's results
+    def record_missing(region, profile_name, results):
+        results["key_models"]["missing"].extend(['model1', 'model2'])
+        return []
+    
+    mock_models_simple.side_effect = record_missing
+    
+    # Mock argparse to simulate command line args
+    with patch('sys.argv', ['check-bedrock-access.py', '--sagemaker-alternatives']):
+        # Silence output for cleaner test results
+        with patch('bedrock_access_checker.cli.console.print'):
+            main()
     
-    # Verify SageMaker alternatives check was called
-    mock_sagemaker.assert_called_once()
+    # Verify SageMaker alternatives check was called for the missing models
+    mock_sagemaker.assert_called_once_with(['model1', 'model2'], 'us-east-1', None, results=ANY)
 
 
 @pytest.mark.unit
@@ -103,7 +112,7 @@ def test_cli_with_output_option(mock_display, mock_output, mock_regions, mock_cr
             main()
     
     # Verify output function was called with correct format
-    mock_output.assert_called_once_with('json')
+    mock_output.assert_called_once_with('json', results=ANY)
 
 
 @pytest.mark.unit
@@ -126,4 +135,475 @@ def test_cli_with_failed_credentials(mock_credentials):
     
     # Verify regions check was not called (should exit early)
     with patch('bedrock_access_checker.cli.check_bedrock_regions') as mock_regions:
-        assert mock_regions.call_count == 0
\ No newline at end of file
+        assert mock_regions.call_count == 0
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.cli.list_available_profiles')
+@patch('bedrock_access_checker.cli.check_aws_credentials')
+@patch('bedrock_access_checker.cli.check_bedrock_regions')
+@patch('bedrock_access_checker.cli.compare_profile_results')
+@patch('bedrock_access_checker.cli.display_summary_dashboard')
+def test_cli_with_parallel_profiles(mock_display, mock_compare, mock_regions, mock_credentials, mock_profiles):
+    """Test that parallel profiles each get their own isolated results."""
+    # Configure mocks
+    mock_profiles.return_value = ['dev', 'prod']
+    mock_regions.return_value = []
+    
+    def record_profile(profile_name, results):
+        results["aws_credentials"]["details"].append(f"checked {profile_name}")
+        return True
+    
+    mock_credentials.side_effect = record_profile
+    
+    # Mock argparse to simulate command line args
+    with patch('sys.argv', ['check-bedrock-access.py', '--all-profiles', '--parallel-profiles', '2', '--compare']):
+        # Silence output for cleaner test results
+        with patch('bedrock_access_checker.cli.console.print'):
+            main()
+    
+    # Each profile's results only contain its own details
+    profile_results = mock_compare.call_args[0][0]
+    assert list(profile_results) == ['dev', 'prod']
+    assert profile_results['dev']["aws_credentials"]["details"] == ["checked dev"]
+    assert profile_results['prod']["aws_credentials"]["details"] == ["checked prod"]
+    assert mock_display.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.cli.assume_account_role')
+@patch('bedrock_access_checker.cli.check_aws_credentials')
+@patch('bedrock_access_checker.cli.check_bedrock_regions')
+@patch('bedrock_access_checker.cli.compare_profile_results')
+@patch('bedrock_access_checker.cli.display_summary_dashboard')
+def test_cli_org_sweep(mock_display, mock_compare, mock_regions, mock_credentials, mock_assume, tmp_path):
+    """Test that an org sweep checks every account under its label and reports each as it finishes."""
+    from bedrock_access_checker.checker import STATUS_SUCCESS
+    
+    accounts_file = tmp_path / "accounts.txt"
+    accounts_file.write_text("111122223333,Payments\n444455556666,Sandbox\n")
+    
+    def assume(account_id, role_name):
+        if account_id == '444455556666':
+            raise Exception("AccessDenied")
+        return f"{role_name}@{account_id}"
+    
+    def credentials(profile_name, results):
+        results.aws_credentials.status = STATUS_SUCCESS
+        return True
+    
+    mock_assume.side_effect = assume
+    mock_credentials.side_effect = credentials
+    mock_regions.return_value = []
+    
+    with patch('sys.argv', ['check-bedrock-access.py', '--org-sweep', '--accounts-file', str(accounts_file),
+                            '--role-name', 'AuditRole', '--sweep-workers', '2', '--compare']):
+        with patch('bedrock_access_checker.cli.console.print') as mock_print:
+            main()
+    
+    # Results are filed under each account's label, in account order
+    profile_results = mock_compare.call_args[0][0]
+    assert list(profile_results) == ['AuditRole@111122223333', 'AuditRole@444455556666']
+    mock_credentials.assert_called_once_with('AuditRole@111122223333', results=ANY)
+    assert "AccessDenied" in profile_results['AuditRole@444455556666'].aws_credentials.errors[0]
+    
+    # One line per finished account
+    printed = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
+    assert any("444455556666 (Sandbox): Could not assume role AuditRole" in line for line in printed)
+    assert any("111122223333 (Payments): no available Bedrock regions" in line for line in printed)
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.cli.list_available_profiles')
+@patch('bedrock_access_checker.cli.check_aws_credentials')
+@patch('bedrock_access_checker.cli.check_bedrock_regions')
+@patch('bedrock_access_checker.cli.compare_profile_results')
+@patch('bedrock_access_checker.cli.display_summary_dashboard')
+def test_cli_checks_each_identity_once(mock_display, mock_compare, mock_regions, mock_credentials, mock_profiles):
+    """Test that profiles resolving to the same principal are checked once and share the results."""
+    mock_profiles.return_value = ['dev', 'dev-admin', 'prod', 'dev-sso', 'broken']
+    mock_regions.return_value = []
+    mock_credentials.return_value = True
+    
+    dev_role = "arn:aws:sts::111122223333:assumed-role/Developer"
+    identities = {
+        'dev': {"Account": "111122223333", "Arn": f"{dev_role}/botocore-session-1700000000"},
+        'dev-admin': {"Account": "111122223333", "Arn": f"{dev_role}/botocore-session-1700000001"},
+        'prod': {"Account": "444455556666", "Arn": "arn:aws:iam::444455556666:user/ci"},
+        'dev-sso': {"Account": "111122223333", "Arn": f"{dev_role}/jane@example.com"},
+    }
+    
+    def caller_identity(profile_name=None):
+        if profile_name not in identities:
+            raise Exception("The config profile could not be found")
+        return identities[profile_name]
+    
+    with patch('sys.argv', ['check-bedrock-access.py', '--all-profiles', '--compare']):
+        with patch('bedrock_access_checker.cli.client_pool.caller_identity', side_effect=caller_identity):
+            with patch('bedrock_access_checker.cli.console.print'):
+                main()
+    
+    checked = [call.args[0] for call in mock_credentials.call_args_list]
+    assert checked == ['dev', 'prod', 'dev-sso', 'broken']
+    
+    # Every alias is in the comparison, in profile order, with its principal's results
+    profile_results = mock_compare.call_args[0][0]
+    assert list(profile_results) == ['dev', 'dev-admin', 'prod', 'dev-sso', 'broken']
+    assert profile_results['dev-admin'] is profile_results['dev']
+    assert profile_results['prod'] is not profile_results['dev']
+    
+    # --no-dedupe-profiles checks every profile
+    mock_credentials.reset_mock()
+    with patch('sys.argv', ['check-bedrock-access.py', '--all-profiles', '--no-dedupe-profiles']):
+        with patch('bedrock_access_checker.cli.client_pool.caller_identity', side_effect=caller_identity):
+            with patch('bedrock_access_checker.cli.console.print'):
+                main()
+    assert mock_credentials.call_count == 5
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.pipeline.model_catalog')
+@patch('bedrock_access_checker.cli.check_aws_credentials')
+@patch('bedrock_access_checker.cli.check_bedrock_regions')
+@patch('bedrock_access_checker.pipeline.check_bedrock_runtime_access')
+@patch('bedrock_access_checker.pipeline.check_bedrock_models')
+@patch('bedrock_access_checker.pipeline.check_key_models')
+@patch('bedrock_access_checker.cli.output_results')
+@patch('bedrock_access_checker.cli.display_summary_dashboard')
+def test_cli_resume_from_checkpoint(mock_display, mock_output, mock_key_models, mock_models, mock_runtime,
+                                    mock_regions, mock_credentials, mock_catalog, tmp_path):
+    """Test that --resume skips the checks in the journal and the report still covers every check."""
+    import json
+    from bedrock_access_checker.checker import STATUS_SUCCESS
+    
+    journal = str(tmp_path / "sweep.journal")
+    interrupted = [True]
+    
+    def credentials(profile_name, results):
+        results.aws_credentials.status = STATUS_SUCCESS
+        return True
+    
+    def regions(profile_name, regions_to_check, max_workers, results, deadline):
+        results.bedrock_regions.available.extend(['us-east-1', 'us-west-2'])
+        return ['us-east-1', 'us-west-2']
+    
+    def models(region, profile_name, results):
+        if interrupted[0] and region == 'us-west-2':
+            raise RuntimeError("The SSO session has expired")
+        results.bedrock_models.available.add(region, [f"model-from-{region}"])
+    
+    def key_models(region, profile_name, results):
+        if 'anthropic.claude-v2' not in results.key_models.available:
+            results.key_models.available.append('anthropic.claude-v2')
+        return ['anthropic.claude-v2']
+    
+    mock_credentials.side_effect = credentials
+    mock_regions.side_effect = regions
+    mock_models.side_effect = models
+    mock_key_models.side_effect = key_models
+    
+    with patch('bedrock_access_checker.cli.client_pool.caller_identity'):
+        with patch('bedrock_access_checker.cli.console.print'):
+            with patch('sys.argv', ['check-bedrock-access.py', '--checkpoint', journal, '--output', 'json']):
+                with pytest.raises(RuntimeError):
+                    main()
+            
+            with open(journal) as f:
+                done = [json.loads(line)["check"] for line in f]
+            assert "regions" in done and "models:us-west-2" not in done
+            
+            interrupted[0] = False
+            for mock in (mock_credentials, mock_regions, mock_runtime, mock_models, mock_key_models):
+                mock.reset_mock()
+            with patch('sys.argv', ['check-bedrock-access.py', '--resume', journal, '--output', 'json']):
+                main()
+    
+    # Only the checks missing from the journal ran again (in whichever order the workers took them)
+    mock_credentials.assert_not_called()
+    mock_regions.assert_not_called()
+    assert sorted(call.args[0] for call in mock_models.call_args_list) == [
+        region for region in ('us-east-1', 'us-west-2') if f"models:{region}" not in done
+    ]
+    assert sorted(call.args[0] for call in mock_key_models.call_args_list) == [
+        region for region in ('us-east-1', 'us-west-2') if f"key_models:{region}" not in done
+    ]
+    
+    # The report has the restored and the new results
+    results = mock_output.call_args.kwargs["results"]
+    assert results.aws_credentials.status == STATUS_SUCCESS
+    assert results.bedrock_models.available.regions_for("model-from-us-east-1") == ['us-east-1']
+    assert results.bedrock_models.available.regions_for("model-from-us-west-2") == ['us-west-2']
+    assert results.key_models.available == ['anthropic.claude-v2']
+    
+    # The resumed run appended the rest of the checks
+    with open(journal) as f:
+        assert "models:us-west-2" in [json.loads(line)["check"] for line in f]
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.cli.list_available_profiles')
+@patch('bedrock_access_checker.cli.check_aws_credentials')
+@patch('bedrock_access_checker.cli.check_bedrock_regions')
+@patch('bedrock_access_checker.cli.compare_profile_results')
+@patch('bedrock_access_checker.cli.write_consolidated_report')
+@patch('bedrock_access_checker.cli.output_results')
+@patch('bedrock_access_checker.cli.display_summary_dashboard')
+def test_cli_sharded_sweep_and_merge(mock_display, mock_output, mock_report, mock_compare, mock_regions,
+                                     mock_credentials, mock_profiles, tmp_path):
+    """Test that shards check disjoint profile/region units and merge combines them into one report."""
+    from bedrock_access_checker.checker import STATUS_SUCCESS
+    
+    mock_profiles.return_value = ['dev', 'prod']
+    checked = []
+    
+    def credentials(profile_name, results):
+        results.aws_credentials.status = STATUS_SUCCESS
+        return True
+    
+    def regions(profile_name, regions_to_check, max_workers, results, deadline):
+        checked.extend((profile_name, region) for region in regions_to_check)
+        results.bedrock_regions.status = STATUS_SUCCESS
+        results.bedrock_regions.available.extend(regions_to_check)
+        return []
+    
+    mock_credentials.side_effect = credentials
+    mock_regions.side_effect = regions
+    
+    partials = []
+    with patch('bedrock_access_checker.cli.console.print'):
+        for index in (1, 2, 3):
+            partials.append(str(tmp_path / f"shard{index}.json"))
+            with patch('sys.argv', ['check-bedrock-access.py', '--all-profiles', '--no-dedupe-profiles',
+                                    '--region', 'us-east-1', '--region', 'us-west-2',
+                                    '--shard', f'{index}/3', '--shard-file', partials[-1]]):
+                main()
+        
+        # Shards write partial files instead of reports
+        mock_output.assert_not_called()
+        mock_report.assert_not_called()
+        assert sorted(checked) == sorted((profile_name, region) for profile_name in ('dev', 'prod')
+                                         for region in ('us-east-1', 'us-west-2'))
+        
+        with patch('sys.argv', ['check-bedrock-access.py', 'merge', *partials, '--compare', '--output', 'json']):
+            main()
+    
+    profile_results = mock_compare.call_args[0][0]
+    assert list(profile_results) == ['dev', 'prod']
+    assert profile_results['dev'].bedrock_regions.available == ['us-east-1', 'us-west-2']
+    assert profile_results['prod'].bedrock_regions.available == ['us-east-1', 'us-west-2']
+    # One report covers both profiles
+    mock_output.assert_not_called()
+    assert mock_report.call_args.args[0] == 'json'
+    assert mock_report.call_args.args[1] is profile_results
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.cli.client_pool.caller_identity')
+@patch('bedrock_access_checker.cli.list_available_profiles')
+@patch('bedrock_access_checker.cli.check_aws_credentials')
+@patch('bedrock_access_checker.cli.check_bedrock_regions')
+@patch('bedrock_access_checker.cli.compare_profile_results')
+@patch('bedrock_access_checker.cli.write_consolidated_report')
+@patch('bedrock_access_checker.cli.display_summary_dashboard')
+def test_cli_shards_agree_when_an_identity_lookup_fails(mock_display, mock_report, mock_compare, mock_regions,
+                                                        mock_credentials, mock_profiles, mock_identity, tmp_path):
+    """Test that the shards split the configured profiles the same way even if one cannot dedupe its aliases."""
+    import json
+    from bedrock_access_checker.checker import STATUS_SUCCESS
+    
+    # 'alias' is the same principal as 'dev'
+    arns = {'dev': "arn:aws:iam::111122223333:user/dev", 'alias': "arn:aws:iam::111122223333:user/dev",
+            'prod': "arn:aws:iam::444455556666:user/prod"}
+    mock_profiles.return_value = ['dev', 'alias', 'prod']
+    shard = []
+    
+    def caller_identity(profile_name=None):
+        if shard == [1] and profile_name == 'dev':
+            raise RuntimeError("expired token")
+        return {"Account": arns[profile_name].split(':')[4], "Arn": arns[profile_name]}
+    
+    def credentials(profile_name, results):
+        results.aws_credentials.status = STATUS_SUCCESS
+        return True
+    
+    def regions(profile_name, regions_to_check, max_workers, results, deadline):
+        results.bedrock_regions.status = STATUS_SUCCESS
+        results.bedrock_regions.available.extend(regions_to_check)
+        return []
+    
+    mock_identity.side_effect = caller_identity
+    mock_credentials.side_effect = credentials
+    mock_regions.side_effect = regions
+    
+    partials = []
+    with patch('bedrock_access_checker.cli.console.print'):
+        for index in (1, 2, 3):
+            shard[:] = [index]
+            partials.append(str(tmp_path / f"shard{index}.json"))
+            with patch('sys.argv', ['check-bedrock-access.py', '--all-profiles', '--region', 'us-east-1',
+                                    '--region', 'us-west-2', '--shard', f'{index}/3', '--shard-file', partials[-1]]):
+                main()
+        
+        with patch('sys.argv', ['check-bedrock-access.py', 'merge', *partials, '--compare', '--output', 'json']):
+            main()
+    
+    # Every profile/region unit is planned by exactly one shard
+    units = []
+    for partial in partials:
+        with open(partial) as f:
+            plan = json.load(f)["plan"]
+        units.extend((label, region) for label, regions in plan.items() for region in regions)
+    assert sorted(units) == sorted((label, region) for label in ('dev', 'alias', 'prod')
+                                   for region in ('us-east-1', 'us-west-2'))
+    
+    profile_results = mock_compare.call_args[0][0]
+    assert list(profile_results) == ['dev', 'alias', 'prod']
+    for results in profile_results.values():
+        assert sorted(results.bedrock_regions.available) == ['us-east-1', 'us-west-2']
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.pipeline.model_catalog')
+@patch('bedrock_access_checker.cli.check_aws_credentials')
+@patch('bedrock_access_checker.cli.check_bedrock_regions')
+@patch('bedrock_access_checker.pipeline.check_bedrock_runtime_access')
+@patch('bedrock_access_checker.pipeline.check_bedrock_models')
+@patch('bedrock_access_checker.pipeline.check_key_models')
+@patch('bedrock_access_checker.cli.output_results')
+@patch('bedrock_access_checker.cli.display_summary_dashboard')
+def test_cli_streams_a_record_per_check(mock_display, mock_output, mock_key_models, mock_models, mock_runtime,
+                                        mock_regions, mock_credentials, mock_catalog, tmp_path):
+    """Test that --stream writes one record per finished check unit and no other report is needed."""
+    import json
+    from bedrock_access_checker.checker import STATUS_SUCCESS, STATUS_ERROR
+    
+    stream_file = str(tmp_path / "checks.ndjson")
+    
+    def credentials(profile_name, results):
+        results.aws_credentials.status = STATUS_SUCCESS
+        return True
+    
+    def regions(profile_name, regions_to_check, max_workers, results, deadline):
+        results.bedrock_regions.status = STATUS_SUCCESS
+        results.bedrock_regions.available.extend(['us-east-1', 'us-west-2'])
+        return ['us-east-1', 'us-west-2']
+    
+    def models(region, profile_name, results):
+        if region == 'us-west-2':
+            results.bedrock_models.status = STATUS_ERROR
+            results.bedrock_models.errors.append(f"Error listing models in {region}")
+        else:
+            results.bedrock_models.details.append(f"Found 3 models in {region}")
+    
+    mock_credentials.side_effect = credentials
+    mock_regions.side_effect = regions
+    mock_models.side_effect = models
+    mock_key_models.return_value = []
+    
+    with patch('bedrock_access_checker.cli.client_pool.caller_identity'):
+        with patch('bedrock_access_checker.cli.console.print'):
+            with patch('sys.argv', ['check-bedrock-access.py', '--stream', stream_file]):
+                main()
+    
+    with open(stream_file) as f:
+        records = {record["check"]: record for record in map(json.loads, f)}
+    assert sorted(records) == sorted(['credentials', 'regions'] + [
+        f"{check}:{region}" for check in ('runtime', 'models', 'key_models') for region in ('us-east-1', 'us-west-2')
+    ])
+    assert records["credentials"]["profile"] == "default"
+    assert records["credentials"]["status"] == STATUS_SUCCESS
+    assert records["models:us-east-1"]["region"] == "us-east-1"
+    assert records["models:us-east-1"]["details"] == ["Found 3 models in us-east-1"]
+    assert records["models:us-west-2"]["errors"] == ["Error listing models in us-west-2"]
+    assert all(record["latency_ms"] is not None for record in records.values())
+    mock_output.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.pipeline.model_catalog')
+@patch('bedrock_access_checker.cli.check_aws_credentials')
+@patch('bedrock_access_checker.cli.check_bedrock_regions')
+@patch('bedrock_access_checker.pipeline.check_bedrock_runtime_access')
+@patch('bedrock_access_checker.pipeline.check_bedrock_models')
+@patch('bedrock_access_checker.pipeline.check_key_models')
+def test_cli_quiet_prints_only_the_results(mock_key_models, mock_models, mock_runtime, mock_regions,
+                                           mock_credentials, mock_catalog, capsys):
+    """Test that --quiet renders nothing and prints the final results as one JSON document."""
+    import json
+    from bedrock_access_checker.checker import STATUS_SUCCESS, console
+    
+    def credentials(profile_name, results):
+        console.print("[green]Credentials found[/green]")
+        results.aws_credentials.status = STATUS_SUCCESS
+        return True
+    
+    def regions(profile_name, regions_to_check, max_workers, results, deadline):
+        results.bedrock_regions.status = STATUS_SUCCESS
+        results.bedrock_regions.available.append('us-east-1')
+        return ['us-east-1']
+    
+    mock_credentials.side_effect = credentials
+    mock_regions.side_effect = regions
+    mock_key_models.return_value = ['anthropic.claude-v2']
+    
+    with patch('bedrock_access_checker.cli.client_pool.caller_identity'):
+        with patch('sys.argv', ['check-bedrock-access.py', '--quiet', '--region', 'us-east-1']):
+            main()
+    
+    document = json.loads(capsys.readouterr().out)
+    assert list(document["profiles"]) == ["default"]
+    assert document["profiles"]["default"]["aws_credentials"]["status"] == STATUS_SUCCESS
+    assert document["comparison"]["regions"] == ['us-east-1']
+    assert not console.quiet
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+def test_cli_empty_org_sweep_still_cleans_up(tmp_path):
+    """Test that a sweep with no accounts closes the journal and stream and gives the console back."""
+    from bedrock_access_checker.checker import console
+    from bedrock_access_checker.journal import active_journal
+    from bedrock_access_checker.stream import active_stream
+    
+    accounts_file = tmp_path / "accounts.txt"
+    accounts_file.write_text("")
+    journal = tmp_path / "sweep.journal"
+    
+    with patch('sys.argv', ['check-bedrock-access.py', '--org-sweep', '--accounts-file', str(accounts_file),
+                            '--quiet', '--checkpoint', str(journal), '--stream', str(tmp_path / "records.ndjson")]):
+        main()
+    
+    assert active_journal() is None
+    assert active_stream() is None
+    assert not console.quiet
+    assert console.file is not sys.stderr
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("option, value", [
+    ('--max-in-flight', '0'),
+    ('--max-in-flight', '-2'),
+    ('--invoke-rate', '0'),
+    ('--invoke-rate', '-0.5'),
+    ('--invoke-rate', 'nan'),
+    ('--max-concurrency', '0'),
+    ('--max-concurrency', '-1'),
+])
+def test_cli_rejects_non_positive_limits(option, value, capsys):
+    """Test that concurrency and invocation limits of zero or less are rejected when the arguments are parsed."""
+    with patch('sys.argv', ['check-bedrock-access.py', option, value]):
+        with patch('bedrock_access_checker.cli.check_aws_credentials') as mock_credentials:
+            with pytest.raises(SystemExit) as exit_info:
+                main()
+    
+    assert exit_info.value.code == 2
+    assert "must be greater than 0" in capsys.readouterr().err
+    mock_credentials.assert_not_called()
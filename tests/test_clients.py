@@ -0,0 +1,168 @@
+"""
+Unit tests for the bedrock_access_checker.clients module.
+"""
+
+import threading
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from bedrock_access_checker.clients import ClientPool
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_pool_reuses_sessions_and_clients(mock_session):
+    """Test that sessions and clients are created once per key."""
+    mock_session.return_value.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+    pool = ClientPool()
+    east = pool.client('bedrock', 'us-east-1', 'dev')
+    assert pool.client('bedrock', 'us-east-1', 'dev') is east
+    assert pool.client('bedrock', 'us-west-2', 'dev') is not east
+    assert pool.client('bedrock', 'us-east-1', 'prod') is not east
+
+    # One session per profile, one client per (profile, service, region)
+    assert mock_session.call_count == 2
+    assert mock_session.return_value.client.call_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_pool_applies_connection_pool_size(mock_session):
+    """Test that configured connection pool sizes reach the client config."""
+    pool = ClientPool()
+    pool.configure(max_pool_connections=25)
+    pool.client('bedrock-runtime', 'us-east-1')
+
+    config = mock_session.return_value.client.call_args[1]['config']
+    assert config.max_pool_connections == 25
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_pool_applies_timeouts_and_retries(mock_session):
+    """Test that clients get explicit timeouts and retry budgets, with per-service overrides."""
+    mock_session.return_value.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+    pool = ClientPool()
+    pool.configure(connect_timeout=2, read_timeout=7, max_attempts=4)
+    pool.client('bedrock', 'us-east-1')
+    pool.client('bedrock-runtime', 'us-east-1')
+
+    bedrock_config, runtime_config = [call[1]['config'] for call in mock_session.return_value.client.call_args_list]
+    assert bedrock_config.connect_timeout == 2
+    assert bedrock_config.read_timeout == 7
+    assert bedrock_config.retries == {"max_attempts": 4, "mode": "standard"}
+
+    # Invocations get a longer read timeout and leave throttling retries to the prober
+    assert runtime_config.connect_timeout == 2
+    assert runtime_config.read_timeout == 60
+    assert runtime_config.retries["max_attempts"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_pool_applies_endpoint_overrides(mock_session):
+    """Test that endpoint overrides apply per service, with '*' as the fallback."""
+    mock_session.return_value.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+    pool = ClientPool()
+    pool.client('sts')
+    pool.configure(endpoint_urls={'*': 'http://127.0.0.1:8765', 'bedrock-runtime': 'http://127.0.0.1:9000'})
+    pool.client('bedrock', 'us-east-1')
+    pool.client('bedrock-runtime', 'us-east-1')
+
+    sts_call, bedrock_call, runtime_call = mock_session.return_value.client.call_args_list
+    assert 'endpoint_url' not in sts_call[1]
+    assert bedrock_call[1]['endpoint_url'] == 'http://127.0.0.1:8765'
+    assert runtime_call[1]['endpoint_url'] == 'http://127.0.0.1:9000'
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_pool_concurrent_lookups_create_one_client(mock_session):
+    """Test that threads asking for the same client share one instance."""
+    mock_session.return_value.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+    pool = ClientPool()
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(pool.client('bedrock', 'us-east-1')))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in clients}) == 1
+    mock_session.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_pool_slow_session_does_not_block_other_profiles(mock_session):
+    """Test that one profile resolving its credentials does not hold up client lookups for another."""
+    resolving = threading.Event()
+    release = threading.Event()
+
+    def make_session(profile_name=None):
+        session = MagicMock()
+        session.client.side_effect = lambda *args, **kwargs: MagicMock()
+        if profile_name == 'slow':
+            def get_credentials():
+                resolving.set()
+                release.wait(5)
+                return MagicMock()
+            session.get_credentials.side_effect = get_credentials
+        return session
+
+    mock_session.side_effect = make_session
+
+    pool = ClientPool()
+    slow_clients = []
+    thread = threading.Thread(target=lambda: slow_clients.append(pool.client('bedrock', 'us-east-1', 'slow')))
+    thread.start()
+    try:
+        assert resolving.wait(5)
+        # The slow profile is still resolving its credentials
+        assert pool.client('bedrock', 'us-east-1', 'fast') is not None
+        assert not slow_clients
+    finally:
+        release.set()
+        thread.join()
+
+    assert pool.client('bedrock', 'us-east-1', 'slow') is slow_clients[0]
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.clients.time.monotonic')
+@patch('bedrock_access_checker.clients.boto3.Session')
+def test_pool_ttl_rebuilds_expired_sessions(mock_session, mock_monotonic):
+    """Test that with a TTL, sessions are rebuilt with fresh clients and identities, except registered ones."""
+    mock_session.side_effect = lambda profile_name=None: MagicMock()
+    mock_monotonic.return_value = 100.0
+
+    pool = ClientPool()
+    pool.set_ttl(60)
+    registered = MagicMock()
+    pool.register_session('account', registered)
+    client = pool.client('bedrock', 'us-east-1', 'dev')
+    identity = pool.caller_identity('dev')
+
+    mock_monotonic.return_value = 159.0
+    assert pool.client('bedrock', 'us-east-1', 'dev') is client
+
+    mock_monotonic.return_value = 160.0
+    assert pool.client('bedrock', 'us-east-1', 'dev') is not client
+    assert pool.caller_identity('dev') is not identity
+    assert pool.session('account') is registered
+    assert mock_session.call_count == 2
@@ -0,0 +1,134 @@
+"""
+Unit tests for the bedrock_access_checker.credentials module.
+"""
+
+import datetime
+import os
+import stat
+
+import pytest
+from botocore.credentials import RefreshableCredentials
+from moto import mock_sts
+
+from bedrock_access_checker.clients import client_pool
+from bedrock_access_checker.credentials import CredentialCache, CredentialRefresher, credential_cache
+
+
+def _metadata(expires_in):
+    """Credentials in botocore's refresh format, expiring in expires_in seconds"""
+    expiry = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=expires_in)
+    return {"access_key": "AKID", "secret_key": "SECRET", "token": "TOKEN", "expiry_time": expiry.isoformat()}
+
+
+@pytest.mark.unit
+def test_credential_cache_persists_with_owner_only_permissions(tmp_path):
+    """Test that cached credentials are written owner-only and read back by a later run."""
+    directory = tmp_path / "credentials"
+    expiration = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+
+    cache = CredentialCache(str(directory))
+    cache["role-key"] = {"Credentials": {"AccessKeyId": "AKID", "Expiration": expiration}}
+
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    files = os.listdir(directory)
+    assert len(files) == 1
+    assert stat.S_IMODE(os.stat(directory / files[0]).st_mode) == 0o600
+
+    later_run = CredentialCache(str(directory))
+    assert "role-key" in later_run
+    assert later_run["role-key"]["Credentials"]["Expiration"] == expiration.isoformat()
+    assert "other-key" not in later_run
+
+    del later_run["role-key"]
+    assert os.listdir(directory) == []
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+def test_role_profiles_share_cached_credentials(aws_credentials, tmp_path, monkeypatch):
+    """Test that assumed-role credentials are reused across profiles and, when persisted, across runs."""
+    config_file = tmp_path / "config"
+    config_file.write_text(
+        "[profile base]\n"
+        "region = us-east-1\n"
+        "[profile audit]\n"
+        "role_arn = arn:aws:iam::111122223333:role/AuditRole\n"
+        "source_profile = base\n"
+        "[profile audit-again]\n"
+        "role_arn = arn:aws:iam::111122223333:role/AuditRole\n"
+        "source_profile = base\n"
+    )
+    credentials_file = tmp_path / "credentials"
+    credentials_file.write_text("[base]\naws_access_key_id = testing\naws_secret_access_key = testing\n")
+    monkeypatch.setenv("AWS_CONFIG_FILE", str(config_file))
+    monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(credentials_file))
+    credential_cache.configure(str(tmp_path / "cache"))
+
+    with mock_sts():
+        first = client_pool.session('audit').get_credentials().get_frozen_credentials()
+        second = client_pool.session('audit-again').get_credentials().get_frozen_credentials()
+
+        # A new run starts with empty memory and finds the persisted credentials
+        client_pool.clear()
+        credential_cache.clear()
+        later_run = client_pool.session('audit').get_credentials().get_frozen_credentials()
+
+    assert first.access_key.startswith("ASIA")
+    assert second.access_key == first.access_key
+    assert later_run.access_key == first.access_key
+
+
+@pytest.mark.unit
+def test_refresher_refreshes_credentials_before_they_expire():
+    """Test that credentials close to expiry are refreshed ahead of time and others are left alone."""
+    refreshes = []
+
+    def refresh():
+        refreshes.append(True)
+        return _metadata(3600)
+
+    expiring = RefreshableCredentials.create_from_metadata(_metadata(10 * 60), refresh, "assume-role")
+    fresh = RefreshableCredentials.create_from_metadata(_metadata(3600), refresh, "assume-role")
+
+    refresher = CredentialRefresher(refresh_ahead=20 * 60, interval=3600)
+    try:
+        refresher.watch(expiring)
+        refresher.watch(fresh)
+        refresher.watch(expiring)
+
+        assert refresher.refresh_due() == 1
+        assert len(refreshes) == 1
+        assert not expiring.refresh_needed(20 * 60)
+
+        # Nothing is due any more
+        assert refresher.refresh_due() == 0
+    finally:
+        refresher.stop()
+
+
+@pytest.mark.unit
+def test_refresher_falls_back_to_public_botocore_api():
+    """Test that credentials without botocore's refresh internals are refreshed through the public API."""
+    refreshes = []
+
+    def refresh():
+        refreshes.append(True)
+        return _metadata(3600)
+
+    class PublicOnly:
+        """Real botocore credentials seen only through their public methods"""
+
+        def __init__(self, credentials):
+            self.refresh_needed = credentials.refresh_needed
+            self.get_frozen_credentials = credentials.get_frozen_credentials
+
+    # Within botocore's own mandatory refresh window, so reading them refreshes them
+    credentials = RefreshableCredentials.create_from_metadata(_metadata(5 * 60), refresh, "assume-role")
+    refresher = CredentialRefresher(refresh_ahead=20 * 60, interval=3600)
+    try:
+        refresher.watch(PublicOnly(credentials))
+        assert refresher.refresh_due() == 1
+        assert len(refreshes) == 1
+        assert not credentials.refresh_needed(20 * 60)
+    finally:
+        refresher.stop()
@@ -0,0 +1,72 @@
+"""
+Unit tests for the bedrock_access_checker.html_report module.
+"""
+
+import json
+import re
+
+import pytest
+
+from bedrock_access_checker.checker import STATUS_SUCCESS, STATUS_WARNING
+from bedrock_access_checker.results import CheckResults, InvocationResults, ModelDetails
+from bedrock_access_checker.html_report import model_entries, write_html_report
+
+
+def _results():
+    """Results of a run with test invocations, cost estimates and advanced details"""
+    results = CheckResults()
+    results.aws_credentials.status = STATUS_SUCCESS
+    results.bedrock_regions.status = STATUS_SUCCESS
+    results.bedrock_regions.available.extend(['us-east-1', 'us-west-2'])
+    results.key_models.status = STATUS_WARNING
+    results.key_models.available.extend(['anthropic.claude-v2', 'amazon.titan-embed-text-v1'])
+    results.key_models.missing.append('meta.llama2-13b-chat-v1')
+    results.model_invocations = InvocationResults(successful=['anthropic.claude-v2'])
+    results.cost_estimates.models['anthropic.claude-v2'] = {
+        "input_price": 8.0, "output_price": 24.0, "context_window": 100000,
+        "common_usage_estimate": 24.0, "pricing_note": "Prices as of </script> May 2025",
+    }
+    results.model_details = {'anthropic.claude-v2': ModelDetails(
+        model_id='anthropic.claude-v2', region='us-east-1', specs={"provider": "Anthropic", "error": "ignored"},
+        quotas={"Requests per minute": {"value": 100, "unit": "None", "adjustable": True}},
+    )}
+    return results
+
+
+@pytest.mark.unit
+def test_model_entries_hold_each_models_data_once():
+    """Test that every key model gets one compact entry with its test, cost and details."""
+    entries = {entry["id"]: entry for entry in model_entries(_results())}
+
+    assert sorted(entries) == ['amazon.titan-embed-text-v1', 'anthropic.claude-v2', 'meta.llama2-13b-chat-v1']
+    claude = entries['anthropic.claude-v2']
+    assert claude["listed"] == 1
+    assert claude["test"] == "ok"
+    assert claude["cost"]["estimate"] == 24.0
+    assert claude["details"]["specs"] == {"provider": "Anthropic"}
+    assert claude["details"]["quotas"] == {"Requests per minute": "100 None (adjustable)"}
+    assert entries['amazon.titan-embed-text-v1']["test"] == "untested"
+    assert entries['amazon.titan-embed-text-v1']["purpose"] == "Text embeddings (V1)"
+    assert entries['meta.llama2-13b-chat-v1']["listed"] == 0
+    assert "test" not in entries['meta.llama2-13b-chat-v1']
+
+
+@pytest.mark.unit
+def test_html_report_embeds_model_data_for_the_browser(tmp_path):
+    """Test that the report embeds the model data as JSON and keeps the rest of the page readable."""
+    filename = str(tmp_path / "report.html")
+    write_html_report(filename, _results(), "20250101_000000")
+
+    with open(filename) as f:
+        page = f.read()
+
+    data = re.findall(r"<script type='application/json' class='report-data' data-section='r0'>(.*?)</script>", page)
+    assert len(data) == 1
+    assert [entry["id"] for entry in json.loads(data[0])["models"]] == [
+        'amazon.titan-embed-text-v1', 'anthropic.claude-v2', 'meta.llama2-13b-chat-v1'
+    ]
+    # The model cards are rendered by the inline script, not written out per model
+    assert "<div class='model-card'>" not in page
+    assert "<div class='region-badge'>us-west-2</div>" in page
+    assert "Report ID: 20250101_000000" in page
+    assert page.rstrip().endswith("</html>")
@@ -0,0 +1,107 @@
+"""
+Unit tests for the bedrock_access_checker.invocation module.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+from botocore.exceptions import ClientError
+
+from bedrock_access_checker.invocation import (
+    InvocationProber,
+    TokenBucket,
+    model_family,
+    INVOKE_SUCCESS,
+    INVOKE_FAILED,
+    INVOKE_THROTTLED
+)
+
+
+def throttling_error():
+    """Build the error Bedrock raises when a call is throttled."""
+    return ClientError({"Error": {"Code": "ThrottlingException", "Message": "Too many requests"}}, "InvokeModel")
+
+
+@pytest.mark.unit
+def test_model_family():
+    """Test that models are grouped by provider and model name prefix."""
+    assert model_family("anthropic.claude-3-haiku-20240307-v1:0") == "anthropic.claude"
+    assert model_family("anthropic.claude-v2:1") == "anthropic.claude"
+    assert model_family("amazon.titan-embed-text-v1") == "amazon.titan"
+    assert model_family("meta.llama2-13b-chat-v1") == "meta.llama"
+
+
+@pytest.mark.unit
+def test_token_bucket_gives_up_at_deadline():
+    """Test that an empty bucket refuses tokens it cannot refill before the deadline."""
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    assert bucket.acquire()
+    assert not bucket.acquire(deadline=time.monotonic() + 0.1)
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.invocation.invoke_test_prompt')
+def test_probe_retries_throttled_calls(mock_invoke):
+    """Test that a throttled call is retried and then reported as a success."""
+    mock_invoke.side_effect = [throttling_error(), throttling_error(), "Success: hi"]
+
+    prober = InvocationProber(rate=100, burst=10, deadline=5, backoff_base=0.01, backoff_cap=0.02)
+    outcome, message = prober.probe_model("anthropic.claude-v2", "us-east-1")
+
+    assert outcome == INVOKE_SUCCESS
+    assert message == "Success: hi"
+    assert mock_invoke.call_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.invocation.invoke_test_prompt')
+def test_probe_reports_throttling_separately(mock_invoke):
+    """Test that models throttled until the deadline are throttled, not failed."""
+    def invoke(model_id, region, profile_name=None):
+        if model_id.startswith("anthropic"):
+            raise throttling_error()
+        raise ClientError({"Error": {"Code": "AccessDeniedException", "Message": "No access"}}, "InvokeModel")
+
+    mock_invoke.side_effect = invoke
+
+    prober = InvocationProber(rate=100, burst=10, deadline=0.3, backoff_base=0.05, backoff_cap=0.1)
+    outcomes = prober.probe(["anthropic.claude-v2", "amazon.titan-text-express-v1"], "us-east-1")
+
+    assert [(model_id, outcome) for model_id, outcome, _ in outcomes] == [
+        ("anthropic.claude-v2", INVOKE_THROTTLED),
+        ("amazon.titan-text-express-v1", INVOKE_FAILED),
+    ]
+    assert outcomes[1][2] == "Access denied"
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.invocation.invoke_test_prompt')
+def test_probe_bounds_in_flight_invocations(mock_invoke):
+    """Test that no more invocations run at once than the in-flight limit."""
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def invoke(model_id, region, profile_name=None):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return "Success"
+
+    mock_invoke.side_effect = invoke
+
+    model_ids = [f"provider{index}.model-v1" for index in range(8)]
+    prober = InvocationProber(max_in_flight=3, rate=100, burst=10)
+    outcomes = prober.probe(model_ids, "us-east-1")
+
+    assert [model_id for model_id, _, _ in outcomes] == model_ids
+    assert all(outcome == INVOKE_SUCCESS for _, outcome, _ in outcomes)
+    assert 1 < peak[0] <= 3
@@ -0,0 +1,77 @@
+"""
+Unit tests for the bedrock_access_checker.journal module.
+"""
+
+import pytest
+
+from bedrock_access_checker.journal import CheckpointJournal
+from bedrock_access_checker.results import CheckResults, ModelDetails
+from bedrock_access_checker.scheduler import CheckNode
+
+
+def _done(name, component, region=None, result=None):
+    """A finished check node"""
+    node = CheckNode(name, component=component, region=region)
+    node.result = result
+    return node
+
+
+@pytest.mark.unit
+def test_journal_restores_completed_checks(tmp_path):
+    """Test that a resumed journal knows the completed checks and restores each component's latest state."""
+    path = str(tmp_path / "run.journal")
+    results = CheckResults()
+
+    journal = CheckpointJournal(path)
+    results.bedrock_regions.available.extend(['us-east-1', 'us-west-2'])
+    journal.record('dev', _done("regions", "bedrock_regions"), results)
+    results.bedrock_models.available.add('us-east-1', ['anthropic.claude-v2'])
+    journal.record('dev', _done("models:us-east-1", "bedrock_models", 'us-east-1'), results)
+    results.bedrock_models.available.add('us-west-2', ['anthropic.claude-v2', 'meta.llama3-8b-instruct-v1:0'])
+    journal.record('dev', _done("models:us-west-2", "bedrock_models", 'us-west-2'), results)
+    results.key_models.available.append('anthropic.claude-v2')
+    journal.record('dev', _done("key_models:us-east-1", "key_models", 'us-east-1', ['anthropic.claude-v2']), results)
+    results.model_details = {'anthropic.claude-v2': ModelDetails(model_id='anthropic.claude-v2', region='us-east-1')}
+    journal.record('dev', _done("details:us-east-1", "model_details", 'us-east-1'), results)
+    journal.close()
+
+    # A line cut short by an interrupted run is ignored
+    with open(path, 'a') as f:
+        f.write('{"version": 1, "profile": "dev", "check": "runti')
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.resumed_checks == 5
+    assert resumed.is_completed('dev', "models:us-west-2")
+    assert not resumed.is_completed('dev', "runtime:us-east-1")
+    assert not resumed.is_completed('prod', "regions")
+    assert resumed.completed_value('dev', "key_models:us-east-1") == ['anthropic.claude-v2']
+
+    restored = CheckResults()
+    assert resumed.restore('dev', restored) == 4
+    assert restored.to_dict() == results.to_dict()
+    assert restored.bedrock_models.available.regions_for('anthropic.claude-v2') == ['us-east-1', 'us-west-2']
+    assert restored.model_details['anthropic.claude-v2'].region == 'us-east-1'
+    assert resumed.restore('prod', CheckResults()) == 0
+    resumed.close()
+
+
+@pytest.mark.unit
+def test_new_journal_replaces_an_earlier_run(tmp_path):
+    """Test that a journal opened without resume starts empty instead of appending to an old run."""
+    path = str(tmp_path / "run.journal")
+    results = CheckResults()
+
+    old = CheckpointJournal(path)
+    old.record('dev', _done("regions", "bedrock_regions"), results)
+    old.close()
+
+    fresh = CheckpointJournal(path)
+    assert fresh.resumed_checks == 0
+    fresh.record('dev', _done("models:us-east-1", "bedrock_models", 'us-east-1'), results)
+    fresh.close()
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.resumed_checks == 1
+    assert not resumed.is_completed('dev', "regions")
+    assert resumed.is_completed('dev', "models:us-east-1")
+    resumed.close()
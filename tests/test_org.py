@@ -0,0 +1,82 @@
+"""
+Unit tests for the bedrock_access_checker.org module.
+"""
+
+import boto3
+import pytest
+from unittest.mock import patch
+from moto import mock_organizations, mock_sts
+
+from bedrock_access_checker.clients import client_pool
+from bedrock_access_checker.org import (
+    AssumedRoleSessions,
+    assume_account_role,
+    load_accounts,
+)
+
+
+@pytest.mark.unit
+def test_load_accounts_from_file(tmp_path):
+    """Test that the accounts file is parsed with names, comments and duplicates handled."""
+    accounts_file = tmp_path / "accounts.txt"
+    accounts_file.write_text(
+        "# Production accounts\n"
+        "111122223333,Payments Prod\n"
+        "\n"
+        "444455556666  Data Lake\n"
+        "777788889999\n"
+        "111122223333,Payments Prod again\n"
+    )
+
+    assert load_accounts(str(accounts_file)) == [
+        ("111122223333", "Payments Prod"),
+        ("444455556666", "Data Lake"),
+        ("777788889999", ""),
+    ]
+
+    accounts_file.write_text("111122223333\nnot-an-account\n")
+    with pytest.raises(ValueError, match=":2:"):
+        load_accounts(str(accounts_file))
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+def test_load_accounts_from_organization(aws_credentials):
+    """Test that without a file the organization's accounts are listed."""
+    with mock_organizations(), mock_sts():
+        organizations = boto3.client('organizations', region_name='us-east-1')
+        organizations.create_organization(FeatureSet='ALL')
+        for name in ("Payments", "Data Lake"):
+            organizations.create_account(AccountName=name, Email=f"{name.replace(' ', '')}@example.com")
+
+        accounts = load_accounts()
+
+    names = [name for _, name in accounts]
+    assert "Payments" in names and "Data Lake" in names
+    assert all(len(account_id) == 12 for account_id, _ in accounts)
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+def test_assumed_role_sessions_are_cached(aws_credentials):
+    """Test that each role is assumed once and its session is used for the account's checks."""
+    with mock_sts(), patch.object(AssumedRoleSessions, '_assume', autospec=True,
+                                  side_effect=AssumedRoleSessions._assume) as mock_assume:
+        sessions = AssumedRoleSessions()
+        first = sessions.session('111122223333', 'AuditRole')
+        second = sessions.session('111122223333', 'AuditRole')
+        other = sessions.session('444455556666', 'AuditRole')
+
+        assert first is second
+        assert other is not first
+        assert mock_assume.call_count == 2
+        assert mock_assume.call_args_list[0][0][1] == 'arn:aws:iam::111122223333:role/AuditRole'
+
+        # The assumed credentials are what the checks see under the account's label
+        with patch('bedrock_access_checker.org.assumed_role_sessions', sessions):
+            label = assume_account_role('111122223333', 'AuditRole')
+        assert label == 'AuditRole@111122223333'
+        assert client_pool.is_registered(label)
+        identity = client_pool.caller_identity(label)
+        assert identity['Account'] == '111122223333'
+        assert 'assumed-role/AuditRole' in identity['Arn']
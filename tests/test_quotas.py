@@ -0,0 +1,113 @@
+"""
+Unit tests for the bedrock_access_checker.quotas module.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from bedrock_access_checker.quotas import QuotaIndex, QuotaIndexCache, model_tokens
+from bedrock_access_checker.checker import get_model_quotas_and_details
+
+
+@pytest.fixture
+def paged_quotas_client():
+    """Mocked Service Quotas client whose paginator returns Bedrock quotas over two pages."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {
+            'Quotas': [
+                {'QuotaName': 'Claude 3 Sonnet requests per minute', 'Value': 500, 'Unit': 'None', 'Adjustable': True},
+                {'QuotaName': 'Titan Text Express tokens per minute', 'Value': 300000, 'Unit': 'None'},
+            ],
+            'NextToken': 'page-2'
+        },
+        {
+            'Quotas': [
+                {'QuotaName': 'Claude 3 Haiku tokens per minute', 'Value': 1000000, 'Unit': 'None'},
+                {'QuotaName': 'Model invocation max throughput', 'Value': 10, 'Unit': 'None'},
+            ]
+        },
+    ]
+    return client
+
+
+@pytest.mark.unit
+def test_model_tokens():
+    """Test that only meaningful model name parts are used for lookups."""
+    assert model_tokens('anthropic.claude-3-sonnet-20240229-v1:0') == {'claude', 'sonnet', '20240229'}
+    assert model_tokens('amazon.titan-embed-text-v1') == {'titan', 'embed', 'text'}
+
+
+@pytest.mark.unit
+def test_quota_index_lookup(mock_servicequotas_response):
+    """Test that model lookups match quota name tokens and general quotas."""
+    quotas = mock_servicequotas_response['Quotas'] + [
+        {'QuotaName': 'Titan Text Express tokens per minute', 'Value': 300000, 'Unit': 'None'},
+        {'QuotaName': 'Cross-region invocation rate', 'Value': 5, 'Unit': 'None'},
+    ]
+    index = QuotaIndex(quotas)
+
+    relevant = index.quotas_for_model('anthropic.claude-3-haiku-20240307-v1:0')
+    assert set(relevant) == {
+        'Claude 3 Tokens per minute',
+        'Claude 3 Requests per minute',
+        'Cross-region invocation rate',
+    }
+    assert relevant['Claude 3 Tokens per minute'] == {"value": 50000, "unit": "TPM", "adjustable": True}
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.quotas.client_pool')
+def test_quota_index_reads_all_pages_once(mock_pool, paged_quotas_client):
+    """Test that the index reads every page through the paginator and is built once per region."""
+    mock_pool.client.return_value = paged_quotas_client
+
+    cache = QuotaIndexCache()
+    index = cache.get_index('us-east-1')
+    assert cache.get_index('us-east-1') is index
+
+    paged_quotas_client.get_paginator.assert_called_once_with('list_service_quotas')
+    paged_quotas_client.get_paginator.return_value.paginate.assert_called_once_with(ServiceCode='bedrock')
+
+    haiku = index.quotas_for_model('anthropic.claude-3-haiku-20240307-v1:0')
+    assert 'Claude 3 Haiku tokens per minute' in haiku
+    assert 'Model invocation max throughput' in haiku
+    assert 'Titan Text Express tokens per minute' not in haiku
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.checker.boto3.Session')
+def test_model_details_share_region_quota_listing(mock_session, paged_quotas_client, mock_model_details_response):
+    """Test that quota lookups for several models list the region's quotas once."""
+    mock_bedrock_client = MagicMock()
+    mock_bedrock_client.get_foundation_model.return_value = mock_model_details_response
+    clients = {'bedrock': mock_bedrock_client, 'service-quotas': paged_quotas_client}
+    mock_session.return_value.client.side_effect = lambda service, **kwargs: clients[service]
+
+    sonnet = get_model_quotas_and_details('anthropic.claude-3-sonnet-20240229-v1:0', 'us-east-1')
+    titan = get_model_quotas_and_details('amazon.titan-text-express-v1', 'us-east-1')
+
+    paged_quotas_client.get_paginator.return_value.paginate.assert_called_once()
+    assert 'Claude 3 Sonnet requests per minute' in sonnet["quotas"]
+    assert 'Titan Text Express tokens per minute' in titan["quotas"]
+    assert 'Claude 3 Sonnet requests per minute' not in titan["quotas"]
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+@patch('bedrock_access_checker.quotas.client_pool')
+def test_quota_index_retries_after_a_failed_listing(mock_pool, paged_quotas_client):
+    """Test that a failed quota listing is not kept, so the next lookup lists the quotas again."""
+    pages = paged_quotas_client.get_paginator.return_value.paginate.return_value
+    paged_quotas_client.get_paginator.return_value.paginate.side_effect = [RuntimeError("throttled"), pages]
+    mock_pool.client.return_value = paged_quotas_client
+
+    cache = QuotaIndexCache()
+    with pytest.raises(RuntimeError):
+        cache.get_index('us-east-1')
+
+    index = cache.get_index('us-east-1')
+    assert 'Claude 3 Haiku tokens per minute' in index.quotas_for_model('anthropic.claude-3-haiku-20240307-v1:0')
+    assert cache.get_index('us-east-1') is index
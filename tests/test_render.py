@@ -0,0 +1,84 @@
+"""
+Unit tests for the bedrock_access_checker.render module.
+"""
+
+import io
+
+import pytest
+
+from bedrock_access_checker.checker import CheckerConsole, STATUS_ERROR, STATUS_SUCCESS
+from bedrock_access_checker.results import CheckResults, InvocationResults
+from bedrock_access_checker.render import ProgressView, TerminalRenderer
+from bedrock_access_checker.scheduler import CheckGraph
+
+
+def _console():
+    """Console that records what it prints"""
+    return CheckerConsole(file=io.StringIO(), width=200, record=True)
+
+
+@pytest.mark.unit
+def test_terminal_renderer_prints_each_table_once_from_results():
+    """Test that the check tables are rendered from the results alone, once over all regions."""
+    results = CheckResults()
+    results.aws_credentials.status = STATUS_SUCCESS
+    results.aws_credentials.details.append("Valid AWS credentials found from: Profile 'dev'")
+    results.bedrock_regions.available.extend(['us-east-1', 'us-west-2'])
+    results.bedrock_regions.details.extend(["Region us-east-1: Available - Successfully connected",
+                                            "Region us-west-2: Available - Successfully connected"])
+    results.bedrock_regions.errors.append("Region eu-west-1: Permission denied")
+    results.bedrock_models.available.add('us-east-1', ['anthropic.claude-v2', 'amazon.titan-embed-text-v1'])
+    results.bedrock_models.available.add('us-west-2', ['anthropic.claude-v2'])
+    results.key_models.available.extend(['anthropic.claude-v2', 'amazon.titan-embed-text-v1'])
+    results.model_invocations = InvocationResults(
+        successful=['anthropic.claude-v2'], failed=['amazon.titan-embed-text-v1'],
+        details=['anthropic.claude-v2: Hello', 'amazon.titan-embed-text-v1: Failed - AccessDenied'])
+    output = _console()
+
+    assert TerminalRenderer(output).render(results, 'dev', 0, 2)
+
+    text = output.export_text()
+    assert "=== Profile 1/2: dev ===" in text
+    assert text.count("Bedrock Region Availability") == 1
+    assert "eu-west-1" in text and "No access" in text
+    assert "Bedrock Models (2 listed in 2 regions)" in text
+    assert "us-east-1, us-west-2" in text
+    assert "Failed: AccessDenied" in text
+    assert "may have incurred small AWS charges" in text
+
+
+@pytest.mark.unit
+def test_terminal_renderer_stops_where_the_checks_stopped():
+    """Test that failed credentials only get the skip message and quiet mode renders nothing."""
+    results = CheckResults()
+    results.aws_credentials.status = STATUS_ERROR
+    results.aws_credentials.errors.append("No AWS credentials found!")
+    output = _console()
+
+    assert not TerminalRenderer(output).render(results, None)
+    text = output.export_text()
+    assert "No AWS credentials found!" in text
+    assert "Skipping this profile" in text
+    assert "Bedrock Region Availability" not in text
+
+    output = _console()
+    with output.mute():
+        TerminalRenderer(output).render(results, None)
+    assert output.export_text() == ""
+
+
+@pytest.mark.unit
+def test_progress_view_counts_settled_units_of_every_profile():
+    """Test that the progress bar sums the settled and known units of each profile's graph."""
+    graph = CheckGraph()
+    graph.add("credentials", apply=lambda _: True)
+    graph.add("regions", deps=["credentials"], apply=lambda _: False)
+    graph.add("models:us-east-1", deps=["regions"])
+    graph.run()
+    assert graph.progress() == (3, 3)
+
+    view = ProgressView(CheckerConsole(file=io.StringIO(), force_terminal=True))
+    view.update('dev', *graph.progress())
+    view.update('prod', 1, 4)
+    task = view._progress.tasks[0]
+    assert (task.completed, task.total) == (4, 7)
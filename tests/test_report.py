@@ -0,0 +1,68 @@
+"""
+Unit tests for the bedrock_access_checker.report module.
+"""
+
+import json
+
+import pytest
+
+from bedrock_access_checker.checker import STATUS_SUCCESS, STATUS_ERROR
+from bedrock_access_checker.results import CheckResults
+from bedrock_access_checker.report import compare_profiles, write_consolidated_report
+
+
+def _profile_results():
+    """Results of two profiles with different access"""
+    dev, prod = CheckResults(), CheckResults()
+    dev.aws_credentials.status = STATUS_SUCCESS
+    dev.bedrock_regions.available.extend(['us-west-2', 'us-east-1'])
+    dev.key_models.available.append('anthropic.claude-v2')
+    dev.key_models.missing.append('meta.llama2-13b-chat-v1')
+    prod.aws_credentials.status = STATUS_ERROR
+    prod.aws_credentials.errors.append("ExpiredToken, please log in again")
+    return {'dev': dev, 'prod': prod}
+
+
+@pytest.mark.unit
+def test_compare_profiles_builds_the_matrices_once():
+    """Test that the comparison has one row per profile aligned with the region and model columns."""
+    comparison = compare_profiles(_profile_results())
+
+    assert comparison["regions"] == ['us-east-1', 'us-west-2']
+    assert comparison["models"] == ['anthropic.claude-v2', 'meta.llama2-13b-chat-v1']
+    assert comparison["model_names"] == ['claude-v2', 'llama2-13b-chat-v1']
+    dev, prod = comparison["profiles"]
+    assert dev["profile"] == 'dev'
+    assert dev["regions"] == [True, True]
+    assert dev["models"] == [True, False]
+    assert dev["counts"]["key_models_total"] == 2
+    assert prod["statuses"]["aws_credentials"] == STATUS_ERROR
+    assert prod["overall"] == STATUS_ERROR
+    assert prod["models"] == [None, None]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("format_type", ['json', 'csv', 'html'])
+def test_consolidated_report_covers_every_profile(format_type, tmp_path, monkeypatch):
+    """Test that one report file is written with a profile axis."""
+    monkeypatch.chdir(tmp_path)
+    filename = write_consolidated_report(format_type, _profile_results(), timestamp="20250101_000000")
+
+    assert filename == f"bedrock_check_profiles_20250101_000000.{format_type}"
+    with open(tmp_path / filename) as f:
+        content = f.read()
+
+    if format_type == 'json':
+        report = json.loads(content)
+        assert list(report["profiles"]) == ['dev', 'prod']
+        assert report["profiles"]['dev']["key_models"]["available"] == ['anthropic.claude-v2']
+        assert [row["profile"] for row in report["comparison"]["profiles"]] == ['dev', 'prod']
+    elif format_type == 'csv':
+        lines = content.splitlines()
+        assert lines[0] == "Profile,Component,Status,Details"
+        assert lines[1].startswith("dev,AWS Credentials,")
+        assert "prod,Key Models,None,0/0 key models available" in lines
+    else:
+        assert content.count("class='report-data'") == 2
+        assert "<h2>Profile Comparison</h2>" in content
+        assert "<a href='#r1'>prod</a>" in content
@@ -0,0 +1,101 @@
+"""
+Unit tests for the bedrock_access_checker.results module.
+"""
+
+import pytest
+
+from bedrock_access_checker.results import CheckResults, InvocationResults, ModelDetails, ModelRegistry
+
+
+@pytest.mark.unit
+def test_results_support_attribute_and_item_access():
+    """Test that fields can be used as attributes and, like the old dict structure, as items."""
+    results = CheckResults()
+    results.key_models.available.append('anthropic.claude-v2')
+    results["key_models"]["missing"].append('amazon.titan-embed-text-v1')
+
+    assert results["key_models"]["available"] == ['anthropic.claude-v2']
+    assert results.key_models.missing == ['amazon.titan-embed-text-v1']
+    assert "key_models" in results
+    assert "available" in results.bedrock_models
+    # Optional components only exist once their check has run
+    assert "model_invocations" not in results
+    assert results.get("model_invocations", "unset") == "unset"
+    results.model_invocations = InvocationResults(successful=['anthropic.claude-v2'])
+    assert "model_invocations" in results
+
+    with pytest.raises(KeyError):
+        results["no_such_component"]
+    with pytest.raises(AttributeError):
+        results.no_such_component = {}
+
+
+@pytest.mark.unit
+def test_snapshot_is_read_only_and_detached():
+    """Test that a snapshot keeps the values at the time it was taken and cannot be changed."""
+    results = CheckResults()
+    results.bedrock_regions.available.append('us-east-1')
+    results.model_details = {'anthropic.claude-v2': ModelDetails(model_id='anthropic.claude-v2', specs={'provider': 'Anthropic'})}
+
+    snapshot = results.snapshot()
+    results.bedrock_regions.available.append('us-west-2')
+    results.bedrock_regions.status = "changed"
+
+    assert snapshot.frozen
+    assert snapshot.bedrock_regions.available == ('us-east-1',)
+    assert snapshot.bedrock_regions.status is None
+    assert snapshot.model_details['anthropic.claude-v2'].specs['provider'] == 'Anthropic'
+    assert snapshot.snapshot() is snapshot
+
+    with pytest.raises(AttributeError):
+        snapshot.bedrock_regions.status = "changed"
+    with pytest.raises(AttributeError):
+        snapshot.bedrock_regions.available.append('eu-west-1')
+    with pytest.raises(TypeError):
+        snapshot.model_details['amazon.titan-embed-text-v1'] = ModelDetails()
+
+
+@pytest.mark.unit
+def test_to_dict_matches_the_json_structure():
+    """Test that to_dict gives plain dicts and lists, leaving out components that never ran."""
+    results = CheckResults()
+    results.aws_credentials.details.append("Account: 123456789012")
+    results.model_details = {'anthropic.claude-v2': ModelDetails(region='us-east-1')}
+
+    plain = results.snapshot().to_dict()
+
+    assert plain["aws_credentials"] == {"status": None, "details": ["Account: 123456789012"], "errors": []}
+    assert plain["key_models"] == {"status": None, "details": [], "errors": [], "available": [], "missing": []}
+    assert plain["model_details"]['anthropic.claude-v2'] == {
+        "region": 'us-east-1', "quotas": {}, "inference_params": {}, "pricing": {}, "specs": {}
+    }
+    assert "model_invocations" not in plain
+    assert "timings" not in plain
+    assert plain["timed_out"] == []
+
+
+@pytest.mark.unit
+def test_model_registry_keeps_each_model_once():
+    """Test that the registry de-duplicates models across regions and answers per-region queries."""
+    registry = ModelRegistry()
+    registry.add('us-east-1', ['anthropic.claude-v2', 'amazon.titan-embed-text-v1'])
+    registry.add('us-west-2', ['anthropic.claude-v2', 'meta.llama3-8b-instruct-v1:0'])
+    registry.add('us-east-1', ['cohere.command-text-v14'])
+
+    assert len(registry) == 4
+    assert list(registry) == [
+        'anthropic.claude-v2', 'amazon.titan-embed-text-v1', 'meta.llama3-8b-instruct-v1:0', 'cohere.command-text-v14'
+    ]
+    assert registry.regions == ['us-east-1', 'us-west-2']
+    assert registry.regions_for('anthropic.claude-v2') == ['us-east-1', 'us-west-2']
+    assert registry.regions_for('not.a-model') == []
+    assert registry.models_in('us-west-2') == ['anthropic.claude-v2', 'meta.llama3-8b-instruct-v1:0']
+    assert registry.models_in_all_regions() == ['anthropic.claude-v2']
+    assert 'meta.llama3-8b-instruct-v1:0' in registry
+
+    snapshot = registry.snapshot()
+    registry.add('eu-west-1', ['anthropic.claude-v2'])
+    assert snapshot.regions == ['us-east-1', 'us-west-2']
+    assert snapshot.to_dict()['amazon.titan-embed-text-v1'] == ['us-east-1']
+    with pytest.raises(AttributeError):
+        snapshot.add('eu-west-1', ['anthropic.claude-v2'])
@@ -0,0 +1,136 @@
+"""
+Unit tests for the bedrock_access_checker.scheduler module.
+"""
+
+import threading
+import time
+
+import pytest
+
+from bedrock_access_checker.scheduler import CheckGraph, ConcurrencyBudget, DONE, FAILED, SKIPPED, TIMED_OUT
+
+
+@pytest.mark.unit
+def test_graph_runs_independent_nodes_concurrently():
+    """Test that nodes without dependencies between them overlap."""
+    barrier = threading.Barrier(3, timeout=5)
+    graph = CheckGraph(ConcurrencyBudget(4))
+    applied = []
+
+    for region in ['us-east-1', 'us-west-2', 'eu-west-1']:
+        # Each func waits for the other two, so this only finishes if all three run at once
+        graph.add(f"probe:{region}", lambda region=region: barrier.wait() is not None and region,
+                  apply=applied.append)
+    graph.run()
+
+    assert sorted(applied) == ['eu-west-1', 'us-east-1', 'us-west-2']
+
+
+@pytest.mark.unit
+def test_graph_respects_dependencies_and_dynamic_nodes():
+    """Test that nodes run after their dependencies, including nodes added while running."""
+    graph = CheckGraph(ConcurrencyBudget(4))
+    order = []
+
+    def apply_regions(regions):
+        order.append("regions")
+        for region in regions:
+            graph.add(f"models:{region}", lambda region=region: region, deps=["regions"],
+                      apply=lambda region: order.append(f"models:{region}"))
+        graph.add("costs", deps=[f"models:{region}" for region in regions],
+                  apply=lambda _: order.append("costs"))
+
+    graph.add("credentials", lambda: True, apply=lambda _: order.append("credentials"))
+    graph.add("regions", lambda: ['us-east-1', 'us-west-2'], deps=["credentials"], apply=apply_regions)
+    graph.run()
+
+    assert order[:2] == ["credentials", "regions"]
+    assert sorted(order[2:4]) == ["models:us-east-1", "models:us-west-2"]
+    assert order[4] == "costs"
+
+
+@pytest.mark.unit
+def test_graph_skips_dependents_of_failed_nodes():
+    """Test that an apply step returning False skips everything that depends on it."""
+    graph = CheckGraph(ConcurrencyBudget(2))
+    graph.add("credentials", apply=lambda _: False)
+    graph.add("regions", lambda: pytest.fail("regions should not run"), deps=["credentials"])
+    graph.add("models", deps=["regions"])
+    graph.add("unrelated", lambda: "ok")
+    graph.run()
+
+    assert graph.node("credentials").state == FAILED
+    assert graph.node("regions").state == SKIPPED
+    assert graph.node("models").state == SKIPPED
+    assert graph.node("unrelated").state == DONE
+    assert not graph.succeeded("regions")
+
+
+@pytest.mark.unit
+def test_graph_reports_finished_nodes_with_latency():
+    """Test that on_done sees done and failed nodes, and that node latency covers func."""
+    finished = []
+    graph = CheckGraph(ConcurrencyBudget(2), on_done=lambda node: finished.append((node.name, node.state)))
+    graph.add("credentials", lambda: time.sleep(0.05))
+    graph.add("regions", deps=["credentials"], apply=lambda _: False)
+    graph.add("models", deps=["regions"])
+    graph.run()
+
+    assert finished == [("credentials", DONE), ("regions", FAILED)]
+    assert graph.node("credentials").latency >= 0.05
+    assert graph.node("regions").latency < 0.05
+    assert graph.node("models").latency is None
+
+
+@pytest.mark.unit
+def test_concurrency_budget_limits_running_nodes():
+    """Test that no more nodes run at once than the budget allows."""
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def work():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        threading.Event().wait(0.02)
+        with lock:
+            running[0] -= 1
+
+    # Two graphs sharing one budget, as parallel profiles do
+    budget = ConcurrencyBudget(2)
+    graphs = [CheckGraph(budget), CheckGraph(budget)]
+    for graph in graphs:
+        for index in range(4):
+            graph.add(f"node{index}", work)
+
+    threads = [threading.Thread(target=graph.run) for graph in graphs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] <= 2
+
+
+@pytest.mark.unit
+def test_graph_times_out_unfinished_nodes():
+    """Test that nodes still running or pending at the deadline are marked as timed out."""
+    release = threading.Event()
+    graph = CheckGraph(ConcurrencyBudget(2))
+    graph.add("fast", lambda: "ok", component="bedrock_models", region="us-east-1")
+    graph.add("hung", release.wait, component="bedrock_runtime", region="us-west-2")
+    graph.add("after_hung", lambda: "never", deps=["hung"], component="key_models", region="us-west-2")
+
+    started = time.monotonic()
+    graph.run(deadline=time.monotonic() + 0.2)
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert elapsed < 2
+    assert graph.node("fast").state == DONE
+    assert [(node.name, node.component, node.region) for node in graph.timed_out()] == [
+        ("hung", "bedrock_runtime", "us-west-2"),
+        ("after_hung", "key_models", "us-west-2"),
+    ]
+    assert graph.node("after_hung").state == TIMED_OUT
@@ -0,0 +1,87 @@
+"""
+Unit tests for the bedrock_access_checker.shard module.
+"""
+
+import pytest
+
+from bedrock_access_checker.checker import STATUS_ERROR, STATUS_SUCCESS, STATUS_WARNING
+from bedrock_access_checker.results import CheckResults
+from bedrock_access_checker.shard import merge_results, parse_shard, read_partials, shard_plan, write_partial
+
+
+@pytest.mark.unit
+def test_shards_split_the_plan_deterministically():
+    """Test that the shards of a plan cover every profile/region unit exactly once."""
+    profiles = ['dev', 'prod', None]
+    regions = ['us-east-1', 'us-west-2', 'eu-west-1']
+
+    shards = [shard_plan(profiles, regions, index, 4) for index in range(1, 5)]
+
+    units = [(profile_name, region) for plan in shards for profile_name, regions in plan.items() for region in regions]
+    assert sorted(units, key=str) == sorted([(p, r) for p in profiles for r in regions], key=str)
+    assert [sum(len(regions) for regions in plan.values()) for plan in shards] == [3, 2, 2, 2]
+    assert shards[0] == {'dev': ['us-east-1'], 'prod': ['us-west-2'], None: ['eu-west-1']}
+    assert shard_plan(profiles, regions, 2, 4) == shards[1]
+
+    assert parse_shard("2/4") == (2, 4)
+    for bad in ("0/4", "5/4", "2", "a/b"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+@pytest.mark.unit
+def test_merge_combines_shard_results():
+    """Test that a profile's results from several shards combine into one view."""
+    east, west = CheckResults(), CheckResults()
+    for part in (east, west):
+        part.aws_credentials.status = STATUS_SUCCESS
+        part.aws_credentials.details.append("AWS Account: 1111...3333")
+
+    east.bedrock_regions.status = STATUS_SUCCESS
+    east.bedrock_regions.available.append('us-east-1')
+    east.bedrock_models.available.add('us-east-1', ['anthropic.claude-v2'])
+    east.key_models.available.append('anthropic.claude-v2')
+    east.key_models.missing.append('meta.llama3-8b-instruct-v1:0')
+    east.key_models.status = STATUS_WARNING
+    east.sagemaker_alternatives = {'meta.llama3-8b-instruct-v1:0': ['meta-textgeneration-llama-3-8b']}
+
+    west.bedrock_regions.status = STATUS_ERROR
+    west.bedrock_regions.errors.append("Region eu-west-1: AccessDenied")
+    west.bedrock_models.available.add('us-west-2', ['anthropic.claude-v2', 'meta.llama3-8b-instruct-v1:0'])
+    west.key_models.available.extend(['anthropic.claude-v2', 'meta.llama3-8b-instruct-v1:0'])
+    west.key_models.status = STATUS_SUCCESS
+    west.timed_out.append("model_invocations (us-west-2)")
+
+    merged = merge_results([east, west])
+
+    assert merged.aws_credentials.details == ["AWS Account: 1111...3333"]
+    assert merged.bedrock_regions.available == ['us-east-1']
+    assert merged.bedrock_regions.status == STATUS_SUCCESS
+    assert merged.bedrock_regions.errors == ["Region eu-west-1: AccessDenied"]
+    assert merged.bedrock_models.available.regions_for('anthropic.claude-v2') == ['us-east-1', 'us-west-2']
+    # Missing in one shard's regions but listed in another's
+    assert merged.key_models.available == ['anthropic.claude-v2', 'meta.llama3-8b-instruct-v1:0']
+    assert merged.key_models.missing == []
+    assert merged.key_models.status == STATUS_SUCCESS
+    assert merged.sagemaker_alternatives == {}
+    assert merged.timed_out == ["model_invocations (us-west-2)"]
+
+
+@pytest.mark.unit
+def test_partial_files_round_trip(tmp_path):
+    """Test that partial files are read back in shard order and missing or duplicate shards are noticed."""
+    results = CheckResults()
+    results.bedrock_regions.available.append('us-west-2')
+    second = str(tmp_path / "second.json")
+    third = str(tmp_path / "third.json")
+    write_partial(second, 2, 3, ['dev'], ['us-east-1', 'us-west-2'], {'dev': results}, {'dev': ['us-west-2']})
+    write_partial(third, 3, 3, ['dev'], ['us-east-1', 'us-west-2'], {}, {})
+
+    partials, count, missing = read_partials([third, second])
+    assert [partial["shard"]["index"] for partial in partials] == [2, 3]
+    assert count == 3
+    assert missing == [1]
+    assert CheckResults.from_dict(partials[0]["profiles"]["dev"]).bedrock_regions.available == ['us-west-2']
+
+    with pytest.raises(ValueError, match="more than one"):
+        read_partials([second, second])
@@ -0,0 +1,111 @@
+"""
+Unit tests for the bedrock_access_checker.standin module.
+"""
+
+import random
+
+import pytest
+from botocore.exceptions import ClientError
+
+from bedrock_access_checker.checker import _probe_bedrock_region
+from bedrock_access_checker.catalog import model_catalog
+from bedrock_access_checker.clients import client_pool
+from bedrock_access_checker.invocation import invoke_test_prompt
+from bedrock_access_checker.quotas import quota_indexes
+from bedrock_access_checker.standin import StandInError, StandInService, sample_latency, start_standin, standin_url
+
+MODELS = ['anthropic.claude-3-sonnet-20240229-v1:0', 'amazon.titan-embed-text-v1', 'meta.llama2-13b-chat-v1']
+
+
+@pytest.fixture
+def standin(aws_credentials):
+    """Stand-in server on a free port, with the client pool pointed at it."""
+    server = start_standin({
+        "seed": 1,
+        "models": MODELS,
+        "quota_page_size": 4,
+        "regions": {
+            "us-east-1": {"throttle": {"invoke_model": {"rate": 0.01, "burst": 1}}, "denied_models": [MODELS[2]]},
+            "eu-west-1": {"available": False},
+            "ap-northeast-1": {"outage": True},
+        },
+    }, port=0)
+    client_pool.configure(endpoint_urls={'*': standin_url(server)}, max_attempts=1)
+    yield server
+    client_pool.configure(endpoint_urls={}, max_attempts=3)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+def test_sample_latency_distributions():
+    """Test that each latency distribution gives delays in seconds within its bounds."""
+    rng = random.Random(0)
+    assert sample_latency(None, rng) == 0.0
+    assert sample_latency(250, rng) == 0.25
+    assert sample_latency({"distribution": "fixed", "value": 40}, rng) == 0.04
+    assert all(0.01 <= sample_latency({"distribution": "uniform", "low": 10, "high": 20}, rng) <= 0.02
+               for _ in range(50))
+    assert all(sample_latency({"distribution": "normal", "mean": 5, "stddev": 50}, rng) >= 0 for _ in range(50))
+    assert all(sample_latency({"distribution": "lognormal", "median": 100, "sigma": 2, "max": 300}, rng) <= 0.3
+               for _ in range(50))
+    with pytest.raises(ValueError):
+        sample_latency({"distribution": "pareto"}, rng)
+
+
+@pytest.mark.unit
+def test_standin_service_error_rates_are_seeded_and_counted():
+    """Test that injected errors follow the seeded error rate and show up in the stats."""
+    def failures(seed):
+        service = StandInService({"seed": seed, "regions": {"*": {"error_rate": {"get_caller_identity": 0.5}}}})
+        outcomes = []
+        for _ in range(40):
+            try:
+                service.handle("get_caller_identity", "us-east-1", {})
+                outcomes.append(True)
+            except StandInError as e:
+                assert (e.status, e.code) == (500, "InternalFailure")
+                outcomes.append(False)
+        return outcomes, service.stats()
+
+    outcomes, stats = failures(3)
+    assert failures(3)[0] == outcomes
+    assert 0 < outcomes.count(False) < 40
+    assert stats["get_caller_identity"] == {"calls": 40, "throttled": 0, "errors": outcomes.count(False)}
+
+
+@pytest.mark.unit
+def test_checker_calls_reach_the_standin(standin):
+    """Test that the checker's AWS calls work against the stand-in through the endpoint override."""
+    assert client_pool.caller_identity()["Account"] == "123456789012"
+
+    models = model_catalog.get_models('us-east-1')
+    assert [model['modelId'] for model in models] == MODELS
+    assert model_catalog.get_model_details(MODELS[0], 'us-east-1')['providerName'] == 'Anthropic'
+
+    # Quotas are paged and matched to the models by name
+    index = quota_indexes.get_index('us-east-1')
+    assert list(index.quotas_for_model(MODELS[0])) == [
+        "On-demand InvokeModel requests per minute for claude-3-sonnet-20240229-v1:0",
+        "On-demand InvokeModel tokens per minute for claude-3-sonnet-20240229-v1:0",
+    ]
+
+    assert invoke_test_prompt(MODELS[0], 'us-west-2').startswith("Success: {'id': 'msg_")
+
+
+@pytest.mark.unit
+def test_standin_simulates_unavailable_regions_throttling_and_denials(standin):
+    """Test that region settings surface as the errors the checker classifies."""
+    assert _probe_bedrock_region('eu-west-1')["status"] == "not_available"
+    assert _probe_bedrock_region('ap-northeast-1')["status"] == "error"
+    assert _probe_bedrock_region('us-east-1')["status"] == "available"
+
+    with pytest.raises(ClientError) as denied:
+        invoke_test_prompt(MODELS[2], 'us-east-1')
+    assert denied.value.response['Error']['Code'] == 'AccessDeniedException'
+
+    # The one-token burst is spent, and the bucket refills far too slowly for another call
+    with pytest.raises(ClientError) as throttled:
+        invoke_test_prompt(MODELS[0], 'us-east-1')
+    assert throttled.value.response['Error']['Code'] == 'ThrottlingException'
+    assert standin.service.stats()["invoke_model"]["throttled"] >= 1
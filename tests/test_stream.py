@@ -0,0 +1,57 @@
+"""
+Unit tests for the bedrock_access_checker.stream module.
+"""
+
+import json
+
+import pytest
+
+from bedrock_access_checker.checker import STATUS_SUCCESS, STATUS_WARNING
+from bedrock_access_checker.results import CheckResults
+from bedrock_access_checker.scheduler import CheckNode, DONE, FAILED
+from bedrock_access_checker.stream import ResultStream
+
+
+def _finished(name, component, region=None, state=DONE, latency=0.25):
+    """A node as the check graph leaves it when it finishes"""
+    node = CheckNode(name, component=component, region=region)
+    node.state = state
+    node.started, node.finished = 10.0, 10.0 + latency
+    return node
+
+
+@pytest.mark.unit
+def test_stream_writes_one_record_per_unit(tmp_path):
+    """Test that each record holds only what its unit added to the shared component."""
+    path = str(tmp_path / "checks.ndjson")
+    results = CheckResults()
+    # Restored from a journal before streaming started
+    results.bedrock_models.details.append("us-east-1: 12 models")
+
+    stream = ResultStream(path)
+    on_done = stream.recorder('dev', results)
+
+    results.bedrock_models.details.append("us-west-2: 9 models")
+    results.bedrock_models.status = STATUS_SUCCESS
+    on_done(_finished("models:us-west-2", "bedrock_models", "us-west-2"))
+
+    results.bedrock_models.errors.append("eu-west-1: AccessDeniedException")
+    results.bedrock_models.status = STATUS_WARNING
+    on_done(_finished("models:eu-west-1", "bedrock_models", "eu-west-1"))
+
+    on_done(_finished("details:eu-west-1", "model_details", "eu-west-1", state=FAILED))
+    stream.close()
+
+    with open(path) as f:
+        records = [json.loads(line) for line in f]
+    assert stream.count == 3
+    assert [record["check"] for record in records] == ["models:us-west-2", "models:eu-west-1", "details:eu-west-1"]
+    assert records[0]["profile"] == "dev"
+    assert records[0]["region"] == "us-west-2"
+    assert records[0]["status"] == STATUS_SUCCESS
+    assert records[0]["details"] == ["us-west-2: 9 models"]
+    assert records[0]["latency_ms"] == 250.0
+    assert records[1]["details"] == []
+    assert records[1]["errors"] == ["eu-west-1: AccessDeniedException"]
+    # Components without a status report the unit's state
+    assert records[2]["status"] == FAILED
@@ -0,0 +1,78 @@
+"""
+Unit tests for the bedrock_access_checker.timings module.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from botocore.exceptions import ClientError, ConnectTimeoutError
+
+from bedrock_access_checker.clients import ClientPool
+from bedrock_access_checker.timings import enable_timings, timing_summary, summarize_calls
+
+
+def endpoint_response(status_code, parsed):
+    """Build what a client's endpoint returns for one HTTP exchange."""
+    http_response = MagicMock(status_code=status_code)
+    parsed = dict(parsed, ResponseMetadata={"HTTPStatusCode": status_code, "RetryAttempts": 1})
+    return http_response, parsed
+
+
+@pytest.mark.unit
+@pytest.mark.mock
+def test_pooled_clients_record_api_calls(aws_credentials):
+    """Test that instrumented clients record each call's operation, region, status, retries and errors."""
+    recorder = enable_timings()
+    client = ClientPool().client('bedrock', 'us-west-2', None)
+
+    # Replace the HTTP layer only, so botocore still emits its call events
+    with patch.object(client._endpoint, 'make_request') as mock_request:
+        mock_request.side_effect = [
+            endpoint_response(200, {'modelSummaries': []}),
+            endpoint_response(403, {'Error': {'Code': 'AccessDeniedException', 'Message': 'No access'}}),
+            ConnectTimeoutError(endpoint_url='https://bedrock.us-west-2.amazonaws.com'),
+        ]
+
+        client.list_foundation_models()
+        with pytest.raises(ClientError):
+            client.get_foundation_model(modelIdentifier='anthropic.claude-v2')
+        with pytest.raises(ConnectTimeoutError):
+            client.list_foundation_models()
+
+    listed, described, timed_out = recorder.calls()
+    assert (listed["service"], listed["operation"], listed["region"]) == ('bedrock', 'ListFoundationModels', 'us-west-2')
+    assert listed["http_status"] == 200
+    assert listed["retries"] == 1
+    assert listed["error"] is None
+    assert listed["latency_ms"] >= 0
+    assert described["operation"] == 'GetFoundationModel'
+    assert described["http_status"] == 403
+    assert described["error"] == 'AccessDeniedException'
+    assert timed_out["operation"] == 'ListFoundationModels'
+    assert timed_out["error"] == 'ConnectTimeoutError'
+
+    # Calls are attributed to their profile
+    assert timing_summary(None)["total_calls"] == 3
+    assert timing_summary('other-profile')["total_calls"] == 0
+
+
+@pytest.mark.unit
+def test_summarize_calls_orders_slowest_first():
+    """Test that the breakdown aggregates per operation and region, slowest first."""
+    def call(operation, region, latency_ms, retries=0, error=None):
+        return {"service": "bedrock", "operation": operation, "region": region, "profile": None,
+                "start_ms": 0, "latency_ms": latency_ms, "retries": retries, "http_status": 200,
+                "error": error, "thread": 1}
+
+    summary = summarize_calls([
+        call("ListFoundationModels", "us-east-1", 100),
+        call("ListFoundationModels", "eu-west-1", 300, retries=2),
+        call("GetFoundationModel", "us-east-1", 50, error="ThrottlingException"),
+    ])
+
+    assert summary["total_calls"] == 3
+    assert summary["total_ms"] == 450
+    assert summary["total_retries"] == 2
+    listed, described = summary["by_operation"]
+    assert (listed["operation"], listed["calls"], listed["avg_ms"], listed["max_ms"]) == ("ListFoundationModels", 2, 200, 300)
+    assert (described["operation"], described["errors"]) == ("GetFoundationModel", 1)
+    assert list(summary["by_region"]) == ["eu-west-1", "us-east-1"]
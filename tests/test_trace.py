@@ -0,0 +1,60 @@
+"""
+Unit tests for the bedrock_access_checker.trace module.
+"""
+
+import json
+
+import pytest
+
+from bedrock_access_checker.timings import active_recorder
+from bedrock_access_checker.trace import enable_tracing, traced, write_trace
+
+
+@traced
+def check_something(region, profile_name=None, other=None):
+    """Traced function standing in for a check."""
+    # Simulate the API call this check makes
+    recorder = active_recorder()
+    if recorder is not None:
+        recorder.record({
+            "service": "bedrock", "operation": "ListFoundationModels", "region": region,
+            "profile": profile_name, "start_ms": 0.0, "latency_ms": 0.0, "retries": 0,
+            "http_status": 200, "error": None, "thread": 1,
+        })
+    return region
+
+
+@pytest.mark.unit
+def test_traced_is_transparent_when_disabled(tmp_path):
+    """Test that traced functions run normally and nothing is written when tracing is off."""
+    assert check_something('us-east-1') == 'us-east-1'
+    assert write_trace(str(tmp_path / "trace.json")) == 0
+    assert not (tmp_path / "trace.json").exists()
+
+
+@pytest.mark.unit
+def test_write_trace_has_check_and_api_spans(tmp_path):
+    """Test that the trace holds tagged check spans, API call spans and one process per profile."""
+    enable_tracing()
+    check_something('us-east-1', profile_name='dev')
+    check_something('eu-west-1', 'prod')
+
+    trace_file = tmp_path / "trace.json"
+    assert write_trace(str(trace_file)) == 4
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    checks = [event for event in spans if event["cat"] == "check"]
+    api_calls = [event for event in spans if event["cat"] == "aws"]
+
+    assert [event["args"] for event in checks] == [
+        {"region": "us-east-1", "profile_name": "dev"},
+        {"region": "eu-west-1", "profile_name": "prod"},
+    ]
+    assert {event["name"] for event in api_calls} == {"bedrock.ListFoundationModels"}
+    assert all(event["name"] == "check_something" and event["dur"] >= 0 for event in checks)
+
+    # Each profile is its own trace process
+    processes = {event["pid"]: event["args"]["name"] for event in events if event["name"] == "process_name"}
+    assert sorted(processes.values()) == ["profile: dev", "profile: prod"]
+    assert {event["pid"] for event in checks} == set(processes)